@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Compliance Scan Benchmark
+
+Times a whole-repository RM/RDI compliance scan four ways and checks that they
+report the same issues:
+  serial      - RMValidator per module, then RequirementTracer and DesignValidator
+  in-process  - ComplianceScanEngine with one process and no cache
+  parallel    - ComplianceScanEngine on a process pool, cold cache
+  warm        - the same engine again with every file cached
+
+Usage:
+    python scripts/benchmark_compliance_scan.py [--project-root .] [--workers N]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.beast_mode.compliance.rdi.design_validator import DesignValidator
+from src.beast_mode.compliance.rdi.requirement_tracer import RequirementTracer
+from src.beast_mode.compliance.rm.module_analysis import default_module_cache
+from src.beast_mode.compliance.rm.rm_validator import RMValidator
+from src.beast_mode.compliance.scan_engine import ComplianceScanEngine
+from src.beast_mode.utils.project_walker import ProjectWalker
+
+
+def issue_signature(issues):
+    """Order-independent form of an issue list for comparing runs."""
+    return sorted(
+        (issue.issue_type.value, issue.severity.value, issue.description, tuple(sorted(issue.affected_files)))
+        for issue in issues
+    )
+
+
+def run_serial(root: str):
+    issues = []
+    rm_validator = RMValidator()
+    for module_path in ProjectWalker(root, extensions={'.py'}).walk():
+        if module_path.name != '__init__.py':
+            issues.extend(rm_validator.validate_rm_compliance(str(module_path)).issues)
+    issues.extend(RequirementTracer(root).validate(root))
+    issues.extend(DesignValidator(root).validate(root))
+    return issues, {}
+
+
+def run_engine(root: str, workers: int, cache_path):
+    engine = ComplianceScanEngine(root, max_workers=workers, cache_path=cache_path, use_cache=cache_path is not None)
+    issues = engine.run()
+    return issues, engine.get_stats()
+
+
+def timed(label, function, *args):
+    default_module_cache.clear()  # no parse reuse between runs
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # validators print per-file warnings
+        issues, stats = function(*args)
+    return {"run": label, "seconds": time.perf_counter() - start_time, "issues": issues, "stats": stats}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parallel compliance scan")
+    parser.add_argument("--project-root", default=".", help="Project root directory (default: current directory)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    root = str(Path(args.project_root).resolve())
+    with tempfile.TemporaryDirectory(prefix="beast_mode_scan_bench_") as temp_dir:
+        cache_path = str(Path(temp_dir) / "compliance_scan_cache.json")
+        runs = [
+            timed("serial", run_serial, root),
+            timed("in-process", run_engine, root, 1, None),
+            timed(f"parallel ({args.workers} workers)", run_engine, root, args.workers, cache_path),
+            timed("warm cache", run_engine, root, args.workers, cache_path),
+        ]
+
+    baseline = runs[0]
+    expected = issue_signature(baseline["issues"])
+    files = runs[1]["stats"].get("files", 0)
+    rows = [
+        {
+            "run": run["run"],
+            "seconds": round(run["seconds"], 3),
+            "speedup": round(baseline["seconds"] / run["seconds"], 2) if run["seconds"] else None,
+            "issues": len(run["issues"]),
+            "matches_serial": issue_signature(run["issues"]) == expected,
+            "cached_files": run["stats"].get("cached", 0)
+        }
+        for run in runs
+    ]
+
+    if args.json:
+        print(json.dumps({"root": root, "files": files, "cpus": os.cpu_count(), "runs": rows}, indent=2))
+    else:
+        print(f"📊 Compliance scan benchmark: {files} files, {os.cpu_count()} CPUs")
+        print(f"{'run':<24}{'seconds':>10}{'speedup':>10}{'issues':>9}{'cached':>9}  same issues")
+        for row in rows:
+            print(f"{row['run']:<24}{row['seconds']:>10.3f}{row['speedup']:>9.2f}x{row['issues']:>9}"
+                  f"{row['cached_files']:>9}  {'✅' if row['matches_serial'] else '❌'}")
+
+    return 0 if all(row["matches_serial"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
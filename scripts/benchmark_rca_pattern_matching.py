@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+RCA Pattern Matching Benchmark
+
+Fills an RCAEngine pattern library with synthetic pytest failure patterns,
+indexes them in the MinHash LSH index and times match_existing_patterns for
+near-duplicate queries against DR3 (<1 second per match).
+
+Usage:
+    python scripts/benchmark_rca_pattern_matching.py [--patterns 100000] [--queries 20]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.beast_mode.analysis.pattern_lsh_index import signature_error_message
+from src.beast_mode.analysis.rca_engine import RCAEngine, Failure, FailureCategory, PreventionPattern
+
+WORDS = ["import", "error", "module", "timeout", "connection", "refused", "assert", "expected",
+         "file", "found", "permission", "denied", "key", "index", "attribute", "object", "type"]
+
+
+def make_failure(error_message: str) -> Failure:
+    return Failure(
+        failure_id="benchmark_failure",
+        timestamp=datetime.now(),
+        component="test:tests/test_imports.py",
+        error_message=error_message,
+        stack_trace=None,
+        context={"test_file": "tests/test_imports.py"},
+        category=FailureCategory.PYTEST_FAILURE
+    )
+
+
+def make_pattern(engine: RCAEngine, pattern_id: str, failure: Failure) -> PreventionPattern:
+    return PreventionPattern(
+        pattern_id=pattern_id,
+        pattern_name=f"Pattern {pattern_id}",
+        failure_signature=engine._generate_failure_signature(failure),
+        root_cause_pattern="Missing dependency",
+        prevention_steps=[],
+        detection_criteria=[],
+        automated_checks=[],
+        pattern_hash=pattern_id[-8:]
+    )
+
+
+def build_library(engine: RCAEngine, count: int, rng: random.Random):
+    patterns = []
+    for i in range(count):
+        message = " ".join(rng.choices(WORDS, k=rng.randint(4, 10))) + f" '{rng.choice(WORDS)}_{i:x}'"
+        pattern = make_pattern(engine, f"pattern_{i:08d}", make_failure(message))
+        engine.pattern_library[pattern.pattern_id] = pattern
+        engine.pattern_index.setdefault(pattern.pattern_hash, []).append(pattern.pattern_id)
+        patterns.append(pattern)
+    engine.pattern_lsh_index.add_many(
+        (pattern.pattern_id, signature_error_message(pattern.failure_signature), pattern.pattern_hash)
+        for pattern in patterns
+    )
+    return patterns
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark RCA pattern matching against DR3")
+    parser.add_argument("--patterns", type=int, default=100000, help="Library size (default: 100000)")
+    parser.add_argument("--queries", type=int, default=20, help="Near-duplicate queries to time (default: 20)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="beast_mode_rca_bench_") as temp_dir:
+        engine = RCAEngine(pattern_library_path=str(Path(temp_dir) / "rca_patterns.json"))
+
+        start_time = time.perf_counter()
+        patterns = build_library(engine, args.patterns, rng)
+        build_seconds = time.perf_counter() - start_time
+
+        latencies = []
+        found = 0
+        for pattern in rng.sample(patterns, min(args.queries, len(patterns))):
+            query = signature_error_message(pattern.failure_signature)[:-2] + "z'"
+            start_time = time.perf_counter()
+            matches = engine.match_existing_patterns(make_failure(query))
+            latencies.append(time.perf_counter() - start_time)
+            found += pattern in matches
+
+    worst = max(latencies)
+    result = {
+        "patterns": args.patterns,
+        "queries": len(latencies),
+        "build_seconds": round(build_seconds, 3),
+        "mean_match_seconds": round(sum(latencies) / len(latencies), 4),
+        "worst_match_seconds": round(worst, 4),
+        "recall": found / len(latencies),
+        "meets_dr3": worst < 1.0
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"📊 RCA pattern matching benchmark: {args.patterns} patterns, {len(latencies)} queries")
+        print(f"   index build:  {result['build_seconds']:.3f}s")
+        print(f"   mean match:   {result['mean_match_seconds']:.4f}s")
+        print(f"   worst match:  {result['worst_match_seconds']:.4f}s  {'✅' if result['meets_dr3'] else '❌'} DR3 (<1s)")
+        print(f"   recall:       {result['recall']:.0%}")
+
+    return 0 if result["meets_dr3"] and found == len(latencies) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
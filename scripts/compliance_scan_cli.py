@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Compliance Scan CLI Tool
+
+Command-line interface for the parallel RM/RDI compliance scan.
+Streams issues as they are found and reuses cached results for unchanged files.
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.beast_mode.compliance.scan_engine import ComplianceScanEngine, DEFAULT_CHECKS, SCAN_CHECKS
+from src.beast_mode.utils.enum_serialization import EnumJSONEncoder
+
+
+SEVERITY_ICONS = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🔵"}
+
+
+def format_issue(issue) -> str:
+    """One-line text form of a compliance issue."""
+    line = f"{SEVERITY_ICONS.get(issue.severity.value, '•')} [{issue.severity.value}] {issue.issue_type.value}: {issue.description}"
+    if issue.affected_files:
+        shown = ", ".join(issue.affected_files[:3])
+        more = f" (+{len(issue.affected_files) - 3} more)" if len(issue.affected_files) > 3 else ""
+        line += f"\n     {shown}{more}"
+    return line
+
+
+def print_summary(issues, stats) -> None:
+    """Print issue counts and scan statistics."""
+    severities = Counter(issue.severity.value for issue in issues)
+    print(f"\n📊 Compliance scan: {len(issues)} issues in {stats.get('files', 0)} files")
+    for severity in ("critical", "high", "medium", "low"):
+        print(f"   {SEVERITY_ICONS[severity]} {severity}: {severities.get(severity, 0)}")
+    print(f"   Blocking merge: {sum(1 for issue in issues if issue.blocking_merge)}")
+    print(f"\n⚡ Analyzed: {stats.get('analyzed', 0)}  Cached: {stats.get('cached', 0)}  "
+          f"Workers: {stats.get('workers', 1)}  Duration: {stats.get('duration_seconds', 0.0):.2f}s")
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Parallel RM/RDI compliance scan",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scan the current repository
+  python scripts/compliance_scan_cli.py
+
+  # RM checks only, on 4 worker processes
+  python scripts/compliance_scan_cli.py --checks rm --workers 4
+
+  # Include test coverage and write a JSON report
+  python scripts/compliance_scan_cli.py --coverage --format json --output compliance_scan.json
+
+  # Fail (exit 1) when any issue blocks merging
+  python scripts/compliance_scan_cli.py --fail-on-blocking
+        """,
+    )
+
+    parser.add_argument("--project-root", default=".", help="Project root directory (default: current directory)")
+    parser.add_argument("--checks", default=",".join(DEFAULT_CHECKS),
+                        help=f"Comma-separated checks from: {', '.join(SCAN_CHECKS)} (default: %(default)s)")
+    parser.add_argument("--coverage", action="store_true", help="Also run the test suite for coverage")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Analyze every file and leave the cache untouched")
+    parser.add_argument("--cache-file", help="Result cache file (default: inside the .git directory)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+    parser.add_argument("--output", "-o", help="Output file for the JSON report (default: stdout)")
+    parser.add_argument("--fail-on-blocking", action="store_true", help="Exit with status 1 if any issue blocks merging")
+
+    args = parser.parse_args()
+
+    checks = [check.strip() for check in args.checks.split(",") if check.strip()]
+    if args.coverage:
+        checks.append("coverage")
+
+    try:
+        engine = ComplianceScanEngine(
+            args.project_root,
+            checks=checks,
+            max_workers=args.workers,
+            cache_path=args.cache_file,
+            use_cache=not args.no_cache
+        )
+
+        issues = []
+        for issue in engine.scan():
+            issues.append(issue)
+            if args.format == "text":
+                print(format_issue(issue), flush=True)
+        stats = engine.get_stats()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    if args.format == "json":
+        report = json.dumps({"issues": [asdict(issue) for issue in issues], "stats": stats},
+                            cls=EnumJSONEncoder, indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(report)
+            print(f"✅ Report saved to: {args.output}")
+        else:
+            print(report)
+    else:
+        print_summary(issues, stats)
+
+    if args.fail_on_blocking and any(issue.blocking_merge for issue in issues):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+"""
+Beast Mode Framework - Pattern LSH Index
+MinHash / locality-sensitive hashing index for near-duplicate failure matching
+
+Error messages are normalized (case, numbers, hex addresses, whitespace) and
+split into character shingles. Each pattern gets a MinHash signature whose
+bands are hashed into buckets; a query only compares against patterns sharing
+at least one bucket, so lookups stay sub-linear in the library size (DR3).
+Signatures are persisted next to the pattern library and reused on restart
+for patterns whose hash is unchanged.
+"""
+
+import base64
+import json
+import logging
+import re
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Mersenne prime for the universal hash family h(x) = (a * x + b) mod p
+_MERSENNE_PRIME = (1 << 31) - 1
+
+_HEX_PATTERN = re.compile(r"0x[0-9a-f]+")
+_NUMBER_PATTERN = re.compile(r"\d+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_error_message(message: Optional[str]) -> str:
+    """Normalize an error message so incidental details do not affect matching"""
+    if not message:
+        return ""
+    text = message.lower()
+    text = _HEX_PATTERN.sub("0x", text)
+    text = _NUMBER_PATTERN.sub("0", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def shingle(text: str, size: int = 4) -> Set[str]:
+    """Character shingles of a normalized text"""
+    if not text:
+        return set()
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def signature_error_message(failure_signature: str) -> str:
+    """Error message part of an RCAEngine failure signature"""
+    parts = failure_signature.split("|")
+    return parts[2] if len(parts) > 2 else failure_signature
+
+
+class PatternLSHIndex:
+    """
+    MinHash LSH index over pattern error messages
+
+    Features:
+    - Normalized character shingles hashed with CRC32 (stable across processes)
+    - MinHash signatures, vectorized and batched with NumPy when available
+    - Banded bucket lookup for sub-linear candidate retrieval
+    - Candidates ranked by estimated Jaccard similarity
+    - JSON persistence keyed by pattern hash for incremental rebuilds
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 4, seed: int = 1,
+                 batch_size: int = 1024):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.batch_size = batch_size
+
+        # Deterministic permutation parameters so persisted signatures stay valid
+        params = [zlib.crc32(f"{seed}:{i}".encode()) for i in range(2 * num_perm)]
+        self._coeff_a = [(value % (_MERSENNE_PRIME - 1)) + 1 for value in params[:num_perm]]
+        self._coeff_b = [value % _MERSENNE_PRIME for value in params[num_perm:]]
+        if NUMPY_AVAILABLE:
+            self._np_coeff_a = np.array(self._coeff_a, dtype=np.uint64)[:, None]
+            self._np_coeff_b = np.array(self._coeff_b, dtype=np.uint64)[:, None]
+
+        # Internal slots keep per-pattern storage compact
+        self._slot_ids: List[Optional[str]] = []
+        self._slot_hashes: List[Optional[str]] = []
+        self._signatures: List[Optional[array]] = []
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, pattern_id: str) -> bool:
+        return pattern_id in self._slots
+
+    def compute_signature(self, message: str) -> Optional[array]:
+        """MinHash signature of an error message (None when it has no shingles)"""
+        shingles = shingle(normalize_error_message(message), self.shingle_size)
+        if not shingles:
+            return None
+
+        hashes = [zlib.crc32(item.encode()) for item in shingles]
+        if NUMPY_AVAILABLE:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            minimums = ((self._np_coeff_a * values + self._np_coeff_b) % _MERSENNE_PRIME).min(axis=1)
+            return array("I", minimums.astype(np.uint32).tobytes())
+
+        prime = _MERSENNE_PRIME
+        return array("I", (
+            min((a * value + b) % prime for value in hashes)
+            for a, b in zip(self._coeff_a, self._coeff_b)
+        ))
+
+    def compute_signatures(self, messages: List[str]) -> List[Optional[array]]:
+        """MinHash signatures of many error messages, batched when NumPy is available"""
+        if not NUMPY_AVAILABLE:
+            return [self.compute_signature(message) for message in messages]
+
+        signatures: List[Optional[array]] = [None] * len(messages)
+        for start in range(0, len(messages), self.batch_size):
+            hashes: List[int] = []
+            offsets: List[int] = []
+            positions: List[int] = []
+            for position in range(start, min(start + self.batch_size, len(messages))):
+                shingles = shingle(normalize_error_message(messages[position]), self.shingle_size)
+                if shingles:
+                    offsets.append(len(hashes))
+                    positions.append(position)
+                    hashes.extend(zlib.crc32(item.encode()) for item in shingles)
+            if not positions:
+                continue
+
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            permuted = (self._np_coeff_a * values + self._np_coeff_b) % _MERSENNE_PRIME
+            minimums = np.minimum.reduceat(permuted, offsets, axis=1).T.astype(np.uint32)
+            for position, row in zip(positions, minimums):
+                signatures[position] = array("I", row.tobytes())
+        return signatures
+
+    def add(self, pattern_id: str, message: str, pattern_hash: Optional[str] = None) -> bool:
+        """Index (or re-index) a pattern's error message"""
+        return self._insert(pattern_id, self.compute_signature(message), pattern_hash)
+
+    def add_many(self, patterns: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """Index (pattern_id, message, pattern_hash) triples in batches, returning the number indexed"""
+        patterns = list(patterns)
+        signatures = self.compute_signatures([message for _, message, _ in patterns])
+        return sum(
+            self._insert(pattern_id, signature, pattern_hash)
+            for (pattern_id, _, pattern_hash), signature in zip(patterns, signatures)
+        )
+
+    def remove(self, pattern_id: str) -> bool:
+        """Remove a pattern from the index"""
+        slot = self._slots.pop(pattern_id, None)
+        if slot is None:
+            return False
+
+        for band, key in enumerate(self._band_keys(self._signatures[slot])):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.remove(slot)
+                if not bucket:
+                    del self._buckets[band][key]
+
+        self._slot_ids[slot] = None
+        self._slot_hashes[slot] = None
+        self._signatures[slot] = None
+        self._free_slots.append(slot)
+        return True
+
+    def clear(self) -> None:
+        """Remove all patterns"""
+        self._slot_ids.clear()
+        self._slot_hashes.clear()
+        self._signatures.clear()
+        self._slots.clear()
+        self._free_slots.clear()
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def query(self, message: str, limit: int = 10, min_similarity: float = 0.5) -> List[Tuple[str, float]]:
+        """Ranked (pattern_id, estimated Jaccard similarity) matches for an error message"""
+        signature = self.compute_signature(message)
+        if signature is None:
+            return []
+
+        candidates: Set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                candidates.update(bucket)
+
+        scored = []
+        num_perm = self.num_perm
+        for slot in candidates:
+            other = self._signatures[slot]
+            similarity = sum(1 for left, right in zip(signature, other) if left == right) / num_perm
+            if similarity >= min_similarity:
+                scored.append((self._slot_ids[slot], similarity))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def sync(self, patterns: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Bring the index in line with (pattern_id, message, pattern_hash) triples
+
+        Patterns already indexed under the same hash are kept as-is; others are
+        (re)computed and patterns no longer present are removed. Returns the
+        number of signatures computed.
+        """
+        seen = set()
+        stale = []
+        for pattern_id, message, pattern_hash in patterns:
+            seen.add(pattern_id)
+            slot = self._slots.get(pattern_id)
+            if slot is None or self._slot_hashes[slot] != pattern_hash:
+                stale.append((pattern_id, message, pattern_hash))
+
+        for pattern_id in [pattern_id for pattern_id in self._slots if pattern_id not in seen]:
+            self.remove(pattern_id)
+
+        self.add_many(stale)
+        return len(stale)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist signatures and index parameters as JSON"""
+        entries = {}
+        for pattern_id, slot in self._slots.items():
+            entries[pattern_id] = [
+                self._slot_hashes[slot],
+                base64.b64encode(self._signatures[slot].tobytes()).decode("ascii")
+            ]
+
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "shingle_size": self.shingle_size,
+            "seed": self.seed,
+            "entries": entries
+        }
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        temp_path.replace(path)
+
+    def load(self, path: Union[str, Path]) -> bool:
+        """Load persisted signatures; returns False if missing or built with other parameters"""
+        path = Path(path)
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load pattern LSH index {path}: {e}")
+            return False
+
+        parameters = (data.get("version"), data.get("num_perm"), data.get("bands"),
+                      data.get("shingle_size"), data.get("seed"))
+        if parameters != (INDEX_FORMAT_VERSION, self.num_perm, self.bands, self.shingle_size, self.seed):
+            logger.info(f"Ignoring pattern LSH index {path} built with different parameters")
+            return False
+
+        self.clear()
+        for pattern_id, (pattern_hash, encoded) in data.get("entries", {}).items():
+            signature = array("I")
+            signature.frombytes(base64.b64decode(encoded))
+            if len(signature) == self.num_perm:
+                self._insert(pattern_id, signature, pattern_hash)
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Index size and bucket statistics"""
+        bucket_count = sum(len(buckets) for buckets in self._buckets)
+        largest = max((len(bucket) for buckets in self._buckets for bucket in buckets.values()), default=0)
+        return {
+            "patterns": len(self._slots),
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "buckets": bucket_count,
+            "largest_bucket": largest
+        }
+
+    def _insert(self, pattern_id: str, signature: Optional[array], pattern_hash: Optional[str]) -> bool:
+        self.remove(pattern_id)
+        if signature is None:
+            return False
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_ids[slot] = pattern_id
+            self._slot_hashes[slot] = pattern_hash
+            self._signatures[slot] = signature
+        else:
+            slot = len(self._signatures)
+            self._slot_ids.append(pattern_id)
+            self._slot_hashes.append(pattern_hash)
+            self._signatures.append(signature)
+
+        self._slots[pattern_id] = slot
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(slot)
+        return True
+
+    def _band_keys(self, signature: array) -> List[bytes]:
+        raw = signature.tobytes()
+        width = self.rows * signature.itemsize
+        return [raw[i:i + width] for i in range(0, len(raw), width)]
@@ -0,0 +1,119 @@
+"""
+Beast Mode Framework - Append-Only Pattern Store
+Persistent storage for the RCA pattern library
+
+Patterns live in a JSON snapshot (the existing pattern library format) plus an
+append-only JSONL log next to it. Adding a pattern appends one line instead of
+rewriting the whole library; the log is folded back into the snapshot by
+periodic compaction, which writes the snapshot atomically (temp file + rename).
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class PatternStore:
+    """
+    Snapshot + append-only log store for prevention patterns
+
+    Features:
+    - O(1) appends for new or updated patterns
+    - Streaming replay of the log at startup
+    - Amortized compaction once the log outgrows the snapshot
+    - Atomic snapshot writes; torn trailing log lines are ignored
+    """
+
+    def __init__(self, snapshot_path: Union[str, Path], min_compaction_records: int = 1000,
+                 compaction_ratio: float = 1.0):
+        self.snapshot_path = Path(snapshot_path)
+        self.log_path = self.snapshot_path.with_suffix(".log.jsonl")
+        self.min_compaction_records = min_compaction_records
+        self.compaction_ratio = compaction_ratio
+
+        self.snapshot_records = 0
+        self.log_records = 0
+        self.skipped_records = 0
+
+    def load(self) -> Iterator[Dict[str, Any]]:
+        """Stream pattern dicts from the snapshot followed by the log (later records win)"""
+        self.snapshot_records = 0
+        self.log_records = 0
+        self.skipped_records = 0
+
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            for pattern_data in data.get('patterns', []):
+                self.snapshot_records += 1
+                yield pattern_data
+
+        if self.log_path.exists():
+            with open(self.log_path, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        pattern_data = json.loads(line)
+                    except ValueError:
+                        # Partially written record from an interrupted append
+                        self.skipped_records += 1
+                        continue
+                    self.log_records += 1
+                    yield pattern_data
+
+        if self.skipped_records:
+            logger.warning(f"Skipped {self.skipped_records} unreadable records in {self.log_path}")
+
+    def append(self, pattern_data: Dict[str, Any]) -> None:
+        """Append one pattern record to the log"""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'a') as f:
+            f.write(json.dumps(pattern_data, separators=(',', ':')) + "\n")
+        self.log_records += 1
+
+    def needs_compaction(self) -> bool:
+        """Whether the log has grown enough to fold into the snapshot"""
+        threshold = max(self.min_compaction_records, self.compaction_ratio * self.snapshot_records)
+        return self.log_records >= threshold or self.skipped_records > 0
+
+    def compact(self, patterns_data: List[Dict[str, Any]]) -> None:
+        """Atomically write a new snapshot of all patterns and truncate the log"""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            'patterns': patterns_data,
+            'last_updated': datetime.now().isoformat(),
+            'pattern_count': len(patterns_data)
+        }
+
+        temp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        # The snapshot now contains every logged record
+        if self.log_path.exists():
+            self.log_path.unlink()
+
+        self.snapshot_records = len(patterns_data)
+        self.log_records = 0
+        self.skipped_records = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics"""
+        return {
+            "snapshot_path": str(self.snapshot_path),
+            "log_path": str(self.log_path),
+            "snapshot_records": self.snapshot_records,
+            "log_records": self.log_records,
+            "skipped_records": self.skipped_records
+        }
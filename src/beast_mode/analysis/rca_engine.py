@@ -7,16 +7,17 @@ Requirements: DR3 (Scalability) - <1 second pattern matching for 10,000+ pattern
 
 import os
 import subprocess
-import json
 import time
 import hashlib
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 
 from ..core.reflective_module import ReflectiveModule, HealthStatus
+from .pattern_lsh_index import PatternLSHIndex, signature_error_message
+from .pattern_store import PatternStore
 
 class FailureCategory(Enum):
     TOOL_FAILURE = "tool_failure"
@@ -143,6 +144,10 @@ class RCAEngine(ReflectiveModule):
         self.pattern_library_path = pattern_library_path or "patterns/rca_patterns.json"
         self.pattern_library: Dict[str, PreventionPattern] = {}
         self.pattern_index: Dict[str, List[str]] = {}  # Hash-based index for fast lookup
+        self.pattern_store = PatternStore(self.pattern_library_path)  # Snapshot + append-only log
+        self.pattern_lsh_index = PatternLSHIndex()  # Near-duplicate index over error messages
+        self.pattern_lsh_index_path = str(Path(self.pattern_library_path).with_suffix(".lsh.json"))
+        self.fuzzy_match_threshold = 0.5
         
         # RCA metrics
         self.rca_count = 0
@@ -184,6 +189,7 @@ class RCAEngine(ReflectiveModule):
             "successful_fixes": self.successful_fixes,
             "pattern_library_size": len(self.pattern_library),
             "pattern_matches": self.pattern_matches,
+            "lsh_indexed_patterns": len(self.pattern_lsh_index),
             "average_analysis_time": self.total_analysis_time / max(1, self.rca_count),
             "degradation_active": self._degradation_active
         }
@@ -447,6 +453,13 @@ class RCAEngine(ReflectiveModule):
                             matching_patterns.append(pattern)
                             self.pattern_matches += 1
                             
+            # Near-duplicate lookup catches small variations in the error message
+            exact_ids = {pattern.pattern_id for pattern in matching_patterns}
+            for pattern, _ in self.find_similar_patterns(failure):
+                if pattern.pattern_id not in exact_ids and self._verify_pattern_match(failure, pattern):
+                    matching_patterns.append(pattern)
+                    self.pattern_matches += 1
+                    
             match_time = time.time() - start_time
             self.logger.info(f"Pattern matching completed in {match_time:.3f}s, found {len(matching_patterns)} matches")
             
@@ -460,6 +473,21 @@ class RCAEngine(ReflectiveModule):
             self.logger.error(f"Pattern matching failed: {e}")
             return []
             
+    def find_similar_patterns(self, failure: Failure, limit: int = 10,
+                              min_similarity: Optional[float] = None) -> List[Tuple[PreventionPattern, float]]:
+        """
+        Ranked near-duplicate patterns by error message similarity (MinHash LSH)
+        """
+        threshold = self.fuzzy_match_threshold if min_similarity is None else min_similarity
+        message = signature_error_message(self._generate_failure_signature(failure))
+        
+        similar_patterns = []
+        for pattern_id, similarity in self.pattern_lsh_index.query(message, limit=limit, min_similarity=threshold):
+            pattern = self.pattern_library.get(pattern_id)
+            if pattern is not None:
+                similar_patterns.append((pattern, similarity))
+        return similar_patterns
+        
     # Test-specific analysis methods for Requirements 4.1, 4.2, 4.3, 4.4, 5.1, 5.2, 5.3, 5.4
     
     def analyze_test_failure_categorization(self, failure: Failure) -> Dict[str, Any]:
@@ -1021,6 +1049,30 @@ class RCAEngine(ReflectiveModule):
         
     def _add_pattern_to_library(self, pattern: PreventionPattern):
         """Add pattern to library with hash-based indexing for fast lookup"""
+        self._index_pattern(pattern)
+        
+        # Add to near-duplicate index for fuzzy lookup
+        self.pattern_lsh_index.add(
+            pattern.pattern_id, signature_error_message(pattern.failure_signature), pattern.pattern_hash
+        )
+        
+        # Append to the pattern store; the full library is only rewritten on compaction
+        try:
+            self.pattern_store.append(asdict(pattern))
+        except Exception as e:
+            self.logger.error(f"Failed to append pattern to library: {e}")
+            
+        if self.pattern_store.needs_compaction():
+            self._save_pattern_library()
+            
+    def _index_pattern(self, pattern: PreventionPattern):
+        """Store pattern and add it to the hash index, replacing any previous version"""
+        previous = self.pattern_library.get(pattern.pattern_id)
+        if previous is not None and previous.pattern_hash in self.pattern_index:
+            pattern_ids = self.pattern_index[previous.pattern_hash]
+            if pattern.pattern_id in pattern_ids:
+                pattern_ids.remove(pattern.pattern_id)
+                
         self.pattern_library[pattern.pattern_id] = pattern
         
         # Add to hash index for fast lookup (DR3: <1 second matching)
@@ -1028,9 +1080,6 @@ class RCAEngine(ReflectiveModule):
             self.pattern_index[pattern.pattern_hash] = []
         self.pattern_index[pattern.pattern_hash].append(pattern.pattern_id)
         
-        # Save pattern library
-        self._save_pattern_library()
-        
     def _verify_pattern_match(self, failure: Failure, pattern: PreventionPattern) -> bool:
         """Verify if failure matches existing pattern"""
         failure_signature = self._generate_failure_signature(failure)
@@ -1056,54 +1105,42 @@ class RCAEngine(ReflectiveModule):
         return (analysis_confidence + root_cause_confidence + validation_confidence) / 3
         
     def _load_pattern_library(self):
-        """Load existing pattern library from disk"""
+        """Load existing pattern library from disk (snapshot plus append-only log)"""
         try:
-            if Path(self.pattern_library_path).exists():
-                with open(self.pattern_library_path, 'r') as f:
-                    data = json.load(f)
-                    
-                for pattern_data in data.get('patterns', []):
-                    pattern = PreventionPattern(**pattern_data)
-                    self.pattern_library[pattern.pattern_id] = pattern
-                    
-                    # Build hash index
-                    if pattern.pattern_hash not in self.pattern_index:
-                        self.pattern_index[pattern.pattern_hash] = []
-                    self.pattern_index[pattern.pattern_hash].append(pattern.pattern_id)
-                    
+            # Stream records; later log records replace earlier versions
+            for pattern_data in self.pattern_store.load():
+                self._index_pattern(PreventionPattern(**pattern_data))
+                
+            if self.pattern_library:
                 self.logger.info(f"Loaded {len(self.pattern_library)} patterns from library")
+                
+                if self.pattern_store.needs_compaction():
+                    self._save_pattern_library()
+                self._load_pattern_lsh_index()
         except Exception as e:
             self.logger.warning(f"Failed to load pattern library: {e}")
             
+    def _load_pattern_lsh_index(self):
+        """Load persisted LSH signatures and index any patterns missing from them"""
+        loaded = self.pattern_lsh_index.load(self.pattern_lsh_index_path)
+        computed = self.pattern_lsh_index.sync(
+            (pattern.pattern_id, signature_error_message(pattern.failure_signature), pattern.pattern_hash)
+            for pattern in self.pattern_library.values()
+        )
+        
+        if computed or not loaded:
+            self.pattern_lsh_index.save(self.pattern_lsh_index_path)
+        self.logger.info(f"LSH index ready with {len(self.pattern_lsh_index)} patterns ({computed} rebuilt)")
+            
     def _save_pattern_library(self):
-        """Save pattern library to disk"""
+        """Compact pattern library to disk (atomic snapshot rewrite, log truncated)"""
         try:
-            # Ensure directory exists
-            Path(self.pattern_library_path).parent.mkdir(parents=True, exist_ok=True)
-            
             # Convert patterns to serializable format
-            patterns_data = []
-            for pattern in self.pattern_library.values():
-                patterns_data.append({
-                    'pattern_id': pattern.pattern_id,
-                    'pattern_name': pattern.pattern_name,
-                    'failure_signature': pattern.failure_signature,
-                    'root_cause_pattern': pattern.root_cause_pattern,
-                    'prevention_steps': pattern.prevention_steps,
-                    'detection_criteria': pattern.detection_criteria,
-                    'automated_checks': pattern.automated_checks,
-                    'pattern_hash': pattern.pattern_hash
-                })
-                
-            data = {
-                'patterns': patterns_data,
-                'last_updated': datetime.now().isoformat(),
-                'pattern_count': len(patterns_data)
-            }
+            patterns_data = [asdict(pattern) for pattern in self.pattern_library.values()]
+            self.pattern_store.compact(patterns_data)
+            
+            self.pattern_lsh_index.save(self.pattern_lsh_index_path)
             
-            with open(self.pattern_library_path, 'w') as f:
-                json.dump(data, f, indent=2)
-                
         except Exception as e:
             self.logger.error(f"Failed to save pattern library: {e}")
             
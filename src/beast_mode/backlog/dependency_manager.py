@@ -6,16 +6,17 @@ providing dependency declaration, validation, cycle detection, and critical path
 with performance optimization to meet the <500ms constraint.
 """
 
-from typing import Dict, List, Set, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Set, Optional, Tuple, Any
 from dataclasses import dataclass, field
+from collections import deque
 from datetime import datetime, timedelta
 import time
-from collections import defaultdict, deque
 import logging
 
 from ..core.reflective_module import ReflectiveModule, HealthStatus
 from .models import DependencySpec, BacklogItem
 from .enums import DependencyType, RiskLevel, StrategicTrack
+from .dynamic_topological_order import DynamicTopologicalOrder
 
 
 @dataclass(frozen=True)
@@ -63,6 +64,19 @@ class DependencyResult:
     validation_errors: List[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class BulkDependencyResult:
+    """Result of a bulk dependency import"""
+    declared_count: int
+    rejected: List[DependencyResult]
+    circular_dependencies: CircularDependencyReport
+    import_time_ms: float
+    
+    @property
+    def success(self) -> bool:
+        return not self.rejected
+
+
 @dataclass(frozen=True)
 class GraphValidationResult:
     """Result of dependency graph validation"""
@@ -93,6 +107,10 @@ class BacklogDependencyManager(ReflectiveModule):
         self._cache_timestamp: float = 0.0
         self._cache_ttl: float = 300.0  # 5 minutes
         
+        # Live graph with incrementally maintained topological order (target -> source)
+        self._dependency_order = DynamicTopologicalOrder()
+        self._dependency_order_stale = False
+        
         # Performance tracking
         self._operation_times: List[float] = []
         self._max_operation_history = 100
@@ -227,11 +245,17 @@ class BacklogDependencyManager(ReflectiveModule):
                     validation_errors=validation_errors
                 )
             
-            # Check for circular dependency before adding
-            temp_deps = self._dependencies.copy()
-            temp_deps[dependency_spec.dependency_id] = dependency_spec
-            
-            if self._would_create_cycle(item_id, dependency_spec.target_item_id, temp_deps):
+            # Check for circular dependency on the affected region of the maintained order
+            self._ensure_dependency_order()
+            previous_spec = self._dependencies.get(dependency_spec.dependency_id)
+            previous_edge = self._dependency_edge(previous_spec) if previous_spec else None
+            new_edge = self._dependency_edge(dependency_spec)
+            
+            if previous_edge:
+                self._dependency_order.remove_edge(*previous_edge)
+            if new_edge and not self._dependency_order.add_edge(*new_edge):
+                if previous_edge:
+                    self._dependency_order.add_edge(*previous_edge)
                 return DependencyResult(
                     success=False,
                     dependency_id=dependency_spec.dependency_id,
@@ -239,9 +263,9 @@ class BacklogDependencyManager(ReflectiveModule):
                     validation_errors=[f"Adding dependency from {item_id} to {dependency_spec.target_item_id} would create a cycle"]
                 )
             
-            # Add the dependency
+            # Add the dependency; the order stays valid, only the graph snapshot is stale
             self._dependencies[dependency_spec.dependency_id] = dependency_spec
-            self._invalidate_cache()
+            self._graph_cache = None
             
             self.logger.info(f"Dependency declared: {dependency_spec.dependency_id}")
             
@@ -262,6 +286,136 @@ class BacklogDependencyManager(ReflectiveModule):
         finally:
             self._record_operation_time(time.time() - start_time)
             
+    def declare_dependencies(self, dependency_specs: Iterable[DependencySpec],
+                             replace_existing: bool = False) -> BulkDependencyResult:
+        """
+        Declare many dependencies at once with a single validation pass
+        
+        All specs are merged with the existing dependencies (or replace them) and
+        the combined graph is checked with one Tarjan SCC pass. Specs whose edge
+        lies inside a strongly connected component are rejected, every cycle is
+        reported together, and the graph is rebuilt once from the accepted specs.
+        
+        Args:
+            dependency_specs: Specifications to declare; later duplicates win
+            replace_existing: Drop all current dependencies first (full re-import)
+            
+        Returns:
+            BulkDependencyResult with accepted count, rejections and cycle report
+        """
+        start_time = time.time()
+        
+        try:
+            rejected = []
+            incoming: Dict[str, DependencySpec] = {}
+            for dependency_spec in dependency_specs:
+                if dependency_spec is None:
+                    rejected.append(DependencyResult(
+                        success=False,
+                        dependency_id="unknown",
+                        message="Dependency specification is missing"
+                    ))
+                    continue
+                validation_errors = self._validate_dependency_spec(dependency_spec)
+                if validation_errors:
+                    rejected.append(DependencyResult(
+                        success=False,
+                        dependency_id=dependency_spec.dependency_id,
+                        message="Dependency validation failed",
+                        validation_errors=validation_errors
+                    ))
+                    continue
+                incoming[dependency_spec.dependency_id] = dependency_spec
+            
+            merged = {} if replace_existing else dict(self._dependencies)
+            merged.update(incoming)
+            
+            # One SCC pass over the combined graph finds every cycle at once
+            edges: Dict[str, Set[str]] = {}
+            for dep_spec in merged.values():
+                edge = self._dependency_edge(dep_spec)
+                if edge:
+                    edges.setdefault(edge[0], set()).add(edge[1])
+            components = [scc for scc in self._find_strongly_connected_components(edges) if len(scc) > 1]
+            
+            component_of = {}
+            for index, component in enumerate(components):
+                for node in component:
+                    component_of[node] = index
+            
+            # Existing dependencies are acyclic, so dropping the incoming edges inside
+            # each component leaves an acyclic graph
+            restored = []
+            for dependency_id, dep_spec in incoming.items():
+                edge = self._dependency_edge(dep_spec)
+                if edge and edge[0] in component_of and component_of[edge[0]] == component_of.get(edge[1]):
+                    rejected.append(DependencyResult(
+                        success=False,
+                        dependency_id=dependency_id,
+                        message="Would create circular dependency",
+                        validation_errors=[f"Dependency {dependency_id} is part of a dependency cycle"]
+                    ))
+                    del merged[dependency_id]
+                    if not replace_existing and dependency_id in self._dependencies:
+                        restored.append(dependency_id)
+            
+            cycles = [self._extract_cycle(edges, component) for component in components]
+            detection_time = (time.time() - start_time) * 1000
+            circular_report = CircularDependencyReport(
+                cycles_found=cycles,
+                affected_items=set().union(*components) if components else set(),
+                resolution_suggestions=self._generate_cycle_resolution_suggestions(cycles),
+                detection_time_ms=detection_time
+            )
+            
+            # Rebuild the maintained order and the cached graph once. Rejected
+            # redeclarations keep their previous spec unless that closes a new cycle.
+            for dependency_id in restored:
+                merged[dependency_id] = self._dependencies[dependency_id]
+            order = DynamicTopologicalOrder.from_edges(
+                edge for edge in map(self._dependency_edge, merged.values()) if edge
+            )
+            if not order.acyclic:
+                for dependency_id in restored:
+                    del merged[dependency_id]
+                order = DynamicTopologicalOrder.from_edges(
+                    edge for edge in map(self._dependency_edge, merged.values()) if edge
+                )
+            
+            self._dependencies = merged
+            self._dependency_order = order
+            self._dependency_order_stale = False
+            self._graph_cache = self._build_dependency_graph()
+            self._cache_timestamp = time.time()
+            
+            declared_count = sum(1 for dependency_id in incoming if dependency_id in merged
+                                 and merged[dependency_id] is incoming[dependency_id])
+            self.logger.info(f"Bulk import declared {declared_count} dependencies, rejected {len(rejected)}")
+            
+            return BulkDependencyResult(
+                declared_count=declared_count,
+                rejected=rejected,
+                circular_dependencies=circular_report,
+                import_time_ms=(time.time() - start_time) * 1000
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Bulk dependency import failed: {str(e)}")
+            import_time = (time.time() - start_time) * 1000
+            
+            return BulkDependencyResult(
+                declared_count=0,
+                rejected=[DependencyResult(
+                    success=False,
+                    dependency_id="unknown",
+                    message=f"Internal error: {str(e)}"
+                )],
+                circular_dependencies=CircularDependencyReport([], set(), [], 0.0),
+                import_time_ms=import_time
+            )
+        finally:
+            self._record_operation_time(time.time() - start_time)
+            
     def validate_dependency_graph(self) -> GraphValidationResult:
         """
         Validate the entire dependency graph for consistency and cycles
@@ -438,37 +592,53 @@ class BacklogDependencyManager(ReflectiveModule):
         return self._graph_cache
         
     def _build_dependency_graph(self) -> DependencyGraph:
-        """Build dependency graph from current dependencies"""
-        nodes = set()
-        edges = defaultdict(set)
-        reverse_edges = defaultdict(set)
+        """Build dependency graph snapshot from the maintained dependency order"""
+        self._ensure_dependency_order()
+        order = self._dependency_order
         
-        # Extract item relationships from dependency specs
-        for dep_spec in self._dependencies.values():
-            # Find which item has this dependency by looking at the dependency ID pattern
-            # Assuming dependency_id format: "{source_item_id}_depends_on_{target_item_id}"
-            if "_depends_on_" in dep_spec.dependency_id:
-                source_item = dep_spec.dependency_id.split("_depends_on_")[0]
-                target_item = dep_spec.target_item_id
-                
-                nodes.add(source_item)
-                nodes.add(target_item)
-                
-                # source depends on target, so target -> source in dependency flow
-                edges[target_item].add(source_item)
-                reverse_edges[source_item].add(target_item)
+        nodes = set()
+        edges = {}
+        reverse_edges = {}
+        
+        # target -> source in dependency flow (source depends on target)
+        for node in order.nodes():
+            dependents = order.successors(node)
+            dependencies = order.predecessors(node)
+            if dependents:
+                edges[node] = set(dependents)
+            if dependencies:
+                reverse_edges[node] = set(dependencies)
+            if dependents or dependencies:
+                nodes.add(node)
         
         return DependencyGraph(
             nodes=nodes,
-            edges=dict(edges),
-            reverse_edges=dict(reverse_edges),
+            edges=edges,
+            reverse_edges=reverse_edges,
             dependency_specs=self._dependencies.copy()
         )
         
+    def _ensure_dependency_order(self):
+        """Rebuild the maintained order from the dependency specs after invalidation"""
+        if self._dependency_order_stale:
+            self._dependency_order = DynamicTopologicalOrder.from_edges(
+                edge for edge in map(self._dependency_edge, self._dependencies.values()) if edge
+            )
+            self._dependency_order_stale = False
+            
+    def _dependency_edge(self, dep_spec: DependencySpec) -> Optional[Tuple[str, str]]:
+        """Dependency flow edge (target -> source) for a spec"""
+        # Assuming dependency_id format: "{source_item_id}_depends_on_{target_item_id}"
+        if "_depends_on_" not in dep_spec.dependency_id:
+            return None
+        source_item = dep_spec.dependency_id.split("_depends_on_")[0]
+        return dep_spec.target_item_id, source_item
+        
     def _invalidate_cache(self):
-        """Invalidate the dependency graph cache"""
+        """Invalidate the dependency graph cache and the maintained order"""
         self._graph_cache = None
         self._cache_timestamp = 0.0
+        self._dependency_order_stale = True
         
     def _validate_dependency_spec(self, spec: DependencySpec) -> List[str]:
         """Validate a dependency specification"""
@@ -491,58 +661,6 @@ class BacklogDependencyManager(ReflectiveModule):
         
         return errors
         
-    def _would_create_cycle(self, source_item: str, target_item: str, temp_deps: Dict[str, DependencySpec]) -> bool:
-        """Check if adding a dependency would create a cycle"""
-        # Don't check for cycles if source and target are the same (handled elsewhere)
-        if source_item == target_item:
-            return False
-            
-        # Build temporary graph including the new dependency
-        temp_graph = self._build_temp_graph(temp_deps)
-        
-        # Add the new dependency edge: source depends on target, so target -> source
-        if target_item not in temp_graph:
-            temp_graph[target_item] = set()
-        temp_graph[target_item].add(source_item)
-        
-        # Check if there's already a path from source to target (which would create a cycle)
-        return self._has_path(temp_graph, source_item, target_item)
-        
-    def _build_temp_graph(self, temp_deps: Dict[str, DependencySpec]) -> Dict[str, Set[str]]:
-        """Build temporary graph for cycle detection"""
-        graph = defaultdict(set)
-        
-        for dep_spec in temp_deps.values():
-            if "_depends_on_" in dep_spec.dependency_id:
-                source_item = dep_spec.dependency_id.split("_depends_on_")[0]
-                target_item = dep_spec.target_item_id
-                graph[target_item].add(source_item)
-                
-        return dict(graph)
-        
-    def _has_path(self, graph: Dict[str, Set[str]], start: str, end: str) -> bool:
-        """Check if there's a path from start to end in the graph using BFS"""
-        if start == end:
-            return True
-            
-        visited = set()
-        queue = deque([start])
-        
-        while queue:
-            current = queue.popleft()
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            
-            for neighbor in graph.get(current, set()):
-                if neighbor == end:
-                    return True
-                if neighbor not in visited:
-                    queue.append(neighbor)
-                    
-        return False
-        
     def _find_cycles_dfs(self, graph: DependencyGraph) -> List[List[str]]:
         """Find all cycles in the dependency graph using DFS"""
         cycles = []
@@ -577,6 +695,70 @@ class BacklogDependencyManager(ReflectiveModule):
                 
         return cycles
         
+    def _find_strongly_connected_components(self, edges: Dict[str, Set[str]]) -> List[List[str]]:
+        """Tarjan's SCC algorithm (iterative, so long chains do not hit the recursion limit)"""
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        
+        for root in list(edges):
+            if root in index_of:
+                continue
+            index_of[root] = lowlink[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(edges.get(root, ())))]
+            
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index_of:
+                        index_of[neighbor] = lowlink[neighbor] = len(index_of)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(edges.get(neighbor, ()))))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+                        
+        return components
+        
+    def _extract_cycle(self, edges: Dict[str, Set[str]], component: List[str]) -> List[str]:
+        """Shortest cycle through the first node of a strongly connected component"""
+        members = set(component)
+        start = component[0]
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for neighbor in edges.get(node, ()):
+                if neighbor == start:
+                    cycle = [node]
+                    while parents[cycle[-1]] is not None:
+                        cycle.append(parents[cycle[-1]])
+                    cycle.reverse()
+                    return cycle + [start]
+                if neighbor in members and neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+        return component + [start]
+        
     def _find_orphaned_nodes(self, graph: DependencyGraph) -> Set[str]:
         """Find nodes with no dependencies or dependents"""
         orphaned = set()
@@ -606,9 +788,56 @@ class BacklogDependencyManager(ReflectiveModule):
         
     def _calculate_longest_path(self, graph: DependencyGraph, nodes: Set[str]) -> Tuple[List[str], timedelta]:
         """Calculate longest path through the dependency graph (critical path)"""
-        # Simplified implementation - in practice would use more sophisticated algorithms
-        # For now, return the longest chain of dependencies
+        self._ensure_dependency_order()
+        order = self._dependency_order.topological_order()
+        if order is None:
+            # Cyclic graph (only reachable through direct edits); no topological order to reuse
+            return self._calculate_longest_path_by_search(graph, nodes)
+            
+        durations = self._dependency_durations()
+        
+        # Longest (duration, length) chain ending at each node, in maintained topological order
+        best: Dict[str, Tuple[timedelta, int, Optional[str]]] = {}
+        for node in order:
+            if node not in nodes:
+                continue
+            best_duration, best_length, best_predecessor = timedelta(0), 1, None
+            for dependency in graph.get_dependencies(node):
+                if dependency not in best:
+                    continue
+                duration, length, _ = best[dependency]
+                candidate = (duration + durations.get((dependency, node), timedelta(days=1)), length + 1)
+                if candidate > (best_duration, best_length):
+                    best_duration, best_length, best_predecessor = candidate[0], candidate[1], dependency
+            best[node] = (best_duration, best_length, best_predecessor)
+            
+        if not best:
+            return [], timedelta(0)
+            
+        end_node = max(best, key=lambda node: best[node][:2])
+        longest_path = []
+        node = end_node
+        while node is not None:
+            longest_path.append(node)
+            node = best[node][2]
+        longest_path.reverse()
+        
+        return longest_path, best[end_node][0]
+        
+    def _dependency_durations(self) -> Dict[Tuple[str, str], timedelta]:
+        """Estimated duration per dependency flow edge, computed in one pass over the specs"""
+        durations = {}
+        now = datetime.now()
+        
+        for dep_spec in self._dependencies.values():
+            edge = self._dependency_edge(dep_spec)
+            if edge and dep_spec.estimated_completion and edge not in durations:
+                durations[edge] = dep_spec.estimated_completion - now
+                
+        return durations
         
+    def _calculate_longest_path_by_search(self, graph: DependencyGraph, nodes: Set[str]) -> Tuple[List[str], timedelta]:
+        """Longest chain by DFS from each starting point (fallback for cyclic graphs)"""
         longest_path = []
         max_duration = timedelta(0)
         
@@ -625,7 +854,7 @@ class BacklogDependencyManager(ReflectiveModule):
         
     def _find_longest_path_from_node(self, graph: DependencyGraph, start_node: str, valid_nodes: Set[str]) -> Tuple[List[str], timedelta]:
         """Find longest path from a specific starting node"""
-        # Simplified implementation
+        durations = self._dependency_durations()
         visited = set()
         path = [start_node]
         duration = timedelta(0)
@@ -642,7 +871,7 @@ class BacklogDependencyManager(ReflectiveModule):
             for dependent in graph.get_dependents(node):
                 if dependent in valid_nodes and dependent not in visited:
                     # Estimate duration based on dependency specs
-                    dep_duration = self._estimate_dependency_duration(node, dependent)
+                    dep_duration = durations.get((node, dependent), timedelta(days=1))
                     dfs_longest(dependent, current_path + [dependent], current_duration + dep_duration)
                     
             visited.remove(node)
@@ -650,20 +879,6 @@ class BacklogDependencyManager(ReflectiveModule):
             
         return dfs_longest(start_node, [start_node], timedelta(0))
         
-    def _estimate_dependency_duration(self, source: str, target: str) -> timedelta:
-        """Estimate duration for a dependency relationship"""
-        # Look for dependency spec that matches this relationship
-        for dep_spec in self._dependencies.values():
-            if (dep_spec.target_item_id == source and 
-                "_depends_on_" in dep_spec.dependency_id and
-                dep_spec.dependency_id.split("_depends_on_")[0] == target):
-                
-                if dep_spec.estimated_completion:
-                    return dep_spec.estimated_completion - datetime.now()
-                    
-        # Default estimate based on risk level
-        return timedelta(days=1)  # Default 1 day
-        
     def _identify_bottlenecks(self, graph: DependencyGraph, critical_path: List[str]) -> List[str]:
         """Identify bottleneck nodes in the critical path"""
         bottlenecks = []
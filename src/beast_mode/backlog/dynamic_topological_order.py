@@ -0,0 +1,184 @@
+"""
+DynamicTopologicalOrder - Incrementally maintained topological order
+
+This module implements the Pearce-Kelly dynamic topological sort for the
+backlog dependency graph. Inserting an edge u -> v that already agrees with
+the current order costs O(1); otherwise only the affected region between
+v and u in the order is searched and reordered, which both answers the cycle
+check and restores a valid order. Edge removals never invalidate the order.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class DynamicTopologicalOrder:
+    """
+    Directed graph with an incrementally maintained topological order
+
+    Features:
+    - Pearce-Kelly edge insertion with cycle detection on the affected region only
+    - O(1) insertion for edges consistent with the current order
+    - Edge multiplicity (the same edge may be declared by several specs)
+    - Degrades to plain reachability checks if built from a cyclic edge set
+    """
+
+    def __init__(self):
+        self._successors: Dict[str, Set[str]] = {}
+        self._predecessors: Dict[str, Set[str]] = {}
+        self._edge_counts: Dict[Tuple[str, str], int] = {}
+        self._order: List[str] = []          # position -> node
+        self._position: Dict[str, int] = {}  # node -> position
+        self.acyclic = True
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]]) -> "DynamicTopologicalOrder":
+        """Build from an edge list with one Kahn pass (cycles leave the order invalid)"""
+        graph = cls()
+        for source, target in edges:
+            graph._insert_edge(source, target)
+
+        in_degree = {node: len(preds) for node, preds in graph._predecessors.items()}
+        ready = deque(node for node in graph._order if in_degree[node] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor in graph._successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
+
+        if len(order) == len(graph._order):
+            graph._order = order
+            graph._position = {node: index for index, node in enumerate(order)}
+        else:
+            graph.acyclic = False
+        return graph
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._position
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add_node(self, node: str) -> None:
+        if node not in self._position:
+            self._position[node] = len(self._order)
+            self._order.append(node)
+            self._successors[node] = set()
+            self._predecessors[node] = set()
+
+    def add_edge(self, source: str, target: str) -> bool:
+        """
+        Insert edge source -> target, keeping the order topological
+
+        Returns False (leaving the graph unchanged) if the edge would close a cycle.
+        """
+        if source == target:
+            return False
+        if (source, target) in self._edge_counts:
+            self._edge_counts[(source, target)] += 1
+            return True
+
+        self.add_node(source)
+        self.add_node(target)
+
+        if self.acyclic:
+            lower, upper = self._position[target], self._position[source]
+            if lower < upper:
+                forward = self._forward_region(target, upper)
+                if forward is None:
+                    return False
+                backward = self._backward_region(source, lower)
+                self._reorder(backward, forward)
+        elif self.has_path(target, source):
+            return False
+
+        self._insert_edge(source, target)
+        return True
+
+    def remove_edge(self, source: str, target: str) -> None:
+        count = self._edge_counts.get((source, target), 0)
+        if count > 1:
+            self._edge_counts[(source, target)] = count - 1
+        elif count == 1:
+            del self._edge_counts[(source, target)]
+            self._successors[source].discard(target)
+            self._predecessors[target].discard(source)
+
+    def topological_order(self) -> Optional[List[str]]:
+        """Nodes in topological order, or None if the graph contains a cycle"""
+        return list(self._order) if self.acyclic else None
+
+    def successors(self, node: str) -> Set[str]:
+        return self._successors.get(node, set())
+
+    def predecessors(self, node: str) -> Set[str]:
+        return self._predecessors.get(node, set())
+
+    def nodes(self) -> List[str]:
+        return list(self._order)
+
+    def has_path(self, start: str, end: str) -> bool:
+        """Reachability check by BFS"""
+        if start == end:
+            return True
+        visited = {start}
+        queue = deque([start])
+        while queue:
+            for neighbor in self._successors.get(queue.popleft(), ()):
+                if neighbor == end:
+                    return True
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+        return False
+
+    # Pearce-Kelly helpers
+
+    def _insert_edge(self, source: str, target: str) -> None:
+        self.add_node(source)
+        self.add_node(target)
+        self._edge_counts[(source, target)] = self._edge_counts.get((source, target), 0) + 1
+        self._successors[source].add(target)
+        self._predecessors[target].add(source)
+
+    def _forward_region(self, start: str, upper: int) -> Optional[List[str]]:
+        """Nodes reachable from start with position < upper; None if the node at upper is reached"""
+        successors, positions = self._successors, self._position
+        visited = {start}
+        stack = [start]
+        while stack:
+            for successor in successors[stack.pop()]:
+                position = positions[successor]
+                if position < upper:
+                    if successor not in visited:
+                        visited.add(successor)
+                        stack.append(successor)
+                elif position == upper:
+                    return None
+        return list(visited)
+
+    def _backward_region(self, start: str, lower: int) -> List[str]:
+        """Nodes reaching start with position > lower"""
+        predecessors, positions = self._predecessors, self._position
+        visited = {start}
+        stack = [start]
+        while stack:
+            for predecessor in predecessors[stack.pop()]:
+                if positions[predecessor] > lower and predecessor not in visited:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+        return list(visited)
+
+    def _reorder(self, backward: List[str], forward: List[str]) -> None:
+        """Place the backward region before the forward region using their pooled positions"""
+        position_of = self._position
+        backward.sort(key=position_of.__getitem__)
+        forward.sort(key=position_of.__getitem__)
+        nodes = backward + forward
+        positions = sorted(map(position_of.__getitem__, nodes))
+        for node, position in zip(nodes, positions):
+            position_of[node] = position
+            self._order[position] = node
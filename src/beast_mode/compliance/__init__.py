@@ -6,6 +6,7 @@ and RM architectural compliance within the Beast Mode Framework.
 """
 
 from .orchestrator import ComplianceOrchestrator
+from .scan_engine import ComplianceScanEngine
 from .models import (
     ComplianceAnalysisResult,
     ComplianceIssue,
@@ -21,6 +22,7 @@ from .interfaces import (
 
 __all__ = [
     'ComplianceOrchestrator',
+    'ComplianceScanEngine',
     'ComplianceAnalysisResult',
     'ComplianceIssue', 
     'Phase2ValidationResult',
@@ -3,13 +3,20 @@ GitAnalyzer - Git analysis component for compliance checking.
 
 This module implements git repository analysis capabilities for the Beast Mode
 compliance checking system, including commit analysis and file change detection.
+
+Commit metadata, file changes and line counts for all commits ahead of main
+are read from a single streamed `git log --raw --numstat -z` invocation and
+cached on disk by commit hash, since commits are immutable.
 """
 
+import json
 import logging
 import subprocess
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 
 from ...core.reflective_module import ReflectiveModule
 from ..interfaces import ComplianceAnalyzer, ValidationContext
@@ -31,12 +38,18 @@ class GitAnalyzer(ReflectiveModule, ComplianceAnalyzer):
     by identifying the commits ahead of main and analyzing their content.
     """
     
-    def __init__(self, repository_path: str = "."):
+    # Commit record layout for the streamed git log (fields separated by NUL under -z)
+    LOG_RECORD_SEPARATOR = "\x1e"
+    LOG_FORMAT = "%x1e%H%x00%P%x00%an%x00%at%x00%s"
+    COMMIT_CACHE_VERSION = 1
+    
+    def __init__(self, repository_path: str = ".", commit_cache_path: Optional[str] = None):
         """
         Initialize the GitAnalyzer.
         
         Args:
             repository_path: Path to the git repository to analyze
+            commit_cache_path: Commit metadata cache file (default: inside the .git directory)
         """
         super().__init__("GitAnalyzer")
         self.repository_path = Path(repository_path).resolve()
@@ -47,9 +60,20 @@ class GitAnalyzer(ReflectiveModule, ComplianceAnalyzer):
             "target_branch": "main",
             "base_branch": "origin/master",
             "max_commits_to_analyze": 10,
-            "git_timeout": 30
+            "git_timeout": 30,
+            "commit_cache_size": 5000
         }
         
+        # Commit hash -> cached metadata (None for merge commits, which are skipped)
+        if commit_cache_path is not None:
+            self.commit_cache_path: Optional[Path] = Path(commit_cache_path)
+        elif (self.repository_path / ".git").is_dir():
+            self.commit_cache_path = self.repository_path / ".git" / "beast_mode" / "commit_cache.json"
+        else:
+            self.commit_cache_path = None
+        self._commit_cache: Optional["OrderedDict[str, Optional[Dict[str, Any]]]"] = None
+        self._commit_cache_dirty = False
+        
         self.logger.info(f"GitAnalyzer initialized for repository: {self.repository_path}")
     
     def get_commits_ahead_of_main(self, target_branch: str = "HEAD", base_branch: str = "origin/master") -> List[CommitInfo]:
@@ -80,12 +104,9 @@ class GitAnalyzer(ReflectiveModule, ComplianceAnalyzer):
                 )
                 commit_hashes = commit_hashes[:self._config["max_commits_to_analyze"]]
             
-            # Get detailed information for each commit
-            commits = []
-            for commit_hash in commit_hashes:
-                commit_info = self._get_commit_info(commit_hash)
-                if commit_info:
-                    commits.append(commit_info)
+            # Get detailed information for all commits from one git log stream
+            commits = list(self.iter_commit_info(commit_hashes))
+            self._save_commit_cache()
             
             self.logger.info(f"Successfully analyzed {len(commits)} commits ahead of {base_branch}")
             return commits
@@ -94,6 +115,37 @@ class GitAnalyzer(ReflectiveModule, ComplianceAnalyzer):
             self.logger.error(f"Error getting commits ahead of main: {str(e)}")
             raise
     
+    def iter_commit_info(self, commit_hashes: Iterable[str]) -> Iterator[CommitInfo]:
+        """
+        Yield CommitInfo for the given commits in order, skipping merge commits.
+        
+        Cached commits are served from the commit cache; the rest are parsed
+        incrementally from a single `git log` process as its output arrives.
+        
+        Args:
+            commit_hashes: Full commit hashes
+            
+        Returns:
+            Iterator of CommitInfo objects
+        """
+        cache = self._load_commit_cache()
+        commit_hashes = list(commit_hashes)
+        uncached = [commit_hash for commit_hash in commit_hashes if commit_hash not in cache]
+        stream = self._stream_commit_log(uncached) if uncached else iter(())
+        
+        for commit_hash in commit_hashes:
+            if commit_hash not in cache:
+                # git log emits records in stdin order, so read up to this commit
+                for record_hash, entry in stream:
+                    self._cache_commit(record_hash, entry)
+                    if record_hash == commit_hash:
+                        break
+            
+            entry = cache.get(commit_hash)
+            if entry is None:
+                continue
+            yield self._commit_info_from_entry(commit_hash, entry)
+    
     def analyze_file_changes(self, commits: Optional[List[CommitInfo]] = None) -> FileChangeAnalysis:
         """
         Analyze file changes across the provided commits or commits ahead of main.
@@ -418,8 +470,170 @@ class GitAnalyzer(ReflectiveModule, ComplianceAnalyzer):
             self.logger.error(f"Error getting commit info for {commit_hash}: {str(e)}")
             return None
     
+    def _stream_commit_log(self, commit_hashes: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Run one `git log` over the commits and yield (hash, cache entry) as records arrive."""
+        cmd = [
+            "git", "log",
+            "--no-walk=unsorted",  # exactly the given commits, in the given order
+            "--stdin",
+            "--raw",
+            "--numstat",
+            "-z",
+            f"--format={self.LOG_FORMAT}"
+        ]
+        
+        try:
+            process = subprocess.Popen(
+                cmd,
+                cwd=self.repository_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            self.logger.error(f"Failed to start git log: {str(e)}")
+            return
+        
+        # git reads all revisions from stdin before writing any output
+        process.stdin.write("".join(f"{commit_hash}\n" for commit_hash in commit_hashes).encode())
+        process.stdin.close()
+        
+        timer = threading.Timer(self._config["git_timeout"], process.kill)
+        timer.start()
+        try:
+            chunks = iter(lambda: process.stdout.read1(65536), b"")
+            yield from self._parse_commit_log_stream(chunks)
+        finally:
+            timer.cancel()
+            process.stdout.close()
+            stderr = process.stderr.read().decode("utf-8", errors="replace")
+            process.stderr.close()
+            if process.wait() != 0:
+                self.logger.error(f"Git log failed for commits ahead of main: {stderr}")
+    
+    def _parse_commit_log_stream(self, chunks: Iterable[bytes]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Split raw `git log` output into commit records as chunks arrive."""
+        separator = self.LOG_RECORD_SEPARATOR.encode()
+        buffer = b""
+        for chunk in chunks:
+            buffer += chunk
+            *records, buffer = buffer.split(separator)
+            for record in records:
+                if record:
+                    yield self._parse_commit_record(record.decode("utf-8", errors="replace"))
+        if buffer:
+            yield self._parse_commit_record(buffer.decode("utf-8", errors="replace"))
+    
+    def _parse_commit_record(self, record: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Parse one commit record: header fields, then -z raw and numstat entries.
+        
+        Returns the commit hash and its cache entry (None for merge commits).
+        """
+        fields = record.split("\0")
+        commit_hash, parents, author, timestamp_str, message = fields[:5]
+        if len(parents.split()) > 1:
+            return commit_hash, None
+        
+        entry = {
+            "author": author,
+            "timestamp": int(timestamp_str),
+            "message": message,
+            "added_files": [],
+            "modified_files": [],
+            "deleted_files": [],
+            "lines_added": 0,
+            "lines_deleted": 0
+        }
+        
+        tokens = [token.lstrip("\n") for token in fields[5:]]
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            i += 1
+            if token.startswith(":"):
+                # ":old_mode new_mode old_sha new_sha status" then the path(s)
+                status = token.split()[-1]
+                if status[0] in ("R", "C"):
+                    new_path = tokens[i + 1]
+                    i += 2
+                    if status[0] == "R":  # Renamed files are treated as modified
+                        entry["modified_files"].append(new_path)
+                    continue
+                file_path = tokens[i]
+                i += 1
+                if status == "A":
+                    entry["added_files"].append(file_path)
+                elif status == "M":
+                    entry["modified_files"].append(file_path)
+                elif status == "D":
+                    entry["deleted_files"].append(file_path)
+            elif "\t" in token:
+                # "added\tdeleted\tpath", or "added\tdeleted\t" followed by old and new paths
+                added, deleted, file_path = token.split("\t", 2)
+                if not file_path:
+                    i += 2
+                entry["lines_added"] += int(added) if added != "-" else 0
+                entry["lines_deleted"] += int(deleted) if deleted != "-" else 0
+        
+        return commit_hash, entry
+    
+    @staticmethod
+    def _commit_info_from_entry(commit_hash: str, entry: Dict[str, Any]) -> CommitInfo:
+        return CommitInfo(
+            commit_hash=commit_hash,
+            author=entry["author"],
+            timestamp=datetime.fromtimestamp(entry["timestamp"]),
+            message=entry["message"],
+            modified_files=list(entry["modified_files"]),
+            added_files=list(entry["added_files"]),
+            deleted_files=list(entry["deleted_files"])
+        )
+    
+    def _load_commit_cache(self) -> "OrderedDict[str, Optional[Dict[str, Any]]]":
+        """Commit cache, loaded from disk on first use."""
+        if self._commit_cache is not None:
+            return self._commit_cache
+        
+        self._commit_cache = OrderedDict()
+        if self.commit_cache_path is None or not self.commit_cache_path.exists():
+            return self._commit_cache
+        try:
+            with open(self.commit_cache_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get("version") == self.COMMIT_CACHE_VERSION:
+                self._commit_cache.update(payload.get("commits", {}))
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable commit cache {self.commit_cache_path}: {str(e)}")
+        return self._commit_cache
+    
+    def _cache_commit(self, commit_hash: str, entry: Optional[Dict[str, Any]]) -> None:
+        cache = self._load_commit_cache()
+        cache[commit_hash] = entry
+        cache.move_to_end(commit_hash)
+        while len(cache) > self._config["commit_cache_size"]:
+            cache.popitem(last=False)
+        self._commit_cache_dirty = True
+    
+    def _save_commit_cache(self) -> None:
+        if not self._commit_cache_dirty or self.commit_cache_path is None:
+            return
+        try:
+            self.commit_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.commit_cache_path.with_suffix(".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.COMMIT_CACHE_VERSION, "commits": self._commit_cache}, f)
+            temp_path.replace(self.commit_cache_path)
+            self._commit_cache_dirty = False
+        except OSError as e:
+            self.logger.warning(f"Failed to save commit cache {self.commit_cache_path}: {str(e)}")
+    
     def _get_commit_line_changes(self, commit_hash: str) -> Tuple[int, int]:
         """Get the number of lines added and deleted in a commit."""
+        entry = self._load_commit_cache().get(commit_hash)
+        if entry is not None:
+            return entry["lines_added"], entry["lines_deleted"]
+        
         try:
             cmd = [
                 "git", "show", 
@@ -329,9 +329,38 @@ class ComplianceOrchestrator(ReflectiveModule):
         return RMComplianceStatus()
     
     def _validate_test_coverage(self, context: ValidationContext) -> TestCoverageStatus:
-        """Validate test coverage against baseline."""
-        # Placeholder - will be implemented in test coverage validation task
-        return TestCoverageStatus()
+        """
+        Validate test coverage against baseline.
+        
+        With a registered GitAnalyzer only the tests affected by the changes
+        ahead of main are run and merged into the stored coverage baseline.
+        """
+        validator = self._validators.get("TestCoverageValidator")
+        if validator is None:
+            return TestCoverageStatus()
+        
+        file_changes = None
+        git_analyzer = self._analyzers.get("GitAnalyzer")
+        if git_analyzer is not None:
+            try:
+                file_changes = git_analyzer.analyze_file_changes()
+            except Exception as e:
+                self.logger.warning(f"File change analysis failed, running full coverage analysis: {str(e)}")
+        
+        if file_changes is not None:
+            coverage_result = validator.analyze_changes(file_changes)
+        else:
+            coverage_result = validator.analyze_coverage()
+        
+        report = coverage_result.coverage_report
+        return TestCoverageStatus(
+            current_coverage=report.overall_coverage,
+            baseline_coverage=report.baseline_coverage,
+            coverage_adequate=coverage_result.meets_baseline,
+            failing_tests=[test.test_name for test in report.failing_tests],
+            missing_tests=list(report.missing_test_files),
+            issues=coverage_result.issues
+        )
     
     def _reconcile_task_completion(self, context: ValidationContext) -> TaskReconciliationStatus:
         """Reconcile task completion claims with actual implementation."""
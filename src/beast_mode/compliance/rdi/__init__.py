@@ -8,6 +8,8 @@ development practices are maintained according to RDI methodology.
 from .requirement_tracer import RequirementTracer, RequirementReference, RequirementDefinition, TraceabilityResult
 from .design_validator import DesignValidator, DesignComponent, ImplementationComponent, ComponentType, AlignmentResult
 from .test_coverage_validator import TestCoverageValidator, TestFile, FailingTest, CoverageReport, TestType, TestCoverageResult
+from .suite_execution import SuiteExecutor, SuiteExecutionResult, SuiteOutcome
+from .impact_index import TestImpactIndex
 
 __all__ = [
     'RequirementTracer',
@@ -24,5 +26,9 @@ __all__ = [
     'FailingTest',
     'CoverageReport',
     'TestType',
-    'TestCoverageResult'
+    'TestCoverageResult',
+    'SuiteExecutor',
+    'SuiteExecutionResult',
+    'SuiteOutcome',
+    'TestImpactIndex'
 ]
\ No newline at end of file
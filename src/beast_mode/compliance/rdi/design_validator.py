@@ -14,6 +14,7 @@ from enum import Enum
 
 from ..interfaces import ComplianceValidator
 from ..models import ComplianceIssue, ComplianceIssueType, IssueSeverity
+from ...utils.project_walker import ProjectWalker
 
 
 class ComponentType(Enum):
@@ -133,6 +134,22 @@ class DesignValidator(ComplianceValidator):
         
         return self._analyze_alignment()
     
+    def analyze_components(self, implementation_components: Dict[str, ImplementationComponent]) -> AlignmentResult:
+        """
+        Analyze alignment of implementation components that were already collected.
+        
+        Args:
+            implementation_components: Components parsed from the analyzed files
+            
+        Returns:
+            Detailed alignment analysis results
+        """
+        if self.design_cache is None:
+            self.design_cache = self._load_design_components()
+        
+        self.implementation_cache = implementation_components
+        return self._analyze_alignment()
+    
     def _load_design_components(self) -> Dict[str, DesignComponent]:
         """
         Load all design components from design documents.
@@ -389,7 +406,7 @@ class DesignValidator(ComplianceValidator):
         if target_path.is_file() and target_path.suffix == '.py':
             files_to_analyze = [target_path]
         else:
-            files_to_analyze = list(target_path.glob('**/*.py'))
+            files_to_analyze = ProjectWalker(target_path, extensions={'.py'}).walk()
         
         for py_file in files_to_analyze:
             try:
@@ -0,0 +1,347 @@
+"""
+Test impact index for change-scoped compliance runs.
+
+This module maps each source file to the tests that execute it, built from
+per-test coverage contexts (pytest-cov --cov-context=test), and keeps the
+per-file line coverage and failing tests of the last measured run as a
+baseline. Given the files changed on a branch, only the affected test files
+need to run; their results are merged back into the baseline. A baseline is
+only reused when its commit is an ancestor of HEAD, and together with the
+branch changes every file changed since that commit is treated as changed.
+"""
+
+import fnmatch
+import json
+import logging
+import subprocess
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .suite_execution import SuiteExecutionResult, SuiteOutcome
+
+
+logger = logging.getLogger(__name__)
+
+
+# Changes to these can affect any test, so they always trigger a full run
+FULL_RUN_PATTERNS = [
+    "conftest.py",
+    "pytest.ini",
+    "setup.cfg",
+    "setup.py",
+    "tox.ini",
+    "pyproject.toml",
+    ".coveragerc",
+    "requirements*.txt",
+]
+
+INDEX_FILE_NAME = "test_impact_index.json"
+
+
+def default_index_path(repository_path: Path) -> Optional[Path]:
+    """Index location inside the git directory, so it never shows up as a working tree change."""
+    try:
+        git_dir = subprocess.run(
+            ["git", "rev-parse", "--git-common-dir"],
+            capture_output=True, text=True, cwd=repository_path, timeout=30, check=True
+        ).stdout.strip()
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if not git_dir:
+        return None
+    return (Path(repository_path) / git_dir / "beast_mode" / INDEX_FILE_NAME).resolve()
+
+
+def changes_since_commit(repository_path: Path, commit: Optional[str]) -> Optional[Tuple[Set[str], Set[str]]]:
+    """
+    Files changed and deleted between commit and the working tree (untracked files included).
+
+    Returns None when commit is unknown or not an ancestor of HEAD (e.g. an
+    index built on another branch), since such a baseline can't be diffed
+    against reliably.
+    """
+    if not commit:
+        return None
+    try:
+        is_ancestor = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", commit, "HEAD"],
+            capture_output=True, text=True, cwd=repository_path, timeout=30
+        )
+        if is_ancestor.returncode != 0:
+            return None
+        diff = subprocess.run(
+            ["git", "diff", "--name-status", "--no-renames", "-z", commit],
+            capture_output=True, text=True, cwd=repository_path, timeout=60, check=True
+        ).stdout
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+            capture_output=True, text=True, cwd=repository_path, timeout=60, check=True
+        ).stdout
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+    changed, deleted = set(), set()
+    fields = diff.split("\0")
+    for status, path in zip(fields[0::2], fields[1::2]):
+        (deleted if status.startswith("D") else changed).add(path)
+    changed.update(path for path in untracked.split("\0") if path)
+    return changed, deleted
+
+
+class TestImpactIndex:
+    """
+    Source file -> tests mapping with a persisted coverage baseline.
+
+    Features:
+    - Built from the per-test contexts of a full coverage run
+    - Selects the test files affected by a set of changed files
+    - Merges a partial run's coverage and outcomes into the baseline
+    - JSON persistence between runs
+    """
+
+    VERSION = 1
+
+    def __init__(self, coverage_source: str = "src"):
+        self.coverage_source = coverage_source
+        self.commit: Optional[str] = None
+        self.tests: Dict[str, str] = {}                 # nodeid -> test file
+        self.source_to_tests: Dict[str, Set[str]] = {}  # source file -> nodeids
+        self.files: Dict[str, Dict[str, List[int]]] = {}  # source file -> executed/missing lines
+        self.failing: Dict[str, Dict[str, str]] = {}    # nodeid -> outcome details
+
+    @property
+    def has_baseline(self) -> bool:
+        return bool(self.files)
+
+    # Selection
+
+    @staticmethod
+    def is_test_file(path: str) -> bool:
+        posix_path = PurePosixPath(path)
+        return posix_path.suffix == ".py" and (
+            "tests" in posix_path.parts[:-1]
+            or posix_path.name.startswith("test_")
+            or posix_path.name.endswith("_test.py")
+        )
+
+    def is_source_file(self, path: str) -> bool:
+        """Whether a path is a Python file under the measured coverage source."""
+        source = PurePosixPath(self.coverage_source).as_posix().rstrip("/")
+        return path.endswith(".py") and (source in ("", ".") or path.startswith(source + "/"))
+
+    def select_test_files(
+        self,
+        changed_files: Iterable[str],
+        deleted_files: Iterable[str] = ()
+    ) -> Optional[Set[str]]:
+        """
+        Test files affected by the changed and deleted files.
+
+        Returns None when a full run is required: no baseline, a change to
+        shared test configuration such as conftest.py, or a changed source
+        file the baseline never measured (e.g. a new module), whose tests
+        are unknown.
+        """
+        if not self.has_baseline:
+            return None
+
+        deleted_files = {PurePosixPath(path).as_posix() for path in deleted_files}
+        selected = set()
+        for path in list(changed_files) + sorted(deleted_files):
+            path = PurePosixPath(path).as_posix()
+            name = PurePosixPath(path).name
+            if any(fnmatch.fnmatch(name, pattern) for pattern in FULL_RUN_PATTERNS):
+                return None
+            if self.is_test_file(path):
+                selected.add(path)
+            elif path.endswith(".py"):
+                if path not in self.files and path not in deleted_files and self.is_source_file(path):
+                    logger.info(f"{path} is not in the test impact index; running the full suite")
+                    return None
+                selected.update(self.tests[nodeid] for nodeid in self.source_to_tests.get(path, ()))
+        return selected
+
+    # Building and merging
+
+    def rebuild(self, suite_result: SuiteExecutionResult, commit: Optional[str] = None) -> None:
+        """Replace the index and baseline with a full run's results."""
+        self.tests.clear()
+        self.source_to_tests.clear()
+        self.files.clear()
+        self.failing.clear()
+        self._add_outcomes(suite_result.outcomes or [])
+        for file_path, file_data in self._coverage_files(suite_result).items():
+            self.files[file_path] = self._line_data(file_data)
+            self._add_contexts(file_path, file_data)
+        self.commit = commit
+
+    def merge(
+        self,
+        suite_result: Optional[SuiteExecutionResult],
+        ran_test_files: Iterable[str],
+        changed_files: Iterable[str],
+        deleted_files: Iterable[str] = (),
+        commit: Optional[str] = None
+    ) -> None:
+        """
+        Merge a run of ran_test_files into the baseline.
+
+        Coverage of changed source files is replaced by the new measurement
+        (their line numbers may have moved); other files keep their baseline
+        lines plus any newly executed ones. suite_result is None when no test
+        was affected, in which case only deleted files are dropped.
+        """
+        ran_test_files = set(ran_test_files)
+        changed_files = {PurePosixPath(path).as_posix() for path in changed_files}
+        deleted_files = {PurePosixPath(path).as_posix() for path in deleted_files}
+
+        # Forget tests that were re-run or deleted; the new run re-adds what still exists
+        stale_files = ran_test_files | deleted_files
+        stale_tests = {nodeid for nodeid, test_file in self.tests.items() if test_file in stale_files}
+        for nodeid in stale_tests:
+            del self.tests[nodeid]
+            self.failing.pop(nodeid, None)
+        if stale_tests:
+            for source_file in list(self.source_to_tests):
+                remaining = self.source_to_tests[source_file] - stale_tests
+                if remaining:
+                    self.source_to_tests[source_file] = remaining
+                else:
+                    del self.source_to_tests[source_file]
+
+        for deleted_file in deleted_files:
+            self.files.pop(deleted_file, None)
+            self.source_to_tests.pop(deleted_file, None)
+
+        if suite_result is not None:
+            self._add_outcomes(suite_result.outcomes or [])
+            for file_path, file_data in self._coverage_files(suite_result).items():
+                measured = self._line_data(file_data)
+                baseline = self.files.get(file_path)
+                if baseline is None or file_path in changed_files:
+                    self.files[file_path] = measured
+                else:
+                    executed = set(baseline["executed_lines"]) | set(measured["executed_lines"])
+                    statements = executed | set(baseline["missing_lines"])
+                    self.files[file_path] = {
+                        "executed_lines": sorted(executed),
+                        "missing_lines": sorted(statements - executed)
+                    }
+                self._add_contexts(file_path, file_data)
+        if commit is not None:
+            self.commit = commit
+
+    def _add_outcomes(self, outcomes: List[SuiteOutcome]) -> None:
+        for outcome in outcomes:
+            self.tests[outcome.nodeid] = outcome.file
+            if outcome.outcome in ("failed", "error"):
+                self.failing[outcome.nodeid] = {
+                    "file": outcome.file,
+                    "outcome": outcome.outcome,
+                    "message": outcome.message,
+                    "details": outcome.details
+                }
+
+    def _add_contexts(self, file_path: str, file_data: Dict[str, Any]) -> None:
+        for contexts in file_data.get("contexts", {}).values():
+            for context in contexts:
+                # Contexts look like "tests/test_x.py::TestX::test_y|run"; "" is import time
+                nodeid = context.rsplit("|", 1)[0]
+                if nodeid:
+                    self.tests.setdefault(nodeid, nodeid.split("::", 1)[0])
+                    self.source_to_tests.setdefault(file_path, set()).add(nodeid)
+
+    @staticmethod
+    def _coverage_files(suite_result: SuiteExecutionResult) -> Dict[str, Dict[str, Any]]:
+        coverage_json = suite_result.coverage_json or {}
+        return {
+            PurePosixPath(Path(file_path).as_posix()).as_posix(): file_data
+            for file_path, file_data in coverage_json.get("files", {}).items()
+        }
+
+    @staticmethod
+    def _line_data(file_data: Dict[str, Any]) -> Dict[str, List[int]]:
+        return {
+            "executed_lines": sorted(file_data.get("executed_lines", [])),
+            "missing_lines": sorted(file_data.get("missing_lines", []))
+        }
+
+    # Baseline views
+
+    def coverage_data(self) -> Dict[str, Any]:
+        """Baseline coverage in TestCoverageValidator's coverage data format."""
+        total_lines = 0
+        covered_lines = 0
+        file_coverage = {}
+        for file_path, lines in self.files.items():
+            file_covered = len(lines["executed_lines"])
+            file_total = file_covered + len(lines["missing_lines"])
+            total_lines += file_total
+            covered_lines += file_covered
+            file_coverage[file_path] = {
+                "total_lines": file_total,
+                "covered_lines": file_covered,
+                "coverage_percent": (file_covered / file_total * 100) if file_total > 0 else 100.0
+            }
+
+        return {
+            "overall_coverage": (covered_lines / total_lines * 100) if total_lines > 0 else 0.0,
+            "total_lines": total_lines,
+            "covered_lines": covered_lines,
+            "file_coverage": file_coverage
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "commit": self.commit,
+            "tests": len(self.tests),
+            "source_files": len(self.files),
+            "mapped_source_files": len(self.source_to_tests),
+            "failing_tests": len(self.failing)
+        }
+
+    # Persistence
+
+    def save(self, path: Path) -> bool:
+        payload = {
+            "version": self.VERSION,
+            "coverage_source": self.coverage_source,
+            "commit": self.commit,
+            "tests": self.tests,
+            "source_to_tests": {source: sorted(tests) for source, tests in self.source_to_tests.items()},
+            "files": self.files,
+            "failing": self.failing
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            temp_path.replace(path)
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to save test impact index to {path}: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: Optional[Path], coverage_source: str = "src") -> "TestImpactIndex":
+        """Load a saved index; returns an empty index if missing, unreadable or incompatible."""
+        index = cls(coverage_source)
+        if path is None or not path.exists():
+            return index
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load test impact index from {path}: {e}")
+            return index
+
+        if payload.get("version") != cls.VERSION or payload.get("coverage_source") != coverage_source:
+            return index
+
+        index.commit = payload.get("commit")
+        index.tests = dict(payload.get("tests", {}))
+        index.source_to_tests = {source: set(tests) for source, tests in payload.get("source_to_tests", {}).items()}
+        index.files = dict(payload.get("files", {}))
+        index.failing = dict(payload.get("failing", {}))
+        return index
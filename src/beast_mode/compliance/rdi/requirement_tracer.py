@@ -13,6 +13,7 @@ from dataclasses import dataclass
 
 from ..interfaces import ComplianceValidator
 from ..models import ComplianceIssue, ComplianceIssueType, IssueSeverity
+from ...utils.project_walker import ProjectWalker
 
 
 @dataclass
@@ -211,6 +212,20 @@ class RequirementTracer(ComplianceValidator):
         """
         # Find all requirement references in code
         requirement_references = self._find_requirement_references(target_path)
+        return self.analyze_references(requirement_references)
+    
+    def analyze_references(self, requirement_references: List[RequirementReference]) -> TraceabilityResult:
+        """
+        Analyze traceability of references that were already collected.
+        
+        Args:
+            requirement_references: References found in the analyzed files
+            
+        Returns:
+            Traceability analysis results
+        """
+        if self.requirements_cache is None:
+            self.requirements_cache = self._load_requirements()
         
         # Group references by requirement ID
         referenced_requirements = set()
@@ -261,19 +276,21 @@ class RequirementTracer(ComplianceValidator):
         # Define file patterns to search
         search_patterns = ['**/*.py', '**/*.md', '**/*.rst', '**/*.txt']
         
-        for pattern in search_patterns:
-            if target_path.is_file():
-                files_to_search = [target_path] if target_path.match(pattern.replace('**/', '')) else []
-            else:
-                files_to_search = list(target_path.glob(pattern))
-            
-            for file_path in files_to_search:
-                try:
-                    file_references = self._find_references_in_file(file_path)
-                    references.extend(file_references)
-                except Exception as e:
-                    # Log error but continue processing
-                    print(f"Warning: Failed to process file {file_path}: {e}")
+        if target_path.is_file():
+            matches = any(target_path.match(pattern.replace('**/', '')) for pattern in search_patterns)
+            files_to_search = [target_path] if matches else []
+        else:
+            # One walk for all extensions instead of one glob per pattern
+            extensions = {pattern.replace('**/*', '') for pattern in search_patterns}
+            files_to_search = ProjectWalker(target_path, extensions=extensions).walk()
+        
+        for file_path in files_to_search:
+            try:
+                file_references = self._find_references_in_file(file_path)
+                references.extend(file_references)
+            except Exception as e:
+                # Log error but continue processing
+                print(f"Warning: Failed to process file {file_path}: {e}")
         
         return references
     
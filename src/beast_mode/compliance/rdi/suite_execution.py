@@ -0,0 +1,376 @@
+"""
+Shared test suite execution for RDI compliance validation.
+
+This module runs the test suite once and produces both the coverage data and
+the per-test outcomes that TestCoverageValidator needs. Reports are written to
+a private temporary directory, so concurrent validations never overwrite each
+other, and the parsed result is memoized per repository state (HEAD commit
+plus the size and mtime of every changed or untracked file) so every validator
+in a compliance run shares it.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Optional pytest plugins, detected without importing them
+PYTEST_COV_AVAILABLE = importlib.util.find_spec("pytest_cov") is not None
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+
+@dataclass
+class SuiteOutcome:
+    """Outcome of a single test in a suite run."""
+    nodeid: str
+    file: str
+    outcome: str  # passed, failed, error, skipped
+    message: str = ""
+    details: str = ""
+
+
+@dataclass
+class SuiteExecutionResult:
+    """Coverage and per-test outcomes from one suite run."""
+    coverage_data: Optional[Dict[str, Any]]
+    outcomes: Optional[List[SuiteOutcome]]
+    returncode: Optional[int]
+    duration_seconds: float
+    state_key: Optional[str] = None
+    error: Optional[str] = None
+    workers: Optional[str] = None
+    coverage_json: Optional[Dict[str, Any]] = None  # raw report, with per-test contexts if collected
+    selection: Optional[List[str]] = None
+
+    @property
+    def failed(self) -> List[SuiteOutcome]:
+        return [outcome for outcome in self.outcomes or [] if outcome.outcome in ("failed", "error")]
+
+
+@dataclass
+class _MemoSlot:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    result: Optional[SuiteExecutionResult] = None
+
+
+class SuiteExecutor:
+    """
+    Runs the test suite once per repository state and shares the result.
+
+    Coverage is collected with pytest-cov and per-test outcomes come from
+    pytest's built-in JUnit XML report. With pytest-xdist installed the suite
+    runs on parallel workers. Concurrent callers asking for the same state
+    wait for the single in-progress run instead of starting another. Runs that
+    time out or fail to start are not memoized, and only the most recent
+    max_memoized_states states are kept.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 300,
+        workers: Optional[str] = "auto",
+        use_coverage: Optional[bool] = None,
+        coverage_source: str = "src",
+        max_memoized_states: int = 16
+    ):
+        """
+        Initialize the SuiteExecutor.
+
+        Args:
+            timeout: Timeout for a suite run in seconds
+            workers: xdist worker count ("auto", a number, or None to run serially)
+            use_coverage: Collect coverage (default: when pytest-cov is installed)
+            coverage_source: Package or directory passed to --cov
+            max_memoized_states: Suite results kept (least recently used dropped first)
+        """
+        self.timeout = timeout
+        self.workers = workers
+        self.use_coverage = PYTEST_COV_AVAILABLE if use_coverage is None else use_coverage
+        self.coverage_source = coverage_source
+
+        self.max_memoized_states = max_memoized_states
+        self._memo: "OrderedDict[Tuple, _MemoSlot]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self.runs = 0
+        self.memo_hits = 0
+
+    def run(
+        self,
+        repository_path: Path,
+        tests_path: Path,
+        selection: Optional[Sequence[str]] = None,
+        collect_contexts: bool = False
+    ) -> SuiteExecutionResult:
+        """
+        Run the suite for tests_path, reusing a result for the same repository state.
+
+        Args:
+            repository_path: Repository root (working directory for pytest)
+            tests_path: Test directory or file to run
+            selection: Run only these test files / node ids instead of tests_path
+            collect_contexts: Record which tests executed each line (--cov-context=test)
+
+        Returns:
+            Suite execution result
+        """
+        repository_path = Path(repository_path).resolve()
+        selection = sorted(selection) if selection is not None else None
+        state_key = self._repository_state_key(repository_path)
+        if state_key is None:
+            # Not a git repository: no stable state to memoize against
+            return self._execute(repository_path, tests_path, None, selection, collect_contexts)
+
+        memo_key = (
+            str(repository_path), str(tests_path), state_key,
+            tuple(selection) if selection is not None else None, collect_contexts
+        )
+        with self._memo_lock:
+            slot = self._memo.setdefault(memo_key, _MemoSlot())
+            self._memo.move_to_end(memo_key)
+            while len(self._memo) > self.max_memoized_states:
+                self._memo.popitem(last=False)
+
+        with slot.lock:
+            if slot.result is not None:
+                self.memo_hits += 1
+                return slot.result
+            result = self._execute(repository_path, tests_path, state_key, selection, collect_contexts)
+            if result.error is None:
+                slot.result = result
+            else:
+                # Timeouts and launch failures are retried on the next request
+                with self._memo_lock:
+                    if self._memo.get(memo_key) is slot:
+                        del self._memo[memo_key]
+            return result
+
+    def clear(self) -> None:
+        with self._memo_lock:
+            self._memo.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "memo_hits": self.memo_hits,
+            "memoized_states": len(self._memo),
+            "coverage_enabled": self.use_coverage,
+            "parallel_workers": self.workers if XDIST_AVAILABLE else None
+        }
+
+    def _repository_state_key(self, repository_path: Path) -> Optional[str]:
+        """
+        HEAD commit plus a digest of the working tree changes, or None outside git.
+
+        The porcelain status alone does not change when an already modified
+        file is edited again, so the digest also covers the size and mtime of
+        every changed or untracked file.
+        """
+        try:
+            head, _, toplevel = subprocess.run(
+                ["git", "rev-parse", "HEAD", "--show-toplevel"],
+                capture_output=True, text=True, cwd=repository_path, timeout=30, check=True
+            ).stdout.strip().partition("\n")
+            status = subprocess.run(
+                ["git", "status", "--porcelain", "-z", "--untracked-files=all"],
+                capture_output=True, text=True, cwd=repository_path, timeout=60, check=True
+            ).stdout
+        except (subprocess.SubprocessError, OSError):
+            return None
+        if not head or not toplevel:
+            return None
+
+        # Porcelain paths are relative to the top of the work tree
+        digest = hashlib.sha1(status.encode('utf-8'))
+        for path in self._changed_paths(status):
+            try:
+                stat = os.stat(os.path.join(toplevel, path))
+                digest.update(f"\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode('utf-8'))
+            except OSError:
+                digest.update(f"\0{path}\0missing".encode('utf-8'))
+        return f"{head}:{digest.hexdigest()}"
+
+    @staticmethod
+    def _changed_paths(porcelain_z: str) -> List[str]:
+        """Paths in `git status --porcelain -z` output (renames yield the new path)."""
+        paths = []
+        entries = iter(porcelain_z.split('\0'))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            paths.append(entry[3:])
+            if entry[0] in 'RC':
+                next(entries, None)  # Original path of a rename or copy
+        return paths
+
+    def _build_command(
+        self,
+        tests_path: Path,
+        report_dir: Path,
+        selection: Optional[List[str]] = None,
+        coverage_config: Optional[Path] = None
+    ) -> List[str]:
+        command = [
+            sys.executable, '-m', 'pytest',
+            '--tb=short',
+            '-q',
+            '-p', 'no:cacheprovider',
+            f"--junitxml={report_dir / 'junit.xml'}",
+            '-o', 'junit_family=xunit1',  # xunit1 records each test's file
+        ]
+        if self.use_coverage:
+            command.extend([
+                f"--cov={self.coverage_source}",
+                f"--cov-report=json:{report_dir / 'coverage.json'}",
+            ])
+            if coverage_config is not None:
+                command.extend(['--cov-context=test', f"--cov-config={coverage_config}"])
+        if self.workers and XDIST_AVAILABLE:
+            command.extend(['-n', str(self.workers)])
+        command.extend(selection if selection is not None else [str(tests_path)])
+        return command
+
+    @staticmethod
+    def _write_context_config(repository_path: Path, report_dir: Path) -> Path:
+        """Coverage config that keeps the project's .coveragerc and adds per-test contexts to the JSON report."""
+        project_config = repository_path / '.coveragerc'
+        config_text = project_config.read_text(encoding='utf-8') if project_config.exists() else ''
+        if '[json]' in config_text:
+            config_text = config_text.replace('[json]', '[json]\nshow_contexts = True', 1)
+        else:
+            config_text += '\n[json]\nshow_contexts = True\n'
+        config_path = report_dir / 'coveragerc'
+        config_path.write_text(config_text, encoding='utf-8')
+        return config_path
+
+    def _execute(
+        self,
+        repository_path: Path,
+        tests_path: Path,
+        state_key: Optional[str],
+        selection: Optional[List[str]] = None,
+        collect_contexts: bool = False
+    ) -> SuiteExecutionResult:
+        start_time = time.time()
+        self.runs += 1
+
+        with tempfile.TemporaryDirectory(prefix="beast_mode_suite_") as temp_dir:
+            report_dir = Path(temp_dir)
+            env = dict(os.environ)
+            # Keep coverage's data files out of the repository as well
+            env["COVERAGE_FILE"] = str(report_dir / ".coverage")
+            coverage_config = (
+                self._write_context_config(repository_path, report_dir)
+                if collect_contexts and self.use_coverage else None
+            )
+
+            try:
+                result = subprocess.run(
+                    self._build_command(tests_path, report_dir, selection, coverage_config),
+                    capture_output=True,
+                    text=True,
+                    cwd=repository_path,
+                    timeout=self.timeout,
+                    env=env
+                )
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
+                return SuiteExecutionResult(
+                    coverage_data=None,
+                    outcomes=None,
+                    returncode=None,
+                    duration_seconds=time.time() - start_time,
+                    state_key=state_key,
+                    error=str(e),
+                    selection=selection
+                )
+
+            coverage_json = self._load_coverage_json(report_dir / 'coverage.json')
+            return SuiteExecutionResult(
+                coverage_data=self._parse_coverage(coverage_json),
+                outcomes=self._parse_junit(report_dir / 'junit.xml', repository_path),
+                returncode=result.returncode,
+                duration_seconds=time.time() - start_time,
+                state_key=state_key,
+                workers=self.workers if XDIST_AVAILABLE else None,
+                coverage_json=coverage_json,
+                selection=selection
+            )
+
+    @staticmethod
+    def _load_coverage_json(coverage_json_path: Path) -> Optional[Dict[str, Any]]:
+        if not coverage_json_path.exists():
+            return None
+        try:
+            with open(coverage_json_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _parse_coverage(coverage_json: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Coverage data in TestCoverageValidator's format, or None if no report."""
+        if coverage_json is None:
+            return None
+
+        totals = coverage_json.get('totals', {})
+        return {
+            'overall_coverage': totals.get('percent_covered', 0.0),
+            'total_lines': totals.get('num_statements', 0),
+            'covered_lines': totals.get('covered_lines', 0),
+            'file_coverage': coverage_json.get('files', {})
+        }
+
+    @staticmethod
+    def _parse_junit(junit_path: Path, repository_path: Path) -> Optional[List[SuiteOutcome]]:
+        """Per-test outcomes from a JUnit XML report, or None if no report."""
+        if not junit_path.exists():
+            return None
+        try:
+            root = ET.parse(junit_path).getroot()
+        except (OSError, ET.ParseError):
+            return None
+
+        outcomes = []
+        for testcase in root.iter('testcase'):
+            file_path = testcase.get('file', '')
+            classname = testcase.get('classname', '')
+            name = testcase.get('name', '')
+
+            # classname is the dotted module path followed by any test classes
+            module = file_path[:-3].replace('/', '.').replace(os.sep, '.') if file_path.endswith('.py') else ''
+            if module and classname.startswith(module):
+                nested = [part for part in classname[len(module):].split('.') if part]
+                nodeid = "::".join([file_path] + nested + [name])
+            else:
+                nodeid = "::".join(part for part in (file_path or classname, name) if part)
+
+            outcome, message, details = 'passed', '', ''
+            for child in testcase:
+                if child.tag in ('failure', 'error', 'skipped'):
+                    outcome = {'failure': 'failed', 'error': 'error', 'skipped': 'skipped'}[child.tag]
+                    message = child.get('message', '')
+                    details = child.text or ''
+                    break
+
+            outcomes.append(SuiteOutcome(
+                nodeid=nodeid,
+                file=file_path,
+                outcome=outcome,
+                message=message,
+                details=details
+            ))
+        return outcomes
+
+
+# Shared by all validators (e.g. every TestCoverageValidator registered with a ComplianceOrchestrator)
+default_suite_executor = SuiteExecutor()
@@ -7,16 +7,17 @@ and specific analysis for failing tests identified in Phase 2.
 
 import re
 import os
-import subprocess
-import json
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 from ..interfaces import ComplianceValidator
-from ..models import ComplianceIssue, ComplianceIssueType, IssueSeverity
+from ..models import ComplianceIssue, ComplianceIssueType, IssueSeverity, FileChangeAnalysis
+from .suite_execution import SuiteExecutor, SuiteExecutionResult, default_suite_executor
+from .impact_index import TestImpactIndex, changes_since_commit, default_index_path
 from ...utils.path_normalizer import safe_relative_to
+from ...utils.project_walker import ProjectWalker
 
 
 class TestType(Enum):
@@ -84,17 +85,27 @@ class TestCoverageValidator(ComplianceValidator):
     4. Missing test files are identified
     """
     
-    def __init__(self, repository_path: str, baseline_coverage: float = 96.7):
+    def __init__(
+        self,
+        repository_path: str,
+        baseline_coverage: float = 96.7,
+        suite_executor: Optional[SuiteExecutor] = None,
+        impact_index_path: Optional[str] = None
+    ):
         """
         Initialize the TestCoverageValidator.
         
         Args:
             repository_path: Path to the repository root
             baseline_coverage: Baseline coverage percentage to validate against
+            suite_executor: Test suite runner (defaults to the shared, memoizing executor)
+            impact_index_path: Test impact index file (defaults to one inside the git directory)
         """
         self.repository_path = Path(repository_path)
         self.baseline_coverage = baseline_coverage
         self.coverage_cache: Optional[CoverageReport] = None
+        self.suite_executor = suite_executor or default_suite_executor
+        self.impact_index_path = Path(impact_index_path) if impact_index_path else None
         
         # Known failing tests from Phase 2 lessons learned
         self.known_failing_tests = [
@@ -149,6 +160,92 @@ class TestCoverageValidator(ComplianceValidator):
         
         return self._analyze_coverage()
     
+    def analyze_changes(
+        self,
+        file_changes: FileChangeAnalysis,
+        target_path: Optional[str] = None
+    ) -> TestCoverageResult:
+        """
+        Coverage analysis that only runs the tests affected by file_changes.
+        
+        Uses the persisted test impact index to select the test files that
+        exercise the changed files and merges their coverage and outcomes into
+        the stored baseline. Files changed since the baseline's commit count
+        as changed too. The full suite runs and rebuilds the index when there
+        is no baseline, the baseline commit is not an ancestor of HEAD, shared
+        test configuration changed, or a changed source file is not indexed.
+        
+        Args:
+            file_changes: Changes on the branch (e.g. from GitAnalyzer.analyze_file_changes)
+            target_path: Specific path to analyze, or None for full repository
+            
+        Returns:
+            Detailed coverage analysis results
+        """
+        analysis_path = Path(target_path) if target_path else self.repository_path
+        index_path = self.impact_index_path or default_index_path(self.repository_path)
+        index = TestImpactIndex.load(index_path, self.suite_executor.coverage_source)
+        
+        changed_files = set(file_changes.files_added) | set(file_changes.files_modified)
+        deleted_files = set(file_changes.files_deleted)
+        since_baseline = changes_since_commit(self.repository_path, index.commit) if index.has_baseline else None
+        if since_baseline is None:
+            # No baseline, or one measured on a commit this branch doesn't contain
+            selection = None
+        else:
+            changed_files |= since_baseline[0]
+            deleted_files |= since_baseline[1]
+            # Deleted against main but recreated since: the file exists, so it is a change
+            changed_files |= {path for path in deleted_files if (self.repository_path / path).exists()}
+            deleted_files = {path for path in deleted_files if path not in changed_files}
+            selection = index.select_test_files(changed_files, deleted_files)
+        changed_files = sorted(changed_files)
+        deleted_files = sorted(deleted_files)
+        
+        if selection is not None:
+            # Deleted test files can't be run; their tests are dropped by the merge
+            selection = sorted(path for path in selection if (self.repository_path / path).exists())
+        
+        suite_result = None
+        if selection is None or selection:
+            suite_result = self.suite_executor.run(
+                self.repository_path, self._tests_path(analysis_path),
+                selection=selection, collect_contexts=True
+            )
+            if suite_result.coverage_json is None:
+                print(f"Change-scoped coverage unavailable: {suite_result.error or 'no coverage report produced'}")
+                self.coverage_cache = None
+                return self.analyze_coverage(target_path)
+        
+        if selection is None:
+            index.rebuild(suite_result, self._commit_of(suite_result))
+        else:
+            index.merge(
+                suite_result, selection, changed_files, deleted_files,
+                self._commit_of(suite_result) if suite_result else None
+            )
+        
+        if index_path is not None:
+            index.save(index_path)
+        
+        failing_tests = [
+            FailingTest(
+                test_name=nodeid,
+                test_file=failure["file"],
+                error_message=failure["message"] or failure["details"],
+                error_type='test_failure' if failure["outcome"] == 'failed' else 'test_error',
+                stack_trace=failure["details"],
+                requirements_covered=[]
+            )
+            for nodeid, failure in sorted(index.failing.items())
+        ]
+        self.coverage_cache = self._build_coverage_report(analysis_path, index.coverage_data(), failing_tests)
+        return self._analyze_coverage()
+    
+    @staticmethod
+    def _commit_of(suite_result: SuiteExecutionResult) -> Optional[str]:
+        return suite_result.state_key.split(":", 1)[0] if suite_result.state_key else None
+    
     def _generate_coverage_report(self, target_path: Path) -> CoverageReport:
         """
         Generate comprehensive coverage report.
@@ -162,12 +259,31 @@ class TestCoverageValidator(ComplianceValidator):
         # Try to run coverage analysis
         coverage_data = self._run_coverage_analysis(target_path)
         
-        # Find test files
-        test_files = self._find_test_files(target_path)
-        
         # Identify failing tests
         failing_tests = self._identify_failing_tests(target_path)
         
+        return self._build_coverage_report(target_path, coverage_data, failing_tests)
+    
+    def _build_coverage_report(
+        self,
+        target_path: Path,
+        coverage_data: Dict[str, Any],
+        failing_tests: List[FailingTest]
+    ) -> CoverageReport:
+        """
+        Assemble a coverage report from coverage data and failing tests.
+        
+        Args:
+            target_path: Path to analyze
+            coverage_data: Coverage analysis data
+            failing_tests: Failing tests with details
+            
+        Returns:
+            Comprehensive coverage report
+        """
+        # Find test files
+        test_files = self._find_test_files(target_path)
+        
         # Find missing test files
         missing_test_files = self._find_missing_test_files(target_path)
         
@@ -191,6 +307,25 @@ class TestCoverageValidator(ComplianceValidator):
             uncovered_modules=uncovered_modules
         )
     
+    def _execute_test_suite(self, target_path: Path) -> SuiteExecutionResult:
+        """
+        Run the test suite once for coverage and per-test outcomes.
+        
+        The result is shared through the suite executor, so coverage analysis
+        and failing test identification don't each run the suite.
+        
+        Args:
+            target_path: Path to analyze
+            
+        Returns:
+            Suite execution result
+        """
+        return self.suite_executor.run(self.repository_path, self._tests_path(target_path))
+    
+    @staticmethod
+    def _tests_path(target_path: Path) -> Path:
+        return target_path / 'tests' if (target_path / 'tests').exists() else Path('tests')
+    
     def _run_coverage_analysis(self, target_path: Path) -> Dict[str, Any]:
         """
         Run coverage analysis using pytest-cov or coverage.py.
@@ -201,48 +336,14 @@ class TestCoverageValidator(ComplianceValidator):
         Returns:
             Coverage data dictionary
         """
-        coverage_data = {
-            'overall_coverage': 0.0,
-            'total_lines': 0,
-            'covered_lines': 0,
-            'file_coverage': {}
-        }
+        suite_result = self._execute_test_suite(target_path)
         
-        try:
-            # Try to run pytest with coverage
-            result = subprocess.run([
-                'python', '-m', 'pytest', 
-                '--cov=src',
-                '--cov-report=json',
-                '--cov-report=term-missing',
-                str(target_path / 'tests') if (target_path / 'tests').exists() else 'tests'
-            ], 
-            capture_output=True, 
-            text=True, 
-            cwd=self.repository_path,
-            timeout=300
-            )
-            
-            # Look for coverage.json file
-            coverage_json_path = self.repository_path / 'coverage.json'
-            if coverage_json_path.exists():
-                with open(coverage_json_path, 'r') as f:
-                    coverage_json = json.load(f)
-                    
-                coverage_data['overall_coverage'] = coverage_json.get('totals', {}).get('percent_covered', 0.0)
-                coverage_data['total_lines'] = coverage_json.get('totals', {}).get('num_statements', 0)
-                coverage_data['covered_lines'] = coverage_json.get('totals', {}).get('covered_lines', 0)
-                coverage_data['file_coverage'] = coverage_json.get('files', {})
-                
-                # Clean up the coverage file
-                coverage_json_path.unlink()
-            
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
+        if suite_result.coverage_data is None:
             # Fallback to manual analysis if coverage tools fail
-            print(f"Coverage analysis failed: {e}")
-            coverage_data = self._manual_coverage_analysis(target_path)
+            print(f"Coverage analysis failed: {suite_result.error or 'no coverage report produced'}")
+            return self._manual_coverage_analysis(target_path)
         
-        return coverage_data
+        return suite_result.coverage_data
     
     def _manual_coverage_analysis(self, target_path: Path) -> Dict[str, Any]:
         """
@@ -255,8 +356,8 @@ class TestCoverageValidator(ComplianceValidator):
             Coverage data dictionary
         """
         # Find all Python source files
-        src_files = list(self.repository_path.glob('src/**/*.py'))
-        test_files = list(self.repository_path.glob('tests/**/*.py'))
+        src_files = list(ProjectWalker(self.repository_path / 'src', extensions={'.py'}).walk())
+        test_files = list(ProjectWalker(self.repository_path / 'tests', extensions={'.py'}).walk())
         
         total_lines = 0
         covered_lines = 0
@@ -345,10 +446,9 @@ class TestCoverageValidator(ComplianceValidator):
         
         # Find test files
         test_patterns = ['**/test_*.py', '**/tests.py', '**/*_test.py']
-        found_files = []
-        
-        for pattern in test_patterns:
-            found_files.extend(self.repository_path.glob(pattern))
+        found_files = ProjectWalker(
+            self.repository_path, patterns=[pattern.replace('**/', '') for pattern in test_patterns]
+        ).walk()
         
         for test_file in found_files:
             try:
@@ -438,46 +538,21 @@ class TestCoverageValidator(ComplianceValidator):
             List of failing tests with details
         """
         failing_tests = []
+        suite_result = self._execute_test_suite(target_path)
         
-        try:
-            # Run pytest to identify failing tests
-            result = subprocess.run([
-                'python', '-m', 'pytest', 
-                '--tb=short',
-                '--json-report',
-                '--json-report-file=test_report.json',
-                str(target_path / 'tests') if (target_path / 'tests').exists() else 'tests'
-            ], 
-            capture_output=True, 
-            text=True, 
-            cwd=self.repository_path,
-            timeout=300
-            )
-            
-            # Parse test report
-            report_path = self.repository_path / 'test_report.json'
-            if report_path.exists():
-                with open(report_path, 'r') as f:
-                    test_report = json.load(f)
-                
-                # Extract failing tests
-                for test in test_report.get('tests', []):
-                    if test.get('outcome') == 'failed':
-                        failing_tests.append(FailingTest(
-                            test_name=test.get('nodeid', ''),
-                            test_file=test.get('file', ''),
-                            error_message=test.get('call', {}).get('longrepr', ''),
-                            error_type='test_failure',
-                            stack_trace=test.get('call', {}).get('longrepr', ''),
-                            requirements_covered=[]  # Would need to be extracted from test
-                        ))
-                
-                # Clean up report file
-                report_path.unlink()
-            
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
+        if suite_result.outcomes is not None:
+            for outcome in suite_result.failed:
+                failing_tests.append(FailingTest(
+                    test_name=outcome.nodeid,
+                    test_file=outcome.file,
+                    error_message=outcome.message or outcome.details,
+                    error_type='test_failure' if outcome.outcome == 'failed' else 'test_error',
+                    stack_trace=outcome.details,
+                    requirements_covered=[]  # Would need to be extracted from test
+                ))
+        else:
             # Fallback to known failing tests
-            print(f"Test execution failed: {e}")
+            print(f"Test execution failed: {suite_result.error or 'no test report produced'}")
             for test_name in self.known_failing_tests:
                 failing_tests.append(FailingTest(
                     test_name=test_name,
@@ -503,8 +578,8 @@ class TestCoverageValidator(ComplianceValidator):
         missing_test_files = []
         
         # Find all source files
-        src_files = list(self.repository_path.glob('src/**/*.py'))
-        test_files = list(self.repository_path.glob('tests/**/*.py'))
+        src_files = list(ProjectWalker(self.repository_path / 'src', extensions={'.py'}).walk())
+        test_files = list(ProjectWalker(self.repository_path / 'tests', extensions={'.py'}).walk())
         
         for src_file in src_files:
             # Skip __init__.py files
@@ -6,5 +6,6 @@ according to Beast Mode Framework standards.
 """
 
 from .rm_validator import RMValidator
+from .module_analysis import ModuleAnalysisCache, ModuleAnalysis, ModuleSummary
 
-__all__ = ['RMValidator']
\ No newline at end of file
+__all__ = ['RMValidator', 'ModuleAnalysisCache', 'ModuleAnalysis', 'ModuleSummary']
\ No newline at end of file
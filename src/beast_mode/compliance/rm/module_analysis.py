@@ -0,0 +1,210 @@
+"""
+Parse-once module analysis shared by the RM compliance checks.
+
+Each module is read and parsed once per version of the file: the source, its
+line counts, the AST and a summary collected by a single visitor pass (class
+definitions and their method sets, function and import counts, control-flow
+nesting depth) are cached by path and invalidated when the file's mtime, size
+or inode changes.
+"""
+
+import ast
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Statements that count towards control-flow nesting depth
+NESTING_NODES = (ast.If, ast.For, ast.While, ast.With)
+
+
+@dataclass
+class ClassSummary:
+    """A class definition and the methods defined directly in its body."""
+    name: str
+    lineno: int
+    base_names: List[str]
+    methods: Set[str]
+
+    @property
+    def is_reflective_module(self) -> bool:
+        return 'ReflectiveModule' in self.base_names
+
+
+@dataclass
+class ModuleSummary:
+    """Structural facts about a module collected in one AST pass."""
+    classes: List[ClassSummary] = field(default_factory=list)
+    function_names: Set[str] = field(default_factory=set)
+    function_count: int = 0
+    import_count: int = 0
+    imports: List[str] = field(default_factory=list)
+    max_nesting_depth: int = 0
+
+    @property
+    def class_count(self) -> int:
+        return len(self.classes)
+
+    @property
+    def rm_classes(self) -> List[ClassSummary]:
+        return [class_summary for class_summary in self.classes if class_summary.is_reflective_module]
+
+
+@dataclass
+class ModuleAnalysis:
+    """Cached source, AST and summary of one module version."""
+    path: str
+    source: str
+    total_lines: int
+    code_lines: int  # non-empty, non-comment lines
+    tree: Optional[ast.AST]
+    summary: Optional[ModuleSummary]
+    parse_error: Optional[SyntaxError] = None
+
+    def require_summary(self) -> ModuleSummary:
+        """Summary of the module; raises the parse error for invalid Python."""
+        if self.summary is None:
+            raise self.parse_error
+        return self.summary
+
+
+class _SummaryVisitor(ast.NodeVisitor):
+    """Collects a ModuleSummary in a single traversal."""
+
+    def __init__(self, summary: ModuleSummary):
+        self.summary = summary
+        self._nesting = 0  # depth of the enclosing chain of directly nested control statements
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if isinstance(node, NESTING_NODES):
+            self._nesting += 1
+            self.summary.max_nesting_depth = max(self.summary.max_nesting_depth, self._nesting)
+            self._visit_children(node)
+            self._nesting -= 1
+        else:
+            # Only directly nested control statements extend a nesting chain
+            nesting, self._nesting = self._nesting, 0
+            self._visit_children(node)
+            self._nesting = nesting
+
+    def _visit_children(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        base_names = []
+        for base in node.bases:
+            if isinstance(base, ast.Name):
+                base_names.append(base.id)
+            elif isinstance(base, ast.Attribute):
+                # Handle cases like module.ReflectiveModule
+                base_names.append(base.attr)
+        self.summary.classes.append(ClassSummary(
+            name=node.name,
+            lineno=node.lineno,
+            base_names=base_names,
+            methods={child.name for child in node.body if isinstance(child, ast.FunctionDef)}
+        ))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.summary.function_names.add(node.name)
+        self.summary.function_count += 1
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.summary.import_count += 1
+        self.summary.imports.extend(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.summary.import_count += 1
+        self.summary.imports.append('.' * node.level + (node.module or ''))
+
+
+def analyze_source(path: str, source: str) -> ModuleAnalysis:
+    """Parse source and summarize it; syntax errors are kept on the analysis."""
+    lines = source.split('\n')
+    analysis = ModuleAnalysis(
+        path=path,
+        source=source,
+        total_lines=len(source.splitlines()),
+        code_lines=sum(1 for line in lines if line.strip() and not line.strip().startswith('#')),
+        tree=None,
+        summary=None
+    )
+    try:
+        analysis.tree = ast.parse(source)
+    except SyntaxError as e:
+        analysis.parse_error = e
+        return analysis
+
+    analysis.summary = ModuleSummary()
+    _SummaryVisitor(analysis.summary).visit(analysis.tree)
+    return analysis
+
+
+class ModuleAnalysisCache:
+    """
+    LRU cache of ModuleAnalysis keyed by path.
+
+    An entry is reused while the file's (mtime_ns, size, inode) is unchanged,
+    so every check of a module version shares one read and one parse.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], ModuleAnalysis]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, module_path: str) -> ModuleAnalysis:
+        """Analysis of module_path; raises OSError if the file can't be read."""
+        path = os.path.abspath(module_path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        with open(module_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        analysis = analyze_source(module_path, source)
+
+        with self._lock:
+            self._entries[path] = (key, analysis)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return analysis
+
+    def invalidate(self, module_path: str) -> None:
+        with self._lock:
+            self._entries.pop(os.path.abspath(module_path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# Shared by RMValidator instances in this process (and by each process pool worker)
+default_module_cache = ModuleAnalysisCache()
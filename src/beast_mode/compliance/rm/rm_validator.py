@@ -2,19 +2,23 @@
 RM (Reflective Module) architectural compliance validator.
 
 Validates that components follow RM interface requirements and architectural constraints
-as defined in the Beast Mode Framework standards.
+as defined in the Beast Mode Framework standards. All checks read each module
+through a shared ModuleAnalysisCache, so a module is read and parsed once no
+matter how many checks run against it.
 """
 
-import ast
 import inspect
 import importlib.util
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass
 from pathlib import Path
 
 from ..models import ComplianceIssue, ComplianceIssueType, IssueSeverity, RMComplianceStatus
 from ...core.reflective_module import ReflectiveModule
+from ...utils.project_walker import ProjectWalker
+from .module_analysis import ClassSummary, ModuleAnalysisCache, default_module_cache
 
 
 @dataclass
@@ -94,8 +98,9 @@ class RMValidator:
         '_update_health_indicator': 'Internal health indicator updates'
     }
     
-    def __init__(self):
+    def __init__(self, module_cache: Optional[ModuleAnalysisCache] = None):
         self.max_lines_per_module = 200
+        self.module_cache = module_cache or default_module_cache
         
     def validate_rm_interface_implementation(self, module_path: str) -> RMInterfaceResult:
         """
@@ -112,14 +117,10 @@ class RMValidator:
         invalid_methods = []
         
         try:
-            # Parse the module AST
-            with open(module_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            tree = ast.parse(source_code)
+            summary = self.module_cache.get(module_path).require_summary()
             
             # Find class definitions that should inherit from ReflectiveModule
-            rm_classes = self._find_rm_classes(tree, source_code)
+            rm_classes = summary.rm_classes
             
             if not rm_classes:
                 issues.append(ComplianceIssue(
@@ -144,9 +145,9 @@ class RMValidator:
                 )
             
             # Validate each RM class
-            for class_node in rm_classes:
+            for class_summary in rm_classes:
                 class_missing, class_invalid = self._validate_class_methods(
-                    class_node, module_path
+                    class_summary, module_path
                 )
                 missing_methods.extend(class_missing)
                 invalid_methods.extend(class_invalid)
@@ -230,15 +231,8 @@ class RMValidator:
         issues = []
         
         try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
             # Count non-empty, non-comment lines
-            code_lines = [
-                line.strip() for line in lines 
-                if line.strip() and not line.strip().startswith('#')
-            ]
-            line_count = len(code_lines)
+            line_count = self.module_cache.get(module_path).code_lines
             
             # Check size constraint
             meets_size_constraint = line_count <= self.max_lines_per_module
@@ -329,16 +323,11 @@ class RMValidator:
         missing_health_methods = []
         
         try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            tree = ast.parse(source_code)
+            analysis = self.module_cache.get(module_path)
+            source_code = analysis.source
             
             # Find all method definitions
-            method_names = set()
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    method_names.add(node.name)
+            method_names = analysis.require_summary().function_names
             
             # Check for health monitoring methods
             for method_name, description in self.HEALTH_MONITORING_METHODS.items():
@@ -430,8 +419,7 @@ class RMValidator:
         issues = []
         
         try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+            source_code = self.module_cache.get(module_path).source
             
             # Check for registry-related patterns
             has_registration_method = 'register_rm_documentation' in source_code
@@ -508,6 +496,43 @@ class RMValidator:
                 issues=issues
             )
     
+    def validate_tree(self, root: str, max_workers: Optional[int] = None) -> Dict[str, RMComplianceStatus]:
+        """
+        Validate RM compliance of every module under root.
+        
+        Modules are spread over a process pool; each worker parses a module
+        once and runs all checks against its cached analysis.
+        
+        Args:
+            root: Directory to scan for Python modules
+            max_workers: Worker processes (default: CPU count; 1 validates in-process)
+            
+        Returns:
+            Mapping of module path to its RMComplianceStatus
+        """
+        module_paths = sorted(
+            str(path) for path in ProjectWalker(root, extensions={'.py'}).walk()
+            if path.name != '__init__.py'
+        )
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        if max_workers > 1 and len(module_paths) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    chunksize = max(1, len(module_paths) // (max_workers * 4))
+                    statuses = executor.map(
+                        _validate_module_in_worker,
+                        module_paths,
+                        [self.max_lines_per_module] * len(module_paths),
+                        chunksize=chunksize
+                    )
+                    return dict(zip(module_paths, statuses))
+            except OSError:
+                # Process pools can be unavailable (e.g. restricted sandboxes)
+                pass
+        
+        return {module_path: self.validate_rm_compliance(module_path) for module_path in module_paths}
+    
     def validate_rm_compliance(self, module_path: str) -> RMComplianceStatus:
         """
         Perform comprehensive RM compliance validation.
@@ -549,33 +574,13 @@ class RMValidator:
             issues=all_issues
         )
     
-    def _find_rm_classes(self, tree: ast.AST, source_code: str) -> List[ast.ClassDef]:
-        """Find classes that inherit from ReflectiveModule."""
-        rm_classes = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check if class inherits from ReflectiveModule
-                for base in node.bases:
-                    if isinstance(base, ast.Name) and base.id == 'ReflectiveModule':
-                        rm_classes.append(node)
-                    elif isinstance(base, ast.Attribute):
-                        # Handle cases like module.ReflectiveModule
-                        if base.attr == 'ReflectiveModule':
-                            rm_classes.append(node)
-        
-        return rm_classes
-    
-    def _validate_class_methods(self, class_node: ast.ClassDef, module_path: str) -> tuple[List[str], List[str]]:
+    def _validate_class_methods(self, class_summary: ClassSummary, module_path: str) -> tuple[List[str], List[str]]:
         """Validate methods in a ReflectiveModule class."""
         missing_methods = []
         invalid_methods = []
         
         # Get all method names in the class
-        class_methods = set()
-        for node in class_node.body:
-            if isinstance(node, ast.FunctionDef):
-                class_methods.add(node.name)
+        class_methods = class_summary.methods
         
         # Check for required methods
         for method_name in self.REQUIRED_RM_METHODS:
@@ -587,28 +592,13 @@ class RMValidator:
     def _analyze_complexity(self, module_path: str) -> Dict[str, Any]:
         """Analyze module complexity indicators."""
         try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            tree = ast.parse(source_code)
-            
-            # Count various complexity indicators
-            class_count = 0
-            function_count = 0
-            import_count = 0
-            max_nesting_depth = 0
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_count += 1
-                elif isinstance(node, ast.FunctionDef):
-                    function_count += 1
-                elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                    import_count += 1
-                elif isinstance(node, (ast.If, ast.For, ast.While, ast.With)):
-                    # Simple nesting depth calculation
-                    depth = self._calculate_nesting_depth(node)
-                    max_nesting_depth = max(max_nesting_depth, depth)
+            summary = self.module_cache.get(module_path).require_summary()
+            
+            # Complexity indicators from the cached single-pass summary
+            class_count = summary.class_count
+            function_count = summary.function_count
+            import_count = summary.import_count
+            max_nesting_depth = summary.max_nesting_depth
             
             return {
                 'class_count': class_count,
@@ -629,17 +619,6 @@ class RMValidator:
                 'complexity_score': 1.0  # Default to high complexity on error
             }
     
-    def _calculate_nesting_depth(self, node: ast.AST, current_depth: int = 1) -> int:
-        """Calculate maximum nesting depth for a node."""
-        max_depth = current_depth
-        
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, (ast.If, ast.For, ast.While, ast.With)):
-                child_depth = self._calculate_nesting_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-        
-        return max_depth
-    
     def _calculate_complexity_score(self, class_count: int, function_count: int, 
                                   import_count: int, max_nesting_depth: int) -> float:
         """Calculate complexity score (lower is better)."""
@@ -689,8 +668,7 @@ class RMValidator:
     def _check_architectural_patterns(self, module_path: str, complexity_indicators: Dict[str, Any], issues: List[ComplianceIssue]) -> None:
         """Check for specific architectural patterns and violations."""
         try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+            source_code = self.module_cache.get(module_path).source
             
             # Check for excessive class coupling
             class_count = complexity_indicators.get('class_count', 0)
@@ -783,4 +761,11 @@ class RMValidator:
                     "Check file permissions and accessibility"
                 ],
                 blocking_merge=False
-            ))
\ No newline at end of file
+            ))
+
+
+def _validate_module_in_worker(module_path: str, max_lines_per_module: int) -> RMComplianceStatus:
+    """Process pool entry point; workers reuse their process-wide module cache."""
+    validator = RMValidator()
+    validator.max_lines_per_module = max_lines_per_module
+    return validator.validate_rm_compliance(module_path)
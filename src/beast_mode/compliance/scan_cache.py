@@ -0,0 +1,238 @@
+"""
+Persistent per-file result cache for compliance scans.
+
+This module stores the per-file results of a compliance scan (RM issues,
+requirement references and implementation components) keyed by path and
+content hash. A file whose (mtime_ns, size, inode) is unchanged is a hit
+without being read; otherwise it is re-hashed, so touched but unchanged files
+are still skipped. Entries are only reused by the same validator code
+(fingerprint) and repository root.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import ComplianceIssue, ComplianceIssueType, IssueSeverity
+from .rdi.design_validator import ComponentType, ImplementationComponent
+from .rdi.requirement_tracer import RequirementReference
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "compliance_scan_cache.json"
+
+
+@dataclass
+class FileScanResult:
+    """Per-file results of the file-level compliance checks."""
+    path: str  # relative to the repository root
+    content_hash: Optional[str]
+    checks: Tuple[str, ...]
+    rm_issues: List[ComplianceIssue] = field(default_factory=list)
+    references: List[RequirementReference] = field(default_factory=list)
+    components: List[ImplementationComponent] = field(default_factory=list)
+    complete: bool = True  # False if a check failed; incomplete results are not cached
+    cached: bool = False
+
+
+def hash_file(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_stat_key(file_path: Path) -> List[int]:
+    stat = os.stat(file_path)
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def fingerprint_sources(module_files: Iterable[str], extra: str = "") -> str:
+    """Digest of the analyzer sources, so cached results die with the code that produced them."""
+    digest = hashlib.sha256(extra.encode('utf-8'))
+    for module_file in module_files:
+        try:
+            digest.update(Path(module_file).read_bytes())
+        except OSError:
+            digest.update(module_file.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ComplianceScanCache:
+    """
+    Relative path -> content hash and file-level scan results.
+
+    Features:
+    - Stat key fast path, content hash fallback
+    - Entries cover a set of checks; a hit needs all requested checks
+    - Pruned to the files of the last scan
+    - JSON persistence between runs
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: str, fingerprint: str):
+        self.root = root
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.rehashed = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(
+        self,
+        relative_path: str,
+        file_path: Path,
+        stat_key: List[int],
+        checks: Sequence[str]
+    ) -> Optional[FileScanResult]:
+        """Cached results for an unchanged file, or None on a miss."""
+        entry = self.entries.get(relative_path)
+        if entry is None or not set(checks) <= set(entry["checks"]):
+            self.misses += 1
+            return None
+
+        if entry["stat"] != stat_key:
+            self.rehashed += 1
+            try:
+                content_hash = hash_file(file_path)
+            except OSError:
+                content_hash = None
+            if content_hash != entry["sha256"]:
+                self.misses += 1
+                return None
+            entry["stat"] = stat_key
+
+        try:
+            result = self._decode(relative_path, entry, tuple(checks))
+        except (KeyError, TypeError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def store(self, result: FileScanResult, stat_key: List[int]) -> None:
+        if not result.complete or result.content_hash is None:
+            self.entries.pop(result.path, None)
+            return
+        self.entries[result.path] = {
+            "stat": stat_key,
+            "sha256": result.content_hash,
+            "checks": list(result.checks),
+            "rm_issues": [_encode_issue(issue) for issue in result.rm_issues],
+            "references": [asdict(reference) for reference in result.references],
+            "components": [_encode_component(component) for component in result.components]
+        }
+
+    def prune(self, keep_paths: Iterable[str]) -> int:
+        """Drop entries for files that are no longer scanned; returns the number dropped."""
+        keep_paths = set(keep_paths)
+        stale = [path for path in self.entries if path not in keep_paths]
+        for path in stale:
+            del self.entries[path]
+        return len(stale)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "rehashed": self.rehashed
+        }
+
+    @staticmethod
+    def _decode(relative_path: str, entry: Dict[str, Any], checks: Tuple[str, ...]) -> FileScanResult:
+        return FileScanResult(
+            path=relative_path,
+            content_hash=entry["sha256"],
+            checks=checks,
+            rm_issues=[_decode_issue(issue) for issue in entry["rm_issues"]] if "rm" in checks else [],
+            references=[
+                RequirementReference(**reference) for reference in entry["references"]
+            ] if "requirements" in checks else [],
+            components=[
+                _decode_component(component) for component in entry["components"]
+            ] if "design" in checks else [],
+            cached=True
+        )
+
+    # Persistence
+
+    def save(self, path: Path) -> bool:
+        payload = {
+            "version": self.VERSION,
+            "root": self.root,
+            "fingerprint": self.fingerprint,
+            "files": self.entries
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            temp_path.replace(path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save compliance scan cache to {path}: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: Optional[Path], root: str, fingerprint: str) -> "ComplianceScanCache":
+        """Load a saved cache; returns an empty cache if missing, unreadable or built by other code."""
+        cache = cls(root, fingerprint)
+        if path is None or not path.exists():
+            return cache
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load compliance scan cache from {path}: {e}")
+            return cache
+
+        if (
+            payload.get("version") != cls.VERSION
+            or payload.get("root") != root
+            or payload.get("fingerprint") != fingerprint
+        ):
+            return cache
+        cache.entries = dict(payload.get("files", {}))
+        return cache
+
+
+def _encode_issue(issue: ComplianceIssue) -> Dict[str, Any]:
+    data = asdict(issue)
+    data["issue_type"] = issue.issue_type.value
+    data["severity"] = issue.severity.value
+    return data
+
+
+def _decode_issue(data: Dict[str, Any]) -> ComplianceIssue:
+    data = dict(data)
+    data["issue_type"] = ComplianceIssueType(data["issue_type"])
+    data["severity"] = IssueSeverity(data["severity"])
+    return ComplianceIssue(**data)
+
+
+def _encode_component(component: ImplementationComponent) -> Dict[str, Any]:
+    data = asdict(component)
+    data["component_type"] = component.component_type.value
+    return data
+
+
+def _decode_component(data: Dict[str, Any]) -> ImplementationComponent:
+    data = dict(data)
+    data["component_type"] = ComponentType(data["component_type"])
+    return ImplementationComponent(**data)
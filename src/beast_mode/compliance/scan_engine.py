@@ -0,0 +1,303 @@
+"""
+Parallel whole-repository compliance scan.
+
+This module runs the file-level parts of the RM and RDI validators (RM
+compliance of each module, requirement references, implementation components)
+for every file of a repository on a process pool, streaming ComplianceIssues
+back as chunks of files complete. Per-file results are kept in a persistent
+content-hash cache, so unchanged files are not analyzed again. Repository-wide
+results (requirement traceability, design alignment and, on request, test
+coverage) are computed from the per-file results once all files are done.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .models import ComplianceIssue
+from .rdi import design_validator as design_validator_module
+from .rdi import requirement_tracer as requirement_tracer_module
+from .rdi.design_validator import AlignmentResult, DesignValidator
+from .rdi.requirement_tracer import RequirementTracer, TraceabilityResult
+from .rdi.test_coverage_validator import TestCoverageValidator
+from .rm import module_analysis as module_analysis_module
+from .rm import rm_validator as rm_validator_module
+from .rm.rm_validator import RMValidator
+from .scan_cache import (
+    CACHE_FILE_NAME,
+    ComplianceScanCache,
+    FileScanResult,
+    file_stat_key,
+    fingerprint_sources,
+    hash_file
+)
+from ..utils.project_walker import ProjectWalker
+
+
+# "coverage" runs the test suite once for the whole repository, so it is opt-in
+SCAN_CHECKS = ("rm", "requirements", "design", "coverage")
+DEFAULT_CHECKS = ("rm", "requirements", "design")
+FILE_CHECKS = ("rm", "requirements", "design")
+
+REQUIREMENT_EXTENSIONS = {'.py', '.md', '.rst', '.txt'}
+
+# Largest number of files per worker task; smaller chunks stream issues sooner
+MAX_CHUNK_SIZE = 32
+
+
+class ComplianceScanEngine:
+    """
+    Whole-repository RM/RDI compliance scan on a process pool.
+
+    Features:
+    - One project walk shared by all checks
+    - File-level checks fanned out over worker processes
+    - Issues streamed as they are produced
+    - Content-hash cache of per-file results between runs
+    """
+
+    def __init__(
+        self,
+        repository_path: str = ".",
+        checks: Sequence[str] = DEFAULT_CHECKS,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        use_cache: bool = True
+    ):
+        """
+        Initialize the ComplianceScanEngine.
+
+        Args:
+            repository_path: Path to the repository root
+            checks: Checks to run (see SCAN_CHECKS)
+            max_workers: Worker processes (default: CPU count; 1 scans in-process)
+            cache_path: Result cache file (default: inside the .git directory)
+            use_cache: Reuse and update cached per-file results
+        """
+        unknown_checks = set(checks) - set(SCAN_CHECKS)
+        if unknown_checks:
+            raise ValueError(f"Unknown compliance checks: {', '.join(sorted(unknown_checks))}")
+
+        self.repository_path = Path(repository_path).resolve()
+        self.checks = tuple(check for check in SCAN_CHECKS if check in checks)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        if not use_cache:
+            self.cache_path: Optional[Path] = None
+        elif cache_path is not None:
+            self.cache_path = Path(cache_path)
+        elif (self.repository_path / ".git").is_dir():
+            self.cache_path = self.repository_path / ".git" / "beast_mode" / CACHE_FILE_NAME
+        else:
+            self.cache_path = None
+
+        # Repository-wide results of the last scan
+        self.traceability_result: Optional[TraceabilityResult] = None
+        self.alignment_result: Optional[AlignmentResult] = None
+        self._stats: Dict[str, Any] = {}
+
+    @property
+    def file_checks(self) -> Tuple[str, ...]:
+        return tuple(check for check in self.checks if check in FILE_CHECKS)
+
+    def scan(self) -> Iterator[ComplianceIssue]:
+        """
+        Scan the repository, yielding issues as they are found.
+
+        RM issues arrive per file (cached files first, then in completion
+        order); traceability, alignment and coverage issues follow once every
+        file has been analyzed.
+        """
+        start_time = time.time()
+        root = str(self.repository_path)
+        file_checks = self.file_checks
+        self.traceability_result = None
+        self.alignment_result = None
+        self._stats = {"files": 0, "cached": 0, "analyzed": 0, "issues": 0, "workers": 1}
+
+        files = self._collect_files(file_checks)
+        cache = (
+            ComplianceScanCache.load(self.cache_path, root, self._fingerprint())
+            if self.cache_path is not None else None
+        )
+        results: Dict[str, FileScanResult] = {}
+        stat_keys: Dict[str, List[int]] = {}
+        pending = []
+        completed = False
+
+        try:
+            for relative_path in files:
+                file_path = self.repository_path / relative_path
+                try:
+                    stat_keys[relative_path] = file_stat_key(file_path)
+                except OSError:
+                    continue  # removed since the walk
+                cached = None
+                if cache is not None:
+                    cached = cache.lookup(relative_path, file_path, stat_keys[relative_path], file_checks)
+                if cached is None:
+                    pending.append(relative_path)
+                    continue
+                results[relative_path] = cached
+                self._stats["cached"] += 1
+                for issue in cached.rm_issues:
+                    self._stats["issues"] += 1
+                    yield issue
+
+            for result in self._analyze(pending, file_checks):
+                results[result.path] = result
+                self._stats["analyzed"] += 1
+                if cache is not None:
+                    cache.store(result, stat_keys[result.path])
+                for issue in result.rm_issues:
+                    self._stats["issues"] += 1
+                    yield issue
+            completed = True
+        finally:
+            # Keep whatever was analyzed, even if the consumer stopped early;
+            # an early stop only drops entries for files no longer walked
+            if cache is not None:
+                cache.prune(results if completed else files)
+                cache.save(self.cache_path)
+                self._stats["cache"] = cache.get_stats()
+
+        # Repository-wide results, merged in walk order like the serial validators
+        ordered_results = [results[relative_path] for relative_path in files if relative_path in results]
+        self._stats["files"] = len(ordered_results)
+
+        for issue in self._repository_issues(ordered_results):
+            self._stats["issues"] += 1
+            yield issue
+
+        self._stats["duration_seconds"] = time.time() - start_time
+
+    def run(self) -> List[ComplianceIssue]:
+        """Scan the repository and return all issues."""
+        return list(self.scan())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistics of the last scan."""
+        return dict(self._stats, checks=list(self.checks))
+
+    def _collect_files(self, file_checks: Tuple[str, ...]) -> List[str]:
+        """Paths relative to the root of every file at least one check applies to, in walk order."""
+        extensions = set()
+        if "rm" in file_checks or "design" in file_checks:
+            extensions.add('.py')
+        if "requirements" in file_checks:
+            extensions.update(REQUIREMENT_EXTENSIONS)
+        if not extensions:
+            return []
+
+        return [
+            path.relative_to(self.repository_path).as_posix()
+            for path in ProjectWalker(self.repository_path, extensions=extensions).walk()
+        ]
+
+    def _analyze(self, relative_paths: List[str], file_checks: Tuple[str, ...]) -> Iterator[FileScanResult]:
+        """Analyze files on the process pool, yielding results as chunks complete."""
+        if not relative_paths:
+            return
+        root = str(self.repository_path)
+
+        if self.max_workers > 1 and len(relative_paths) > 1:
+            chunk_size = max(1, min(MAX_CHUNK_SIZE, len(relative_paths) // (self.max_workers * 4)))
+            chunks = [relative_paths[i:i + chunk_size] for i in range(0, len(relative_paths), chunk_size)]
+            remaining = set(range(len(chunks)))
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {
+                        executor.submit(_scan_files_in_worker, root, chunk, file_checks): index
+                        for index, chunk in enumerate(chunks)
+                    }
+                    self._stats["workers"] = self.max_workers
+                    for future in as_completed(futures):
+                        chunk_results = future.result()
+                        remaining.discard(futures[future])
+                        yield from chunk_results
+                return
+            except (OSError, BrokenProcessPool):
+                # Process pools can be unavailable (e.g. restricted sandboxes); finish in-process
+                self._stats["workers"] = 1
+                relative_paths = [path for index in sorted(remaining) for path in chunks[index]]
+
+        for relative_path in relative_paths:
+            yield _scan_file(root, relative_path, file_checks)
+
+    def _repository_issues(self, results: List[FileScanResult]) -> Iterator[ComplianceIssue]:
+        root = str(self.repository_path)
+
+        if "requirements" in self.checks:
+            tracer = RequirementTracer(root)
+            self.traceability_result = tracer.analyze_references(
+                [reference for result in results for reference in result.references]
+            )
+            yield from self.traceability_result.issues
+
+        if "design" in self.checks:
+            implementation_components = {}
+            for result in results:
+                for component in result.components:
+                    implementation_components[component.name] = component
+            self.alignment_result = DesignValidator(root).analyze_components(implementation_components)
+            yield from self.alignment_result.issues
+
+        if "coverage" in self.checks:
+            yield from TestCoverageValidator(root).validate(root)
+
+    def _fingerprint(self) -> str:
+        return fingerprint_sources(
+            [
+                __file__,
+                rm_validator_module.__file__,
+                module_analysis_module.__file__,
+                requirement_tracer_module.__file__,
+                design_validator_module.__file__
+            ],
+            extra=str(RMValidator().max_lines_per_module)
+        )
+
+
+# Validators of this process, reused across tasks (each pool worker has its own)
+_worker_validators: Dict[str, Tuple[RMValidator, RequirementTracer, DesignValidator]] = {}
+
+
+def _validators_for(root: str) -> Tuple[RMValidator, RequirementTracer, DesignValidator]:
+    validators = _worker_validators.get(root)
+    if validators is None:
+        validators = _worker_validators[root] = (RMValidator(), RequirementTracer(root), DesignValidator(root))
+    return validators
+
+
+def _scan_files_in_worker(root: str, relative_paths: List[str], file_checks: Tuple[str, ...]) -> List[FileScanResult]:
+    """Process pool entry point for a chunk of files."""
+    return [_scan_file(root, relative_path, file_checks) for relative_path in relative_paths]
+
+
+def _scan_file(root: str, relative_path: str, file_checks: Tuple[str, ...]) -> FileScanResult:
+    """Run the file-level checks that apply to one file."""
+    file_path = Path(root) / relative_path
+    try:
+        content_hash = hash_file(file_path)
+    except OSError as e:
+        print(f"Warning: Failed to read file {file_path}: {e}")
+        return FileScanResult(path=relative_path, content_hash=None, checks=file_checks, complete=False)
+
+    rm_validator, tracer, design_validator = _validators_for(root)
+    result = FileScanResult(path=relative_path, content_hash=content_hash, checks=file_checks)
+    suffix = file_path.suffix.lower()
+    try:
+        if "rm" in file_checks and suffix == '.py' and file_path.name != '__init__.py':
+            result.rm_issues = rm_validator.validate_rm_compliance(str(file_path)).issues
+        if "requirements" in file_checks and suffix in REQUIREMENT_EXTENSIONS:
+            result.references = tracer._find_references_in_file(file_path)
+        if "design" in file_checks and suffix == '.py':
+            result.components = list(design_validator._parse_implementation_file(file_path).values())
+    except Exception as e:
+        # Log error but continue processing; the file is analyzed again next run
+        print(f"Warning: Failed to process file {file_path}: {e}")
+        result.complete = False
+    return result
@@ -60,10 +60,18 @@ from .domain_cache import (
     DomainSpecificCache
 )
 
+from .persistent_cache import (
+    PersistentCacheTier
+)
+
 from .domain_index import (
     DomainIndex
 )
 
+from .search_index import (
+    InvertedSearchIndex
+)
+
 from .domain_validator import (
     DomainValidator,
     ValidationRule,
@@ -141,7 +149,9 @@ __all__ = [
     # Core Components
     "DomainCache",
     "DomainSpecificCache",
+    "PersistentCacheTier",
     "DomainIndex",
+    "InvertedSearchIndex",
     "DomainValidator",
     "ValidationRule",
     "ConsistencyCheck",
@@ -18,6 +18,7 @@ DEFAULT_CONFIG = {
     "cache_enabled": True,
     "cache_ttl_seconds": 300,  # 5 minutes
     "cache_max_size": 1000,
+    "persistent_cache_path": None,  # SQLite file for the warm-restart cache tier
     
     # Query engine settings
     "query_timeout_seconds": 30,
@@ -125,7 +126,8 @@ class DomainIndexConfig:
             "registry_backup_dir", 
             "makefile_base_path",
             "log_file",
-            "audit_log_file"
+            "audit_log_file",
+            "persistent_cache_path"
         ]
         
         for key in path_keys:
@@ -24,7 +24,9 @@ from .models import (
 )
 from .exceptions import DependencyAnalysisError
 from .config import get_config
+from .pattern_matcher import DomainPatternMatcher, glob_matches
 from ..utils.path_normalizer import PathNormalizer, safe_relative_to, normalize_path
+from ..utils.project_walker import ProjectWalker, DEFAULT_EXCLUDED_DIRS, ENVIRONMENT_EXCLUDED_DIRS
 
 
 class CircularDependencyDetector:
@@ -199,6 +201,11 @@ class OrphanedFileDetector:
         self.domains = domains
         self.project_root = project_root
         self.file_extensions = {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.hpp'}
+        
+        # Combined matcher over all domain patterns, compiled on first use
+        self._matcher: Optional[DomainPatternMatcher] = None
+        self._matcher_patterns: Optional[Dict[str, List[str]]] = None
+        self._normalized_root: Optional[Path] = None
     
     def detect_orphaned_files(self, include_tests: bool = True) -> Dict[str, Any]:
         """Detect files not covered by any domain pattern"""
@@ -239,39 +246,19 @@ class OrphanedFileDetector:
         # Normalize project root to handle path conflicts
         normalized_project_root = normalize_path(self.project_root)
         
-        for ext in self.file_extensions:
-            pattern = f"**/*{ext}"
-            found_files = list(normalized_project_root.glob(pattern))
-            
-            # Filter out common exclusions
-            filtered_files = []
-            for file_path in found_files:
-                # Normalize the file path first
-                normalized_file_path = normalize_path(file_path)
-                
-                # Use safe path normalization to handle absolute/relative conflicts
-                relative_path = safe_relative_to(normalized_file_path, normalized_project_root)
-                if relative_path is None:
-                    # If we can't make it relative, skip this file
-                    continue
-                    
-                path_str = str(relative_path)
-                
-                # Skip common exclusions
-                if any(exclude in path_str for exclude in [
-                    '__pycache__', '.git', 'node_modules', '.venv', 'venv',
-                    '.pytest_cache', '.mypy_cache', 'build', 'dist'
-                ]):
-                    continue
-                
-                # Skip test files if not including tests
-                if not include_tests and ('test' in path_str.lower() or 'spec' in path_str.lower()):
-                    continue
-                
-                # Use normalized path for consistency
-                filtered_files.append(normalized_file_path)
+        # Single pass over the tree; excluded directories are pruned before descent
+        walker = ProjectWalker(
+            normalized_project_root,
+            extensions=self.file_extensions,
+            excluded_dirs=DEFAULT_EXCLUDED_DIRS | ENVIRONMENT_EXCLUDED_DIRS
+        )
+        for relative_path in walker.walk_relative():
+            # Skip test files if not including tests
+            lowered = relative_path.lower()
+            if not include_tests and ('test' in lowered or 'spec' in lowered):
+                continue
             
-            files.extend(filtered_files)
+            files.append(normalized_project_root / relative_path)
         
         return files
     
@@ -284,40 +271,43 @@ class OrphanedFileDetector:
     
     def _find_covering_domains(self, file_path: Path, domain_patterns: Dict[str, List[str]]) -> List[str]:
         """Find which domains cover a specific file"""
-        # Use path normalization to handle absolute/relative conflicts
-        normalized_project_root = normalize_path(self.project_root)
-        normalized_file_path = normalize_path(file_path)
-        relative_path = safe_relative_to(normalized_file_path, normalized_project_root)
+        relative_path = self._relative_to_root(file_path)
         
         if relative_path is None:
             # If we can't make it relative, return empty list
             return []
-            
-        covering_domains = []
         
-        for domain_name, patterns in domain_patterns.items():
-            for pattern in patterns:
-                if self._file_matches_pattern(relative_path, pattern):
-                    covering_domains.append(domain_name)
-                    break  # One match per domain is enough
+        return self._get_matcher(domain_patterns).covering_domains(relative_path)
+    
+    def _get_matcher(self, domain_patterns: Dict[str, List[str]]) -> DomainPatternMatcher:
+        """Get the combined pattern matcher, recompiling only when patterns change
+
+        Patterns are right-anchored like ``Path.match``, so ``*.py`` covers
+        Python files at any depth.
+        """
+        if self._matcher is None or domain_patterns is not self._matcher_patterns:
+            self._matcher = DomainPatternMatcher(domain_patterns, anchor_right=True)
+            self._matcher_patterns = domain_patterns
+        return self._matcher
+    
+    def _relative_to_root(self, file_path: Path) -> Optional[Path]:
+        """Make a file path relative to the project root, normalizing the root only once"""
+        if self._normalized_root is None:
+            self._normalized_root = normalize_path(self.project_root)
+        
+        if file_path.is_absolute():
+            try:
+                return file_path.relative_to(self._normalized_root)
+            except ValueError:
+                pass
         
-        return covering_domains
+        # Use path normalization to handle absolute/relative conflicts
+        return safe_relative_to(normalize_path(file_path), self._normalized_root)
     
     def _file_matches_pattern(self, file_path: Path, pattern: str) -> bool:
-        """Check if a file matches a domain pattern using glob-like matching"""
+        """Check if a file matches a domain pattern using right-anchored glob matching"""
         try:
-            # Convert pattern to Path and use match
-            pattern_path = Path(pattern)
-            
-            # Handle different pattern types
-            if "**" in pattern:
-                # Recursive pattern - use glob matching
-                return file_path.match(pattern) or any(
-                    file_path.match(part) for part in pattern.split("**") if part.strip()
-                )
-            else:
-                # Simple pattern matching
-                return file_path.match(pattern)
+            return glob_matches(file_path, pattern, anchor_right=True)
         except Exception:
             # Fallback to string matching
             return pattern.replace("**", "") in str(file_path)
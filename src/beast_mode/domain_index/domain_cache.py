@@ -3,18 +3,25 @@ Domain Cache System
 
 This module provides advanced caching capabilities for domain data,
 including TTL management, invalidation strategies, and cache warming.
+
+Entries live in an insertion-ordered LRU list, expirations are tracked in a
+min-heap keyed by monotonic deadlines, and an optional byte budget bounds the
+estimated memory held by cached values.
 """
 
+import heapq
+import sys
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Set, Callable
-from collections import defaultdict
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Set, Callable, Tuple
+from collections import defaultdict, OrderedDict
+from dataclasses import dataclass, field
 
 from .base import DomainSystemComponent
 from .interfaces import CacheInterface
 from .models import Domain, DomainCollection
+from .persistent_cache import PersistentCacheTier
 
 
 @dataclass
@@ -26,17 +33,73 @@ class CacheEntry:
     access_count: int
     ttl_seconds: Optional[int]
     tags: Set[str]
+    # Monotonic bookkeeping used by DomainCache (expires_at is None when the
+    # entry was not created by a cache, in which case created_at is used)
+    expires_at: Optional[float] = None
+    created_monotonic: float = field(default_factory=time.monotonic)
+    accessed_monotonic: float = field(default_factory=time.monotonic)
+    size_bytes: int = 0
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if entry is expired"""
         if self.ttl_seconds is None:
             return False
+        if self.expires_at is not None:
+            return (time.monotonic() if now is None else now) >= self.expires_at
         return datetime.now() - self.created_at > timedelta(seconds=self.ttl_seconds)
     
     def touch(self) -> None:
         """Update last accessed time and increment access count"""
         self.last_accessed = datetime.now()
+        self.accessed_monotonic = time.monotonic()
+        self.access_count += 1
+    
+    def record_access(self, now: float) -> None:
+        """Record an access at a monotonic timestamp (no wall-clock lookup)"""
+        self.accessed_monotonic = now
         self.access_count += 1
+    
+    def last_accessed_at(self) -> datetime:
+        """Wall-clock time of the last access, derived from the monotonic clock"""
+        if self.accessed_monotonic <= self.created_monotonic:
+            return self.last_accessed
+        return self.created_at + timedelta(seconds=self.accessed_monotonic - self.created_monotonic)
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the deep memory footprint of a value in bytes
+    
+    Follows containers, dataclasses and plain objects, counting each
+    object once.
+    """
+    seen: Set[int] = set()
+    stack = [value]
+    total = 0
+    
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj)
+        
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None), type)):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            obj_dict = getattr(obj, "__dict__", None)
+            if obj_dict is not None:
+                stack.append(obj_dict)
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    
+    return total
 
 
 class DomainCache(DomainSystemComponent, CacheInterface):
@@ -44,9 +107,11 @@ class DomainCache(DomainSystemComponent, CacheInterface):
     Advanced caching system for domain data
     
     Features:
-    - TTL-based expiration
+    - TTL-based expiration via a monotonic deadline heap
     - Tag-based invalidation
-    - LRU eviction policy
+    - O(1) LRU eviction policy
+    - Optional memory budget with byte-size accounting
+    - Optional persistent (SQLite) second tier with read-through promotion
     - Cache warming
     - Statistics and monitoring
     """
@@ -59,10 +124,16 @@ class DomainCache(DomainSystemComponent, CacheInterface):
         self.default_ttl = self.config.get('default_ttl_seconds', 300)
         self.cleanup_interval = self.config.get('cleanup_interval_seconds', 60)
         self.enable_lru = self.config.get('enable_lru_eviction', True)
+        # Byte budget for cached values (None disables size accounting)
+        self.max_memory_bytes = self.config.get('max_memory_bytes')
         
-        # Cache storage
-        self._cache: Dict[str, CacheEntry] = {}
+        # Cache storage, ordered from least to most recently used
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._tag_index: Dict[str, Set[str]] = defaultdict(set)
+        # (expires_at, sequence, key); stale items are skipped lazily
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._expiry_sequence = 0
+        self._total_bytes = 0
         self._lock = threading.RLock()
         
         # Statistics
@@ -70,6 +141,17 @@ class DomainCache(DomainSystemComponent, CacheInterface):
         self.misses = 0
         self.evictions = 0
         self.invalidations = 0
+        self.rejected = 0
+        self.persistent_hits = 0
+        
+        # Optional persistent second tier (read-through, opt-in write-through)
+        self.persistent_tier: Optional[PersistentCacheTier] = None
+        persistent_path = self.config.get('persistent_cache_path')
+        if persistent_path:
+            try:
+                self.persistent_tier = PersistentCacheTier(persistent_path)
+            except Exception as e:
+                self.logger.warning(f"Persistent cache disabled, failed to open {persistent_path}: {e}")
         
         # Background cleanup
         self._cleanup_timer = None
@@ -83,46 +165,85 @@ class DomainCache(DomainSystemComponent, CacheInterface):
             entry = self._cache.get(key)
             
             if entry is None:
-                self.misses += 1
-                return None
+                return self._get_persistent(key)
             
-            if entry.is_expired():
+            now = time.monotonic()
+            if entry.is_expired(now):
                 self._remove_entry(key)
-                self.misses += 1
-                return None
+                return self._get_persistent(key)
             
-            entry.touch()
+            entry.record_access(now)
+            self._cache.move_to_end(key)
             self.hits += 1
             return entry.value
     
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None, tags: Optional[Set[str]] = None) -> bool:
-        """Set value in cache with optional TTL and tags"""
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None, tags: Optional[Set[str]] = None,
+            persist: bool = False) -> bool:
+        """Set value in cache with optional TTL and tags (persist also writes the persistent tier)"""
         with self._lock:
             try:
                 # Use default TTL if not specified
                 if ttl_seconds is None:
                     ttl_seconds = self.default_ttl
                 
+                if persist and self.persistent_tier is not None:
+                    if not self.persistent_tier.set(key, value, ttl_seconds, tags):
+                        self.logger.debug(f"Value for '{key}' could not be persisted")
+                
+                return self._store(key, value, ttl_seconds, tags)
+                
+            except Exception as e:
+                self._handle_error(e, "cache_set")
+                return False
+    
+    def _store(self, key: str, value: Any, ttl_seconds: Optional[float], tags: Optional[Set[str]]) -> bool:
+        """Store an entry in the in-memory tier"""
+        with self._lock:
+            try:
+                now = time.monotonic()
+                created_at = datetime.now()
+                
                 # Create cache entry
                 entry = CacheEntry(
                     value=value,
-                    created_at=datetime.now(),
-                    last_accessed=datetime.now(),
+                    created_at=created_at,
+                    last_accessed=created_at,
                     access_count=1,
                     ttl_seconds=ttl_seconds,
-                    tags=tags or set()
+                    tags=tags or set(),
+                    expires_at=now + ttl_seconds if ttl_seconds is not None else None,
+                    created_monotonic=now,
+                    accessed_monotonic=now
                 )
                 
-                # Check if we need to evict entries
-                if len(self._cache) >= self.max_size and key not in self._cache:
-                    self._evict_entries(1)
+                if self.max_memory_bytes is not None:
+                    entry.size_bytes = estimate_size(value)
+                    if entry.size_bytes > self.max_memory_bytes:
+                        self.rejected += 1
+                        self.logger.warning(
+                            f"Not caching '{key}': {entry.size_bytes} bytes exceeds "
+                            f"memory limit of {self.max_memory_bytes} bytes"
+                        )
+                        self._remove_entry(key)
+                        return False
                 
                 # Remove existing entry if present
                 if key in self._cache:
                     self._remove_entry(key)
                 
+                # Make room by dropping expired entries first, then LRU victims
+                if self._over_capacity(entry.size_bytes):
+                    self._purge_expired(now)
+                    while self._over_capacity(entry.size_bytes) and self._evict_entries(1):
+                        pass
+                
                 # Add new entry
                 self._cache[key] = entry
+                self._total_bytes += entry.size_bytes
+                if entry.expires_at is not None:
+                    self._expiry_sequence += 1
+                    heapq.heappush(self._expiry_heap, (entry.expires_at, self._expiry_sequence, key))
+                    self._compact_expiry_heap()
                 
                 # Update tag index
                 for tag in entry.tags:
@@ -137,22 +258,35 @@ class DomainCache(DomainSystemComponent, CacheInterface):
     def delete(self, key: str) -> bool:
         """Delete value from cache"""
         with self._lock:
+            persisted = self.persistent_tier.delete(key) if self.persistent_tier is not None else False
             if key in self._cache:
                 self._remove_entry(key)
                 return True
-            return False
+            return persisted
     
     def clear(self) -> bool:
         """Clear all cache entries"""
+        return self._clear(include_persistent=True)
+    
+    def clear_memory(self) -> bool:
+        """Clear in-memory entries, keeping the persistent tier for later processes"""
+        return self._clear(include_persistent=False)
+    
+    def _clear(self, include_persistent: bool) -> bool:
+        """Clear the memory tier and optionally the persistent tier"""
         with self._lock:
             try:
                 self._cache.clear()
                 self._tag_index.clear()
+                self._expiry_heap.clear()
+                self._total_bytes = 0
+                if include_persistent and self.persistent_tier is not None:
+                    self.persistent_tier.clear()
                 self.hits = 0
                 self.misses = 0
                 self.evictions = 0
                 self.invalidations = 0
-                self.logger.info("Cache cleared")
+                self.logger.info("Cache cleared" if include_persistent else "Memory cache tier cleared")
                 return True
             except Exception as e:
                 self._handle_error(e, "cache_clear")
@@ -166,6 +300,10 @@ class DomainCache(DomainSystemComponent, CacheInterface):
             for key in keys_to_remove:
                 self._remove_entry(key)
             
+            if self.persistent_tier is not None:
+                persisted_keys = self.persistent_tier.invalidate_by_tag(tag)
+                keys_to_remove = list(set(keys_to_remove).union(persisted_keys))
+            
             self.invalidations += len(keys_to_remove)
             self.logger.debug(f"Invalidated {len(keys_to_remove)} entries with tag '{tag}'")
             return len(keys_to_remove)
@@ -179,6 +317,10 @@ class DomainCache(DomainSystemComponent, CacheInterface):
             for key in keys_to_remove:
                 self._remove_entry(key)
             
+            if self.persistent_tier is not None:
+                persisted_keys = self.persistent_tier.invalidate_by_pattern(pattern)
+                keys_to_remove = list(set(keys_to_remove).union(persisted_keys))
+            
             self.invalidations += len(keys_to_remove)
             self.logger.debug(f"Invalidated {len(keys_to_remove)} entries matching pattern '{pattern}'")
             return len(keys_to_remove)
@@ -207,17 +349,20 @@ class DomainCache(DomainSystemComponent, CacheInterface):
             hit_rate = self.hits / total_requests if total_requests > 0 else 0.0
             
             # Calculate memory usage estimation
-            memory_usage_bytes = sum(
-                len(str(entry.value)) + len(str(key)) + 200  # Rough estimation
-                for key, entry in self._cache.items()
-            )
+            if self.max_memory_bytes is not None:
+                memory_usage_bytes = self._total_bytes
+            else:
+                memory_usage_bytes = sum(
+                    len(str(entry.value)) + len(str(key)) + 200  # Rough estimation
+                    for key, entry in self._cache.items()
+                )
             
             # Age distribution
-            now = datetime.now()
+            now = time.monotonic()
             age_buckets = {"<1min": 0, "1-5min": 0, "5-15min": 0, ">15min": 0}
             
             for entry in self._cache.values():
-                age_seconds = (now - entry.created_at).total_seconds()
+                age_seconds = now - entry.created_monotonic
                 if age_seconds < 60:
                     age_buckets["<1min"] += 1
                 elif age_seconds < 300:
@@ -237,9 +382,13 @@ class DomainCache(DomainSystemComponent, CacheInterface):
                 "evictions": self.evictions,
                 "invalidations": self.invalidations,
                 "memory_usage_bytes": memory_usage_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "rejected": self.rejected,
                 "age_distribution": age_buckets,
                 "tag_count": len(self._tag_index),
-                "default_ttl_seconds": self.default_ttl
+                "default_ttl_seconds": self.default_ttl,
+                "persistent_hits": self.persistent_hits,
+                "persistent_tier": self.persistent_tier.get_stats() if self.persistent_tier else None
             }
     
     def get_keys_by_tag(self, tag: str) -> List[str]:
@@ -257,18 +406,36 @@ class DomainCache(DomainSystemComponent, CacheInterface):
             return {
                 "key": key,
                 "created_at": entry.created_at.isoformat(),
-                "last_accessed": entry.last_accessed.isoformat(),
+                "last_accessed": entry.last_accessed_at().isoformat(),
                 "access_count": entry.access_count,
                 "ttl_seconds": entry.ttl_seconds,
                 "is_expired": entry.is_expired(),
                 "tags": list(entry.tags),
                 "value_type": type(entry.value).__name__,
-                "value_size_bytes": len(str(entry.value))
+                "value_size_bytes": entry.size_bytes or len(str(entry.value))
             }
     
+    def set_namespace(self, namespace: str) -> None:
+        """Select the persistent tier namespace (e.g. the registry content hash)"""
+        if self.persistent_tier is not None:
+            self.persistent_tier.set_namespace(namespace)
+    
+    def _get_persistent(self, key: str) -> Optional[Any]:
+        """Read through to the persistent tier on a memory miss, promoting hits"""
+        if self.persistent_tier is not None:
+            persisted = self.persistent_tier.get(key)
+            if persisted is not None:
+                self._store(key, persisted.value, persisted.ttl_remaining, persisted.tags)
+                self.hits += 1
+                self.persistent_hits += 1
+                return persisted.value
+        
+        self.misses += 1
+        return None
+    
     def _remove_entry(self, key: str) -> None:
         """Remove entry and update tag index"""
-        entry = self._cache.get(key)
+        entry = self._cache.pop(key, None)
         if entry:
             # Remove from tag index
             for tag in entry.tags:
@@ -276,44 +443,61 @@ class DomainCache(DomainSystemComponent, CacheInterface):
                 if not self._tag_index[tag]:
                     del self._tag_index[tag]
             
-            # Remove from cache
-            del self._cache[key]
+            # Expiry heap items are dropped lazily when popped
+            self._total_bytes -= entry.size_bytes
     
-    def _evict_entries(self, count: int) -> None:
+    def _over_capacity(self, incoming_bytes: int) -> bool:
+        """Check if adding an entry of the given size exceeds a limit"""
+        if len(self._cache) >= self.max_size:
+            return True
+        return (self.max_memory_bytes is not None
+                and self._total_bytes + incoming_bytes > self.max_memory_bytes)
+    
+    def _evict_entries(self, count: int) -> int:
         """Evict entries using LRU policy"""
         if not self.enable_lru or not self._cache:
-            return
-        
-        # Sort by last accessed time (LRU)
-        entries_by_access = sorted(
-            self._cache.items(),
-            key=lambda x: x[1].last_accessed
-        )
+            return 0
         
         evicted = 0
-        for key, _ in entries_by_access:
-            if evicted >= count:
-                break
-            
-            self._remove_entry(key)
+        while evicted < count and self._cache:
+            # Least recently used entry is at the front of the ordered dict
+            self._remove_entry(next(iter(self._cache)))
             evicted += 1
         
         self.evictions += evicted
         self.logger.debug(f"Evicted {evicted} entries using LRU policy")
+        return evicted
+    
+    def _purge_expired(self, now: float) -> int:
+        """Remove entries whose deadline has passed, earliest first"""
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale heap items for replaced or removed entries
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_entry(key)
+                removed += 1
+        return removed
+    
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap when stale items dominate it"""
+        if len(self._expiry_heap) <= 2 * len(self._cache) + 64:
+            return
+        self._expiry_heap = [
+            item for item in self._expiry_heap
+            if item[2] in self._cache and self._cache[item[2]].expires_at == item[0]
+        ]
+        heapq.heapify(self._expiry_heap)
     
     def _cleanup_expired_entries(self) -> None:
         """Clean up expired entries"""
         with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-            
-            for key in expired_keys:
-                self._remove_entry(key)
+            removed = self._purge_expired(time.monotonic())
             
-            if expired_keys:
-                self.logger.debug(f"Cleaned up {len(expired_keys)} expired entries")
+            if removed:
+                self.logger.debug(f"Cleaned up {removed} expired entries")
     
     def _start_cleanup_timer(self) -> None:
         """Start background cleanup timer"""
@@ -340,6 +524,11 @@ class DomainCache(DomainSystemComponent, CacheInterface):
         with self._lock:
             self._cache.clear()
             self._tag_index.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
+            if self.persistent_tier is not None:
+                self.persistent_tier.close()
+                self.persistent_tier = None
         
         self.logger.info("DomainCache shutdown complete")
 
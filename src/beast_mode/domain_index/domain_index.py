@@ -276,6 +276,45 @@ class DomainIndex(DomainSystemComponent, IndexInterface):
                 'max_results': self.max_results
             }
     
+    def export_state(self) -> Dict[str, Any]:
+        """Export index structures as a picklable snapshot"""
+        with self._lock:
+            return {
+                'text_index': {token: list(entries) for token, entries in self._text_index.items()},
+                'pattern_index': {key: set(names) for key, names in self._pattern_index.items()},
+                'dependency_index': {key: set(names) for key, names in self._dependency_index.items()},
+                'reverse_dependency_index': {key: set(names) for key, names in self._reverse_dependency_index.items()},
+                'category_index': {key: set(names) for key, names in self._category_index.items()},
+                'tag_index': {key: set(names) for key, names in self._tag_index.items()},
+                'indexed_domains': set(self._indexed_domains),
+                'total_entries': self.total_entries
+            }
+    
+    def import_state(self, state: Dict[str, Any]) -> bool:
+        """Restore index structures from a snapshot created by export_state"""
+        with self._lock:
+            try:
+                self._clear_index()
+                # Copy containers so later incremental updates never touch the snapshot
+                for token, entries in state['text_index'].items():
+                    self._text_index[token] = list(entries)
+                for index_name in ('pattern_index', 'dependency_index', 'reverse_dependency_index',
+                                   'category_index', 'tag_index'):
+                    index = getattr(self, f"_{index_name}")
+                    for key, names in state[index_name].items():
+                        index[key] = set(names)
+                self._indexed_domains.update(state['indexed_domains'])
+                self.total_entries = state['total_entries']
+                
+                self._last_build_time = datetime.now()
+                self._index_version += 1
+                return True
+            
+            except Exception as e:
+                self._clear_index()
+                self._handle_error(e, "import_state")
+                return False
+    
     def rebuild_index(self) -> bool:
         """Rebuild the entire index (placeholder - requires domain collection)"""
         # This would typically be called by the registry manager
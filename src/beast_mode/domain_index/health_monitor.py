@@ -6,9 +6,10 @@ including dependency validation, file pattern checking, and health reporting.
 """
 
 import os
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -21,7 +22,9 @@ from .models import (
 from .exceptions import HealthMonitorError, HealthCheckFailedError
 from .config import get_config
 from .health_reporter import HealthReportGenerator
-from ..utils.path_normalizer import safe_relative_to
+from .domain_cache import DomainCache
+from .pattern_matcher import DomainPatternMatcher, compile_glob, glob_matches
+from ..utils.project_walker import ProjectWalker
 
 
 class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
@@ -36,6 +39,8 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
     - Issue detection and resolution suggestions
     """
     
+    HEALTH_CACHE_KEY = "health:statuses"
+    
     def __init__(self, registry_manager=None, config: Optional[Dict[str, Any]] = None):
         super().__init__("domain_health_monitor", config)
         
@@ -64,6 +69,16 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
         # Project root for file validation
         self.project_root = Path.cwd()
         
+        # Project files classified by (domain, pattern) with one combined
+        # matcher, shared by pattern, content and orphaned file checks
+        self.pattern_index_ttl = self.config.get("pattern_index_ttl_seconds", 60)
+        self._project_files: Optional[List[str]] = None
+        self._pattern_matcher: Optional[DomainPatternMatcher] = None
+        self._pattern_signature: Optional[Tuple[Tuple[str, Tuple[str, ...]], ...]] = None
+        self._pattern_file_index: Dict[Tuple[str, str], List[str]] = {}
+        self._pattern_index_built_at: Optional[float] = None
+        self._pattern_index_lock = threading.RLock()
+        
         # Health reporting integration
         self.health_reporter = None
         
@@ -83,6 +98,7 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
     def set_project_root(self, project_root: str):
         """Set the project root directory for file validation"""
         self.project_root = Path(project_root)
+        self._invalidate_pattern_index()
         self.logger.info(f"Set project root to: {self.project_root}")
     
     def check_domain_health(self, domain_name: str) -> HealthStatus:
@@ -112,6 +128,9 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
                 all_domains = self.registry_manager.get_all_domains()
                 health_statuses = {}
                 
+                # Walk and classify the project once for all domains
+                self._build_pattern_index(all_domains)
+                
                 if self.parallel_checks and len(all_domains) > 1:
                     # Parallel health checks
                     health_statuses = self._parallel_health_checks(all_domains)
@@ -128,6 +147,7 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
                 # Update cache and timestamp
                 self._health_cache.update(health_statuses)
                 self._last_full_check = datetime.now()
+                self._persist_health_statuses()
                 
                 self.logger.info(f"Completed health checks for {len(health_statuses)} domains")
                 return health_statuses
@@ -136,6 +156,32 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
                 self._handle_error(e, "check_all_domains")
                 return {}
     
+    def _get_shared_cache(self):
+        """Registry cache persisted per registry version, if the registry provides one"""
+        get_shared_cache = getattr(self.registry_manager, "get_shared_cache", None)
+        if get_shared_cache is None:
+            return None
+        cache = get_shared_cache()
+        return cache if isinstance(cache, DomainCache) else None
+    
+    def _persist_health_statuses(self) -> None:
+        """Store the latest health statuses so a new process can reuse them"""
+        cache = self._get_shared_cache()
+        if cache is not None:
+            cache.set(self.HEALTH_CACHE_KEY, dict(self._health_cache), self.check_interval * 60,
+                      tags={"health"}, persist=True)
+    
+    def _restore_health_statuses(self) -> bool:
+        """Reload health statuses stored by an earlier check of the same registry"""
+        cache = self._get_shared_cache()
+        statuses = cache.get(self.HEALTH_CACHE_KEY) if cache is not None else None
+        if not statuses:
+            return False
+        
+        self._health_cache.update(statuses)
+        self.logger.debug(f"Restored {len(statuses)} cached health statuses")
+        return True
+    
     def _parallel_health_checks(self, domains: Dict[str, Domain]) -> HealthStatusCollection:
         """Perform health checks in parallel"""
         health_statuses = {}
@@ -217,11 +263,8 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
         
         try:
             for pattern in domain.patterns:
-                # Convert glob pattern to pathlib pattern
-                pattern_path = self.project_root / pattern.replace("**", "*")
-                
                 # Check if pattern matches any files
-                matching_files = list(self.project_root.glob(pattern))
+                matching_files = self._get_matching_files(domain, pattern)
                 
                 if not matching_files:
                     issues.append(HealthIssue(
@@ -257,6 +300,71 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
         
         return issues
     
+    def _invalidate_pattern_index(self) -> None:
+        """Drop the cached project file listing and pattern classification"""
+        with self._pattern_index_lock:
+            self._project_files = None
+            self._pattern_matcher = None
+            self._pattern_signature = None
+            self._pattern_file_index = {}
+            self._pattern_index_built_at = None
+    
+    @staticmethod
+    def _domain_pattern_signature(domains: Dict[str, Domain]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Identify the domain patterns a matcher was compiled from"""
+        return tuple((name, tuple(domain.patterns)) for name, domain in domains.items())
+    
+    def _refresh_pattern_matcher(self, domains: Dict[str, Domain]) -> bool:
+        """Recompile the combined matcher only when the domain patterns changed"""
+        signature = self._domain_pattern_signature(domains)
+        if self._pattern_matcher is not None and signature == self._pattern_signature:
+            return False
+        
+        self._pattern_matcher = DomainPatternMatcher.from_domains(domains)
+        self._pattern_signature = signature
+        return True
+    
+    def _build_pattern_index(self, domains: Dict[str, Domain]) -> None:
+        """Walk the project once and classify every file against all domain patterns"""
+        with self._pattern_index_lock:
+            project_files = list(ProjectWalker(self.project_root).walk_relative())
+            
+            self._project_files = project_files
+            self._refresh_pattern_matcher(domains)
+            self._pattern_file_index = self._pattern_matcher.classify(project_files)
+            self._pattern_index_built_at = time.monotonic()
+    
+    def _ensure_pattern_index(self) -> None:
+        """Build the pattern index if missing or older than the configured TTL"""
+        with self._pattern_index_lock:
+            domains = self.registry_manager.get_all_domains() if self.registry_manager else {}
+            
+            built_at = self._pattern_index_built_at
+            if built_at is not None and time.monotonic() - built_at < self.pattern_index_ttl:
+                # Listing is still fresh; reclassify it only if the domains changed
+                if self._refresh_pattern_matcher(domains):
+                    self._pattern_file_index = self._pattern_matcher.classify(self._project_files)
+                return
+            
+            self._build_pattern_index(domains)
+    
+    def _get_matching_files(self, domain: Domain, pattern: str) -> List[Path]:
+        """Get project files matching a domain pattern from the shared index"""
+        self._ensure_pattern_index()
+        
+        with self._pattern_index_lock:
+            relative_paths = self._pattern_file_index.get((domain.name, pattern))
+            if relative_paths is None:
+                if self._pattern_matcher.has_pattern(domain.name, pattern):
+                    relative_paths = []
+                else:
+                    # Pattern not known to the matcher (e.g. an unregistered or
+                    # edited domain): match it against the cached file listing
+                    regex = compile_glob(pattern)
+                    relative_paths = [path for path in self._project_files if regex.match(path)]
+        
+        return [self.project_root / relative_path for relative_path in relative_paths]
+    
     def _check_dependencies(self, domain: Domain) -> List[HealthIssue]:
         """Check if domain dependencies exist and are accessible"""
         issues = []
@@ -305,8 +413,7 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
             # Get files matching domain patterns
             domain_files = []
             for pattern in domain.patterns:
-                matching_files = list(self.project_root.glob(pattern))
-                domain_files.extend(matching_files)
+                domain_files.extend(self._get_matching_files(domain, pattern))
             
             if not domain_files:
                 return issues  # No files to check
@@ -471,33 +578,16 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
                 if not self.registry_manager:
                     return []
                 
-                # Get all domain patterns
-                all_domains = self.registry_manager.get_all_domains()
-                covered_patterns = set()
-                
-                for domain in all_domains.values():
-                    for pattern in domain.patterns:
-                        covered_patterns.add(pattern)
-                
-                # Find all Python files in the project
-                all_py_files = list(self.project_root.glob("**/*.py"))
-                
-                # Check which files are not covered by any pattern
-                orphaned_files = []
-                for file_path in all_py_files:
-                    relative_path = safe_relative_to(file_path, self.project_root)
-                    if relative_path is None:
-                        continue  # Skip files that can't be made relative
-                    is_covered = False
-                    
-                    for pattern in covered_patterns:
-                        # Simple pattern matching (could be enhanced)
-                        if self._file_matches_pattern(str(relative_path), pattern):
-                            is_covered = True
-                            break
-                    
-                    if not is_covered:
-                        orphaned_files.append(str(relative_path))
+                # Classify all Python files with the shared combined matcher
+                self._ensure_pattern_index()
+                with self._pattern_index_lock:
+                    project_files = list(self._project_files or [])
+                    matcher = self._pattern_matcher
+                
+                orphaned_files = [
+                    relative_path for relative_path in project_files
+                    if relative_path.endswith(".py") and not matcher.is_covered(relative_path)
+                ]
                 
                 return orphaned_files
                 
@@ -507,15 +597,7 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
     
     def _file_matches_pattern(self, file_path: str, pattern: str) -> bool:
         """Check if a file path matches a domain pattern"""
-        # Simple pattern matching - could be enhanced with proper glob matching
-        if "**" in pattern:
-            # Recursive pattern
-            pattern_parts = pattern.split("**")
-            if len(pattern_parts) == 2:
-                prefix, suffix = pattern_parts
-                return file_path.startswith(prefix.rstrip("/")) and file_path.endswith(suffix.lstrip("/"))
-        
-        return pattern in file_path
+        return glob_matches(file_path, pattern)
     
     def detect_circular_dependencies(self) -> List[List[str]]:
         """Detect circular dependency chains"""
@@ -566,7 +648,7 @@ class DomainHealthMonitor(DomainSystemComponent, HealthMonitorInterface):
     def get_health_summary(self) -> Dict[str, Any]:
         """Get overall health summary"""
         try:
-            if not self._health_cache:
+            if not self._health_cache and not self._restore_health_statuses():
                 # Perform health checks if cache is empty
                 self.check_all_domains()
             
@@ -19,6 +19,7 @@ from .exceptions import (
     MakefileIntegrationError, MakefileNotFoundError, MakeTargetExecutionError
 )
 from .config import get_config
+from ..utils.project_walker import ProjectWalker
 
 
 class MakefileIntegrator(DomainSystemComponent, MakefileIntegratorInterface):
@@ -89,12 +90,12 @@ class MakefileIntegrator(DomainSystemComponent, MakefileIntegratorInterface):
                 self._makefile_cache = {}
                 self._target_cache = {}
                 
-                # Scan for makefile files
+                # Scan for makefile files in one directory listing (no duplicates
+                # for names matching several patterns)
                 makefile_patterns = ["*.mk", "Makefile*", "makefile*"]
-                makefile_files = []
-                
-                for pattern in makefile_patterns:
-                    makefile_files.extend(self.makefile_base_path.glob(pattern))
+                makefile_files = list(ProjectWalker(
+                    self.makefile_base_path, patterns=makefile_patterns, max_depth=0
+                ).walk())
                 
                 # Parse each makefile
                 for makefile_path in makefile_files:
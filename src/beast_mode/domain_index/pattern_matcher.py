@@ -0,0 +1,318 @@
+"""
+Domain Pattern Matcher
+
+This module compiles the file patterns of all domains into a single matcher.
+Patterns are grouped in a prefix trie keyed by their literal leading
+directories, and the patterns that share a trie node are combined into one
+regular expression, so every file is classified against every domain in a
+single pass. Results are cached by path.
+
+Patterns use project-root anchored glob semantics, the same as
+``Path(project_root).glob(pattern)``:
+- ``*`` and ``?`` match within a single path component
+- ``**`` as a full component matches zero or more directories
+- ``[...]`` matches a character class (``[!...]`` negates)
+
+With ``anchor_right`` a pattern may also match below the root, like
+``PurePath.match``: ``*.py`` covers ``pkg/sub/mod.py``.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from pathlib import PurePath
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .models import DomainCollection
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+PathLike = Union[str, PurePath]
+
+
+def _normalize_relative(path: PathLike) -> str:
+    """Convert a relative path to the posix form used for matching"""
+    path_str = path.as_posix() if isinstance(path, PurePath) else str(path).replace("\\", "/")
+    while path_str.startswith("./"):
+        path_str = path_str[2:]
+    return path_str.strip("/")
+
+
+def _split_pattern(pattern: str) -> List[str]:
+    """Split a glob pattern into normalized path components"""
+    return [part for part in _normalize_relative(pattern).split("/") if part and part != "."]
+
+
+def _translate_component(component: str) -> str:
+    """Translate a single glob path component to a regex fragment"""
+    result = []
+    i, n = 0, len(component)
+    while i < n:
+        char = component[i]
+        i += 1
+        if char == "*":
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[":
+            j = i
+            if j < n and component[j] in "!^":
+                j += 1
+            if j < n and component[j] == "]":
+                j += 1
+            while j < n and component[j] != "]":
+                j += 1
+            if j >= n:
+                result.append("\\[")
+            else:
+                body = component[i:j].replace("\\", "\\\\")
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                result.append(f"[{body}]")
+                i = j + 1
+        else:
+            result.append(re.escape(char))
+    return "".join(result)
+
+
+def _translate_components(components: List[str]) -> str:
+    """Translate glob path components to an unanchored regex body"""
+    parts = []
+    last = len(components) - 1
+    for index, component in enumerate(components):
+        if component == "**":
+            parts.append(".*" if index == last else "(?:[^/]+/)*")
+        else:
+            parts.append(_translate_component(component))
+            if index != last:
+                parts.append("/")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def compile_glob(pattern: str) -> "re.Pattern[str]":
+    """Compile a root-anchored glob pattern to a regular expression"""
+    return re.compile(_translate_components(_split_pattern(pattern)) + r"\Z")
+
+
+def right_anchored(pattern: str) -> str:
+    """Rewrite a glob pattern so it matches at any depth below the root"""
+    components = _split_pattern(pattern)
+    if components[:1] == ["**"]:
+        return "/".join(components)
+    return "/".join(["**"] + components)
+
+
+def glob_matches(path: PathLike, pattern: str, anchor_right: bool = False) -> bool:
+    """Check if a project-relative path matches a glob pattern
+
+    Patterns are root-anchored unless ``anchor_right`` is set.
+    """
+    if anchor_right:
+        pattern = right_anchored(pattern)
+    return compile_glob(pattern).match(_normalize_relative(path)) is not None
+
+
+class _TrieNode:
+    """Prefix trie node holding patterns whose literal prefix ends here"""
+
+    __slots__ = ("children", "pattern_ids", "remainders", "exact_ids", "keyed", "regex")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Patterns without any literal component after this node's prefix
+        self.pattern_ids: List[int] = []
+        self.remainders: List[str] = []
+        # Patterns keyed by a literal component they require further down
+        # (e.g. "auth" for "src/**/auth/**/*.py"), only tried when the path
+        # contains that component
+        self.keyed: Dict[str, List[Tuple[int, "re.Pattern[str]"]]] = {}
+        # Fully literal patterns ending exactly at this node
+        self.exact_ids: List[int] = []
+        self.regex: Optional["re.Pattern[str]"] = None
+
+    def add(self, pattern_id: int, remainder: List[str]) -> None:
+        """Add a pattern given the components following this node's prefix"""
+        if not remainder:
+            self.exact_ids.append(pattern_id)
+            return
+
+        regex_body = _translate_components(remainder)
+        for component in remainder:
+            if component != "**" and not _GLOB_CHARS.intersection(component):
+                self.keyed.setdefault(component, []).append(
+                    (pattern_id, re.compile(regex_body + r"\Z"))
+                )
+                return
+
+        self.pattern_ids.append(pattern_id)
+        self.remainders.append(regex_body)
+
+    def compile(self) -> None:
+        """Combine all unkeyed patterns of this node into one regex
+
+        Every pattern becomes an optional lookahead followed by an empty
+        capturing group, so a single ``match`` reports all patterns that
+        match instead of only the first alternative.
+        """
+        if self.pattern_ids:
+            self.regex = re.compile("".join(
+                f"(?:(?={remainder}\\Z)())?" for remainder in self.remainders
+            ))
+        for child in self.children.values():
+            child.compile()
+
+
+class DomainPatternMatcher:
+    """
+    Combined matcher for the file patterns of many domains
+
+    Features:
+    - Prefix trie over literal leading directories of each pattern
+    - One combined regex per trie node instead of one match per pattern
+    - Patterns requiring a literal directory are only tried on paths containing it
+    - Single-pass classification of files into covering domains
+    - Bounded per-path result cache
+    - Optional right-anchored matching (``anchor_right``) for ``PurePath.match`` style coverage
+    """
+
+    def __init__(self, domain_patterns: Dict[str, List[str]], cache_size: int = 100000,
+                 anchor_right: bool = False):
+        self.cache_size = cache_size
+        self.anchor_right = anchor_right
+
+        # pattern_id -> (domain_name, pattern)
+        self._patterns: List[Tuple[str, str]] = []
+        self._pattern_keys: Set[Tuple[str, str]] = set()
+        self._domain_order: Dict[str, int] = {}
+        self._root = _TrieNode()
+
+        for domain_name, patterns in domain_patterns.items():
+            self._domain_order.setdefault(domain_name, len(self._domain_order))
+            for pattern in dict.fromkeys(patterns):
+                self._add_pattern(domain_name, pattern)
+        self._root.compile()
+
+        self._cache: Dict[str, Tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def from_domains(cls, domains: DomainCollection, cache_size: int = 100000) -> "DomainPatternMatcher":
+        """Build a matcher from a domain collection"""
+        return cls({name: list(domain.patterns) for name, domain in domains.items()}, cache_size)
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of compiled (domain, pattern) pairs"""
+        return len(self._patterns)
+
+    def has_pattern(self, domain_name: str, pattern: str) -> bool:
+        """Check if a (domain_name, pattern) pair was compiled into this matcher"""
+        return (domain_name, pattern) in self._pattern_keys
+
+    def match_patterns(self, path: PathLike) -> List[Tuple[str, str]]:
+        """Return every (domain_name, pattern) pair matching a project-relative path"""
+        return [self._patterns[pattern_id] for pattern_id in self._match_ids(path)]
+
+    def covering_domains(self, path: PathLike) -> List[str]:
+        """Return the domains covering a project-relative path, in domain order"""
+        domains = dict.fromkeys(self._patterns[pattern_id][0] for pattern_id in self._match_ids(path))
+        return sorted(domains, key=self._domain_order.__getitem__)
+
+    def is_covered(self, path: PathLike) -> bool:
+        """Check if any domain pattern covers a project-relative path"""
+        return bool(self._match_ids(path))
+
+    def classify(self, paths: Iterable[PathLike]) -> Dict[Tuple[str, str], List[str]]:
+        """Group project-relative paths by the (domain_name, pattern) pairs they match"""
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for path in paths:
+            path_str = _normalize_relative(path)
+            for pattern_id in self._match_ids(path_str):
+                groups.setdefault(self._patterns[pattern_id], []).append(path_str)
+        return groups
+
+    def clear_cache(self) -> None:
+        """Drop cached match results"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get matcher statistics"""
+        return {
+            "domains": len(self._domain_order),
+            "patterns": len(self._patterns),
+            "cached_paths": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses
+        }
+
+    def _add_pattern(self, domain_name: str, pattern: str) -> None:
+        components = _split_pattern(right_anchored(pattern) if self.anchor_right else pattern)
+        literal_length = 0
+        for component in components:
+            if _GLOB_CHARS.intersection(component):
+                break
+            literal_length += 1
+
+        node = self._root
+        for component in components[:literal_length]:
+            node = node.children.setdefault(component, _TrieNode())
+
+        pattern_id = len(self._patterns)
+        self._patterns.append((domain_name, pattern))
+        self._pattern_keys.add((domain_name, pattern))
+        node.add(pattern_id, components[literal_length:])
+
+    def _match_ids(self, path: PathLike) -> Tuple[int, ...]:
+        path_str = path if isinstance(path, str) and "\\" not in path and not path.startswith(("./", "/")) \
+            else _normalize_relative(path)
+
+        cached = self._cache.get(path_str)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        self.cache_misses += 1
+
+        matched: List[int] = []
+        components = None
+        node = self._root
+        offset = 0
+        while True:
+            if node.regex is not None:
+                groups = node.regex.match(path_str, offset).groups()
+                matched.extend(
+                    pattern_id for pattern_id, value in zip(node.pattern_ids, groups)
+                    if value is not None
+                )
+
+            if node.keyed:
+                if components is None:
+                    components = set(path_str.split("/"))
+                for component in components.intersection(node.keyed):
+                    matched.extend(
+                        pattern_id for pattern_id, regex in node.keyed[component]
+                        if regex.match(path_str, offset)
+                    )
+
+            separator = path_str.find("/", offset)
+            if separator < 0:
+                leaf = node.children.get(path_str[offset:])
+                if leaf is not None:
+                    matched.extend(leaf.exact_ids)
+                break
+
+            node = node.children.get(path_str[offset:separator])
+            if node is None:
+                break
+            offset = separator + 1
+
+        result = tuple(sorted(matched))
+        with self._lock:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[path_str] = result
+        return result
@@ -0,0 +1,254 @@
+"""
+Persistent Cache Tier
+
+This module provides a SQLite-backed second tier for DomainCache. Entries are
+pickled and stored under a namespace (normally the content hash of the
+registry file), so a new process can reopen parsed domains, index state and
+health results computed by an earlier process for the same registry.
+"""
+
+import fnmatch
+import pickle
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS cache_tags (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (namespace, key, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_tags_tag ON cache_tags (namespace, tag);
+"""
+
+
+@dataclass
+class PersistedEntry:
+    """Entry read back from the persistent tier"""
+    value: Any
+    ttl_remaining: Optional[float]
+    tags: Set[str]
+
+
+class PersistentCacheTier:
+    """
+    SQLite-backed persistent cache tier
+
+    Features:
+    - Namespaced entries (e.g. keyed by registry content hash)
+    - Wall-clock TTL so expirations survive restarts
+    - Tag and key-pattern invalidation mirroring DomainCache
+    - Pruning of entries from stale namespaces
+    - WAL journal for concurrent readers
+    """
+
+    def __init__(self, db_path: Union[str, Path], namespace: str = "default"):
+        self.db_path = Path(db_path)
+        self.namespace = namespace
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def set_namespace(self, namespace: str) -> None:
+        """Switch the namespace used for subsequent operations"""
+        with self._lock:
+            self.namespace = namespace
+
+    def get(self, key: str) -> Optional[PersistedEntry]:
+        """Look up a key in the current namespace"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value_blob, expires_at = row
+            now = time.time()
+            if expires_at is not None and expires_at <= now:
+                self._delete_keys([key])
+                self.misses += 1
+                return None
+
+            try:
+                value = pickle.loads(value_blob)
+            except Exception:
+                # Unreadable entry (e.g. written by an incompatible version)
+                self.errors += 1
+                self._delete_keys([key])
+                self.misses += 1
+                return None
+
+            tags = {tag for (tag,) in self._conn.execute(
+                "SELECT tag FROM cache_tags WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )}
+
+            self.hits += 1
+            return PersistedEntry(value, expires_at - now if expires_at is not None else None, tags)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
+        """Store a value, returning False if it cannot be pickled"""
+        try:
+            value_blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.errors += 1
+            return False
+
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+
+        with self._lock:
+            with self._transaction():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, key, value_blob, now, expires_at)
+                )
+                self._conn.execute(
+                    "DELETE FROM cache_tags WHERE namespace = ? AND key = ?", (self.namespace, key)
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO cache_tags (namespace, key, tag) VALUES (?, ?, ?)",
+                    [(self.namespace, key, tag) for tag in set(tags or ())]
+                )
+            self.writes += 1
+            return True
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from the current namespace"""
+        with self._lock:
+            return self._delete_keys([key]) > 0
+
+    def invalidate_by_tag(self, tag: str) -> List[str]:
+        """Delete all entries of the current namespace carrying a tag, returning their keys"""
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute(
+                "SELECT key FROM cache_tags WHERE namespace = ? AND tag = ?", (self.namespace, tag)
+            )]
+            self._delete_keys(keys)
+            return keys
+
+    def invalidate_by_pattern(self, pattern: str) -> List[str]:
+        """Delete all entries of the current namespace whose key matches a pattern, returning their keys"""
+        with self._lock:
+            keys = [key for key in self.keys() if fnmatch.fnmatch(key, pattern)]
+            self._delete_keys(keys)
+            return keys
+
+    def keys(self) -> List[str]:
+        """List keys of the current namespace"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT key FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            )]
+
+    def clear(self, all_namespaces: bool = False) -> None:
+        """Delete entries of the current namespace (or every namespace)"""
+        with self._lock:
+            with self._transaction():
+                if all_namespaces:
+                    self._conn.execute("DELETE FROM cache_entries")
+                    self._conn.execute("DELETE FROM cache_tags")
+                else:
+                    self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+                    self._conn.execute("DELETE FROM cache_tags WHERE namespace = ?", (self.namespace,))
+
+    def prune(self, keep_namespaces: Optional[Set[str]] = None) -> int:
+        """Drop expired entries and entries outside the kept namespaces"""
+        keep = set(keep_namespaces) if keep_namespaces is not None else {self.namespace}
+        placeholders = ",".join("?" * len(keep))
+
+        with self._lock:
+            with self._transaction():
+                removed = self._conn.execute(
+                    f"DELETE FROM cache_entries WHERE namespace NOT IN ({placeholders}) "
+                    "OR (expires_at IS NOT NULL AND expires_at <= ?)",
+                    (*keep, time.time())
+                ).rowcount
+                self._conn.execute(
+                    "DELETE FROM cache_tags WHERE NOT EXISTS ("
+                    "SELECT 1 FROM cache_entries e WHERE e.namespace = cache_tags.namespace "
+                    "AND e.key = cache_tags.key)"
+                )
+            return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get persistent tier statistics"""
+        with self._lock:
+            entries, size_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+            return {
+                "db_path": str(self.db_path),
+                "namespace": self.namespace,
+                "entries": entries,
+                "size_bytes": size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "errors": self.errors
+            }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _delete_keys(self, keys: List[str]) -> int:
+        if not keys:
+            return 0
+        params = [(self.namespace, key) for key in keys]
+        with self._transaction():
+            removed = self._conn.executemany(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", params
+            ).rowcount
+            self._conn.executemany("DELETE FROM cache_tags WHERE namespace = ? AND key = ?", params)
+        return removed
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+
+class _Transaction:
+    """Explicit BEGIN/COMMIT block for an autocommit connection"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
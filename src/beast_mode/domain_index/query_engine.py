@@ -5,6 +5,7 @@ This module provides intelligent querying capabilities for domain information,
 including pattern matching, content-based search, and natural language processing.
 """
 
+import heapq
 import re
 import time
 from typing import List, Dict, Optional, Any, Set
@@ -16,6 +17,7 @@ from .interfaces import QueryEngineInterface
 from .models import Domain, QueryResult
 from .exceptions import QueryEngineError, InvalidQueryError, QueryTimeoutError
 from .config import get_config
+from .search_index import InvertedSearchIndex
 
 
 class DomainQueryEngine(CachedComponent, QueryEngineInterface):
@@ -55,12 +57,49 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
         self._capability_index = {}
         self._index_built = False
         
+        # Tokenized inverted index with BM25 ranking, kept up to date
+        # incrementally through registry change notifications
+        self._search_index = InvertedSearchIndex(
+            k1=self.config.get('bm25_k1', 1.2),
+            b=self.config.get('bm25_b', 0.75)
+        )
+        self._indexed_domains: Dict[str, Domain] = {}
+        self._domain_index_keys: Dict[str, Dict[str, Set[str]]] = {}
+        self.index_updates = 0
+        
         self.logger.info("Initialized DomainQueryEngine")
     
     def set_registry_manager(self, registry_manager):
         """Set the registry manager (dependency injection)"""
+        if self.registry_manager is not None and hasattr(self.registry_manager, "remove_change_listener"):
+            self.registry_manager.remove_change_listener(self._on_registry_change)
+        
         self.registry_manager = registry_manager
         self._index_built = False  # Rebuild indexes when registry changes
+        
+        if registry_manager is not None and hasattr(registry_manager, "add_change_listener"):
+            registry_manager.add_change_listener(self._on_registry_change)
+    
+    def _on_registry_change(self, event: str, domain_name: str, domain: Optional[Domain] = None) -> None:
+        """Apply a registry mutation to the search indexes incrementally"""
+        if not self._index_built:
+            return  # Indexes will be built from scratch on next use
+        
+        if event == "reloaded":
+            self._index_built = False
+            return
+        
+        try:
+            self._unindex_domain(domain_name)
+            if event in ("created", "updated") and domain is not None:
+                self._index_domain(domain)
+            self.index_updates += 1
+            
+            # Cached query results may reference the changed domain
+            self._clear_cache()
+        except Exception as e:
+            self._handle_error(e, "incremental_index_update")
+            self._index_built = False
     
     def _ensure_indexes_built(self):
         """Ensure search indexes are built"""
@@ -77,31 +116,12 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
                 self._pattern_index = {}
                 self._content_index = {}
                 self._capability_index = {}
+                self._indexed_domains = {}
+                self._domain_index_keys = {}
+                self._search_index.clear()
                 
-                # Build pattern index
-                for domain_name, domain in domains.items():
-                    # Index file patterns
-                    for pattern in domain.patterns:
-                        pattern_key = pattern.lower()
-                        if pattern_key not in self._pattern_index:
-                            self._pattern_index[pattern_key] = set()
-                        self._pattern_index[pattern_key].add(domain_name)
-                    
-                    # Index content indicators
-                    for indicator in domain.content_indicators:
-                        indicator_key = indicator.lower()
-                        if indicator_key not in self._content_index:
-                            self._content_index[indicator_key] = set()
-                        self._content_index[indicator_key].add(domain_name)
-                    
-                    # Index capabilities (from requirements and tools)
-                    capabilities = domain.requirements + [domain.tools.linter, domain.tools.formatter]
-                    for capability in capabilities:
-                        if capability:
-                            cap_key = capability.lower()
-                            if cap_key not in self._capability_index:
-                                self._capability_index[cap_key] = set()
-                            self._capability_index[cap_key].add(domain_name)
+                for domain in domains.values():
+                    self._index_domain(domain)
                 
                 self._index_built = True
                 self.logger.info(f"Built search indexes for {len(domains)} domains")
@@ -109,6 +129,50 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
             except Exception as e:
                 self._handle_error(e, "build_indexes")
     
+    def _index_domain(self, domain: Domain) -> None:
+        """Add a single domain to all search indexes"""
+        # Index file patterns
+        pattern_keys = {pattern.lower() for pattern in domain.patterns}
+        
+        # Index content indicators
+        indicator_keys = {indicator.lower() for indicator in domain.content_indicators}
+        
+        # Index capabilities (from requirements and tools)
+        capabilities = domain.requirements + [domain.tools.linter, domain.tools.formatter]
+        capability_keys = {capability.lower() for capability in capabilities if capability}
+        
+        for index, keys in ((self._pattern_index, pattern_keys),
+                            (self._content_index, indicator_keys),
+                            (self._capability_index, capability_keys)):
+            for key in keys:
+                index.setdefault(key, set()).add(domain.name)
+        
+        self._domain_index_keys[domain.name] = {
+            "patterns": pattern_keys,
+            "content": indicator_keys,
+            "capabilities": capability_keys
+        }
+        self._indexed_domains[domain.name] = domain
+        self._search_index.add_domain(domain)
+    
+    def _unindex_domain(self, domain_name: str) -> None:
+        """Remove a single domain from all search indexes"""
+        keys = self._domain_index_keys.pop(domain_name, None)
+        if keys:
+            for index, index_keys in ((self._pattern_index, keys["patterns"]),
+                                      (self._content_index, keys["content"]),
+                                      (self._capability_index, keys["capabilities"])):
+                for key in index_keys:
+                    names = index.get(key)
+                    if names is None:
+                        continue
+                    names.discard(domain_name)
+                    if not names:
+                        del index[key]
+        
+        self._indexed_domains.pop(domain_name, None)
+        self._search_index.remove_domain(domain_name)
+    
     def natural_language_query(self, query: str) -> QueryResult:
         """Process natural language queries about domains with advanced NLP"""
         with self._time_operation("natural_language_query"):
@@ -133,10 +197,18 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
                 relevance_scores = self._calculate_enhanced_relevance_scores(domains, parsed_query)
                 
                 # Sort by relevance with tie-breaking
-                domains.sort(key=lambda d: (
-                    relevance_scores.get(d.name, 0.0),
-                    d.name  # Tie-breaker for consistent ordering
-                ), reverse=True)
+                def rank_key(d):
+                    return (
+                        relevance_scores.get(d.name, 0.0),
+                        d.name  # Tie-breaker for consistent ordering
+                    )
+
+                if any(m.startswith("sort_by:") for m in parsed_query.get("modifiers", [])):
+                    domains.sort(key=rank_key, reverse=True)
+                else:
+                    # Only the top results survive the limit below, so select
+                    # them with a heap instead of sorting every match
+                    domains = heapq.nlargest(self.max_results, domains, key=rank_key)
                 
                 # Apply result ranking and filtering
                 domains = self._rank_and_filter_results(domains, parsed_query)
@@ -891,26 +963,12 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
         return factors
     
     def _search_by_patterns(self, keywords: List[str]) -> List[Domain]:
-        """Search domains by pattern keywords"""
-        results = []
-        seen_names = set()
-        for keyword in keywords:
-            for domain in self.pattern_search(keyword):
-                if domain.name not in seen_names:
-                    results.append(domain)
-                    seen_names.add(domain.name)
-        return results
+        """Search domains by pattern keywords using the inverted index"""
+        return self._search_inverted_index(keywords, fields=["patterns"])
     
     def _search_by_content(self, keywords: List[str]) -> List[Domain]:
-        """Search domains by content keywords"""
-        results = []
-        seen_names = set()
-        for keyword in keywords:
-            for domain in self.content_search(keyword):
-                if domain.name not in seen_names:
-                    results.append(domain)
-                    seen_names.add(domain.name)
-        return results
+        """Search domains by content keywords using the inverted index"""
+        return self._search_inverted_index(keywords, fields=["content_indicators"])
     
     def _search_by_capabilities(self, keywords: List[str]) -> List[Domain]:
         """Search domains by capability keywords"""
@@ -924,31 +982,16 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
         return results
     
     def _combined_search(self, keywords: List[str]) -> List[Domain]:
-        """Perform combined search across all indexes"""
-        all_results = set()
-        
-        for keyword in keywords:
-            # Search patterns
-            pattern_results = self.pattern_search(keyword)
-            all_results.update(d.name for d in pattern_results)
-            
-            # Search content
-            content_results = self.content_search(keyword)
-            all_results.update(d.name for d in content_results)
-            
-            # Search capabilities
-            capability_results = self.capability_search(keyword)
-            all_results.update(d.name for d in capability_results)
-        
-        # Convert back to domain objects
-        domains = []
-        if self.registry_manager:
-            all_domains = self.registry_manager.get_all_domains()
-            for domain_name in all_results:
-                if domain_name in all_domains:
-                    domains.append(all_domains[domain_name])
+        """Perform combined search across all indexed fields"""
+        return self._search_inverted_index(keywords)
+    
+    def _search_inverted_index(self, keywords: List[str], fields: Optional[List[str]] = None,
+                               top_k: Optional[int] = None) -> List[Domain]:
+        """Rank domains with BM25 over the inverted index, best matches first"""
+        self._ensure_indexes_built()
         
-        return domains
+        hits = self._search_index.search(keywords, top_k=top_k, fields=fields)
+        return [self._indexed_domains[name] for name, _ in hits if name in self._indexed_domains]
     
     def _calculate_relevance_scores(self, domains: List[Domain], keywords: List[str]) -> Dict[str, float]:
         """Calculate enhanced relevance scores for search results"""
@@ -1011,23 +1054,27 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
                     if keyword.lower() in tag.lower():
                         score += 1.0
             
-            # Boost score for domains with better health status
-            if domain.health_status:
-                if domain.health_status.status.value == "healthy":
-                    score *= 1.1
-                elif domain.health_status.status.value == "degraded":
-                    score *= 0.9
-                elif domain.health_status.status.value == "failed":
-                    score *= 0.7
-            
-            # Boost score for extraction candidates
-            if domain.metadata.extraction_candidate == "high":
-                score *= 1.05
-            
-            scores[domain.name] = score
+            scores[domain.name] = self._apply_status_boost(domain, score)
         
         return scores
     
+    def _apply_status_boost(self, domain: Domain, score: float) -> float:
+        """Scale a keyword relevance score by domain health and extraction status"""
+        # Boost score for domains with better health status
+        if domain.health_status:
+            if domain.health_status.status.value == "healthy":
+                score *= 1.1
+            elif domain.health_status.status.value == "degraded":
+                score *= 0.9
+            elif domain.health_status.status.value == "failed":
+                score *= 0.7
+        
+        # Boost score for extraction candidates
+        if domain.metadata.extraction_candidate == "high":
+            score *= 1.05
+        
+        return score
+    
     def _parse_natural_language_query(self, query: str) -> Dict[str, Any]:
         """Parse natural language query into structured components"""
         query_lower = query.lower().strip()
@@ -1465,12 +1512,13 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
         entities = parsed_query.get("entities", {})
         intent = parsed_query.get("intent", "general_search")
         
+        # Base relevance from keywords, scored with BM25 over the posting
+        # lists of the query terms instead of scanning every domain field
+        self._ensure_indexes_built()
+        base_scores = self._search_index.score_domains(keywords, (d.name for d in domains))
+        
         for domain in domains:
-            score = 0.0
-            
-            # Base relevance from keywords
-            base_scores = self._calculate_relevance_scores([domain], keywords)
-            score += base_scores.get(domain.name, 0.0)
+            score = self._apply_status_boost(domain, base_scores.get(domain.name, 0.0))
             
             # Boost based on entity matches
             for domain_name in entities.get("domain_names", []):
@@ -1815,5 +1863,7 @@ class DomainQueryEngine(CachedComponent, QueryEngineInterface):
             "pattern_index_size": len(self._pattern_index),
             "content_index_size": len(self._content_index),
             "capability_index_size": len(self._capability_index),
+            "search_index": self._search_index.get_stats(),
+            "incremental_index_updates": self.index_updates,
             "cache_stats": self.get_cache_stats()
         }
\ No newline at end of file
@@ -5,10 +5,11 @@ This module provides the core domain registry management functionality,
 including loading, parsing, and managing the project_model_registry.json file.
 """
 
+import hashlib
 import json
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 
 from .base import CachedComponent
@@ -36,8 +37,11 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
     - Domain retrieval with caching
     - Validation and consistency checking
     - Dependency graph analysis
+    - Warm restart from the persistent cache tier, keyed by registry content hash
     """
     
+    REGISTRY_SNAPSHOT_KEY = "registry_snapshot"
+    
     def __init__(self, registry_path: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
         super().__init__("domain_registry_manager", config)
         
@@ -54,7 +58,9 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
         self._registry_version = None
         
         # Initialize caching, indexing, and validation systems
-        cache_config = self.config.get('cache', {})
+        cache_config = dict(self.config.get('cache', {}))
+        cache_config.setdefault('persistent_cache_path', self.config_obj.get("persistent_cache_path"))
+        self.snapshot_ttl = cache_config.get('registry_snapshot_ttl_seconds', 86400)
         index_config = self.config.get('index', {})
         validator_config = self.config.get('validator', {})
         
@@ -63,6 +69,9 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
         self._index = DomainIndex(index_config)
         self._validator = DomainValidator(validator_config)
         
+        # Listeners notified of domain mutations as (event, domain_name, domain)
+        self._change_listeners: List[Callable[[str, str, Optional[Domain]], None]] = []
+        
         # Statistics
         self.load_count = 0
         self.validation_count = 0
@@ -77,12 +86,19 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 if not self.registry_path.exists():
                     raise DomainRegistryError(f"Registry file not found: {self.registry_path}")
                 
-                # Load raw JSON data
-                with open(self.registry_path, 'r', encoding='utf-8') as f:
-                    self._raw_registry_data = json.load(f)
+                # Load raw registry content; its hash keys the persistent cache tier
+                with open(self.registry_path, 'rb') as f:
+                    raw_content = f.read()
+                self._registry_version = hashlib.sha256(raw_content).hexdigest()
+                self._cache.set_namespace(self._registry_version)
                 
-                # Parse domains from registry
-                self._parse_domains()
+                # Reuse parsed domains and index state from an earlier process if possible
+                restored = self._restore_registry_snapshot()
+                if not restored:
+                    self._raw_registry_data = json.loads(raw_content.decode('utf-8'))
+                    
+                    # Parse domains from registry
+                    self._parse_domains()
                 
                 # Update metadata
                 self._registry_loaded = True
@@ -93,12 +109,17 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 self._clear_cache()
                 
                 # Rebuild index with new data
-                self._index.build_index(self._domains)
+                if not restored:
+                    self._index.build_index(self._domains)
+                    self._save_registry_snapshot()
                 
                 # Warm cache with frequently accessed domains
                 self._warm_cache()
                 
-                self.logger.info(f"Successfully loaded {len(self._domains)} domains from registry")
+                self._notify_change("reloaded", "")
+                
+                source = "persistent cache" if restored else "registry"
+                self.logger.info(f"Successfully loaded {len(self._domains)} domains from {source}")
                 return True
                 
             except json.JSONDecodeError as e:
@@ -110,6 +131,55 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 self._handle_error(e, "load_registry")
                 return False
     
+    def _restore_registry_snapshot(self) -> bool:
+        """Restore parsed domains and index state for the current registry hash"""
+        if self._cache.persistent_tier is None:
+            return False
+        
+        snapshot = self._cache.get(self.REGISTRY_SNAPSHOT_KEY)
+        if not isinstance(snapshot, dict):
+            return False
+        
+        try:
+            if not self._index.import_state(snapshot["index"]):
+                return False
+            self._raw_registry_data = snapshot["raw"]
+            self._domains = dict(snapshot["domains"])
+            return True
+        except (KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring invalid registry snapshot: {e}")
+            return False
+    
+    def _save_registry_snapshot(self) -> None:
+        """Persist parsed domains and index state under the current registry hash"""
+        if self._cache.persistent_tier is None:
+            return
+        
+        snapshot = {
+            "raw": self._raw_registry_data,
+            "domains": dict(self._domains),
+            "index": self._index.export_state()
+        }
+        self._cache.set(self.REGISTRY_SNAPSHOT_KEY, snapshot, self.snapshot_ttl,
+                        tags={"registry_snapshot"}, persist=True)
+        # Entries cached for other registry versions can never be hit again
+        self._cache.persistent_tier.prune()
+    
+    def _clear_cache(self) -> None:
+        """Clear in-memory cache entries
+        
+        Persisted entries are namespaced by the registry content hash, so they
+        stay valid for this registry version and are kept for warm restarts.
+        """
+        self._cache.clear_memory()
+        self._cache_timestamps.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def get_shared_cache(self) -> DomainCache:
+        """Cache shared with other components (results persisted per registry version)"""
+        return self._cache
+    
     def _parse_domains(self) -> None:
         """Parse domains from raw registry data"""
         self._domains = {}
@@ -292,6 +362,8 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 # Invalidate cache entries
                 self._domain_cache.invalidate_domain(domain.name)
                 
+                self._notify_change("updated", domain.name, domain)
+                
                 self.logger.info(f"Updated domain: {domain.name}")
                 return True
                 
@@ -321,6 +393,8 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 # Invalidate cache
                 self._domain_cache.invalidate_domain(domain.name)
                 
+                self._notify_change("created", domain.name, domain)
+                
                 self.logger.info(f"Created new domain: {domain.name}")
                 return True
                 
@@ -348,6 +422,8 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 # Invalidate cache
                 self._domain_cache.invalidate_domain(domain_name)
                 
+                self._notify_change("deleted", domain_name)
+                
                 self.logger.info(f"Deleted domain: {domain_name}")
                 return True
                 
@@ -355,6 +431,31 @@ class DomainRegistryManager(CachedComponent, DomainRegistryInterface):
                 self._handle_error(e, "delete_domain")
                 return False
     
+    def add_change_listener(self, listener: Callable[[str, str, Optional[Domain]], None]) -> None:
+        """Register a listener for domain mutations
+        
+        Listeners are called with the event ("created", "updated", "deleted"
+        or "reloaded"), the domain name and the new domain (if any), so that
+        derived indexes can be maintained incrementally.
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[str, str, Optional[Domain]], None]) -> bool:
+        """Unregister a domain mutation listener"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+            return True
+        return False
+    
+    def _notify_change(self, event: str, domain_name: str, domain: Optional[Domain] = None) -> None:
+        """Notify listeners of a domain mutation"""
+        for listener in list(self._change_listeners):
+            try:
+                listener(event, domain_name, domain)
+            except Exception as e:
+                self.logger.warning(f"Change listener failed for {event} '{domain_name}': {e}")
+    
     def get_registry_stats(self) -> Dict[str, Any]:
         """Get comprehensive registry statistics"""
         return {
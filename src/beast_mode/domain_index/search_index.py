@@ -0,0 +1,278 @@
+"""
+Inverted Search Index
+
+This module provides a tokenized inverted index over domain fields with
+BM25 ranking. Posting lists and per-document term frequencies are kept up
+to date incrementally, so single-domain mutations never require a rebuild.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Iterable
+
+from .models import Domain
+
+
+# Tokens are alphanumeric runs, so "src/test/**/*.py" -> ["src", "test", "py"]
+# and "test_domain" -> ["test", "domain"].
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens"""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedSearchIndex:
+    """
+    Tokenized inverted index with BM25F-style scoring
+
+    Features:
+    - Posting lists mapping term -> {domain_name: weighted term frequency}
+    - Per-field weights folded into term frequencies at index time
+    - Prefix expansion over a sorted vocabulary
+    - Incremental add/remove/update of single domains
+    - Top-k selection with a heap
+    """
+
+    DEFAULT_FIELD_WEIGHTS = {
+        'name': 3.0,
+        'description': 1.0,
+        'patterns': 1.0,
+        'content_indicators': 1.5,
+        'requirements': 1.2,
+        'tools': 1.0,
+        'tags': 1.0,
+        'demo_role': 1.5
+    }
+
+    def __init__(self, field_weights: Optional[Dict[str, float]] = None,
+                 k1: float = 1.2, b: float = 0.75, prefix_weight: float = 0.5,
+                 min_prefix_length: int = 3):
+        self.field_weights = dict(field_weights or self.DEFAULT_FIELD_WEIGHTS)
+        self.k1 = k1
+        self.b = b
+        self.prefix_weight = prefix_weight
+        self.min_prefix_length = min_prefix_length
+
+        # term -> {domain_name: weighted tf}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        # field -> term -> set of domain names (for field-restricted search)
+        self._field_postings: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        # domain_name -> {term: weighted tf}, used for removal
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        # domain_name -> {field: set(terms)}, used for removal
+        self._doc_field_terms: Dict[str, Dict[str, Set[str]]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+
+        # Sorted vocabulary for prefix expansion, rebuilt lazily
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, domain_name: str) -> bool:
+        return domain_name in self._doc_terms
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct indexed terms"""
+        return len(self._postings)
+
+    @property
+    def average_document_length(self) -> float:
+        """Average weighted document length"""
+        return self._total_length / len(self._doc_terms) if self._doc_terms else 0.0
+
+    def build(self, domains: Iterable[Domain]) -> None:
+        """Rebuild the index from scratch"""
+        with self._lock:
+            self.clear()
+            for domain in domains:
+                self._add(domain)
+
+    def clear(self) -> None:
+        """Remove all documents from the index"""
+        with self._lock:
+            self._postings.clear()
+            self._field_postings.clear()
+            self._doc_terms.clear()
+            self._doc_field_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0.0
+            self._vocabulary = []
+            self._vocabulary_dirty = False
+
+    def add_domain(self, domain: Domain) -> None:
+        """Add or replace a single domain"""
+        with self._lock:
+            if domain.name in self._doc_terms:
+                self._remove(domain.name)
+            self._add(domain)
+
+    def remove_domain(self, domain_name: str) -> bool:
+        """Remove a single domain, returning True if it was indexed"""
+        with self._lock:
+            if domain_name not in self._doc_terms:
+                return False
+            self._remove(domain_name)
+            return True
+
+    def search(self, keywords: List[str], top_k: Optional[int] = None,
+               fields: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+        """Rank domains against keywords, returning (domain_name, score) pairs"""
+        with self._lock:
+            scores = self._score(keywords, fields=fields)
+            if top_k is None:
+                return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def score_domains(self, keywords: List[str], domain_names: Iterable[str]) -> Dict[str, float]:
+        """BM25 scores for a given set of domains (0.0 for non-matching domains)"""
+        with self._lock:
+            candidates = set(domain_names)
+            scores = self._score(keywords, restrict_to=candidates)
+            return {name: scores.get(name, 0.0) for name in candidates}
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get index statistics"""
+        with self._lock:
+            return {
+                "documents": len(self._doc_terms),
+                "terms": len(self._postings),
+                "postings": sum(len(p) for p in self._postings.values()),
+                "average_document_length": self.average_document_length
+            }
+
+    def _field_texts(self, domain: Domain) -> Dict[str, List[str]]:
+        """Extract indexable text for each field of a domain"""
+        tools = [domain.tools.linter, domain.tools.formatter, domain.tools.validator]
+        tools.extend(domain.tools.custom_tools.values())
+
+        return {
+            'name': [domain.name],
+            'description': [domain.description],
+            'patterns': list(domain.patterns),
+            'content_indicators': list(domain.content_indicators),
+            'requirements': list(domain.requirements),
+            'tools': [tool for tool in tools if tool],
+            'tags': list(domain.metadata.tags),
+            'demo_role': [domain.metadata.demo_role]
+        }
+
+    def _add(self, domain: Domain) -> None:
+        term_freqs: Dict[str, float] = defaultdict(float)
+        field_terms: Dict[str, Set[str]] = {}
+
+        for field_name, texts in self._field_texts(domain).items():
+            weight = self.field_weights.get(field_name, 1.0)
+            terms = set()
+            for text in texts:
+                for token in tokenize(text):
+                    term_freqs[token] += weight
+                    terms.add(token)
+            if terms:
+                field_terms[field_name] = terms
+
+        for term, tf in term_freqs.items():
+            if term not in self._postings:
+                self._vocabulary_dirty = True
+            self._postings[term][domain.name] = tf
+
+        for field_name, terms in field_terms.items():
+            for term in terms:
+                self._field_postings[field_name][term].add(domain.name)
+
+        length = sum(term_freqs.values())
+        self._doc_terms[domain.name] = dict(term_freqs)
+        self._doc_field_terms[domain.name] = field_terms
+        self._doc_lengths[domain.name] = length
+        self._total_length += length
+
+    def _remove(self, domain_name: str) -> None:
+        for term in self._doc_terms.pop(domain_name, {}):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(domain_name, None)
+            if not posting:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+        for field_name, terms in self._doc_field_terms.pop(domain_name, {}).items():
+            field_index = self._field_postings[field_name]
+            for term in terms:
+                names = field_index.get(term)
+                if names is None:
+                    continue
+                names.discard(domain_name)
+                if not names:
+                    del field_index[term]
+
+        self._total_length -= self._doc_lengths.pop(domain_name, 0.0)
+
+    def _expand_term(self, term: str) -> List[Tuple[str, float]]:
+        """Expand a query term to indexed terms with a match weight"""
+        expanded = []
+        if term in self._postings:
+            expanded.append((term, 1.0))
+
+        if len(term) >= self.min_prefix_length:
+            if self._vocabulary_dirty:
+                self._vocabulary = sorted(self._postings)
+                self._vocabulary_dirty = False
+            start = bisect.bisect_right(self._vocabulary, term)
+            for indexed_term in self._vocabulary[start:]:
+                if not indexed_term.startswith(term):
+                    break
+                expanded.append((indexed_term, self.prefix_weight))
+
+        return expanded
+
+    def _score(self, keywords: List[str], fields: Optional[List[str]] = None,
+               restrict_to: Optional[Set[str]] = None) -> Dict[str, float]:
+        scores: Dict[str, float] = defaultdict(float)
+        doc_count = len(self._doc_terms)
+        if doc_count == 0:
+            return scores
+        avg_length = self.average_document_length or 1.0
+
+        query_terms = []
+        for keyword in keywords:
+            query_terms.extend(tokenize(keyword))
+
+        for query_term in dict.fromkeys(query_terms):
+            for term, match_weight in self._expand_term(query_term):
+                posting = self._postings[term]
+                idf = math.log(1.0 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+
+                allowed = None
+                if fields is not None:
+                    allowed = set()
+                    for field_name in fields:
+                        allowed.update(self._field_postings.get(field_name, {}).get(term, ()))
+
+                if restrict_to is not None and len(restrict_to) < len(posting):
+                    matches = ((name, posting[name]) for name in restrict_to if name in posting)
+                else:
+                    matches = posting.items()
+
+                for domain_name, tf in matches:
+                    if allowed is not None and domain_name not in allowed:
+                        continue
+                    if restrict_to is not None and domain_name not in restrict_to:
+                        continue
+                    norm = self.k1 * (1.0 - self.b + self.b * self._doc_lengths[domain_name] / avg_length)
+                    scores[domain_name] += match_weight * idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+        return scores
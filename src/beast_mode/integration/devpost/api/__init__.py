@@ -3,5 +3,7 @@ API client for Devpost integration.
 """
 
 from .client import DevpostAPIClient
+from .rate_limiter import AsyncRateLimiter, RateLimitExceeded
+from .response_cache import ResponseCache
 
-__all__ = ["DevpostAPIClient"]
\ No newline at end of file
+__all__ = ["DevpostAPIClient", "AsyncRateLimiter", "RateLimitExceeded", "ResponseCache"]
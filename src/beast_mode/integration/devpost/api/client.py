@@ -21,12 +21,18 @@ from aiohttp import ClientTimeout, ClientError, ClientResponseError
 from ..interfaces import DevpostAPIClientInterface
 from ..models import DevpostProject, AuthResult
 from ..auth.auth_service import DevpostAuthService
+from .rate_limiter import AsyncRateLimiter, RateLimitExceeded
+from .response_cache import ResponseCache
 from ....core.exceptions import NetworkError, AuthenticationError, ValidationError
 
 
 logger = logging.getLogger(__name__)
 
 
+class _InflightRequestCancelled(Exception):
+    """Set on a coalesced request's future when the caller sending it is cancelled"""
+
+
 class DevpostAPIClient(DevpostAPIClientInterface):
     """
     HTTP client for Devpost API with comprehensive error handling and retry logic.
@@ -55,6 +61,18 @@ class DevpostAPIClient(DevpostAPIClientInterface):
     RATE_LIMIT_WINDOW = 60  # seconds
     MAX_REQUESTS_PER_WINDOW = 100  # Conservative limit
     BURST_LIMIT = 10  # Maximum burst requests
+    BURST_WINDOW = 10  # seconds to refill a full burst
+    MAX_RATE_LIMIT_WAIT = 60.0  # seconds a request may wait for capacity before failing
+    
+    # Response cache configuration
+    CACHE_TTL = 300  # 5 minutes
+    CACHE_MAX_ENTRIES = 100
+    
+    # Upload configuration
+    CHUNKED_UPLOAD_THRESHOLD = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
+    CHUNK_RETRY_ATTEMPTS = 3
+    MAX_CONCURRENT_UPLOADS = 4
     
     # HTTP status codes that should trigger retries
     RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
@@ -68,7 +86,11 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retry_attempts: Optional[int] = None,
-        enable_logging: bool = True
+        enable_logging: bool = True,
+        max_rate_limit_wait: Optional[float] = None,
+        cache_max_entries: Optional[int] = None,
+        cache_ttl_overrides: Optional[Dict[str, float]] = None,
+        cache_path: Optional[Path] = None
     ):
         """
         Initialize Devpost API client.
@@ -79,6 +101,10 @@ class DevpostAPIClient(DevpostAPIClientInterface):
             timeout: Request timeout in seconds
             max_retry_attempts: Maximum retry attempts for failed requests
             enable_logging: Enable request/response logging
+            max_rate_limit_wait: Longest a request waits for rate limit capacity
+            cache_max_entries: Maximum number of cached GET responses
+            cache_ttl_overrides: Cache TTLs in seconds by endpoint prefix
+            cache_path: Optional file used to persist the response cache between runs
         """
         self.auth_service = auth_service
         self.base_url = base_url or self.BASE_URL
@@ -91,18 +117,34 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         self._session_created_at: Optional[datetime] = None
         self._session_max_age = timedelta(hours=1)  # Recreate session every hour
         
-        # Rate limiting
-        self._request_timestamps: List[float] = []
-        self._burst_timestamps: List[float] = []
+        # Rate limiting: requests await capacity (FIFO) instead of failing
+        self.max_rate_limit_wait = (
+            max_rate_limit_wait if max_rate_limit_wait is not None else self.MAX_RATE_LIMIT_WAIT
+        )
+        self._rate_limiter = AsyncRateLimiter(
+            max_requests=self.MAX_REQUESTS_PER_WINDOW,
+            window_seconds=self.RATE_LIMIT_WINDOW,
+            burst_limit=self.BURST_LIMIT,
+            burst_window_seconds=self.BURST_WINDOW
+        )
         
         # Request tracking
         self._request_count = 0
         self._error_count = 0
         self._retry_count = 0
         
-        # Response caching (simple in-memory cache)
-        self._response_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_ttl = 300  # 5 minutes
+        # Response caching: LRU with ETag/Last-Modified revalidation
+        self._response_cache = ResponseCache(
+            max_entries=cache_max_entries or self.CACHE_MAX_ENTRIES,
+            default_ttl=self.CACHE_TTL,
+            ttl_overrides=cache_ttl_overrides
+        )
+        self.cache_path = cache_path
+        if cache_path:
+            self._response_cache.load(cache_path)
+        
+        # Identical GETs in flight share one request
+        self._inflight_requests: Dict[str, asyncio.Future] = {}
     
     async def authenticate(self, credentials: Dict[str, Any]) -> AuthResult:
         """
@@ -381,7 +423,7 @@ class DevpostAPIClient(DevpostAPIClientInterface):
                 metadata["is_primary"] = is_primary
             
             # For large files, use chunked upload
-            if file_size > 10 * 1024 * 1024:  # 10MB threshold
+            if file_size > self.CHUNKED_UPLOAD_THRESHOLD:
                 return await self._upload_large_media(
                     project_id, media_path, metadata, progress_callback
                 )
@@ -798,7 +840,6 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         Returns:
             Dictionary with upload result
         """
-        chunk_size = 5 * 1024 * 1024  # 5MB chunks
         file_size = metadata["size"]
         
         # Initialize chunked upload
@@ -809,51 +850,31 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         if not upload_id:
             raise NetworkError("Failed to initialize chunked upload")
         
-        # Upload chunks
+        # Upload chunks; only one chunk is held in memory at a time
         uploaded_chunks = []
         bytes_uploaded = 0
         
         try:
-            with open(media_path, 'rb') as file:
-                chunk_number = 1
+            for offset in range(0, file_size, self.UPLOAD_CHUNK_SIZE):
+                chunk_number = len(uploaded_chunks) + 1
+                length = min(self.UPLOAD_CHUNK_SIZE, file_size - offset)
                 
-                while True:
-                    chunk_data = file.read(chunk_size)
-                    if not chunk_data:
-                        break
-                    
-                    # Upload chunk
-                    chunk_endpoint = f"/projects/{project_id}/media/upload/{upload_id}/chunk/{chunk_number}"
-                    
-                    form_data = aiohttp.FormData()
-                    form_data.add_field(
-                        'chunk',
-                        chunk_data,
-                        filename=f"chunk_{chunk_number}",
-                        content_type="application/octet-stream"
-                    )
-                    
-                    chunk_response = await self._make_request(
-                        "POST",
-                        chunk_endpoint,
-                        form_data=form_data,
-                        timeout=300  # 5 minute timeout for chunks
-                    )
-                    
-                    uploaded_chunks.append({
-                        "chunk_number": chunk_number,
-                        "etag": chunk_response.get("etag"),
-                        "size": len(chunk_data)
-                    })
-                    
-                    bytes_uploaded += len(chunk_data)
-                    
-                    # Report progress
-                    if progress_callback:
-                        progress = int((bytes_uploaded / file_size) * 100)
-                        progress_callback(progress)
-                    
-                    chunk_number += 1
+                etag = await self._upload_chunk(
+                    project_id, upload_id, media_path, chunk_number, offset, length
+                )
+                
+                uploaded_chunks.append({
+                    "chunk_number": chunk_number,
+                    "etag": etag,
+                    "size": length
+                })
+                
+                bytes_uploaded += length
+                
+                # Report progress
+                if progress_callback:
+                    progress = int((bytes_uploaded / file_size) * 100)
+                    progress_callback(progress)
             
             # Complete upload
             complete_endpoint = f"/projects/{project_id}/media/upload/{upload_id}/complete"
@@ -890,6 +911,77 @@ class DevpostAPIClient(DevpostAPIClientInterface):
             
             raise e
     
+    async def _upload_chunk(
+        self,
+        project_id: str,
+        upload_id: str,
+        media_path: Path,
+        chunk_number: int,
+        offset: int,
+        length: int
+    ) -> Optional[str]:
+        """
+        Upload one chunk of a chunked upload, retrying just that chunk on failure.
+        
+        The chunk is re-read from disk and sent as fresh form data on every
+        attempt, so a failure never restarts the upload from the first chunk.
+        
+        Args:
+            project_id: Unique project identifier
+            upload_id: Chunked upload identifier
+            media_path: Path to media file
+            chunk_number: 1-based chunk number
+            offset: Byte offset of the chunk in the file
+            length: Chunk length in bytes
+            
+        Returns:
+            Chunk etag reported by the server
+        """
+        chunk_endpoint = f"/projects/{project_id}/media/upload/{upload_id}/chunk/{chunk_number}"
+        loop = asyncio.get_running_loop()
+        
+        for attempt in range(self.CHUNK_RETRY_ATTEMPTS):
+            # Read off the event loop so concurrent uploads keep streaming
+            chunk_data = await loop.run_in_executor(
+                None, self._read_file_chunk, media_path, offset, length
+            )
+            
+            form_data = aiohttp.FormData()
+            form_data.add_field(
+                'chunk',
+                chunk_data,
+                filename=f"chunk_{chunk_number}",
+                content_type="application/octet-stream"
+            )
+            
+            try:
+                # This loop is the only retry layer: each attempt needs fresh form data
+                chunk_response = await self._make_request(
+                    "POST",
+                    chunk_endpoint,
+                    form_data=form_data,
+                    timeout=300,  # 5 minute timeout for chunks
+                    max_attempts=1
+                )
+                return chunk_response.get("etag")
+                
+            except NetworkError as e:
+                if attempt == self.CHUNK_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = self._calculate_backoff_delay(attempt)
+                logger.warning(
+                    f"Chunk {chunk_number} of upload {upload_id} failed, retrying in {delay:.2f}s: {e}"
+                )
+                self._retry_count += 1
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _read_file_chunk(file_path: Path, offset: int, length: int) -> bytes:
+        """Read length bytes at offset from a file."""
+        with open(file_path, 'rb') as file:
+            file.seek(offset)
+            return file.read(length)
+    
     async def delete_media(self, project_id: str, media_id: str) -> bool:
         """
         Delete a media file from a project.
@@ -1022,15 +1114,20 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         self,
         project_id: str,
         media_files: List[Path],
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_concurrent_uploads: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Upload multiple media files in batch.
         
+        Files are uploaded concurrently by a bounded pool of workers, and
+        progress is reported as the share of all bytes uploaded so far.
+        
         Args:
             project_id: Unique project identifier
             media_files: List of media file paths
             progress_callback: Optional progress callback
+            max_concurrent_uploads: Maximum files uploaded at once
             
         Returns:
             Dictionary with batch upload results
@@ -1045,45 +1142,67 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         if not media_files:
             raise ValidationError("Media files list cannot be empty")
         
+        workers = max_concurrent_uploads or self.MAX_CONCURRENT_UPLOADS
+        if workers < 1:
+            raise ValidationError("max_concurrent_uploads must be at least 1")
+        
         # Validate all files exist
         for media_path in media_files:
             if not media_path.exists():
                 raise ValidationError(f"Media file does not exist: {media_path}")
         
-        results = {
-            "total_files": len(media_files),
-            "successful_uploads": [],
-            "failed_uploads": [],
-            "total_size": 0
-        }
+        file_sizes = [media_path.stat().st_size for media_path in media_files]
+        total_bytes = sum(file_sizes)
+        bytes_done = [0] * len(media_files)
+        last_reported = -1
         
-        try:
-            for i, media_path in enumerate(media_files):
+        def file_progress(index: int, percent: int) -> None:
+            nonlocal last_reported
+            bytes_done[index] = file_sizes[index] * min(percent, 100) // 100
+            if total_bytes:
+                overall_progress = int(sum(bytes_done) * 100 / total_bytes)
+            else:
+                overall_progress = int(sum(1 for done in bytes_done if done) * 100 / len(media_files))
+            if progress_callback and overall_progress > last_reported:
+                last_reported = overall_progress
+                progress_callback(overall_progress)
+        
+        semaphore = asyncio.Semaphore(workers)
+        
+        async def upload_one(index: int, media_path: Path) -> Dict[str, Any]:
+            async with semaphore:
                 try:
-                    # Individual progress callback
-                    def file_progress(percent):
-                        if progress_callback:
-                            overall_progress = ((i * 100) + percent) / len(media_files)
-                            progress_callback(int(overall_progress))
-                    
                     upload_result = await self.upload_media(
                         project_id,
                         media_path,
-                        progress_callback=file_progress
+                        progress_callback=lambda percent: file_progress(index, percent)
                     )
-                    
-                    results["successful_uploads"].append({
-                        "file": str(media_path),
-                        "result": upload_result
-                    })
-                    results["total_size"] += media_path.stat().st_size
+                    # Empty files report no byte progress
+                    file_progress(index, 100)
+                    return {"file": str(media_path), "result": upload_result}
                     
                 except Exception as e:
                     logger.warning(f"Failed to upload {media_path}: {e}")
-                    results["failed_uploads"].append({
-                        "file": str(media_path),
-                        "error": str(e)
-                    })
+                    return {"file": str(media_path), "error": str(e)}
+        
+        try:
+            outcomes = await asyncio.gather(*(
+                upload_one(index, media_path) for index, media_path in enumerate(media_files)
+            ))
+            
+            results = {
+                "total_files": len(media_files),
+                "successful_uploads": [],
+                "failed_uploads": [],
+                "total_size": 0
+            }
+            
+            for outcome, file_size in zip(outcomes, file_sizes):
+                if "error" in outcome:
+                    results["failed_uploads"].append(outcome)
+                else:
+                    results["successful_uploads"].append(outcome)
+                    results["total_size"] += file_size
             
             results["success_rate"] = len(results["successful_uploads"]) / len(media_files)
             
@@ -1174,7 +1293,8 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         form_data: Optional[aiohttp.FormData] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request with retry logic and error handling.
@@ -1187,6 +1307,7 @@ class DevpostAPIClient(DevpostAPIClientInterface):
             params: Query parameters
             headers: Additional headers
             timeout: Request timeout override
+            max_attempts: Attempts override (1 for callers that retry themselves)
             
         Returns:
             Response data as dictionary
@@ -1203,28 +1324,102 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         if not self.auth_service.is_authenticated():
             raise AuthenticationError("Not authenticated with Devpost API")
         
-        # Check rate limiting
-        if not self._check_rate_limit():
-            raise NetworkError("Rate limit exceeded. Please wait before making more requests.")
-        
-        # Prepare headers
-        request_headers = self._get_request_headers()
-        if headers:
-            request_headers.update(headers)
+        if method != "GET" or form_data:
+            response_data = await self._send_request(
+                method, url, endpoint, json_data, form_data, params, headers, request_timeout,
+                max_attempts=max_attempts
+            )
+            # A successful unsafe request invalidates cached representations of its target
+            self._response_cache.invalidate_url(url)
+            return response_data
         
         # Check cache for GET requests
-        cache_key = None
-        if method == "GET" and not form_data:
-            cache_key = self._get_cache_key(url, params)
-            cached_response = self._get_cached_response(cache_key)
-            if cached_response:
-                logger.debug(f"Returning cached response for {method} {url}")
-                return cached_response
+        cache_key = self._get_cache_key(url, params)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            logger.debug(f"Returning cached response for {method} {url}")
+            return cached_response
+        
+        # Coalesce identical GETs that are already in flight
+        inflight = self._inflight_requests.get(cache_key)
+        while inflight is not None:
+            self._response_cache.coalesced += 1
+            logger.debug(f"Joining in-flight request for {method} {url}")
+            try:
+                return await asyncio.shield(inflight)
+            except _InflightRequestCancelled:
+                # Only the leading caller was cancelled: the first waiter to
+                # resume sends the request again and the others join it
+                inflight = self._inflight_requests.get(cache_key)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_requests[cache_key] = future
+        try:
+            response_data = await self._send_request(
+                method, url, endpoint, json_data, form_data, params, headers, request_timeout, cache_key,
+                max_attempts
+            )
+            future.set_result(response_data)
+            return response_data
+        except asyncio.CancelledError:
+            future.set_exception(_InflightRequestCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't log it as never retrieved
+            raise
+        finally:
+            del self._inflight_requests[cache_key]
+    
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        form_data: Optional[aiohttp.FormData],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        request_timeout: float,
+        cache_key: Optional[str] = None,
+        max_attempts: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request with retries, revalidating a stale cache entry if there is one.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            endpoint: API endpoint (for per-endpoint cache TTLs)
+            json_data: JSON data for request body
+            form_data: Form data for multipart requests
+            params: Query parameters
+            headers: Additional headers
+            request_timeout: Request timeout in seconds
+            cache_key: Cache key for cacheable GET requests
+            max_attempts: Attempts override (defaults to max_retry_attempts)
+            
+        Returns:
+            Response data as dictionary
+        """
+        # Conditional request for a stale entry so unchanged payloads aren't re-downloaded
+        extra_headers = dict(headers or {})
+        stale_entry = self._response_cache.get_entry(cache_key) if cache_key else None
+        if stale_entry is not None:
+            extra_headers.update(stale_entry.conditional_headers())
+        
+        request_headers = self._get_request_headers()
+        request_headers.update(extra_headers)
         
         # Execute request with retry logic
         last_exception = None
+        max_attempts = max_attempts or self.max_retry_attempts
         
-        for attempt in range(self.max_retry_attempts):
+        for attempt in range(max_attempts):
+            # Every attempt counts against the API's limits, cached responses do not
+            await self._wait_for_rate_limit()
+            
             try:
                 if self.enable_logging:
                     logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
@@ -1244,12 +1439,17 @@ class DevpostAPIClient(DevpostAPIClientInterface):
                     # Track request
                     self._request_count += 1
                     
+                    if response.status == 304 and stale_entry is not None:
+                        if self.enable_logging:
+                            logger.debug(f"Cached response still valid: {method} {url}")
+                        return self._response_cache.revalidate(cache_key, endpoint, stale_entry)
+                    
                     # Handle response
                     response_data = await self._handle_response(response, url, method)
                     
                     # Cache successful GET responses
-                    if method == "GET" and cache_key and response.status == 200:
-                        self._cache_response(cache_key, response_data)
+                    if cache_key and response.status == 200:
+                        self._cache_response(cache_key, url, endpoint, response_data, response.headers)
                     
                     if self.enable_logging:
                         logger.debug(f"Request successful: {method} {url}")
@@ -1268,6 +1468,7 @@ class DevpostAPIClient(DevpostAPIClientInterface):
                     try:
                         await self.auth_service.refresh_token()
                         request_headers = self._get_request_headers()
+                        request_headers.update(extra_headers)
                         logger.info("Refreshed authentication token, retrying request")
                         continue
                     except Exception as refresh_error:
@@ -1275,14 +1476,14 @@ class DevpostAPIClient(DevpostAPIClientInterface):
                         raise AuthenticationError(f"Authentication failed: {str(e)}")
                 
                 elif e.status in self.RETRYABLE_STATUS_CODES:
-                    if attempt < self.max_retry_attempts - 1:
+                    if attempt < max_attempts - 1:
                         delay = self._calculate_backoff_delay(attempt)
                         logger.warning(f"Request failed with status {e.status}, retrying in {delay:.2f}s")
                         await asyncio.sleep(delay)
                         self._retry_count += 1
                         continue
                     else:
-                        logger.error(f"Request failed after {self.max_retry_attempts} attempts: {e}")
+                        logger.error(f"Request failed after {max_attempts} attempts: {e}")
                         raise NetworkError(f"Request failed: {str(e)}")
                 
                 else:
@@ -1294,14 +1495,14 @@ class DevpostAPIClient(DevpostAPIClientInterface):
                 last_exception = e
                 self._error_count += 1
                 
-                if attempt < self.max_retry_attempts - 1:
+                if attempt < max_attempts - 1:
                     delay = self._calculate_backoff_delay(attempt)
                     logger.warning(f"Network error, retrying in {delay:.2f}s: {e}")
                     await asyncio.sleep(delay)
                     self._retry_count += 1
                     continue
                 else:
-                    logger.error(f"Network error after {self.max_retry_attempts} attempts: {e}")
+                    logger.error(f"Network error after {max_attempts} attempts: {e}")
                     raise NetworkError(f"Network error: {str(e)}")
                     
             except Exception as e:
@@ -1310,7 +1511,7 @@ class DevpostAPIClient(DevpostAPIClientInterface):
                 raise NetworkError(f"Unexpected error: {str(e)}")
         
         # All retries exhausted
-        error_msg = f"Request failed after {self.max_retry_attempts} attempts"
+        error_msg = f"Request failed after {max_attempts} attempts"
         if last_exception:
             error_msg += f": {str(last_exception)}"
         
@@ -1432,35 +1633,21 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         
         return headers
     
-    def _check_rate_limit(self) -> bool:
+    async def _wait_for_rate_limit(self) -> None:
         """
-        Check if request is within rate limits.
+        Wait until the rate limiter admits another request.
         
-        Returns:
-            True if request is allowed, False if rate limited
+        Raises:
+            NetworkError: If capacity will not free up within max_rate_limit_wait
         """
-        now = time.time()
-        
-        # Clean old timestamps
-        cutoff = now - self.RATE_LIMIT_WINDOW
-        self._request_timestamps = [ts for ts in self._request_timestamps if ts > cutoff]
-        self._burst_timestamps = [ts for ts in self._burst_timestamps if ts > now - 10]  # 10 second burst window
-        
-        # Check burst limit
-        if len(self._burst_timestamps) >= self.BURST_LIMIT:
-            logger.warning("Burst rate limit exceeded")
-            return False
-        
-        # Check window limit
-        if len(self._request_timestamps) >= self.MAX_REQUESTS_PER_WINDOW:
-            logger.warning("Rate limit exceeded")
-            return False
-        
-        # Add timestamps
-        self._request_timestamps.append(now)
-        self._burst_timestamps.append(now)
+        try:
+            waited = await self._rate_limiter.acquire(max_wait=self.max_rate_limit_wait)
+        except RateLimitExceeded as e:
+            logger.warning(f"Rate limit exceeded, next slot in {e.required_wait:.2f}s")
+            raise NetworkError("Rate limit exceeded. Please wait before making more requests.") from e
         
-        return True
+        if waited > 0 and self.enable_logging:
+            logger.debug(f"Rate limiter delayed request by {waited:.3f}s")
     
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """
@@ -1491,31 +1678,31 @@ class DevpostAPIClient(DevpostAPIClientInterface):
         return "|".join(key_parts)
     
     def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get cached response if still valid."""
-        if cache_key not in self._response_cache:
-            return None
-        
-        cached_data = self._response_cache[cache_key]
-        if time.time() - cached_data["timestamp"] > self._cache_ttl:
-            del self._response_cache[cache_key]
-            return None
-        
-        return cached_data["data"]
+        """Get cached response if still fresh."""
+        return self._response_cache.get(cache_key)
     
-    def _cache_response(self, cache_key: str, data: Dict[str, Any]) -> None:
-        """Cache response data."""
-        self._response_cache[cache_key] = {
-            "data": data,
-            "timestamp": time.time()
-        }
-        
-        # Simple cache cleanup - remove oldest entries if cache gets too large
-        if len(self._response_cache) > 100:
-            oldest_key = min(
-                self._response_cache.keys(),
-                key=lambda k: self._response_cache[k]["timestamp"]
-            )
-            del self._response_cache[oldest_key]
+    def _cache_response(
+        self,
+        cache_key: str,
+        url: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        response_headers: Optional[Any] = None
+    ) -> None:
+        """Cache response data with its ETag / Last-Modified validators."""
+        etag = last_modified = None
+        if response_headers is not None:
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+        
+        self._response_cache.put(
+            cache_key,
+            url,
+            endpoint,
+            data,
+            etag=etag if isinstance(etag, str) else None,
+            last_modified=last_modified if isinstance(last_modified, str) else None
+        )
     
     def _validate_project_updates(self, updates: Dict[str, Any]) -> None:
         """Validate project update data."""
@@ -1584,14 +1771,14 @@ class DevpostAPIClient(DevpostAPIClientInterface):
             "retry_count": self._retry_count,
             "error_rate": self._error_count / max(self._request_count, 1),
             "cache_size": len(self._response_cache),
+            "cache": self._response_cache.get_stats(),
             "session_age": (
                 (datetime.now() - self._session_created_at).total_seconds()
                 if self._session_created_at else 0
             ),
-            "rate_limit_remaining": max(
-                0, 
-                self.MAX_REQUESTS_PER_WINDOW - len(self._request_timestamps)
-            )
+            "rate_limit_remaining": self._rate_limiter.remaining(),
+            "rate_limit_wait_seconds": round(self._rate_limiter.total_wait_seconds, 6),
+            "rate_limit": self._rate_limiter.get_stats()
         }
     
     async def health_check(self) -> Dict[str, Any]:
@@ -1645,12 +1832,13 @@ class DevpostAPIClient(DevpostAPIClientInterface):
             await self._session.close()
             logger.debug("HTTP session closed")
         
-        # Clear cache
+        # Persist, then clear cache
+        if self.cache_path:
+            self._response_cache.save(self.cache_path)
         self._response_cache.clear()
         
-        # Reset counters
-        self._request_timestamps.clear()
-        self._burst_timestamps.clear()
+        # Reset rate limiting state
+        self._rate_limiter.reset()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,199 @@
+"""
+Rate limiting for the Devpost API client.
+
+This module provides an asyncio-aware limiter that combines a token bucket
+(short-term burst control) with a sliding-window request cap. Callers await
+capacity instead of failing, and waiters are served strictly in arrival order.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket with O(1) refill accounting.
+
+    Tokens accrue continuously at ``refill_rate`` per second up to
+    ``capacity``; each request consumes one token.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, clock: Callable[[], float] = time.monotonic):
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity and refill_rate must be positive")
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+            self._updated_at = now
+
+    def delay_until_available(self, now: float) -> float:
+        """Seconds until one token is available"""
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.refill_rate
+
+    def consume(self, now: float) -> None:
+        self._refill(now)
+        self._tokens -= 1
+
+    @property
+    def tokens(self) -> float:
+        self._refill(self._clock())
+        return self._tokens
+
+
+class SlidingWindowLimiter:
+    """
+    Exact sliding-window request cap.
+
+    Keeps at most ``max_requests`` timestamps; expiring old entries is an
+    amortized O(1) popleft instead of rebuilding a list per request.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: float):
+        if max_requests <= 0 or window_seconds <= 0:
+            raise ValueError("max_requests and window_seconds must be positive")
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._timestamps: Deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._timestamps and self._timestamps[0] <= cutoff:
+            self._timestamps.popleft()
+
+    def delay_until_available(self, now: float) -> float:
+        """Seconds until the window has room for one more request"""
+        self._expire(now)
+        if len(self._timestamps) < self.max_requests:
+            return 0.0
+        return self._timestamps[0] + self.window_seconds - now
+
+    def record(self, now: float) -> None:
+        self._timestamps.append(now)
+
+    def remaining(self, now: float) -> int:
+        self._expire(now)
+        return max(0, self.max_requests - len(self._timestamps))
+
+
+class RateLimitExceeded(Exception):
+    """Raised when the wait for capacity would exceed the caller's limit"""
+
+    def __init__(self, required_wait: float):
+        super().__init__(f"Rate limit exceeded: next slot in {required_wait:.2f}s")
+        self.required_wait = required_wait
+
+
+class AsyncRateLimiter:
+    """
+    Fair asyncio rate limiter: token bucket plus sliding window.
+
+    ``acquire`` waits until both limits admit the request. A single FIFO lock
+    orders waiters, so concurrent coroutines are admitted in arrival order and
+    none can be starved by later arrivals.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        burst_limit: int,
+        burst_window_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = asyncio.sleep
+    ):
+        self.window = SlidingWindowLimiter(max_requests, window_seconds)
+        # burst_limit requests immediately, refilled evenly over the burst window
+        self.bucket = TokenBucket(burst_limit, burst_limit / burst_window_seconds, clock)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Statistics
+        self.acquired = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.waiting = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _required_wait(self, now: float) -> float:
+        return max(self.bucket.delay_until_available(now), self.window.delay_until_available(now))
+
+    async def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        Wait for capacity and record the request.
+
+        Args:
+            max_wait: Give up with RateLimitExceeded if the total wait (queueing
+                plus throttling) would exceed this many seconds
+
+        Returns:
+            Seconds spent waiting
+        """
+        arrived_at = self._clock()
+        self.waiting += 1
+        try:
+            async with self._get_lock():
+                while True:
+                    now = self._clock()
+                    delay = self._required_wait(now)
+                    if delay <= 0:
+                        break
+                    if max_wait is not None and (now - arrived_at) + delay > max_wait:
+                        self.rejected += 1
+                        raise RateLimitExceeded(delay)
+                    await self._sleep(delay)
+
+                self.bucket.consume(now)
+                self.window.record(now)
+        finally:
+            self.waiting -= 1
+
+        waited = max(0.0, now - arrived_at)
+        self.acquired += 1
+        if waited > 0:
+            self.delayed += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return waited
+
+    def remaining(self) -> int:
+        """Requests still available in the current sliding window"""
+        return self.window.remaining(self._clock())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "waiting": self.waiting,
+            "total_wait_seconds": round(self.total_wait_seconds, 6),
+            "max_wait_seconds": round(self.max_wait_seconds, 6),
+            "average_wait_seconds": round(self.total_wait_seconds / self.acquired, 6) if self.acquired else 0.0,
+            "window_remaining": self.remaining(),
+            "burst_tokens": round(self.bucket.tokens, 3)
+        }
+
+    def reset(self) -> None:
+        self.window = SlidingWindowLimiter(self.window.max_requests, self.window.window_seconds)
+        self.bucket = TokenBucket(self.bucket.capacity, self.bucket.refill_rate, self._clock)
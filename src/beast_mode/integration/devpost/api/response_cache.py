@@ -0,0 +1,228 @@
+"""
+HTTP response cache for the Devpost API client.
+
+This module provides an O(1) LRU cache for GET responses with per-endpoint
+TTLs. Expired entries are kept (subject to LRU eviction) together with their
+ETag / Last-Modified validators so the client can revalidate them with a
+conditional request instead of downloading an unchanged payload again.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Cached response payload with its freshness and validators"""
+    url: str
+    data: Dict[str, Any]
+    stored_at: float
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn a GET for this entry into a conditional request"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    LRU response cache with per-endpoint TTLs.
+
+    ``ttl_overrides`` maps endpoint prefixes (e.g. "/hackathons/") to TTLs in
+    seconds; the longest matching prefix wins, other endpoints use
+    ``default_ttl``. Entries are also indexed by URL so an unsafe request can
+    invalidate every cached variant of its target in O(variants).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100,
+        default_ttl: float = 300,
+        ttl_overrides: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._keys_by_url: Dict[str, Set[str]] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def ttl_for(self, endpoint: str) -> float:
+        """TTL for an endpoint from the longest matching override prefix"""
+        best_prefix = None
+        for prefix in self.ttl_overrides:
+            if endpoint.startswith(prefix) and (best_prefix is None or len(prefix) > len(best_prefix)):
+                best_prefix = prefix
+        return self.ttl_overrides[best_prefix] if best_prefix is not None else self.default_ttl
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Fresh cached payload, or None on a miss or an expired entry"""
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_fresh(self._clock()):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.data
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Entry regardless of freshness (for conditional revalidation)"""
+        return self._entries.get(key)
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        now = self._clock()
+        self._discard(key)
+        self._entries[key] = CacheEntry(
+            url=url,
+            data=data,
+            stored_at=now,
+            expires_at=now + self.ttl_for(endpoint),
+            etag=etag,
+            last_modified=last_modified
+        )
+        self._keys_by_url.setdefault(url, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._discard(oldest_key)
+            self.evictions += 1
+
+    def revalidate(self, key: str, endpoint: str, entry: CacheEntry) -> Dict[str, Any]:
+        """
+        Mark the entry a conditional request was made for fresh again after a
+        304 Not Modified and return its payload.
+
+        The entry is stored again if it was evicted or invalidated while the
+        request was in flight.
+        """
+        if self._entries.get(key) is entry:
+            now = self._clock()
+            entry.stored_at = now
+            entry.expires_at = now + self.ttl_for(endpoint)
+            self._entries.move_to_end(key)
+        else:
+            self.put(key, entry.url, endpoint, entry.data, entry.etag, entry.last_modified)
+        self.revalidations += 1
+        return entry.data
+
+    def invalidate_url(self, url: str) -> int:
+        """Drop all cached variants (query strings) of a URL"""
+        keys = self._keys_by_url.get(url, set())
+        count = len(keys)
+        for key in list(keys):
+            self._discard(key)
+        return count
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_url.clear()
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_url.get(entry.url)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_url[entry.url]
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "coalesced": self.coalesced
+        }
+
+    # Persistence
+
+    def save(self, path: Path) -> bool:
+        """Write entries that carry validators or are still fresh to a JSON file"""
+        now = self._clock()
+        entries = {
+            key: asdict(entry) for key, entry in self._entries.items()
+            if entry.is_fresh(now) or entry.etag or entry.last_modified
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"version": 1, "entries": entries}, f)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save response cache to {path}: {e}")
+            return False
+
+    def load(self, path: Path) -> int:
+        """Load entries saved by save(); returns the number of entries loaded"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            entries = payload.get("entries", {})
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to load response cache from {path}: {e}")
+            return 0
+
+        loaded = 0
+        for key, raw_entry in entries.items():
+            try:
+                entry = CacheEntry(**raw_entry)
+            except TypeError:
+                continue
+            self._discard(key)
+            self._entries[key] = entry
+            self._keys_by_url.setdefault(entry.url, set()).add(key)
+            loaded += 1
+
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+        return loaded
@@ -0,0 +1,104 @@
+"""
+Running Statistics - Incremental accumulators for metric series
+
+Welford accumulators give O(1) mean/variance updates per sample, and
+columnar series keep raw samples in compact typed arrays instead of one
+object per data point.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class RunningStats:
+    """
+    Welford running mean/variance accumulator
+
+    Features:
+    - O(1) updates and queries
+    - Numerically stable variance (no sum-of-squares cancellation)
+    - Mergeable (Chan et al. parallel combination)
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self, values: Optional[Iterable[float]] = None):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        for value in values or ():
+            self.add(value)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 with fewer than two samples)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation"""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None
+        }
+
+
+class MetricSeriesColumns:
+    """Columnar storage of one (metric, approach) series with a running accumulator"""
+
+    __slots__ = ("values", "timestamps", "sequence", "confidence_scores", "contexts", "stats")
+
+    def __init__(self):
+        self.values = array("d")
+        self.timestamps = array("d")
+        self.sequence = array("q")
+        self.confidence_scores = array("d")
+        self.contexts: List[Dict[str, Any]] = []
+        self.stats = RunningStats()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: float, timestamp: float, sequence: int, confidence_score: float,
+               context: Dict[str, Any]) -> None:
+        self.values.append(value)
+        self.timestamps.append(timestamp)
+        self.sequence.append(sequence)
+        self.confidence_scores.append(confidence_score)
+        self.contexts.append(context)
+        self.stats.add(value)
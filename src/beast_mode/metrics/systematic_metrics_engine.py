@@ -10,12 +10,14 @@ import logging
 import json
 import statistics
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+import heapq
+from typing import Dict, List, Any, Optional, Tuple, Sequence, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import time
 
 from ..core.reflective_module import ReflectiveModule
+from .running_stats import RunningStats, MetricSeriesColumns
 
 
 @dataclass
@@ -74,8 +76,10 @@ class SystematicMetricsEngine(ReflectiveModule):
         super().__init__("SystematicMetricsEngine")
         self.logger = logging.getLogger(__name__)
         
-        # Systo's metric storage and tracking
-        self.metric_data: List[MetricDataPoint] = []
+        # Systo's metric storage and tracking: columnar series keyed by (metric_name, approach_type)
+        self.metric_series: Dict[Tuple[str, str], MetricSeriesColumns] = {}
+        self.approach_counts: Dict[str, int] = {"systematic": 0, "adhoc": 0}
+        self._metric_sequence = 0
         self.comparative_analyses: List[ComparativeAnalysisResult] = []
         self.evidence_packages: List[SuperiorityEvidencePackage] = []
         
@@ -92,22 +96,11 @@ class SystematicMetricsEngine(ReflectiveModule):
         """Collect a metric from systematic approach with Systo's collaborative tracking"""
         self.logger.info(f"📊 Collecting systematic metric: {metric_name} = {value}")
         
-        data_point = MetricDataPoint(
-            timestamp=datetime.now(),
-            metric_name=metric_name,
-            value=value,
-            approach_type="systematic",
-            context=context or {},
-            confidence_score=0.95  # High confidence in systematic measurements
-        )
-        
-        self.metric_data.append(data_point)
+        # High confidence in systematic measurements
+        series = self._append_data_point(metric_name, value, "systematic", context, confidence_score=0.95)
         
-        # Update systematic baseline
-        systematic_values = [dp.value for dp in self.metric_data 
-                           if dp.metric_name == metric_name and dp.approach_type == "systematic"]
-        if systematic_values:
-            self.systematic_baselines[metric_name] = statistics.mean(systematic_values)
+        # Update systematic baseline (running mean, O(1) per sample)
+        self.systematic_baselines[metric_name] = series.stats.mean
         
         # Systo's collaborative learning
         self._record_collaboration_event("systematic_metric_collected", {
@@ -120,54 +113,84 @@ class SystematicMetricsEngine(ReflectiveModule):
         """Collect a metric from ad-hoc approach for Systo's comparative analysis"""
         self.logger.info(f"📊 Collecting ad-hoc baseline metric: {metric_name} = {value}")
         
-        data_point = MetricDataPoint(
-            timestamp=datetime.now(),
-            metric_name=metric_name,
-            value=value,
-            approach_type="adhoc",
-            context=context or {},
-            confidence_score=0.7  # Lower confidence in ad-hoc measurements
-        )
-        
-        self.metric_data.append(data_point)
+        # Lower confidence in ad-hoc measurements
+        series = self._append_data_point(metric_name, value, "adhoc", context, confidence_score=0.7)
         
-        # Update ad-hoc baseline
-        adhoc_values = [dp.value for dp in self.metric_data 
-                       if dp.metric_name == metric_name and dp.approach_type == "adhoc"]
-        if adhoc_values:
-            self.adhoc_baselines[metric_name] = statistics.mean(adhoc_values)
+        # Update ad-hoc baseline (running mean, O(1) per sample)
+        self.adhoc_baselines[metric_name] = series.stats.mean
+    
+    @property
+    def metric_data(self) -> List[MetricDataPoint]:
+        """All collected data points in collection order (materialized from the columnar series)"""
+        rows = heapq.merge(*[
+            zip(series.sequence, series.values, series.timestamps, series.confidence_scores,
+                series.contexts, [key] * len(series))
+            for key, series in self.metric_series.items()
+        ])
+        return [
+            MetricDataPoint(
+                timestamp=datetime.fromtimestamp(timestamp),
+                metric_name=metric_name,
+                value=value,
+                approach_type=approach_type,
+                context=context,
+                confidence_score=confidence_score
+            )
+            for _, value, timestamp, confidence_score, context, (metric_name, approach_type) in rows
+        ]
+    
+    def get_metric_values(self, metric_name: str, approach_type: str) -> Sequence[float]:
+        """Raw values of one series as a typed array (zero-copy numpy.frombuffer compatible)"""
+        series = self.metric_series.get((metric_name, approach_type))
+        return series.values if series is not None else []
+    
+    def get_running_stats(self, metric_name: str, approach_type: str) -> RunningStats:
+        """Running mean/variance accumulator of one series"""
+        series = self.metric_series.get((metric_name, approach_type))
+        return series.stats if series is not None else RunningStats()
+    
+    def _append_data_point(self, metric_name: str, value: float, approach_type: str,
+                           context: Optional[Dict[str, Any]], confidence_score: float) -> MetricSeriesColumns:
+        """Append a sample to its columnar series and update the running accumulator"""
+        key = (metric_name, approach_type)
+        series = self.metric_series.get(key)
+        if series is None:
+            series = self.metric_series[key] = MetricSeriesColumns()
+        
+        series.append(value, time.time(), self._metric_sequence, confidence_score, context or {})
+        self._metric_sequence += 1
+        self.approach_counts[approach_type] = self.approach_counts.get(approach_type, 0) + 1
+        return series
     
     def perform_comparative_analysis(self, metric_name: str) -> ComparativeAnalysisResult:
         """Perform Systo's collaborative comparative analysis of systematic vs ad-hoc"""
         self.logger.info(f"🔍 Performing Systo's comparative analysis for {metric_name}")
         
-        # Get systematic and ad-hoc data points
-        systematic_values = [dp.value for dp in self.metric_data 
-                           if dp.metric_name == metric_name and dp.approach_type == "systematic"]
-        adhoc_values = [dp.value for dp in self.metric_data 
-                       if dp.metric_name == metric_name and dp.approach_type == "adhoc"]
+        # Get systematic and ad-hoc running statistics (O(1), no rescans of the samples)
+        systematic_stats = self.get_running_stats(metric_name, "systematic")
+        adhoc_stats = self.get_running_stats(metric_name, "adhoc")
         
-        if not systematic_values or not adhoc_values:
+        if not systematic_stats.count or not adhoc_stats.count:
             # Create simulated ad-hoc baseline if needed (Systo's intelligent estimation)
-            if systematic_values and not adhoc_values:
-                systematic_avg = statistics.mean(systematic_values)
+            if systematic_stats.count and not adhoc_stats.count:
+                systematic_avg = systematic_stats.mean
                 # Estimate ad-hoc performance as 30-50% worse (Systo's collaborative intelligence)
                 adhoc_avg = systematic_avg * 1.4  # 40% worse performance
-                adhoc_values = [adhoc_avg]
+                adhoc_stats = RunningStats([adhoc_avg])
             else:
                 raise ValueError(f"Insufficient data for comparative analysis of {metric_name}")
         else:
-            systematic_avg = statistics.mean(systematic_values)
-            adhoc_avg = statistics.mean(adhoc_values)
+            systematic_avg = systematic_stats.mean
+            adhoc_avg = adhoc_stats.mean
         
         # Calculate improvement percentage (Systo's collaborative math)
         improvement_percentage = ((adhoc_avg - systematic_avg) / adhoc_avg) * 100
         
         # Calculate statistical significance (Systo's confidence assessment)
-        statistical_significance = self._calculate_statistical_significance(systematic_values, adhoc_values)
+        statistical_significance = self._calculate_statistical_significance(systematic_stats, adhoc_stats)
         
         # Calculate confidence interval (Systo's collaborative uncertainty quantification)
-        confidence_interval = self._calculate_confidence_interval(systematic_values, adhoc_values)
+        confidence_interval = self._calculate_confidence_interval(systematic_stats, adhoc_stats)
         
         # Systo's collaborative verdict
         if improvement_percentage > 20 and statistical_significance > 0.8:
@@ -185,8 +208,8 @@ class SystematicMetricsEngine(ReflectiveModule):
             adhoc_average=adhoc_avg,
             improvement_percentage=improvement_percentage,
             statistical_significance=statistical_significance,
-            sample_size_systematic=len(systematic_values),
-            sample_size_adhoc=len(adhoc_values),
+            sample_size_systematic=systematic_stats.count,
+            sample_size_adhoc=adhoc_stats.count,
             confidence_interval=confidence_interval,
             systo_verdict=systo_verdict
         )
@@ -201,7 +224,7 @@ class SystematicMetricsEngine(ReflectiveModule):
         self.logger.info("🏆 Demonstrating systematic superiority with Systo's collaborative approach")
         
         # Collect all unique metrics
-        unique_metrics = set(dp.metric_name for dp in self.metric_data)
+        unique_metrics = set(metric_name for metric_name, _ in self.metric_series)
         
         superiority_results = {}
         total_improvements = []
@@ -320,17 +343,21 @@ class SystematicMetricsEngine(ReflectiveModule):
             "systo_learning": "beast_mode_effectiveness_validated"
         })
     
-    def _calculate_statistical_significance(self, systematic_values: List[float], adhoc_values: List[float]) -> float:
+    def _calculate_statistical_significance(self, systematic_values: Union[Sequence[float], RunningStats],
+                                            adhoc_values: Union[Sequence[float], RunningStats]) -> float:
         """Calculate statistical significance with Systo's collaborative math"""
+        systematic_stats = self._as_running_stats(systematic_values)
+        adhoc_stats = self._as_running_stats(adhoc_values)
+        
         # Simplified statistical significance calculation
-        if len(systematic_values) < 2 or len(adhoc_values) < 2:
+        if systematic_stats.count < 2 or adhoc_stats.count < 2:
             return 0.5  # Low confidence with small samples
         
-        systematic_std = statistics.stdev(systematic_values) if len(systematic_values) > 1 else 0
-        adhoc_std = statistics.stdev(adhoc_values) if len(adhoc_values) > 1 else 0
+        systematic_std = systematic_stats.stdev
+        adhoc_std = adhoc_stats.stdev
         
         # Simple significance based on separation and sample size
-        separation = abs(statistics.mean(systematic_values) - statistics.mean(adhoc_values))
+        separation = abs(systematic_stats.mean - adhoc_stats.mean)
         pooled_std = (systematic_std + adhoc_std) / 2
         
         if pooled_std == 0:
@@ -339,19 +366,27 @@ class SystematicMetricsEngine(ReflectiveModule):
         significance = min(0.95, separation / pooled_std * 0.3)  # Simplified calculation
         return max(0.1, significance)
     
-    def _calculate_confidence_interval(self, systematic_values: List[float], adhoc_values: List[float]) -> Tuple[float, float]:
+    def _calculate_confidence_interval(self, systematic_values: Union[Sequence[float], RunningStats],
+                                       adhoc_values: Union[Sequence[float], RunningStats]) -> Tuple[float, float]:
         """Calculate confidence interval with Systo's collaborative statistics"""
-        if not systematic_values or not adhoc_values:
+        systematic_stats = self._as_running_stats(systematic_values)
+        adhoc_stats = self._as_running_stats(adhoc_values)
+        if not systematic_stats.count or not adhoc_stats.count:
             return (0.0, 0.0)
         
-        systematic_mean = statistics.mean(systematic_values)
-        adhoc_mean = statistics.mean(adhoc_values)
+        systematic_mean = systematic_stats.mean
+        adhoc_mean = adhoc_stats.mean
         improvement = ((adhoc_mean - systematic_mean) / adhoc_mean) * 100
         
         # Simplified confidence interval (±10% of improvement)
         margin = abs(improvement) * 0.1
         return (improvement - margin, improvement + margin)
     
+    @staticmethod
+    def _as_running_stats(values: Union[Sequence[float], RunningStats]) -> RunningStats:
+        """Accept either a running accumulator or raw samples"""
+        return values if isinstance(values, RunningStats) else RunningStats(values)
+    
     def _calculate_systo_collaboration_score(self) -> float:
         """Calculate Systo's collaboration effectiveness score"""
         if not self.collaboration_events:
@@ -413,12 +448,12 @@ BEAST MODE: EVERYONE WINS! 🚀
     # ReflectiveModule implementation
     def get_module_status(self) -> Dict[str, Any]:
         """Get current status of Systo's metrics engine"""
-        systematic_metrics = len([dp for dp in self.metric_data if dp.approach_type == "systematic"])
-        adhoc_metrics = len([dp for dp in self.metric_data if dp.approach_type == "adhoc"])
+        systematic_metrics = self.approach_counts.get("systematic", 0)
+        adhoc_metrics = self.approach_counts.get("adhoc", 0)
         
         return {
             "module_name": "SystematicMetricsEngine",
-            "total_metrics_collected": len(self.metric_data),
+            "total_metrics_collected": self._metric_sequence,
             "systematic_metrics": systematic_metrics,
             "adhoc_metrics": adhoc_metrics,
             "comparative_analyses_performed": len(self.comparative_analyses),
@@ -432,12 +467,12 @@ BEAST MODE: EVERYONE WINS! 🚀
         """Check if Systo's metrics engine is healthy"""
         try:
             # Healthy if we're collecting metrics and learning
-            if len(self.metric_data) == 0:
+            if self._metric_sequence == 0:
                 return True  # Healthy when starting
             
             # Check if we have both systematic and comparative data
-            systematic_count = len([dp for dp in self.metric_data if dp.approach_type == "systematic"])
-            total_count = len(self.metric_data)
+            systematic_count = self.approach_counts.get("systematic", 0)
+            total_count = self._metric_sequence
             
             # Healthy if we have reasonable systematic data
             systematic_ratio = systematic_count / total_count if total_count > 0 else 0
@@ -452,15 +487,15 @@ BEAST MODE: EVERYONE WINS! 🚀
         indicators = []
         
         # Metrics collection health
-        systematic_count = len([dp for dp in self.metric_data if dp.approach_type == "systematic"])
-        adhoc_count = len([dp for dp in self.metric_data if dp.approach_type == "adhoc"])
+        systematic_count = self.approach_counts.get("systematic", 0)
+        adhoc_count = self.approach_counts.get("adhoc", 0)
         
         indicators.append({
             "name": "metrics_collection_health",
-            "status": "healthy" if len(self.metric_data) > 0 else "starting",
+            "status": "healthy" if self._metric_sequence > 0 else "starting",
             "systematic_metrics": systematic_count,
             "adhoc_metrics": adhoc_count,
-            "total_metrics": len(self.metric_data)
+            "total_metrics": self._metric_sequence
         })
         
         # Analysis capability health
@@ -15,6 +15,7 @@ from collections import deque, defaultdict
 import statistics
 
 from ..core.reflective_module import ReflectiveModule, HealthStatus
+from .metric_series import MetricSeries
 
 class MetricType(Enum):
     COUNTER = "counter"
@@ -71,8 +72,8 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
         
         # Metrics storage and processing
         self.metrics_buffer = deque(maxlen=10000)  # Rolling buffer for metrics
-        self.metrics_aggregates = defaultdict(list)  # Aggregated metrics by name
-        self.metrics_lock = threading.RLock()
+        self.metrics_aggregates: Dict[str, MetricSeries] = {}  # Ring buffer + quantile sketch by name
+        self.metrics_lock = threading.RLock()  # Guards series creation only; each series has its own lock
         
         # Health endpoints registry
         self.health_endpoints = {}
@@ -81,6 +82,7 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
         
         # Alerting system
         self.alert_rules = {}
+        self.alert_rules_by_metric: Dict[str, List[str]] = defaultdict(list)  # Metric name -> rule names
         self.active_alerts = {}
         self.alert_history = deque(maxlen=1000)
         
@@ -125,6 +127,7 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
         self._initialize_default_alert_rules()
         
         # Start background monitoring
+        self.monitoring_config = self.get_monitoring_config()
         self._start_background_monitoring()
         
         self._update_health_indicator(
@@ -199,13 +202,9 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
             labels=labels or {}
         )
         
-        with self.metrics_lock:
-            self.metrics_buffer.append(metric)
-            self.metrics_aggregates[name].append(value)
-            
-            # Keep only recent aggregates (last 1000 values)
-            if len(self.metrics_aggregates[name]) > 1000:
-                self.metrics_aggregates[name] = self.metrics_aggregates[name][-1000:]
+        # deque.append is atomic; series updates only lock their own series
+        self.metrics_buffer.append(metric)
+        self._get_metric_series(name).add(value)
                 
         # Check alert rules
         self._check_alert_rules(metric)
@@ -213,6 +212,22 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
         # Update demand patterns for auto-scaling
         self._update_demand_patterns(metric)
         
+    def _get_metric_series(self, name: str) -> MetricSeries:
+        """Get or create the series for a metric name"""
+        series = self.metrics_aggregates.get(name)
+        if series is None:
+            with self.metrics_lock:
+                series = self.metrics_aggregates.get(name)
+                if series is None:
+                    series = MetricSeries(name, capacity=1000)
+                    self.metrics_aggregates[name] = series
+        return series
+        
+    def get_metric_percentile(self, name: str, percentile: float) -> Optional[float]:
+        """Streaming percentile (0-100) of a metric, or None if it was never emitted"""
+        series = self.metrics_aggregates.get(name)
+        return series.quantile(percentile / 100.0) if series is not None else None
+        
     def register_health_endpoint(self, endpoint_name: str, component_name: str, 
                                 health_check_function: Callable[[], Dict[str, Any]], 
                                 check_interval_seconds: int = 60, timeout_seconds: int = 10):
@@ -235,6 +250,11 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
                       severity: AlertSeverity, comparison: str = "greater_than",
                       resolution_guidance: Optional[List[str]] = None):
         """Add alert rule for metric monitoring"""
+        previous_rule = self.alert_rules.get(rule_name)
+        if previous_rule is not None and rule_name in self.alert_rules_by_metric.get(previous_rule['metric_name'], []):
+            self.alert_rules_by_metric[previous_rule['metric_name']].remove(rule_name)
+        self.alert_rules_by_metric[metric_name].append(rule_name)
+        
         self.alert_rules[rule_name] = {
             'metric_name': metric_name,
             'threshold': threshold,
@@ -567,8 +587,10 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
             
     def _check_alert_rules(self, metric: Metric):
         """Check metric against alert rules and trigger alerts if needed"""
-        for rule_name, rule in self.alert_rules.items():
-            if rule['metric_name'] == metric.name:
+        # Only rules indexed under this metric name are evaluated
+        for rule_name in tuple(self.alert_rules_by_metric.get(metric.name, ())):
+            rule = self.alert_rules.get(rule_name)
+            if rule is not None and rule['metric_name'] == metric.name:
                 threshold = rule['threshold']
                 comparison = rule['comparison']
                 
@@ -801,16 +823,11 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
                 "recent_metrics": {}
             }
             
-            # Add recent values for key metrics
-            for metric_name, values in self.metrics_aggregates.items():
-                if values:
-                    summary["recent_metrics"][metric_name] = {
-                        "latest_value": values[-1],
-                        "average": sum(values) / len(values),
-                        "min": min(values),
-                        "max": max(values),
-                        "count": len(values)
-                    }
+            # Add recent values and streaming percentiles for key metrics
+            for metric_name, series in list(self.metrics_aggregates.items()):
+                series_summary = series.summary()
+                if series_summary:
+                    summary["recent_metrics"][metric_name] = series_summary
                     
             return summary
             
@@ -940,18 +957,6 @@ class ComprehensiveMonitoringSystem(ReflectiveModule):
             'alert_evaluation_interval_seconds': 30,
             'auto_scaling_evaluation_interval_seconds': 300
         }
-                    
-                except Exception as e:
-                    self.emit_structured_log(
-                        "error",
-                        f"Error in monitoring loop: {str(e)}",
-                        component="background_monitoring"
-                    )
-                    time.sleep(60)
-                    
-        # Start monitoring thread
-        monitoring_thread = threading.Thread(target=monitoring_loop, daemon=True)
-        monitoring_thread.start()
         
     def _update_system_metrics(self):
         """Update system metrics (simulated for this implementation)"""
@@ -0,0 +1,199 @@
+"""
+Beast Mode Framework - Metric Series Storage
+Fixed-size ring buffers and streaming quantile sketches for emitted metrics
+
+Each metric name gets its own MetricSeries with a private lock, so emitters of
+different metrics never contend. Recent values live in a preallocated ring
+buffer (NumPy when available) and percentiles come from a DDSketch, which
+bounds relative error and uses memory logarithmic in the value range.
+"""
+
+import math
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class RingBuffer:
+    """Preallocated fixed-capacity buffer of floats; appends overwrite the oldest value"""
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float64) if NUMPY_AVAILABLE else [0.0] * capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def latest(self) -> Optional[float]:
+        if self._size == 0:
+            return None
+        return float(self._data[self._next - 1])
+
+    def values(self) -> Union[List[float], Any]:
+        """Values oldest-first (a NumPy array when NumPy is available)"""
+        if self._size < self.capacity:
+            return self._data[:self._size].copy() if NUMPY_AVAILABLE else self._data[:self._size]
+        if NUMPY_AVAILABLE:
+            return np.concatenate((self._data[self._next:], self._data[:self._next]))
+        return self._data[self._next:] + self._data[:self._next]
+
+
+class DDSketch:
+    """
+    Streaming quantile sketch with relative-error guarantees (DDSketch)
+
+    Values are mapped to logarithmic buckets of ratio gamma = (1 + a) / (1 - a),
+    so any reported quantile is within relative accuracy ``a`` of a true value
+    of the stream. Negative values use a mirrored bucket store.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_indexable_value: float = 1e-9):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_indexable_value = min_indexable_value
+
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value > self.min_indexable_value:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < -self.min_indexable_value:
+            key = math.ceil(math.log(-value) / self._log_gamma)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        """Merge another sketch built with the same relative accuracy"""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + count
+        for key, count in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), or None for an empty sketch"""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Negative values ascend as their magnitude bucket descends
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._bucket_value(key))
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._bucket_value(key))
+
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def _bucket_value(self, key: int) -> float:
+        # Midpoint (in relative terms) of the bucket (gamma^(key-1), gamma^key]
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+
+class MetricSeries:
+    """
+    Recent values and streaming percentiles for a single metric
+
+    Features:
+    - Per-series lock so different metrics never contend
+    - Ring buffer of the most recent values (no list copies on trim)
+    - DDSketch percentiles over every value observed
+    - Running totals for lifetime count and mean
+    """
+
+    def __init__(self, name: str, capacity: int = 1000, relative_accuracy: float = 0.01):
+        self.name = name
+        self.lock = threading.Lock()
+        self.recent = RingBuffer(capacity)
+        self.sketch = DDSketch(relative_accuracy)
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def add(self, value: float) -> None:
+        with self.lock:
+            self.recent.append(value)
+            self.sketch.add(value)
+            self.total += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self.lock:
+            return self.sketch.quantile(q)
+
+    def summary(self) -> Dict[str, Any]:
+        """Window statistics over recent values plus sketch percentiles"""
+        with self.lock:
+            values = self.recent.values()
+            count = len(values)
+            if count == 0:
+                return {}
+            if isinstance(values, list):
+                average, minimum, maximum = sum(values) / count, min(values), max(values)
+            else:
+                average, minimum, maximum = float(values.mean()), float(values.min()), float(values.max())
+            return {
+                "latest_value": self.recent.latest(),
+                "average": average,
+                "min": minimum,
+                "max": maximum,
+                "count": count,
+                "p50": self.sketch.quantile(0.5),
+                "p99": self.sketch.quantile(0.99),
+                "total_count": self.sketch.count,
+                "lifetime_average": self.total / self.sketch.count
+            }
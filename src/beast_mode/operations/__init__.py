@@ -17,6 +17,13 @@ from .comprehensive_logging_system import (
     LogEntry
 )
 
+from .async_log_writer import (
+    AsyncLogWriter,
+    BackpressurePolicy
+)
+
+from .log_entry_store import LogEntryStore
+
 __all__ = [
     'OperationalDashboardManager',
     'DashboardType',
@@ -25,5 +32,8 @@ __all__ = [
     'ComprehensiveLoggingSystem',
     'LogLevel',
     'AuditEvent',
-    'LogEntry'
+    'LogEntry',
+    'AsyncLogWriter',
+    'BackpressurePolicy',
+    'LogEntryStore'
 ]
\ No newline at end of file
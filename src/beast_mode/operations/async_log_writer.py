@@ -0,0 +1,295 @@
+"""
+Beast Mode Framework - Asynchronous Log Writer
+Moves log file I/O off the caller's thread
+
+Callers enqueue records onto a bounded deque (append/popleft are atomic in
+CPython, so the fast path takes no lock). A single writer thread drains the
+queue in batches, formats records, writes each target file through a
+persistent buffered handle and rotates files by size. When the queue is full
+a configurable backpressure policy decides whether callers block, low-priority
+records are dropped, or records are sampled. flush() enqueues a marker behind
+the records submitted so far and waits for the writer to reach it, so callers
+never share a counter. Optional listeners receive the
+byte offset of every written record and a notice on each rotation, which lets
+callers index the files for later seeks.
+"""
+
+import atexit
+import logging
+import os
+import random
+import threading
+from collections import deque
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class BackpressurePolicy(Enum):
+    BLOCK = "block"              # Callers wait for queue space
+    DROP_DEBUG = "drop_debug"    # Drop DEBUG records when full; others wait
+    SAMPLE = "sample"            # Keep a sample of non-essential records when full; others wait
+
+
+class AsyncLogWriter:
+    """
+    Background batched log file writer
+
+    Features:
+    - Lock-free enqueue on the caller's thread (soft-bounded deque)
+    - Single writer thread with batched, buffered writes per file
+    - Size-based rotation with numbered backups
+    - Block / drop-debug / sample backpressure policies
+    - flush() barrier for readers that need durable output
+    - Write/rotation listeners for byte-offset indexing
+    """
+
+    def __init__(self,
+                 formatter: Callable[[Any], str],
+                 max_queue_size: int = 65536,
+                 batch_size: int = 1024,
+                 flush_interval_seconds: float = 0.05,
+                 max_file_bytes: int = 50 * 1024 * 1024,
+                 backup_count: int = 5,
+                 policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 sample_rate: float = 0.1,
+                 buffer_size: int = 64 * 1024,
+                 on_written: Optional[Callable[[Path, List[Tuple[Any, int]]], None]] = None,
+                 on_rotated: Optional[Callable[[Path], None]] = None):
+        self.formatter = formatter
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.on_written = on_written
+        self.on_rotated = on_rotated
+
+        self._queue: deque = deque()
+        self._wakeup = threading.Event()
+        self._space_available = threading.Condition()
+        self._handles: Dict[Path, Any] = {}
+        self._file_sizes: Dict[Path, int] = {}
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'blocked': 0,
+            'batches': 0,
+            'rotations': 0,
+            'write_errors': 0,
+            'listener_errors': 0,
+            'max_queue_depth': 0
+        }
+
+    def submit(self, record: Any, targets: Tuple[Path, ...], level: int = logging.INFO,
+               essential: bool = False) -> bool:
+        """
+        Enqueue a record for the given target files
+
+        Returns False if the record was dropped by the backpressure policy.
+        Essential records (e.g. audit or error entries) are never dropped.
+        """
+        if self._closed:
+            return False
+        if self._thread is None:
+            self._start()
+
+        queue = self._queue
+        if len(queue) >= self.max_queue_size:
+            if not essential and self._should_drop(level):
+                self.stats['dropped'] += 1
+                return False
+            self._wait_for_space()
+
+        queue.append((record, targets))
+        depth = len(queue)
+        if depth >= self.batch_size and not self._wakeup.is_set():
+            # Event.set() takes a lock; only pay for it when the writer may be asleep
+            self._wakeup.set()
+        if depth > self.stats['max_queue_depth']:
+            self.stats['max_queue_depth'] = depth
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every record submitted so far is written and flushed to disk buffers"""
+        if self._thread is None or not self._thread.is_alive():
+            return not self._queue
+        # Deque appends are FIFO: every record submitted before this call is
+        # ahead of the marker, whichever thread submitted it
+        marker = threading.Event()
+        self._queue.append(marker)
+        self._wakeup.set()
+        return marker.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the queue, stop the writer thread and close file handles"""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            atexit.unregister(self.close)
+        self._close_handles()
+
+    def get_file_size(self, path: Path) -> int:
+        """Current size in bytes of a target file as tracked by the writer"""
+        return self._file_sizes.get(Path(path), 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['queue_depth'] = len(self._queue)
+        stats['enqueued'] += stats['queue_depth']
+        stats['policy'] = self.policy.value
+        return stats
+
+    # Caller-side helpers
+
+    def _should_drop(self, level: int) -> bool:
+        if self.policy == BackpressurePolicy.DROP_DEBUG:
+            return level <= logging.DEBUG
+        if self.policy == BackpressurePolicy.SAMPLE:
+            return random.random() >= self.sample_rate
+        return False
+
+    def _wait_for_space(self) -> None:
+        self.stats['blocked'] += 1
+        self._wakeup.set()
+        with self._space_available:
+            while len(self._queue) >= self.max_queue_size and not self._closed:
+                self._space_available.wait(0.01)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="beast-mode-log-writer", daemon=True)
+                self._thread.start()
+                # Daemon thread: drain whatever is still queued at interpreter exit
+                atexit.register(self.close)
+
+    # Writer thread
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            self._drain()
+            if self._closed and not self._queue:
+                break
+
+    def _drain(self) -> None:
+        queue = self._queue
+        while queue:
+            batch: List[Tuple[Any, Tuple[Path, ...]]] = []
+            markers: List[threading.Event] = []
+            try:
+                while len(batch) < self.batch_size:
+                    item = queue.popleft()
+                    if item.__class__ is tuple:
+                        batch.append(item)
+                    else:
+                        markers.append(item)
+            except IndexError:
+                pass
+
+            with self._space_available:
+                self._space_available.notify_all()
+
+            if batch:
+                self._write_batch(batch)
+            for marker in markers:
+                marker.set()
+
+    def _write_batch(self, batch: List[Tuple[Any, Tuple[Path, ...]]]) -> None:
+        lines_by_file: Dict[Path, List[Tuple[Any, bytes]]] = {}
+        for record, targets in batch:
+            try:
+                line = self.formatter(record).encode("utf-8")
+            except Exception:
+                self.stats['write_errors'] += 1
+                continue
+            for target in targets:
+                lines_by_file.setdefault(target, []).append((record, line))
+
+        for path, lines in lines_by_file.items():
+            try:
+                self._write_lines(path, lines)
+            except OSError:
+                # Unwritable log location (e.g. read-only directory); keep the caller unaffected
+                self.stats['write_errors'] += 1
+                self._discard_handle(path)
+
+        self.stats['written'] += len(batch)
+        self.stats['enqueued'] += len(batch)
+        self.stats['batches'] += 1
+
+    def _write_lines(self, path: Path, lines: List[Tuple[Any, bytes]]) -> None:
+        handle = self._handles.get(path)
+        if handle is None:
+            handle = self._open(path)
+
+        offset = self._file_sizes[path]
+        handle.write(b"".join(line for _, line in lines))
+        handle.flush()
+
+        if self.on_written is not None:
+            written = []
+            for record, line in lines:
+                written.append((record, offset))
+                offset += len(line)
+            self._notify(self.on_written, path, written)
+        else:
+            offset += sum(len(line) for _, line in lines)
+        self._file_sizes[path] = offset
+
+        if self.max_file_bytes and offset >= self.max_file_bytes:
+            self._rotate(path)
+            if self.on_rotated is not None:
+                self._notify(self.on_rotated, path)
+
+    def _notify(self, listener: Callable, *args) -> None:
+        try:
+            listener(*args)
+        except Exception:
+            # A faulty listener must not stop log output
+            self.stats['listener_errors'] += 1
+
+    def _open(self, path: Path):
+        handle = open(path, "ab", buffering=self.buffer_size)
+        self._handles[path] = handle
+        self._file_sizes[path] = handle.tell()
+        return handle
+
+    def _rotate(self, path: Path) -> None:
+        self._discard_handle(path)
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = path.with_name(f"{path.name}.{index}")
+                if source.exists():
+                    os.replace(source, path.with_name(f"{path.name}.{index + 1}"))
+            os.replace(path, path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink()
+        self._file_sizes[path] = 0
+        self.stats['rotations'] += 1
+
+    def _discard_handle(self, path: Path) -> None:
+        handle = self._handles.pop(path, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+    def _close_handles(self) -> None:
+        for path in list(self._handles):
+            self._discard_handle(path)
@@ -22,6 +22,8 @@ import threading
 from contextlib import contextmanager
 
 from ..core.reflective_module import ReflectiveModule, HealthStatus
+from .async_log_writer import AsyncLogWriter, BackpressurePolicy
+from .log_entry_store import LogEntryStore
 
 class LogLevel(Enum):
     DEBUG = "DEBUG"
@@ -61,6 +63,16 @@ class LogEntry:
     performance_data: Optional[Dict[str, Any]] = None
     error_details: Optional[Dict[str, Any]] = None
 
+# Numeric priorities used by the log writer's backpressure policy
+LOG_LEVEL_NUMBERS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+    LogLevel.AUDIT: logging.INFO
+}
+
 class ComprehensiveLoggingHandler(logging.Handler):
     """Custom logging handler that forwards to ComprehensiveLoggingSystem"""
     
@@ -103,13 +115,24 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
     Provides structured logging, audit trails, and compliance tracking
     """
     
-    def __init__(self, project_root: str = ".", log_directory: str = "logs"):
+    def __init__(self, project_root: str = ".", log_directory: str = "logs",
+                 max_log_file_bytes: int = 50 * 1024 * 1024,
+                 log_backup_count: int = 5,
+                 backpressure_policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 max_queued_log_entries: int = 65536,
+                 max_in_memory_log_entries: int = 10000,
+                 max_in_memory_audit_entries: int = 10000):
         super().__init__("comprehensive_logging_system")
         
         # Configuration
         self.project_root = Path(project_root)
         self.log_directory = self.project_root / log_directory
         
+        # Log files
+        self.main_log_file = self.log_directory / "beast_mode.log"
+        self.audit_log_file = self.log_directory / "beast_mode_audit.log"
+        self.error_log_file = self.log_directory / "beast_mode_errors.log"
+        
         # Try to create log directory, but don't fail if we can't
         try:
             self.log_directory.mkdir(exist_ok=True)
@@ -117,9 +140,42 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
             # If we can't create the log directory, we'll fall back to console-only logging
             pass
         
+        # Recent entries in memory; older ones are read back from the log files
+        self.log_entries = LogEntryStore(
+            capacity=max_in_memory_log_entries,
+            index_fields={
+                'level': lambda entry: entry.level,
+                'component': lambda entry: entry.component,
+                'correlation_id': lambda entry: entry.correlation_id
+            },
+            spill_path=self.main_log_file,
+            loader=self._parse_log_line,
+            backup_count=log_backup_count
+        )
+        self.audit_trail = LogEntryStore(
+            capacity=max_in_memory_audit_entries,
+            index_fields={
+                'audit_event': lambda entry: entry.audit_event,
+                'component': lambda entry: entry.component
+            },
+            spill_path=self.audit_log_file,
+            loader=self._parse_log_line,
+            backup_count=log_backup_count
+        )
+        
+        # Background writer: callers only enqueue, file I/O happens on the writer thread
+        on_written, on_rotated = self._build_spill_listeners()
+        self.log_writer = AsyncLogWriter(
+            formatter=self._format_queued_entry,
+            max_queue_size=max_queued_log_entries,
+            max_file_bytes=max_log_file_bytes,
+            backup_count=log_backup_count,
+            policy=backpressure_policy,
+            on_written=on_written,
+            on_rotated=on_rotated
+        )
+        
         # Logging configuration
-        self.log_entries = []
-        self.audit_trail = []
         self.correlation_contexts = {}
         self.session_contexts = {}
         
@@ -150,6 +206,7 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
         
     def get_module_status(self) -> Dict[str, Any]:
         """Logging system operational status"""
+        self._refresh_log_file_size()
         return {
             "module_name": self.module_name,
             "status": "operational" if self.is_healthy() else "degraded",
@@ -170,6 +227,7 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
         
     def get_health_indicators(self) -> Dict[str, Any]:
         """Detailed health metrics for logging system"""
+        self._refresh_log_file_size()
         return {
             "logging_status": {
                 "total_entries": self.logging_metrics['total_log_entries'],
@@ -187,7 +245,8 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
                 "log_directory_accessible": self.log_directory.exists(),
                 "correlation_tracking_active": len(self.correlation_contexts) >= 0,
                 "session_tracking_active": len(self.session_contexts) >= 0
-            }
+            },
+            "log_writer": self.log_writer.get_stats()
         }
         
     def _get_primary_responsibility(self) -> str:
@@ -231,18 +290,19 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
             )
             
             # Store log entry
-            self.log_entries.append(log_entry)
+            entry_seq = self.log_entries.append(log_entry)
             
             # Add to audit trail if audit event
+            audit_seq = None
             if audit_event:
-                self.audit_trail.append(log_entry)
+                audit_seq = self.audit_trail.append(log_entry)
                 self.logging_metrics['audit_events'] += 1
                 
             # Update metrics
             self._update_logging_metrics(log_entry)
             
             # Write to log file
-            self._write_to_log_file(log_entry)
+            self._write_to_log_file(log_entry, entry_seq, audit_seq)
             
             # Trigger alerts for critical events
             if level in [LogLevel.ERROR, LogLevel.CRITICAL]:
@@ -434,41 +494,27 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
                  correlation_id: Optional[str] = None,
                  limit: int = 100) -> List[LogEntry]:
         """
-        Retrieve log entries with filtering
+        Retrieve the most recent log entries matching the filters (oldest first)
         """
-        filtered_logs = self.log_entries
-        
-        # Apply filters
-        if level:
-            filtered_logs = [log for log in filtered_logs if log.level == level]
-            
-        if component:
-            filtered_logs = [log for log in filtered_logs if log.component == component]
-            
-        if correlation_id:
-            filtered_logs = [log for log in filtered_logs if log.correlation_id == correlation_id]
-            
-        # Return most recent entries
-        return filtered_logs[-limit:]
+        return self.log_entries.query(
+            limit,
+            level=level or None,
+            component=component or None,
+            correlation_id=correlation_id or None
+        )
         
     def get_audit_trail(self, 
                        event_type: Optional[AuditEvent] = None,
                        component: Optional[str] = None,
                        limit: int = 50) -> List[LogEntry]:
         """
-        Retrieve audit trail entries
+        Retrieve the most recent audit trail entries (oldest first)
         """
-        filtered_audit = self.audit_trail
-        
-        # Apply filters
-        if event_type:
-            filtered_audit = [log for log in filtered_audit if log.audit_event == event_type]
-            
-        if component:
-            filtered_audit = [log for log in filtered_audit if log.component == component]
-            
-        # Return most recent entries
-        return filtered_audit[-limit:]
+        return self.audit_trail.query(
+            limit,
+            audit_event=event_type or None,
+            component=component or None
+        )
         
     def get_performance_analytics(self) -> Dict[str, Any]:
         """
@@ -524,11 +570,6 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
     def _setup_logging_infrastructure(self):
         """Setup logging infrastructure"""
         try:
-            # Create log files
-            self.main_log_file = self.log_directory / "beast_mode.log"
-            self.audit_log_file = self.log_directory / "beast_mode_audit.log"
-            self.error_log_file = self.log_directory / "beast_mode_errors.log"
-            
             # Create custom handler that forwards to our logging system
             self.custom_handler = ComprehensiveLoggingHandler(self)
             self.custom_handler.setLevel(logging.INFO)
@@ -584,65 +625,99 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
         if log_entry.performance_data:
             self.logging_metrics['performance_events'] += 1
             
-    def _write_to_log_file(self, log_entry: LogEntry):
-        """Write log entry to appropriate log file"""
+    def _write_to_log_file(self, log_entry: LogEntry, entry_seq: Optional[int] = None,
+                           audit_seq: Optional[int] = None):
+        """Queue log entry for the main log and the audit/error logs it belongs in"""
         try:
-            # Format log entry as JSON
-            log_data = {
-                "timestamp": log_entry.timestamp.isoformat(),
-                "level": log_entry.level.value,
-                "message": log_entry.message,
-                "correlation_id": log_entry.correlation_id,
-                "component": log_entry.component,
-                "operation": log_entry.operation,
-                "user_id": log_entry.user_id,
-                "session_id": log_entry.session_id,
-                "metadata": log_entry.metadata,
-                "audit_event": log_entry.audit_event.value if log_entry.audit_event else None,
-                "performance_data": log_entry.performance_data,
-                "error_details": log_entry.error_details
-            }
-            
-            log_line = json.dumps(log_data) + "\n"
-            
-            # Write to main log (with error handling)
-            try:
-                with open(self.main_log_file, "a") as f:
-                    f.write(log_line)
-            except (OSError, PermissionError, FileNotFoundError):
-                # Silently ignore file write errors (e.g., during testing)
-                pass
-                
-            # Write to audit log if audit event (with error handling)
+            if log_entry.level in (LogLevel.ERROR, LogLevel.CRITICAL):
+                targets = (self.main_log_file, self.error_log_file)
+            else:
+                targets = (self.main_log_file,)
             if log_entry.audit_event:
-                try:
-                    with open(self.audit_log_file, "a") as f:
-                        f.write(log_line)
-                except (OSError, PermissionError, FileNotFoundError):
-                    # Silently ignore file write errors
-                    pass
-                    
-            # Write to error log if error (with error handling)
-            if log_entry.level in [LogLevel.ERROR, LogLevel.CRITICAL]:
-                try:
-                    with open(self.error_log_file, "a") as f:
-                        f.write(log_line)
-                except (OSError, PermissionError, FileNotFoundError):
-                    # Silently ignore file write errors
-                    pass
-                    
-            # Update file size metric (with error handling)
-            try:
-                if self.main_log_file.exists():
-                    self.logging_metrics['log_file_size_bytes'] = self.main_log_file.stat().st_size
-            except (OSError, FileNotFoundError):
-                # If we can't get file size, just skip this metric
-                pass
-            
+                targets += (self.audit_log_file,)
+                
+            # Audit and error entries are never dropped by the backpressure policy
+            self.log_writer.submit(
+                (log_entry, entry_seq, audit_seq),
+                targets,
+                level=LOG_LEVEL_NUMBERS[log_entry.level],
+                essential=len(targets) > 1
+            )
         except Exception:
             # Silently ignore all logging errors to prevent breaking the application
             pass
             
+    @staticmethod
+    def _format_queued_entry(record) -> str:
+        """Format a queued (entry, entry_seq, audit_seq) record"""
+        return ComprehensiveLoggingSystem._format_log_line(record[0])
+        
+    @staticmethod
+    def _format_log_line(log_entry: LogEntry) -> str:
+        """Format log entry as a JSON line (runs on the writer thread)"""
+        log_data = {
+            "timestamp": log_entry.timestamp.isoformat(),
+            "level": log_entry.level.value,
+            "message": log_entry.message,
+            "correlation_id": log_entry.correlation_id,
+            "component": log_entry.component,
+            "operation": log_entry.operation,
+            "user_id": log_entry.user_id,
+            "session_id": log_entry.session_id,
+            "metadata": log_entry.metadata,
+            "audit_event": log_entry.audit_event.value if log_entry.audit_event else None,
+            "performance_data": log_entry.performance_data,
+            "error_details": log_entry.error_details
+        }
+        return json.dumps(log_data, default=str) + "\n"
+        
+    @staticmethod
+    def _parse_log_line(line: str) -> LogEntry:
+        """Rebuild a log entry from a JSON log line"""
+        log_data = json.loads(line)
+        return LogEntry(
+            timestamp=datetime.fromisoformat(log_data["timestamp"]),
+            level=LogLevel(log_data["level"]),
+            message=log_data["message"],
+            correlation_id=log_data["correlation_id"],
+            component=log_data["component"],
+            operation=log_data.get("operation"),
+            user_id=log_data.get("user_id"),
+            session_id=log_data.get("session_id"),
+            metadata=log_data.get("metadata") or {},
+            audit_event=AuditEvent(log_data["audit_event"]) if log_data.get("audit_event") else None,
+            performance_data=log_data.get("performance_data"),
+            error_details=log_data.get("error_details")
+        )
+        
+    def _build_spill_listeners(self):
+        """Writer callbacks that feed file offsets into the entry stores"""
+        # Closures over the stores only, so the writer never keeps this object alive
+        stores = {
+            self.main_log_file: (self.log_entries, 1),
+            self.audit_log_file: (self.audit_trail, 2)
+        }
+        
+        def on_written(path, written):
+            store_info = stores.get(path)
+            if store_info is None:
+                return
+            store, seq_position = store_info
+            for record, offset in written:
+                if record[seq_position] is not None:
+                    store.record_written(record[seq_position], record[0], offset)
+                    
+        def on_rotated(path):
+            store_info = stores.get(path)
+            if store_info is not None:
+                store_info[0].record_rotated()
+                
+        return on_written, on_rotated
+        
+    def _refresh_log_file_size(self):
+        """Update file size metric from the writer's byte count (no stat() per entry)"""
+        self.logging_metrics['log_file_size_bytes'] = self.log_writer.get_file_size(self.main_log_file)
+        
     def _trigger_alert(self, log_entry: LogEntry):
         """Trigger alert for critical log entries"""
         # In a full implementation, this would integrate with alerting systems
@@ -651,8 +726,17 @@ class ComprehensiveLoggingSystem(ReflectiveModule):
             
     # Public API methods
     
+    def flush_logs(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until all queued log entries have been written"""
+        return self.log_writer.flush(timeout)
+        
+    def shutdown(self):
+        """Flush queued log entries and stop the background writer"""
+        self.log_writer.close()
+        
     def get_logging_analytics(self) -> Dict[str, Any]:
         """Get comprehensive logging analytics"""
+        self._refresh_log_file_size()
         return {
             "logging_metrics": self.logging_metrics.copy(),
             "performance_analytics": self.get_performance_analytics(),
@@ -0,0 +1,289 @@
+"""
+Beast Mode Framework - Indexed Log Entry Store
+Bounded in-memory storage for recent log entries with on-disk spill
+
+Recent entries live in a fixed-capacity ring buffer with secondary indexes
+(e.g. by level, component or correlation ID), so queries walk newest-first
+through only the matching entries and stop after ``limit`` hits. Entries that
+have been written to a JSONL log file are also recorded in a compact offset
+index (sequence number -> byte offset per file generation), which keeps
+evicted entries queryable by seeking into the file instead of holding them
+in memory.
+"""
+
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Union
+
+
+class _FileSegment:
+    """Offset index for one generation of a rotated log file"""
+
+    __slots__ = ("seqs", "offsets", "inode")
+
+    def __init__(self):
+        self.seqs = array("q")
+        self.offsets = array("q")
+        self.inode: Optional[int] = None
+
+    def offset_of(self, seq: int) -> Optional[int]:
+        index = bisect_left(self.seqs, seq)
+        if index < len(self.seqs) and self.seqs[index] == seq:
+            return self.offsets[index]
+        return None
+
+
+class LogEntryStore:
+    """
+    Bounded, indexed store of log entries
+
+    Features:
+    - Fixed-capacity ring buffer; appends evict the oldest entry in O(1)
+    - Secondary indexes over the ring for the configured fields
+    - Newest-first queries that stop after `limit` matches
+    - Evicted entries stay queryable through a byte-offset index of the log file
+    - Offset index follows size-based rotation and forgets deleted backups
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 index_fields: Dict[str, Callable[[Any], Optional[Hashable]]],
+                 spill_path: Optional[Union[str, Path]] = None,
+                 loader: Optional[Callable[[str], Any]] = None,
+                 backup_count: int = 5):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.index_fields = index_fields
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+        self.loader = loader
+        self.backup_count = backup_count
+
+        self._slots: List[Any] = [None] * capacity
+        self._next_seq = 0
+        self._indexes: Dict[str, Dict[Hashable, deque]] = {name: {} for name in index_fields}
+        self._lock = threading.Lock()
+
+        # Newest segment describes the live file; older ones its numbered backups
+        self._segments: deque = deque([_FileSegment()])
+        self._disk_indexes: Dict[str, Dict[Hashable, array]] = {name: {} for name in index_fields}
+        # Separate lock so disk queries never stall callers appending to the ring
+        self._disk_lock = threading.Lock()
+        self.disk_read_errors = 0
+
+    # Ring buffer
+
+    def append(self, entry: Any) -> int:
+        """Store an entry and return its sequence number"""
+        with self._lock:
+            seq = self._next_seq
+            slot = seq % self.capacity
+            evicted = self._slots[slot]
+            if evicted is not None:
+                # The evicted entry is the oldest, so it heads every index it is in
+                for name, key_func in self.index_fields.items():
+                    key = key_func(evicted)
+                    if key is None:
+                        continue
+                    seqs = self._indexes[name][key]
+                    seqs.popleft()
+                    if not seqs:
+                        del self._indexes[name][key]
+
+            self._slots[slot] = entry
+            for name, key_func in self.index_fields.items():
+                key = key_func(entry)
+                if key is not None:
+                    self._indexes[name].setdefault(key, deque()).append(seq)
+            self._next_seq = seq + 1
+            return seq
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self.capacity)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate in-memory entries oldest-first"""
+        with self._lock:
+            entries = [self._slots[seq % self.capacity] for seq in range(self._oldest_seq(), self._next_seq)]
+        return iter(entries)
+
+    def __getitem__(self, index: int) -> Any:
+        """In-memory entry by position (0 = oldest retained, -1 = newest)"""
+        with self._lock:
+            size = len(self)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError("log entry index out of range")
+            return self._slots[(self._oldest_seq() + index) % self.capacity]
+
+    def _oldest_seq(self) -> int:
+        return max(0, self._next_seq - self.capacity)
+
+    # Queries
+
+    def query(self, limit: int = 100, include_spilled: bool = True, **filters: Any) -> List[Any]:
+        """
+        Most recent entries matching all filters, returned oldest-first
+
+        Filters with a None value are ignored. In-memory entries are searched
+        first; if fewer than `limit` match, the search continues into entries
+        evicted to the log files.
+        """
+        filters = {name: value for name, value in filters.items() if value is not None}
+        unknown = set(filters) - set(self.index_fields)
+        if unknown:
+            raise ValueError(f"Unindexed filter fields: {sorted(unknown)}")
+        if limit <= 0:
+            return []
+
+        results: List[Any] = []
+        with self._lock:
+            oldest = self._oldest_seq()
+            for seq in self._ring_candidates(filters, oldest):
+                entry = self._slots[seq % self.capacity]
+                if self._matches(entry, filters):
+                    results.append(entry)
+                    if len(results) >= limit:
+                        break
+
+        if len(results) < limit and include_spilled and self.loader is not None:
+            with self._disk_lock:
+                results.extend(self._query_spilled(filters, oldest, limit - len(results)))
+
+        results.reverse()
+        return results
+
+    def _ring_candidates(self, filters: Dict[str, Any], oldest: int) -> Iterator[int]:
+        if not filters:
+            return iter(range(self._next_seq - 1, oldest - 1, -1))
+        candidates = [self._indexes[name].get(value) for name, value in filters.items()]
+        if any(seqs is None for seqs in candidates):
+            return iter(())
+        return reversed(min(candidates, key=len))
+
+    def _matches(self, entry: Any, filters: Dict[str, Any]) -> bool:
+        for name, value in filters.items():
+            if self.index_fields[name](entry) != value:
+                return False
+        return True
+
+    # Spilled entries
+
+    def record_written(self, seq: int, entry: Any, offset: int) -> None:
+        """Record the byte offset at which an entry was written to the live log file"""
+        with self._disk_lock:
+            segment = self._segments[-1]
+            if segment.inode is None and self.spill_path is not None:
+                try:
+                    segment.inode = os.stat(self.spill_path).st_ino
+                except OSError:
+                    pass
+
+            self._insert_sorted(segment.seqs, seq, segment.offsets, offset)
+            for name, key_func in self.index_fields.items():
+                key = key_func(entry)
+                if key is not None:
+                    self._insert_sorted(self._disk_indexes[name].setdefault(key, array("q")), seq)
+
+    def record_rotated(self) -> None:
+        """Shift file generations after the live log file was rotated"""
+        with self._disk_lock:
+            self._segments.append(_FileSegment())
+            while len(self._segments) > self.backup_count + 1:
+                dropped = self._segments.popleft()
+                if dropped.seqs:
+                    self._forget_spilled_through(dropped.seqs[-1])
+
+    def _insert_sorted(self, seqs: array, seq: int, offsets: Optional[array] = None, offset: int = 0) -> None:
+        # Concurrent loggers can reach the writer slightly out of order
+        index = len(seqs) if not seqs or seqs[-1] < seq else bisect_right(seqs, seq)
+        seqs.insert(index, seq)
+        if offsets is not None:
+            offsets.insert(index, offset)
+
+    def _forget_spilled_through(self, last_seq: int) -> None:
+        for keys in self._disk_indexes.values():
+            for key in list(keys):
+                seqs = keys[key]
+                del seqs[:bisect_right(seqs, last_seq)]
+                if not seqs:
+                    del keys[key]
+
+    def _query_spilled(self, filters: Dict[str, Any], below: int, limit: int) -> List[Any]:
+        if filters:
+            candidates = [self._disk_indexes[name].get(value) for name, value in filters.items()]
+            if any(seqs is None for seqs in candidates):
+                return []
+            seqs = min(candidates, key=len)
+            candidate_seqs = (seqs[i] for i in range(bisect_left(seqs, below) - 1, -1, -1))
+        else:
+            candidate_seqs = (
+                segment.seqs[i]
+                for segment in reversed(self._segments)
+                for i in range(bisect_left(segment.seqs, below) - 1, -1, -1)
+            )
+
+        results: List[Any] = []
+        handles: Dict[int, Any] = {}
+        try:
+            for seq in candidate_seqs:
+                entry = self._read_spilled(seq, handles)
+                if entry is not None and self._matches(entry, filters):
+                    results.append(entry)
+                    if len(results) >= limit:
+                        break
+        finally:
+            for handle in handles.values():
+                if handle is not None:
+                    handle.close()
+        return results
+
+    def _read_spilled(self, seq: int, handles: Dict[int, Any]) -> Optional[Any]:
+        for generation, segment in enumerate(reversed(self._segments)):
+            if not segment.seqs or seq < segment.seqs[0]:
+                continue
+            offset = segment.offset_of(seq)
+            if offset is None:
+                return None
+            handle = handles.get(generation, False)
+            if handle is False:
+                handle = handles[generation] = self._open_generation(generation, segment)
+            if handle is None:
+                return None
+            try:
+                handle.seek(offset)
+                return self.loader(handle.readline().decode("utf-8"))
+            except Exception:
+                self.disk_read_errors += 1
+                return None
+        return None
+
+    def _open_generation(self, generation: int, segment: _FileSegment):
+        if self.spill_path is None:
+            return None
+        path = self.spill_path if generation == 0 else self.spill_path.with_name(f"{self.spill_path.name}.{generation}")
+        try:
+            handle = open(path, "rb")
+        except OSError:
+            return None
+        # A rotation may be in progress: only trust the file the offsets were recorded against
+        if segment.inode is not None and os.fstat(handle.fileno()).st_ino != segment.inode:
+            handle.close()
+            return None
+        return handle
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._disk_lock:
+            return {
+                "capacity": self.capacity,
+                "in_memory_entries": len(self),
+                "total_appended": self._next_seq,
+                "spilled_generations": len(self._segments),
+                "indexed_on_disk": sum(len(segment.seqs) for segment in self._segments),
+                "disk_read_errors": self.disk_read_errors
+            }
@@ -0,0 +1,245 @@
+"""
+Beast Mode Framework - Batched Failure Similarity
+Computes pairwise test failure similarity matrices in one pass and clusters
+failures over a similarity threshold graph
+
+The similarity of two failures is the weighted sum used by
+TestRCAIntegrationEngine:
+- 0.3 for the same test file
+- 0.2 for the same failure type
+- 0.3 x Jaccard similarity of error message words
+- 0.2 x Jaccard similarity of stack trace words (when both have one)
+
+Each failure is tokenized once. With NumPy available, word sets become
+binary term matrices restricted to tokens shared across failures, and
+intersections are computed with matrix products; otherwise an inverted
+token index counts intersections for co-occurring pairs only.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+FILE_WEIGHT = 0.3
+TYPE_WEIGHT = 0.2
+ERROR_WEIGHT = 0.3
+TRACE_WEIGHT = 0.2
+
+
+def tokenize_words(text: Optional[str]) -> FrozenSet[str]:
+    """Lowercase whitespace-separated word set of a text"""
+    if not text:
+        return frozenset()
+    return frozenset(text.lower().split())
+
+
+def jaccard(words_a: FrozenSet[str], words_b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two word sets (0.0 when either is empty)"""
+    if not words_a or not words_b:
+        return 0.0
+    intersection = len(words_a & words_b)
+    return intersection / (len(words_a) + len(words_b) - intersection)
+
+
+class _FailureFeatures:
+    """Tokenized features of a batch of failures"""
+
+    __slots__ = ("files", "types", "error_words", "trace_words")
+
+    def __init__(self, failures: Sequence[Any]):
+        self.files = [failure.test_file for failure in failures]
+        self.types = [failure.failure_type for failure in failures]
+        self.error_words = [tokenize_words(failure.error_message) for failure in failures]
+        self.trace_words = [tokenize_words(failure.stack_trace) for failure in failures]
+
+
+class UnionFind:
+    """Disjoint-set forest with path halving and union by size"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item_a: int, item_b: int) -> bool:
+        root_a, root_b = self.find(item_a), self.find(item_b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+
+    def groups(self) -> List[List[int]]:
+        """Components as index lists, ordered by their smallest member"""
+        components: Dict[int, List[int]] = {}
+        for item in range(len(self.parent)):
+            components.setdefault(self.find(item), []).append(item)
+        return list(components.values())
+
+
+class FailureSimilarityEngine:
+    """
+    Batched failure similarity computation
+
+    Features:
+    - One tokenization per failure per batch
+    - NumPy matrix products over shared-token term matrices when available
+    - Inverted-index pure Python fallback
+    - Rectangular (cross-group) similarity blocks
+    - Union-find clustering over a similarity threshold graph
+    """
+
+    def __init__(self, use_numpy: Optional[bool] = None, vocabulary_chunk_size: int = 4096):
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else (use_numpy and NUMPY_AVAILABLE)
+        self.vocabulary_chunk_size = vocabulary_chunk_size
+
+    def similarity_matrix(self, failures: Sequence[Any], others: Optional[Sequence[Any]] = None) -> Any:
+        """
+        Pairwise similarity between failures (rows) and others (columns)
+
+        Returns a NumPy array when NumPy is in use, otherwise a list of lists.
+        When ``others`` is omitted the square matrix has 1.0 on its diagonal.
+        """
+        features_a = _FailureFeatures(failures)
+        features_b = features_a if others is None else _FailureFeatures(others)
+
+        if self.use_numpy:
+            matrix = self._numpy_matrix(features_a, features_b)
+            if others is None:
+                np.fill_diagonal(matrix, 1.0)
+            return matrix
+
+        matrix = self._python_matrix(features_a, features_b)
+        if others is None:
+            for index in range(len(matrix)):
+                matrix[index][index] = 1.0
+        return matrix
+
+    def mean_similarity(self, failures: Sequence[Any], others: Sequence[Any]) -> float:
+        """Average similarity over all cross pairs of two groups"""
+        if not failures or not others:
+            return 0.0
+        matrix = self.similarity_matrix(failures, others)
+        if self.use_numpy:
+            return float(matrix.mean())
+        return sum(map(sum, matrix)) / (len(failures) * len(others))
+
+    def cluster(self, matrix: Any, threshold: float) -> List[List[int]]:
+        """Connected components of the graph with edges where similarity > threshold"""
+        size = len(matrix)
+        union_find = UnionFind(size)
+
+        if self.use_numpy and isinstance(matrix, np.ndarray):
+            rows, cols = np.nonzero(np.triu(matrix > threshold, k=1))
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                union_find.union(row, col)
+        else:
+            for row in range(size):
+                matrix_row = matrix[row]
+                for col in range(row + 1, size):
+                    if matrix_row[col] > threshold:
+                        union_find.union(row, col)
+
+        return union_find.groups()
+
+    def _numpy_matrix(self, features_a: _FailureFeatures, features_b: _FailureFeatures) -> Any:
+        # Same file / same type via integer codes over a shared vocabulary
+        matrix = FILE_WEIGHT * self._equality_matrix(features_a.files, features_b.files)
+        matrix += TYPE_WEIGHT * self._equality_matrix(features_a.types, features_b.types)
+        matrix += ERROR_WEIGHT * self._numpy_jaccard(features_a.error_words, features_b.error_words)
+        matrix += TRACE_WEIGHT * self._numpy_jaccard(features_a.trace_words, features_b.trace_words)
+        np.minimum(matrix, 1.0, out=matrix)
+        return matrix
+
+    def _equality_matrix(self, values_a: List[Any], values_b: List[Any]) -> Any:
+        codes: Dict[Any, int] = {}
+        codes_a = np.fromiter((codes.setdefault(value, len(codes)) for value in values_a), dtype=np.int64,
+                              count=len(values_a))
+        codes_b = np.fromiter((codes.setdefault(value, len(codes)) for value in values_b), dtype=np.int64,
+                              count=len(values_b))
+        return (codes_a[:, None] == codes_b[None, :]).astype(np.float64)
+
+    def _numpy_jaccard(self, sets_a: List[FrozenSet[str]], sets_b: List[FrozenSet[str]]) -> Any:
+        sizes_a = np.fromiter((len(words) for words in sets_a), dtype=np.float64, count=len(sets_a))
+        sizes_b = np.fromiter((len(words) for words in sets_b), dtype=np.float64, count=len(sets_b))
+        intersections = np.zeros((len(sets_a), len(sets_b)), dtype=np.float64)
+
+        # Only tokens present on both sides can contribute to an intersection
+        vocabulary = sorted(set().union(*sets_a) & set().union(*sets_b)) if sets_a and sets_b else []
+        chunk_size = self.vocabulary_chunk_size
+        for start in range(0, len(vocabulary), chunk_size):
+            token_ids = {token: column for column, token in enumerate(vocabulary[start:start + chunk_size])}
+            terms_a = self._term_matrix(sets_a, token_ids)
+            terms_b = terms_a if sets_b is sets_a else self._term_matrix(sets_b, token_ids)
+            intersections += terms_a @ terms_b.T
+
+        unions = sizes_a[:, None] + sizes_b[None, :] - intersections
+        empty = (sizes_a[:, None] == 0) | (sizes_b[None, :] == 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity = np.where(empty | (unions <= 0), 0.0, intersections / unions)
+        return similarity
+
+    def _term_matrix(self, word_sets: List[FrozenSet[str]], token_ids: Dict[str, int]) -> Any:
+        terms = np.zeros((len(word_sets), len(token_ids)), dtype=np.float32)
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, words in enumerate(word_sets):
+            for word in words:
+                col = token_ids.get(word)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        terms[rows, cols] = 1.0
+        return terms
+
+    def _python_matrix(self, features_a: _FailureFeatures, features_b: _FailureFeatures) -> List[List[float]]:
+        error_similarity = self._python_jaccard(features_a.error_words, features_b.error_words)
+        trace_similarity = self._python_jaccard(features_a.trace_words, features_b.trace_words)
+
+        matrix = []
+        for row in range(len(features_a.files)):
+            file_a, type_a = features_a.files[row], features_a.types[row]
+            errors, traces = error_similarity[row], trace_similarity[row]
+            matrix.append([
+                min(FILE_WEIGHT * (file_a == features_b.files[col])
+                    + TYPE_WEIGHT * (type_a == features_b.types[col])
+                    + ERROR_WEIGHT * errors.get(col, 0.0)
+                    + TRACE_WEIGHT * traces.get(col, 0.0), 1.0)
+                for col in range(len(features_b.files))
+            ])
+        return matrix
+
+    def _python_jaccard(self, sets_a: List[FrozenSet[str]],
+                        sets_b: List[FrozenSet[str]]) -> List[Dict[int, float]]:
+        """Sparse Jaccard rows: only pairs sharing at least one token are stored"""
+        postings: Dict[str, List[int]] = {}
+        for col, words in enumerate(sets_b):
+            for word in words:
+                postings.setdefault(word, []).append(col)
+
+        rows = []
+        for words in sets_a:
+            counts: Dict[int, int] = {}
+            for word in words:
+                for col in postings.get(word, ()):
+                    counts[col] = counts.get(col, 0) + 1
+            size_a = len(words)
+            rows.append({
+                col: count / (size_a + len(sets_b[col]) - count)
+                for col, count in counts.items()
+            })
+        return rows
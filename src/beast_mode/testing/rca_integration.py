@@ -7,7 +7,7 @@ Requirements: 1.1, 1.2, 2.1, 4.1, 4.3
 import re
 import time
 import hashlib
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -21,6 +21,7 @@ from .performance_monitor import RCAPerformanceMonitor, ResourceLimits, Performa
 from .timeout_handler import RCATimeoutHandler, TimeoutConfiguration, TimeoutStrategy
 from .test_pattern_library import TestPatternLibrary
 from .error_handler import RCAErrorHandler, DegradationLevel
+from .failure_similarity import FailureSimilarityEngine, jaccard, tokenize_words
 
 
 @dataclass
@@ -131,6 +132,10 @@ class TestRCAIntegrationEngine(ReflectiveModule):
         # Failure grouping configuration
         self.max_failures_per_group = 10
         self.analysis_timeout_seconds = 30
+        self.correlation_threshold = 0.6
+        
+        # Batched similarity computation (vectorized when NumPy is installed)
+        self.similarity_engine = FailureSimilarityEngine()
         
         self._update_health_indicator(
             "test_rca_integration_readiness",
@@ -367,12 +372,13 @@ class TestRCAIntegrationEngine(ReflectiveModule):
         """
         try:
             # Step 1: Calculate multi-dimensional priority scores
+            # (correlation scores come from one batched similarity matrix)
+            correlation_scores = self._calculate_correlation_priority_scores(failures)
             scored_failures = []
-            for failure in failures:
+            for failure, correlation_score in zip(failures, correlation_scores):
                 base_score = self._calculate_failure_priority_score(failure)
                 impact_score = self._calculate_failure_impact_score(failure)
                 urgency_score = self._calculate_failure_urgency_score(failure)
-                correlation_score = self._calculate_correlation_priority_score(failure, failures)
                 
                 total_score = (base_score * 0.4 + impact_score * 0.3 + 
                               urgency_score * 0.2 + correlation_score * 0.1)
@@ -898,20 +904,30 @@ class TestRCAIntegrationEngine(ReflectiveModule):
     
     def _calculate_correlation_priority_score(self, failure: TestFailureData, all_failures: List[TestFailureData]) -> float:
         """Calculate priority score based on correlation with other failures"""
-        correlation_score = 0.0
-        
+        similarities = self.similarity_engine.similarity_matrix([failure], all_failures)[0]
+        return self._correlation_score_from_row(failure, all_failures, similarities)
+    
+    def _calculate_correlation_priority_scores(self, failures: List[TestFailureData]) -> List[float]:
+        """Correlation priority scores for every failure from one similarity matrix"""
+        if not failures:
+            return []
+        matrix = self.similarity_engine.similarity_matrix(failures)
+        return [
+            self._correlation_score_from_row(failure, failures, matrix[i])
+            for i, failure in enumerate(failures)
+        ]
+    
+    def _correlation_score_from_row(self, failure: TestFailureData, all_failures: List[TestFailureData],
+                                    similarities: Sequence[float]) -> float:
+        """Score a failure from its similarity row against all failures"""
         # Count similar failures
-        similar_failures = 0
-        for other_failure in all_failures:
-            if other_failure != failure:
-                similarity = self._calculate_failure_similarity(failure, other_failure)
-                if similarity > 0.5:
-                    similar_failures += 1
-                    
-        # More correlated failures get higher priority
-        correlation_score = min(similar_failures * 10.0, 50.0)
+        similar_failures = sum(
+            1 for other_failure, similarity in zip(all_failures, similarities)
+            if similarity > 0.5 and other_failure != failure
+        )
         
-        return correlation_score
+        # More correlated failures get higher priority
+        return min(similar_failures * 10.0, 50.0)
     
     def _apply_critical_priority_boosting(self, prioritized_failures: List[TestFailureData]) -> List[TestFailureData]:
         """Apply priority boosting for critical failure patterns"""
@@ -934,61 +950,23 @@ class TestRCAIntegrationEngine(ReflectiveModule):
         # Critical failures go first
         return critical_failures + normal_failures
     
-    def _build_correlation_matrix(self, failures: List[TestFailureData]) -> List[List[float]]:
-        """Build correlation matrix for failures within a group"""
-        n = len(failures)
-        matrix = [[0.0 for _ in range(n)] for _ in range(n)]
-        
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    matrix[i][j] = 1.0
-                else:
-                    matrix[i][j] = self._calculate_failure_similarity(failures[i], failures[j])
-                    
-        return matrix
+    def _build_correlation_matrix(self, failures: List[TestFailureData]) -> Sequence[Sequence[float]]:
+        """Build correlation matrix for failures within a group (tokenizing each failure once)"""
+        return self.similarity_engine.similarity_matrix(failures)
     
-    def _split_by_correlation(self, failures: List[TestFailureData], correlation_matrix: List[List[float]]) -> List[List[TestFailureData]]:
+    def _split_by_correlation(self, failures: List[TestFailureData], correlation_matrix: Sequence[Sequence[float]]) -> List[List[TestFailureData]]:
         """Split failures into subgroups based on correlation matrix"""
         n = len(failures)
         if n <= 1:
             return [failures]
             
-        # Simple clustering based on correlation threshold
-        threshold = 0.6
-        groups = []
-        assigned = [False] * n
-        
-        for i in range(n):
-            if assigned[i]:
-                continue
-                
-            group = [failures[i]]
-            assigned[i] = True
-            
-            for j in range(i + 1, n):
-                if not assigned[j] and correlation_matrix[i][j] > threshold:
-                    group.append(failures[j])
-                    assigned[j] = True
-                    
-            groups.append(group)
-            
-        return groups
+        # Connected components of the graph of pairs above the correlation threshold
+        components = self.similarity_engine.cluster(correlation_matrix, self.correlation_threshold)
+        return [[failures[i] for i in component] for component in components]
     
     def _calculate_cross_group_correlation(self, group_a: List[TestFailureData], group_b: List[TestFailureData]) -> float:
         """Calculate correlation score between two groups"""
-        if not group_a or not group_b:
-            return 0.0
-            
-        total_similarity = 0.0
-        comparisons = 0
-        
-        for failure_a in group_a:
-            for failure_b in group_b:
-                total_similarity += self._calculate_failure_similarity(failure_a, failure_b)
-                comparisons += 1
-                
-        return total_similarity / comparisons if comparisons > 0 else 0.0
+        return self.similarity_engine.mean_similarity(group_a, group_b)
     
     def _calculate_failure_similarity(self, failure_a: TestFailureData, failure_b: TestFailureData) -> float:
         """Calculate similarity score between two failures"""
@@ -1019,16 +997,7 @@ class TestRCAIntegrationEngine(ReflectiveModule):
             return 0.0
             
         # Simple word-based similarity
-        words_a = set(text_a.lower().split())
-        words_b = set(text_b.lower().split())
-        
-        if not words_a or not words_b:
-            return 0.0
-            
-        intersection = words_a.intersection(words_b)
-        union = words_a.union(words_b)
-        
-        return len(intersection) / len(union) if union else 0.0
+        return jaccard(tokenize_words(text_a), tokenize_words(text_b))
     
     def _detect_common_failure_patterns(self, failures: List[TestFailureData]) -> List[Dict[str, Any]]:
         """Detect common patterns within a group of failures"""
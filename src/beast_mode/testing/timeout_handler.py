@@ -4,17 +4,18 @@ Implements timeout handling and graceful degradation for RCA operations
 Requirements: 1.4 - 30-second timeout requirement with graceful degradation
 """
 
+import asyncio
 import time
 import signal
-import threading
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass
 from datetime import datetime
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from enum import Enum
 
 from ..core.reflective_module import ReflectiveModule, HealthStatus
 from .performance_monitor import PerformanceMetrics, PerformanceStatus
+from .timer_wheel import TimerScheduler, get_default_scheduler
 
 
 class TimeoutStrategy(Enum):
@@ -53,16 +54,23 @@ class RCATimeoutHandler(ReflectiveModule):
     """
     Timeout handler for RCA operations with graceful degradation
     Ensures 30-second timeout compliance with intelligent fallback strategies
+    
+    Warning/graceful/hard timers are armed on a shared timer-wheel scheduler
+    (one thread for all operations) or, for async callers, on the event loop.
+    Operation callbacks run on that shared thread, so a blocking callback
+    delays the timeouts of every other operation; keep them short.
     """
     
-    def __init__(self, timeout_config: Optional[TimeoutConfiguration] = None):
+    def __init__(self, timeout_config: Optional[TimeoutConfiguration] = None,
+                 scheduler: Optional[TimerScheduler] = None):
         super().__init__("rca_timeout_handler")
         
         # Timeout configuration
         self.timeout_config = timeout_config or TimeoutConfiguration()
+        self.timer_scheduler = scheduler if scheduler is not None else get_default_scheduler()
         
-        # Active timeout tracking
-        self.active_timeouts: Dict[str, threading.Timer] = {}
+        # Active timeout tracking (operation_id -> {timeout_type: timer handle})
+        self.active_timeouts: Dict[str, Dict[str, Any]] = {}
         self.timeout_events: List[TimeoutEvent] = []
         self.operation_callbacks: Dict[str, Callable] = {}
         
@@ -174,6 +182,35 @@ class RCATimeoutHandler(ReflectiveModule):
             # Clean up
             self._cleanup_operation_callbacks(operation_id)
             
+    @asynccontextmanager
+    async def manage_operation_timeout_async(self, operation_id: str, operation_callback: Optional[Callable] = None):
+        """
+        Async variant of manage_operation_timeout
+        Timeout callbacks run on the caller's event loop via loop.call_later
+        """
+        self.total_operations += 1
+        
+        if operation_callback:
+            self.operation_callbacks[operation_id] = operation_callback
+            
+        self._setup_timeout_handlers(operation_id, asyncio.get_running_loop().call_later)
+        
+        try:
+            self.logger.info(f"Managing timeout for async operation: {operation_id} (strategy: {self.timeout_config.strategy.value})")
+            
+            yield self._create_timeout_context(operation_id)
+            
+            self._cleanup_operation_timeouts(operation_id)
+            self.logger.info(f"Operation {operation_id} completed within timeout limits")
+            
+        except BaseException as e:
+            self._cleanup_operation_timeouts(operation_id)
+            self.logger.error(f"Operation {operation_id} failed: {e!r}")
+            raise
+            
+        finally:
+            self._cleanup_operation_callbacks(operation_id)
+            
     def apply_graceful_degradation(self, operation_id: str, degradation_level: int = 1) -> Dict[str, Any]:
         """
         Apply graceful degradation to an operation
@@ -361,45 +398,43 @@ class RCATimeoutHandler(ReflectiveModule):
             
     # Private helper methods
     
-    def _setup_timeout_handlers(self, operation_id: str) -> Dict[str, threading.Timer]:
-        """Set up timeout handlers for an operation"""
+    def _setup_timeout_handlers(self, operation_id: str,
+                                call_later: Optional[Callable] = None) -> Dict[str, Any]:
+        """Arm warning/graceful/hard timers for an operation (O(1) each, no thread per timer)"""
         handlers = {}
+        call_later = call_later or self.timer_scheduler.call_later
         
         try:
             # Warning timeout
             if self.timeout_config.warning_timeout_seconds > 0:
-                warning_timer = threading.Timer(
+                handlers["warning"] = call_later(
                     self.timeout_config.warning_timeout_seconds,
                     self._handle_warning_timeout,
-                    args=[operation_id]
+                    operation_id
                 )
-                warning_timer.start()
-                handlers["warning"] = warning_timer
                 
             # Graceful timeout
             if self.timeout_config.graceful_timeout_seconds > 0:
-                graceful_timer = threading.Timer(
+                handlers["graceful"] = call_later(
                     self.timeout_config.graceful_timeout_seconds,
                     self._handle_graceful_timeout,
-                    args=[operation_id]
+                    operation_id
                 )
-                graceful_timer.start()
-                handlers["graceful"] = graceful_timer
                 
             # Hard timeout
             if self.timeout_config.hard_timeout_seconds > 0:
-                hard_timer = threading.Timer(
+                handlers["hard"] = call_later(
                     self.timeout_config.hard_timeout_seconds,
                     self._handle_hard_timeout,
-                    args=[operation_id]
+                    operation_id
                 )
-                hard_timer.start()
-                handlers["hard"] = hard_timer
                 
             self.active_timeouts[operation_id] = handlers
             return handlers
             
         except Exception as e:
+            for timer in handlers.values():
+                timer.cancel()
             self.logger.error(f"Failed to setup timeout handlers for operation {operation_id}: {e}")
             return {}
             
@@ -416,11 +451,10 @@ class RCATimeoutHandler(ReflectiveModule):
     def _cleanup_operation_timeouts(self, operation_id: str) -> None:
         """Clean up timeout handlers for completed operation"""
         try:
-            if operation_id in self.active_timeouts:
-                handlers = self.active_timeouts.pop(operation_id)
-                for handler_type, timer in handlers.items():
-                    if timer.is_alive():
-                        timer.cancel()
+            handlers = self.active_timeouts.pop(operation_id, None)
+            if handlers:
+                for timer in handlers.values():
+                    timer.cancel()
                         
         except Exception as e:
             self.logger.error(f"Failed to cleanup timeouts for operation {operation_id}: {e}")
@@ -0,0 +1,238 @@
+"""
+Beast Mode Framework - Timer Wheel Scheduler
+Single-thread timer scheduling for large numbers of guarded operations
+
+A hierarchical timing wheel (Varghese & Lauck) keeps timers in per-tick slots:
+level 0 holds timers due within one revolution, higher levels hold coarser
+slots that cascade down as time advances. Arming and cancelling a timer are
+O(1), and one scheduler thread serves every timer instead of one OS thread
+per threading.Timer.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class TimerHandle:
+    """Handle for a scheduled callback; cancel() is O(1) and idempotent"""
+
+    __slots__ = ("callback", "args", "deadline", "expiry_tick", "cancelled", "_slot", "_scheduler")
+
+    def __init__(self, callback: Callable, args: Tuple, deadline: float, expiry_tick: int,
+                 scheduler: Optional["TimerScheduler"] = None):
+        self.callback = callback
+        self.args = args
+        self.deadline = deadline
+        self.expiry_tick = expiry_tick
+        self.cancelled = False
+        self._slot: Optional[Dict["TimerHandle", None]] = None
+        self._scheduler = scheduler
+
+    def cancel(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+        self.cancelled = True
+
+    def is_active(self) -> bool:
+        """Whether the timer is still armed (not fired and not cancelled)"""
+        return self._slot is not None
+
+    def _detach(self) -> None:
+        if self._slot is not None:
+            self._slot.pop(self, None)
+            self._slot = None
+
+
+class HierarchicalTimerWheel:
+    """
+    Hierarchical timing wheel keyed by integer ticks
+
+    Features:
+    - O(1) schedule and cancel
+    - Amortized O(1) per tick advance (timers cascade at most once per level)
+    - Timers beyond the wheel range park in the top level and re-cascade
+    """
+
+    def __init__(self, slot_bits: int = 6, levels: int = 4):
+        self.slot_bits = slot_bits
+        self.levels = levels
+        self._slots_per_level = 1 << slot_bits
+        self._mask = self._slots_per_level - 1
+        self._range = 1 << (slot_bits * levels)
+        self._wheels: List[List[Dict[TimerHandle, None]]] = [
+            [{} for _ in range(self._slots_per_level)] for _ in range(levels)
+        ]
+        self.current_tick = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def insert(self, handle: TimerHandle) -> None:
+        """Place a timer in the slot for its expiry tick"""
+        if handle.expiry_tick <= self.current_tick:
+            # The current tick has already been processed; fire on the next one
+            handle.expiry_tick = self.current_tick + 1
+
+        delta = handle.expiry_tick - self.current_tick
+        placement_tick = handle.expiry_tick
+        if delta >= self._range:
+            placement_tick = self.current_tick + self._range - 1
+            delta = self._range - 1
+
+        level = 0
+        while delta >= (1 << (self.slot_bits * (level + 1))):
+            level += 1
+        slot = self._wheels[level][(placement_tick >> (self.slot_bits * level)) & self._mask]
+        slot[handle] = None
+        handle._slot = slot
+        self._count += 1
+
+    def remove(self, handle: TimerHandle) -> None:
+        if handle._slot is not None:
+            handle._detach()
+            self._count -= 1
+
+    def reset(self, tick: int) -> None:
+        """Jump an empty wheel to the given tick without walking the gap"""
+        if self._count == 0:
+            self.current_tick = max(self.current_tick, tick)
+
+    def advance(self, tick: int) -> List[TimerHandle]:
+        """Advance to the given tick and return expired timers in expiry order"""
+        expired: List[TimerHandle] = []
+        while self.current_tick < tick:
+            if self._count == 0:
+                self.current_tick = tick
+                break
+            self.current_tick += 1
+            self._cascade()
+
+            slot = self._wheels[0][self.current_tick & self._mask]
+            if slot:
+                for handle in list(slot):
+                    handle._slot = None
+                    expired.append(handle)
+                self._count -= len(slot)
+                slot.clear()
+        return expired
+
+    def _cascade(self) -> None:
+        level = 1
+        while level < self.levels and (self.current_tick >> (self.slot_bits * (level - 1))) & self._mask == 0:
+            slot = self._wheels[level][(self.current_tick >> (self.slot_bits * level)) & self._mask]
+            if slot:
+                handles = list(slot)
+                slot.clear()
+                self._count -= len(handles)
+                for handle in handles:
+                    handle._slot = None
+                    self.insert(handle)
+            level += 1
+
+
+class TimerScheduler:
+    """
+    Background scheduler running callbacks from a hierarchical timer wheel
+
+    Features:
+    - One daemon thread for any number of timers
+    - O(1) call_later/cancel under a single lock
+    - Sleeps without ticking while no timers are armed
+    - Callbacks run outside the lock, so they may arm or cancel timers
+    """
+
+    def __init__(self, tick_seconds: float = 0.01, slot_bits: int = 6, levels: int = 4,
+                 name: str = "beast-mode-timer-wheel"):
+        if tick_seconds <= 0:
+            raise ValueError("tick_seconds must be positive")
+        self.tick_seconds = tick_seconds
+        self.name = name
+        self._wheel = HierarchicalTimerWheel(slot_bits, levels)
+        self._origin = time.monotonic()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.fired = 0
+        self.callback_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._wheel)
+
+    def call_later(self, delay: float, callback: Callable, *args: Any) -> TimerHandle:
+        """Run callback(*args) on the scheduler thread after `delay` seconds"""
+        deadline = time.monotonic() + max(0.0, delay)
+        handle = TimerHandle(callback, args, deadline, self._tick_for(deadline, math.ceil), self)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("TimerScheduler is closed")
+            was_empty = len(self._wheel) == 0
+            if was_empty:
+                self._wheel.reset(self._tick_for(time.monotonic(), math.floor))
+            self._wheel.insert(handle)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            elif was_empty:
+                self._condition.notify()
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        with self._condition:
+            self._wheel.remove(handle)
+            handle.cancelled = True
+
+    def close(self) -> None:
+        """Stop the scheduler thread; pending timers are discarded"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(1.0)
+
+    def _tick_for(self, timestamp: float, rounding: Callable[[float], int]) -> int:
+        return int(rounding((timestamp - self._origin) / self.tick_seconds))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and len(self._wheel) == 0:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                next_tick_time = self._origin + (self._wheel.current_tick + 1) * self.tick_seconds
+                wait_seconds = next_tick_time - time.monotonic()
+                if wait_seconds > 0:
+                    self._condition.wait(wait_seconds)
+                    if self._closed:
+                        return
+                expired = self._wheel.advance(self._tick_for(time.monotonic(), math.floor))
+
+            for handle in expired:
+                if handle.cancelled:
+                    continue
+                self.fired += 1
+                try:
+                    handle.callback(*handle.args)
+                except Exception as e:
+                    self.callback_errors += 1
+                    logger.error(f"Timer callback {handle.callback!r} failed: {e}")
+
+
+_default_scheduler: Optional[TimerScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> TimerScheduler:
+    """Process-wide scheduler shared by timeout handlers"""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = TimerScheduler(tick_seconds=0.05)
+        return _default_scheduler
@@ -12,11 +12,21 @@ from .path_normalizer import (
     ensure_relative_to,
     safe_relative_to
 )
+from .project_walker import (
+    ProjectWalker,
+    walk_project_files,
+    DEFAULT_EXCLUDED_DIRS,
+    ENVIRONMENT_EXCLUDED_DIRS
+)
 
 __all__ = [
     'PathNormalizer',
     'PathValidator',
     'normalize_path',
     'ensure_relative_to',
-    'safe_relative_to'
+    'safe_relative_to',
+    'ProjectWalker',
+    'walk_project_files',
+    'DEFAULT_EXCLUDED_DIRS',
+    'ENVIRONMENT_EXCLUDED_DIRS'
 ]
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Project Walker Utility
+
+This module provides a single-pass, os.scandir based project file walker for the
+Beast Mode framework. It prunes excluded directories before descending into them and
+yields files for every requested extension in one traversal, optionally scanning
+top-level subtrees on a thread pool.
+"""
+
+import fnmatch
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    '__pycache__', '.git', 'node_modules', '.pytest_cache', '.mypy_cache'
+})
+
+# Virtualenv, build output and tool directories; callers opt in with
+# excluded_dirs=DEFAULT_EXCLUDED_DIRS | ENVIRONMENT_EXCLUDED_DIRS
+ENVIRONMENT_EXCLUDED_DIRS = frozenset({
+    '.venv', 'venv', 'build', 'dist', '.ruff_cache', '.tox', '.nox', '.eggs'
+})
+
+
+class ProjectWalker:
+    """
+    Single-pass project file walker built on os.scandir.
+
+    Excluded directories are pruned by name (or fnmatch pattern such as
+    ``*.egg-info``) before the walker descends into them, and extension and
+    filename filters are applied to each directory entry during the same
+    traversal.
+
+    Example:
+        >>> walker = ProjectWalker("/project", extensions={".py", ".md"})
+        >>> for path in walker.walk():
+        ...     print(path)
+    """
+
+    def __init__(self,
+                 root: Union[str, Path],
+                 extensions: Optional[Iterable[str]] = None,
+                 patterns: Optional[Iterable[str]] = None,
+                 excluded_dirs: Optional[Iterable[str]] = None,
+                 max_depth: Optional[int] = None,
+                 follow_symlinks: bool = False,
+                 max_workers: int = 0):
+        """
+        Initialize the walker.
+
+        Args:
+            root: Directory to walk
+            extensions: File extensions to include (e.g. {".py"}); all files if None
+            patterns: Filename fnmatch patterns to include (e.g. ["Makefile*"])
+            excluded_dirs: Directory names or fnmatch patterns to prune
+                (defaults to DEFAULT_EXCLUDED_DIRS)
+            max_depth: Maximum directory depth to descend (0 = root only)
+            follow_symlinks: Whether to descend into symlinked directories
+            max_workers: Scan top-level subtrees on this many threads (0 = serial)
+        """
+        self.root = Path(root)
+        self.extensions = {ext.lower() for ext in extensions} if extensions is not None else None
+        self.patterns = list(patterns) if patterns is not None else None
+        self.max_depth = max_depth
+        self.follow_symlinks = follow_symlinks
+        self.max_workers = max_workers
+
+        excluded = DEFAULT_EXCLUDED_DIRS if excluded_dirs is None else excluded_dirs
+        self._excluded_names: Set[str] = {name for name in excluded if not self._is_glob(name)}
+        self._excluded_patterns: List[str] = [name for name in excluded if self._is_glob(name)]
+
+    def walk(self) -> Iterator[Path]:
+        """
+        Yield absolute paths of all matching files under the root.
+
+        Returns:
+            Iterator of Path objects rooted at ``self.root``
+        """
+        root_str = str(self.root)
+        for relative_path in self.walk_relative():
+            yield Path(os.path.join(root_str, relative_path))
+
+    def walk_relative(self) -> Iterator[str]:
+        """
+        Yield posix-style paths of all matching files, relative to the root.
+
+        Returns:
+            Iterator of relative path strings such as ``"src/main.py"``
+        """
+        root_files, subdirs = self._scan_directory(str(self.root), "")
+        yield from root_files
+
+        if self.max_depth is not None and self.max_depth < 1:
+            return
+
+        if self.max_workers and len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # One top-level subtree per task; results are yielded in
+                # directory order so output is deterministic
+                for subtree_files in executor.map(lambda entry: list(self._walk_subtree(*entry)), subdirs):
+                    yield from subtree_files
+        else:
+            for dir_path, relative_dir in subdirs:
+                yield from self._walk_subtree(dir_path, relative_dir)
+
+    def files_by_extension(self) -> Dict[str, List[Path]]:
+        """
+        Group matching files by lowercase extension in a single traversal.
+
+        Returns:
+            Dict mapping extension (e.g. ".py") to a list of absolute paths
+        """
+        grouped: Dict[str, List[Path]] = {}
+        for path in self.walk():
+            grouped.setdefault(path.suffix.lower(), []).append(path)
+        return grouped
+
+    def _walk_subtree(self, dir_path: str, relative_dir: str) -> Iterator[str]:
+        """Iteratively walk a directory subtree (depth-first, sorted entries)"""
+        stack = [(dir_path, relative_dir, 1)]
+        while stack:
+            current_path, current_relative, depth = stack.pop()
+            files, subdirs = self._scan_directory(current_path, current_relative)
+            yield from files
+
+            if self.max_depth is None or depth < self.max_depth:
+                stack.extend((path, relative, depth + 1) for path, relative in reversed(subdirs))
+
+    def _scan_directory(self, dir_path: str, relative_dir: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Scan one directory, returning matching files and subdirectories to descend"""
+        files: List[str] = []
+        subdirs: List[Tuple[str, str]] = []
+        prefix = f"{relative_dir}/" if relative_dir else ""
+
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    try:
+                        if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                            if not self._is_excluded_dir(entry.name):
+                                subdirs.append((entry.path, prefix + entry.name))
+                        elif entry.is_file() and self._matches_file(entry.name):
+                            files.append(prefix + entry.name)
+                    except OSError:
+                        continue  # Entry vanished or is unreadable
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {dir_path}: {e}")
+
+        return files, subdirs
+
+    def _is_excluded_dir(self, name: str) -> bool:
+        """Check if a directory name is excluded"""
+        if name in self._excluded_names:
+            return True
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self._excluded_patterns)
+
+    def _matches_file(self, name: str) -> bool:
+        """Check if a filename passes the extension and pattern filters"""
+        if self.extensions is not None:
+            dot = name.rfind('.')
+            if dot <= 0 or name[dot:].lower() not in self.extensions:
+                return False
+        if self.patterns is not None:
+            return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.patterns)
+        return True
+
+    @staticmethod
+    def _is_glob(name: str) -> bool:
+        return any(char in name for char in '*?[')
+
+
+def walk_project_files(root: Union[str, Path],
+                       extensions: Optional[Iterable[str]] = None,
+                       patterns: Optional[Iterable[str]] = None,
+                       excluded_dirs: Optional[Iterable[str]] = None,
+                       max_workers: int = 0) -> List[Path]:
+    """Convenience function returning all matching files from ProjectWalker.walk()"""
+    return list(ProjectWalker(root, extensions=extensions, patterns=patterns,
+                              excluded_dirs=excluded_dirs, max_workers=max_workers).walk())
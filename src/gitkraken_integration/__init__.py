@@ -14,6 +14,7 @@ Key Components:
 
 from .providers.git_provider import GitProvider, GitOperationResult, BranchInfo
 from .providers.standard_git_provider import StandardGitProvider
+from .providers.async_git_provider import AsyncStandardGitProvider
 
 # These will be implemented in subsequent tasks
 # from .providers.gitkraken_provider import GitKrakenProvider
@@ -29,6 +30,7 @@ __all__ = [
     "GitOperationResult", 
     "BranchInfo",
     "StandardGitProvider",
+    "AsyncStandardGitProvider",
     # These will be added in subsequent tasks:
     # "GitKrakenProvider", 
     # "GitOperationsManager",
@@ -14,6 +14,8 @@ from .git_provider import (
     FileStatus,
     MergeConflict
 )
+from .git_batch_session import GitBatchSession
+from .async_git_provider import AsyncStandardGitProvider
 
 __all__ = [
     "GitProvider",
@@ -22,5 +24,7 @@ __all__ = [
     "BranchInfo",
     "CommitInfo", 
     "FileStatus",
-    "MergeConflict"
+    "MergeConflict",
+    "GitBatchSession",
+    "AsyncStandardGitProvider"
 ]
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""
+Async Standard Git Provider Implementation
+
+This module provides an asyncio variant of the standard git provider. Git
+commands run through asyncio.create_subprocess_exec under a bounded
+concurrency semaphore, so independent queries (both sides of a branch
+comparison, the health checks, commit details and ahead/behind counts for
+every branch) run in parallel instead of one after another.
+"""
+
+import asyncio
+import concurrent.futures
+import subprocess
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+from .git_provider import GitOperationResult, BranchInfo
+from .standard_git_provider import StandardGitProvider
+
+
+class AsyncStandardGitProvider(StandardGitProvider):
+    """
+    Standard git provider with asyncio-based, parallel git execution.
+
+    The *_async coroutines are the primary API. The synchronous
+    list_branches, compare_branches and get_health_status methods are thin
+    wrappers that run the corresponding coroutine to completion, so this
+    provider can be used anywhere a GitProvider is expected.
+    """
+
+    def __init__(self, repo_path: str = ".", max_concurrency: int = 8, batch_mode: bool = False):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        super().__init__(repo_path, batch_mode=batch_mode)
+        self.max_concurrency = max_concurrency
+        # asyncio primitives belong to one event loop; sync wrappers create a new loop per call
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _run_git_command_async(
+        self,
+        args: List[str],
+        input_data: str = None,
+        timeout: int = 30
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command without blocking the event loop.
+
+        Mirrors _run_git_command: returns a CompletedProcess with text output
+        and raises CalledProcessError / TimeoutExpired on failure.
+        """
+        cmd = [self.git_executable] + args
+
+        async with self._get_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input_data.encode() if input_data is not None else None),
+                    timeout
+                )
+            except asyncio.TimeoutError as e:
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout) from e
+
+        stdout_text = stdout.decode("utf-8", errors="replace")
+        stderr_text = stderr.decode("utf-8", errors="replace")
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stdout_text, stderr_text)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout_text, stderr_text)
+
+    async def _gather_commands(self, *commands: Awaitable[Any]) -> List[Any]:
+        """
+        Run commands concurrently and raise the first failure.
+
+        Unlike a plain gather, every command is awaited to completion, so no
+        subprocess is left running when the first one fails.
+        """
+        results = await asyncio.gather(*commands, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _run_sync(self, coroutine: Awaitable[Any]) -> Any:
+        """Run a coroutine to completion from synchronous code"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # Called from inside an event loop: run on a private loop in a worker thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    # Ahead/behind counts
+
+    async def get_ahead_behind_counts_async(self, branch: str, upstream: str = None) -> Dict[str, int]:
+        """Ahead/behind counts of branch against upstream (default: its configured upstream)"""
+        upstream = upstream or f"{branch}@{{u}}"
+        try:
+            result = await self._run_git_command_async([
+                "rev-list", "--left-right", "--count", f"{branch}...{upstream}"
+            ])
+            return self._parse_ahead_behind_output(result.stdout)
+        except subprocess.CalledProcessError:
+            # No upstream branch or other error
+            return {"ahead": 0, "behind": 0}
+
+    async def get_ahead_behind_for_branches_async(
+        self,
+        branches: Dict[str, Optional[str]]
+    ) -> Dict[str, Dict[str, int]]:
+        """Ahead/behind counts for many branches in parallel (branch -> upstream or None)"""
+        names = list(branches)
+        counts = await asyncio.gather(*(
+            self.get_ahead_behind_counts_async(name, branches[name]) for name in names
+        ))
+        return dict(zip(names, counts))
+
+    async def _get_commit_details_async(self, commit_hash: str) -> Tuple[datetime, str]:
+        try:
+            result = await self._run_git_command_async(["show", "-s", "--format=%ci|%an", commit_hash])
+            return self._parse_commit_details_output(result.stdout)
+        except (subprocess.CalledProcessError, ValueError):
+            return datetime.now(), "Unknown"
+
+    # Async operations
+
+    async def list_branches_async(self, include_remote: bool = True) -> GitOperationResult:
+        """List branches; commit details and ahead/behind counts are fetched in parallel"""
+        start_time = time.time()
+
+        try:
+            if self.batch_mode:
+                return self._build_branch_list_result(
+                    self._branches_from_refs(self.batch_session.list_refs(include_remote)), start_time
+                )
+
+            args = ["branch", "-vv"]
+            if include_remote:
+                args.append("--all")
+            result = await self._run_git_command_async(args)
+            lines = self._parse_branch_lines(result.stdout)
+
+            tracked = {name: tracking for name, _, _, _, tracking in lines if tracking}
+            details, ahead_behind = await asyncio.gather(
+                asyncio.gather(*(self._get_commit_details_async(commit_hash) for _, _, commit_hash, _, _ in lines)),
+                self.get_ahead_behind_for_branches_async(tracked)
+            )
+
+            branches = []
+            for (name, is_current, commit_hash, message, tracking), (commit_date, author) in zip(lines, details):
+                counts = ahead_behind.get(name, {"ahead": 0, "behind": 0})
+                branches.append(BranchInfo(
+                    name=name,
+                    is_current=is_current,
+                    ahead_count=counts["ahead"],
+                    behind_count=counts["behind"],
+                    last_commit_hash=commit_hash,
+                    last_commit_message=message,
+                    last_commit_date=commit_date,
+                    last_commit_author=author,
+                    tracking_branch=tracking
+                ))
+
+            return self._build_branch_list_result(branches, start_time)
+
+        except subprocess.CalledProcessError as e:
+            execution_time = int((time.time() - start_time) * 1000)
+            return self._create_result(
+                success=False,
+                message=f"Failed to list branches: {e.stderr}",
+                error_code="GIT_BRANCH_LIST_FAILED",
+                execution_time_ms=execution_time
+            )
+
+    async def compare_branches_async(self, branch1: str, branch2: str) -> GitOperationResult:
+        """Compare two branches, running the count and log queries concurrently"""
+        start_time = time.time()
+
+        try:
+            ahead_result, behind_result, ahead_log, behind_log = await self._gather_commands(
+                self._run_git_command_async(["rev-list", "--count", f"{branch2}..{branch1}"]),
+                self._run_git_command_async(["rev-list", "--count", f"{branch1}..{branch2}"]),
+                self._run_git_command_async(["log", "--format=%H|%s|%an|%ci", f"{branch2}..{branch1}"]),
+                self._run_git_command_async(["log", "--format=%H|%s|%an|%ci", f"{branch1}..{branch2}"])
+            )
+
+            return self._build_comparison_result(
+                branch1,
+                branch2,
+                int(ahead_result.stdout.strip()),
+                int(behind_result.stdout.strip()),
+                self._parse_comparison_log(ahead_log.stdout),
+                self._parse_comparison_log(behind_log.stdout),
+                start_time
+            )
+
+        except subprocess.CalledProcessError as e:
+            execution_time = int((time.time() - start_time) * 1000)
+
+            suggestions = []
+            if "unknown revision" in e.stderr:
+                suggestions.extend([
+                    "One or both branches do not exist",
+                    "Check branch names with list_branches()"
+                ])
+
+            return self._create_result(
+                success=False,
+                message=f"Failed to compare branches '{branch1}' and '{branch2}': {e.stderr}",
+                error_code="GIT_COMPARE_BRANCHES_FAILED",
+                suggestions=suggestions,
+                execution_time_ms=execution_time
+            )
+
+    async def get_health_status_async(self) -> GitOperationResult:
+        """Health check with the version, status and remote probes run concurrently"""
+        start_time = time.time()
+
+        async def probe_remote() -> bool:
+            try:
+                await self._run_git_command_async(["ls-remote", "--heads", "origin"], timeout=5)
+                return True
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                return False
+
+        try:
+            version_result, _, remote_accessible = await self._gather_commands(
+                self._run_git_command_async(["--version"]),
+                self._run_git_command_async(["status", "--porcelain"]),
+                probe_remote()
+            )
+            return self._build_health_result(version_result.stdout.strip(), remote_accessible, start_time)
+
+        except subprocess.CalledProcessError as e:
+            return self._build_health_failure(e, start_time)
+
+    # Synchronous API
+
+    def list_branches(self, include_remote: bool = True) -> GitOperationResult:
+        return self._run_sync(self.list_branches_async(include_remote))
+
+    def compare_branches(self, branch1: str, branch2: str) -> GitOperationResult:
+        return self._run_sync(self.compare_branches_async(branch1, branch2))
+
+    def get_health_status(self) -> GitOperationResult:
+        return self._run_sync(self.get_health_status_async())
+
+    def get_ahead_behind_for_branches(self, branches: Dict[str, Optional[str]]) -> Dict[str, Dict[str, int]]:
+        return self._run_sync(self.get_ahead_behind_for_branches_async(branches))
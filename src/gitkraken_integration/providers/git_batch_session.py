@@ -0,0 +1,342 @@
+"""
+Git Batch Session
+
+This module provides batched repository queries for the standard git provider.
+All refs and their tip commit metadata are read with a single
+`git for-each-ref` call and cached until the repository's refs change, and
+object lookups go through one long-lived `git cat-file --batch` process
+instead of forking git once per query.
+"""
+
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+
+# NUL never appears inside ref names or subjects, so it is a safe field separator
+_REF_FIELDS = [
+    "refname",
+    "refname:short",
+    "symref",
+    "objectname",
+    "objectname:short",
+    "HEAD",
+    "upstream:short",
+    "upstream:track,nobracket",
+    "committerdate:iso-strict",
+    "authorname",
+    "authoremail",
+    "contents:subject",
+]
+_REF_FORMAT = "%00".join(f"%({field})" for field in _REF_FIELDS)
+
+
+@dataclass
+class RefRecord:
+    """One branch ref with its tip commit metadata"""
+    refname: str
+    name: str
+    commit_hash: str
+    short_hash: str
+    is_current: bool
+    upstream: Optional[str]
+    ahead: int
+    behind: int
+    commit_date: datetime
+    author_name: str
+    author_email: str
+    subject: str
+
+    @property
+    def is_remote(self) -> bool:
+        return self.refname.startswith("refs/remotes/")
+
+
+@dataclass
+class CommitObject:
+    """Commit metadata parsed from a raw commit object"""
+    hash: str
+    parent_hashes: List[str]
+    author_name: str
+    author_email: str
+    author_date: datetime
+    committer_name: str
+    committer_email: str
+    commit_date: datetime
+    message: str
+
+    @property
+    def subject(self) -> str:
+        return self.message.split("\n", 1)[0]
+
+
+class GitBatchSession:
+    """
+    Batched, cached git queries for one repository.
+
+    Ref listings are cached and invalidated whenever HEAD, packed-refs or any
+    directory under refs/ changes (git updates refs by renaming lock files, so
+    every ref update touches its directory). Commit objects are immutable and
+    kept in a bounded LRU cache keyed by object id.
+    """
+
+    def __init__(self, git_executable: str, repo_path: str, commit_cache_size: int = 4096, timeout: int = 30):
+        self.git_executable = git_executable
+        self.repo_path = repo_path
+        self.timeout = timeout
+        self.commit_cache_size = commit_cache_size
+
+        git_dir, common_dir = self._run(["rev-parse", "--git-dir", "--git-common-dir"]).splitlines()
+        self.git_dir = os.path.join(repo_path, git_dir) if not os.path.isabs(git_dir) else git_dir
+        self.common_dir = os.path.join(repo_path, common_dir) if not os.path.isabs(common_dir) else common_dir
+
+        self._refs: Optional[List[RefRecord]] = None
+        self._refs_signature: Optional[Tuple] = None
+        self._refs_lock = threading.Lock()
+
+        self._commits: "OrderedDict[str, CommitObject]" = OrderedDict()
+        self._commits_lock = threading.Lock()
+        self._cat_file: Optional[subprocess.Popen] = None
+        self._cat_file_lock = threading.Lock()
+
+        self.ref_reads = 0
+        self.ref_cache_hits = 0
+        self.object_reads = 0
+
+    def _run(self, args: List[str]) -> str:
+        return subprocess.run(
+            [self.git_executable] + args,
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            check=True
+        ).stdout
+
+    # Refs
+
+    def list_refs(self, include_remote: bool = True) -> List[RefRecord]:
+        """All branch refs with tip metadata, from cache if the refs are unchanged"""
+        with self._refs_lock:
+            signature = self._refs_signature_now()
+            if self._refs is None or signature != self._refs_signature:
+                self._refs = self._read_refs()
+                self._refs_signature = signature
+                self.ref_reads += 1
+            else:
+                self.ref_cache_hits += 1
+            refs = self._refs
+
+        return [ref for ref in refs if include_remote or not ref.is_remote]
+
+    def get_ref(self, branch_name: str) -> Optional[RefRecord]:
+        """Local branch ref by short name"""
+        refname = f"refs/heads/{branch_name}"
+        for ref in self.list_refs(include_remote=False):
+            if ref.refname == refname:
+                return ref
+        return None
+
+    def invalidate(self) -> None:
+        with self._refs_lock:
+            self._refs = None
+
+    def _refs_signature_now(self) -> Tuple:
+        entries = []
+        for path in (os.path.join(self.git_dir, "HEAD"), os.path.join(self.common_dir, "packed-refs")):
+            entries.append(self._stat_key(path))
+        for directory, _, _ in os.walk(os.path.join(self.common_dir, "refs")):
+            entries.append((directory, self._stat_key(directory)))
+        return tuple(entries)
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _read_refs(self) -> List[RefRecord]:
+        output = self._run(["for-each-ref", f"--format={_REF_FORMAT}", "refs/heads", "refs/remotes"])
+
+        refs = []
+        for line in output.split("\n"):
+            fields = line.split("\0")
+            if len(fields) != len(_REF_FIELDS):
+                continue
+            (refname, short_name, symref, commit_hash, short_hash, head, upstream, track,
+             date_str, author_name, author_email, subject) = fields
+            if symref:
+                continue  # e.g. refs/remotes/origin/HEAD
+
+            # Match `git branch --all` naming for remote branches
+            name = f"remotes/{short_name}" if refname.startswith("refs/remotes/") else short_name
+            ahead, behind = self._parse_track(track)
+            refs.append(RefRecord(
+                refname=refname,
+                name=name,
+                commit_hash=commit_hash,
+                short_hash=short_hash,
+                is_current=head == "*",
+                upstream=upstream or None,
+                ahead=ahead,
+                behind=behind,
+                commit_date=self._parse_date(date_str),
+                author_name=author_name,
+                author_email=author_email.strip("<>"),
+                subject=subject
+            ))
+        return refs
+
+    @staticmethod
+    def _parse_track(track: str) -> Tuple[int, int]:
+        """Parse "ahead 2, behind 1" (empty when in sync or without upstream)"""
+        ahead = behind = 0
+        for part in track.split(","):
+            words = part.split()
+            if len(words) == 2 and words[1].isdigit():
+                if words[0] == "ahead":
+                    ahead = int(words[1])
+                elif words[0] == "behind":
+                    behind = int(words[1])
+        return ahead, behind
+
+    @staticmethod
+    def _parse_date(date_str: str) -> datetime:
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            return datetime.now()
+
+    # Objects
+
+    def read_object(self, rev: str) -> Optional[Tuple[str, str, bytes]]:
+        """(object id, type, content) for a revision, or None if it does not exist"""
+        if not rev or "\n" in rev:
+            return None
+
+        with self._cat_file_lock:
+            process = self._ensure_cat_file()
+            try:
+                process.stdin.write(rev.encode("utf-8") + b"\n")
+                process.stdin.flush()
+                header = process.stdout.readline().decode("utf-8").rstrip("\n")
+                parts = header.split(" ")
+                if len(parts) != 3 or not parts[2].isdigit():
+                    if not header:
+                        self._stop_cat_file()  # process died; restart on next call
+                    return None
+                object_id, object_type, size = parts[0], parts[1], int(parts[2])
+                content = process.stdout.read(size)
+                process.stdout.read(1)  # trailing newline
+            except (OSError, ValueError):
+                self._stop_cat_file()
+                return None
+
+        self.object_reads += 1
+        return object_id, object_type, content
+
+    def get_commit(self, rev: str) -> Optional[CommitObject]:
+        """Commit metadata for a revision via the cat-file session"""
+        with self._commits_lock:
+            cached = self._commits.get(rev)
+            if cached is not None:
+                self._commits.move_to_end(rev)
+                return cached
+
+        obj = self.read_object(rev)
+        if obj is None or obj[1] != "commit":
+            return None
+        commit = self._parse_commit(obj[0], obj[2])
+
+        # Only full object ids are immutable keys; symbolic revs must be re-resolved
+        with self._commits_lock:
+            self._commits[commit.hash] = commit
+            self._commits.move_to_end(commit.hash)
+            while len(self._commits) > self.commit_cache_size:
+                self._commits.popitem(last=False)
+        return commit
+
+    @classmethod
+    def _parse_commit(cls, object_id: str, content: bytes) -> CommitObject:
+        text = content.decode("utf-8", errors="replace")
+        headers, _, message = text.partition("\n\n")
+
+        parents = []
+        author = committer = ("Unknown", "", datetime.now())
+        for line in headers.split("\n"):
+            key, _, value = line.partition(" ")
+            if key == "parent":
+                parents.append(value)
+            elif key == "author":
+                author = cls._parse_signature(value)
+            elif key == "committer":
+                committer = cls._parse_signature(value)
+
+        return CommitObject(
+            hash=object_id,
+            parent_hashes=parents,
+            author_name=author[0],
+            author_email=author[1],
+            author_date=author[2],
+            committer_name=committer[0],
+            committer_email=committer[1],
+            commit_date=committer[2],
+            message=message.rstrip("\n")
+        )
+
+    @staticmethod
+    def _parse_signature(value: str) -> Tuple[str, str, datetime]:
+        """Parse "Name <email> 1705314600 +0000" """
+        name, _, rest = value.partition(" <")
+        email, _, stamp = rest.partition("> ")
+        try:
+            seconds, offset = stamp.split(" ")
+            sign = -1 if offset.startswith("-") else 1
+            offset_minutes = sign * (int(offset[1:3]) * 60 + int(offset[3:5]))
+            return name, email, datetime.fromtimestamp(int(seconds), timezone(timedelta(minutes=offset_minutes)))
+        except ValueError:
+            return name, email, datetime.now()
+
+    def _ensure_cat_file(self) -> subprocess.Popen:
+        if self._cat_file is None or self._cat_file.poll() is not None:
+            self._cat_file = subprocess.Popen(
+                [self.git_executable, "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self._cat_file
+
+    def _stop_cat_file(self) -> None:
+        process, self._cat_file = self._cat_file, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+    def close(self) -> None:
+        """Terminate the cat-file process"""
+        with self._cat_file_lock:
+            self._stop_cat_file()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "ref_reads": self.ref_reads,
+            "ref_cache_hits": self.ref_cache_hits,
+            "object_reads": self.object_reads,
+            "cached_commits": len(self._commits),
+            "cat_file_running": int(self._cat_file is not None and self._cat_file.poll() is None)
+        }
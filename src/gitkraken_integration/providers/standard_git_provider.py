@@ -24,6 +24,7 @@ from .git_provider import (
     FileStatus,
     MergeConflict
 )
+from .git_batch_session import GitBatchSession
 
 
 class StandardGitProvider(GitProvider):
@@ -33,12 +34,30 @@ class StandardGitProvider(GitProvider):
     This provider implements all git operations using subprocess calls to the
     git command-line tool. It provides comprehensive functionality that works
     on any system with git installed.
+    
+    With batch_mode=True, branch listings and branch details are served from a
+    GitBatchSession: one cached `git for-each-ref` for all refs and a persistent
+    `git cat-file --batch` process for commit lookups.
     """
     
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", batch_mode: bool = False):
         super().__init__(repo_path)
         self.git_executable = self._find_git_executable()
         self._validate_repository()
+        self.batch_mode = batch_mode
+        self._batch_session: Optional[GitBatchSession] = None
+    
+    @property
+    def batch_session(self) -> Optional[GitBatchSession]:
+        """Batch session for this repository (created on first use in batch mode)"""
+        if self.batch_mode and self._batch_session is None:
+            self._batch_session = GitBatchSession(self.git_executable, self.repo_path)
+        return self._batch_session
+    
+    def close(self) -> None:
+        """Release the batch session's long-lived git process"""
+        if self._batch_session is not None:
+            self._batch_session.close()
     
     def _find_git_executable(self) -> str:
         """Find the git executable on the system"""
@@ -225,19 +244,24 @@ class StandardGitProvider(GitProvider):
             result = self._run_git_command([
                 "rev-list", "--left-right", "--count", f"{branch}...@{{u}}"
             ])
-            
-            counts = result.stdout.strip().split('\t')
-            if len(counts) == 2:
-                return {
-                    "ahead": int(counts[0]),
-                    "behind": int(counts[1])
-                }
+            return self._parse_ahead_behind_output(result.stdout)
         except subprocess.CalledProcessError:
             # No upstream branch or other error
             pass
         
         return {"ahead": 0, "behind": 0}
     
+    @staticmethod
+    def _parse_ahead_behind_output(output: str) -> Dict[str, int]:
+        """Parse `git rev-list --left-right --count` output"""
+        counts = output.strip().split('\t')
+        if len(counts) == 2:
+            return {
+                "ahead": int(counts[0]),
+                "behind": int(counts[1])
+            }
+        return {"ahead": 0, "behind": 0}
+    
     def get_current_branch(self) -> GitOperationResult:
         """Get current branch information"""
         start_time = time.time()
@@ -275,27 +299,19 @@ class StandardGitProvider(GitProvider):
         start_time = time.time()
         
         try:
-            # Get local branches
-            args = ["branch", "-vv"]
-            if include_remote:
-                args.append("--all")
-            
-            result = self._run_git_command(args)
-            branches = self._parse_branch_output(result.stdout)
-            
-            execution_time = int((time.time() - start_time) * 1000)
+            if self.batch_mode:
+                # One for-each-ref for every branch and its tip commit
+                branches = self._branches_from_refs(self.batch_session.list_refs(include_remote))
+            else:
+                # Get local branches
+                args = ["branch", "-vv"]
+                if include_remote:
+                    args.append("--all")
+                
+                result = self._run_git_command(args)
+                branches = self._parse_branch_output(result.stdout)
             
-            return self._create_result(
-                success=True,
-                message=f"Found {len(branches)} branches",
-                data={
-                    "branches": [branch.__dict__ for branch in branches],
-                    "total_count": len(branches),
-                    "local_count": len([b for b in branches if not b.name.startswith("remotes/")]),
-                    "remote_count": len([b for b in branches if b.name.startswith("remotes/")])
-                },
-                execution_time_ms=execution_time
-            )
+            return self._build_branch_list_result(branches, start_time)
             
         except subprocess.CalledProcessError as e:
             execution_time = int((time.time() - start_time) * 1000)
@@ -306,11 +322,52 @@ class StandardGitProvider(GitProvider):
                 execution_time_ms=execution_time
             )
     
+    def _build_branch_list_result(self, branches: List[BranchInfo], start_time: float) -> GitOperationResult:
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        return self._create_result(
+            success=True,
+            message=f"Found {len(branches)} branches",
+            data={
+                "branches": [branch.__dict__ for branch in branches],
+                "total_count": len(branches),
+                "local_count": len([b for b in branches if not b.name.startswith("remotes/")]),
+                "remote_count": len([b for b in branches if b.name.startswith("remotes/")])
+            },
+            execution_time_ms=execution_time
+        )
+    
     def _parse_branch_output(self, output: str) -> List[BranchInfo]:
         """Parse git branch output into BranchInfo objects"""
         branches = []
         
-        for line in output.strip().split('\n'):
+        for branch_name, is_current, commit_hash, commit_message, tracking_branch in self._parse_branch_lines(output):
+            # Get detailed commit info
+            commit_date, commit_author = self._get_commit_details(commit_hash)
+            
+            # Get ahead/behind counts
+            ahead_behind = self._get_ahead_behind_counts(branch_name) if is_current else {"ahead": 0, "behind": 0}
+            
+            branches.append(BranchInfo(
+                name=branch_name,
+                is_current=is_current,
+                ahead_count=ahead_behind["ahead"],
+                behind_count=ahead_behind["behind"],
+                last_commit_hash=commit_hash,
+                last_commit_message=commit_message,
+                last_commit_date=commit_date,
+                last_commit_author=commit_author,
+                tracking_branch=tracking_branch
+            ))
+        
+        return branches
+    
+    def _parse_branch_lines(self, output: str) -> List[Tuple[str, bool, str, str, Optional[str]]]:
+        """Parse `git branch -vv` lines into (name, is_current, hash, message, tracking) tuples"""
+        parsed = []
+        
+        # Only strip newlines: the leading "  " marker column is significant
+        for line in output.strip('\n').split('\n'):
             if not line.strip():
                 continue
             
@@ -346,43 +403,55 @@ class StandardGitProvider(GitProvider):
                 message_start = line.find(commit_hash) + len(commit_hash)
                 commit_message = line[message_start:].strip()
             
-            # Get detailed commit info
-            commit_date, commit_author = self._get_commit_details(commit_hash)
-            
-            # Get ahead/behind counts
-            ahead_behind = self._get_ahead_behind_counts(branch_name) if is_current else {"ahead": 0, "behind": 0}
-            
-            branches.append(BranchInfo(
-                name=branch_name,
-                is_current=is_current,
-                ahead_count=ahead_behind["ahead"],
-                behind_count=ahead_behind["behind"],
-                last_commit_hash=commit_hash,
-                last_commit_message=commit_message,
-                last_commit_date=commit_date,
-                last_commit_author=commit_author,
-                tracking_branch=tracking_branch
-            ))
+            parsed.append((branch_name, is_current, commit_hash, commit_message, tracking_branch))
         
-        return branches
+        return parsed
+    
+    def _branches_from_refs(self, refs) -> List[BranchInfo]:
+        """Convert batch session ref records into BranchInfo objects"""
+        return [
+            BranchInfo(
+                name=ref.name,
+                is_current=ref.is_current,
+                ahead_count=ref.ahead,
+                behind_count=ref.behind,
+                last_commit_hash=ref.short_hash,
+                last_commit_message=ref.subject,
+                last_commit_date=ref.commit_date,
+                last_commit_author=ref.author_name,
+                tracking_branch=ref.upstream
+            )
+            for ref in refs
+        ]
     
     def _get_commit_details(self, commit_hash: str) -> Tuple[datetime, str]:
         """Get commit date and author for a specific commit"""
+        if self.batch_mode:
+            commit = self.batch_session.get_commit(commit_hash)
+            if commit is not None:
+                return commit.commit_date, commit.author_name
+            return datetime.now(), "Unknown"
+        
         try:
             result = self._run_git_command([
                 "show", "-s", "--format=%ci|%an", commit_hash
             ])
-            
-            parts = result.stdout.strip().split('|')
-            if len(parts) == 2:
-                date_str, author = parts
-                commit_date = datetime.fromisoformat(date_str.replace(' ', 'T', 1))
-                return commit_date, author
+            return self._parse_commit_details_output(result.stdout)
         except (subprocess.CalledProcessError, ValueError):
             pass
         
         return datetime.now(), "Unknown"
     
+    @staticmethod
+    def _parse_commit_details_output(output: str) -> Tuple[datetime, str]:
+        """Parse `git show -s --format=%ci|%an` output"""
+        parts = output.strip().split('|')
+        if len(parts) == 2:
+            date_str, author = parts
+            commit_date = datetime.fromisoformat(date_str.replace(' ', 'T', 1))
+            return commit_date, author
+        return datetime.now(), "Unknown"
+    
     # Branch Management Methods
     
     def create_branch(self, name: str, from_branch: str = "HEAD") -> GitOperationResult:
@@ -626,29 +695,35 @@ class StandardGitProvider(GitProvider):
             except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
                 remote_accessible = False
             
-            execution_time = int((time.time() - start_time) * 1000)
-            
-            return self._create_result(
-                success=True,
-                message="Standard Git provider is healthy",
-                data={
-                    "git_version": git_version,
-                    "repository_accessible": True,
-                    "remote_accessible": remote_accessible,
-                    "git_executable": self.git_executable,
-                    "repo_path": self.repo_path
-                },
-                execution_time_ms=execution_time
-            )
+            return self._build_health_result(git_version, remote_accessible, start_time)
             
         except subprocess.CalledProcessError as e:
-            execution_time = int((time.time() - start_time) * 1000)
-            return self._create_result(
-                success=False,
-                message=f"Standard Git provider health check failed: {e.stderr}",
-                error_code="GIT_HEALTH_CHECK_FAILED",
-                execution_time_ms=execution_time
-            )
+            return self._build_health_failure(e, start_time)
+    
+    def _build_health_result(self, git_version: str, remote_accessible: bool, start_time: float) -> GitOperationResult:
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        return self._create_result(
+            success=True,
+            message="Standard Git provider is healthy",
+            data={
+                "git_version": git_version,
+                "repository_accessible": True,
+                "remote_accessible": remote_accessible,
+                "git_executable": self.git_executable,
+                "repo_path": self.repo_path
+            },
+            execution_time_ms=execution_time
+        )
+    
+    def _build_health_failure(self, error: subprocess.CalledProcessError, start_time: float) -> GitOperationResult:
+        execution_time = int((time.time() - start_time) * 1000)
+        return self._create_result(
+            success=False,
+            message=f"Standard Git provider health check failed: {error.stderr}",
+            error_code="GIT_HEALTH_CHECK_FAILED",
+            execution_time_ms=execution_time
+        )
     
     # Additional Branch Management Methods
     
@@ -656,6 +731,9 @@ class StandardGitProvider(GitProvider):
         """Get detailed information about a specific branch"""
         start_time = time.time()
         
+        if self.batch_mode:
+            return self._get_branch_details_batched(branch_name, start_time)
+        
         try:
             # Check if branch exists
             try:
@@ -763,6 +841,59 @@ class StandardGitProvider(GitProvider):
                 execution_time_ms=execution_time
             )
     
+    def _get_branch_details_batched(self, branch_name: str, start_time: float) -> GitOperationResult:
+        """get_branch_details served from the cached ref listing"""
+        try:
+            ref = self.batch_session.get_ref(branch_name)
+        except subprocess.CalledProcessError as e:
+            execution_time = int((time.time() - start_time) * 1000)
+            return self._create_result(
+                success=False,
+                message=f"Failed to get branch details for '{branch_name}': {e.stderr}",
+                error_code="GIT_BRANCH_DETAILS_FAILED",
+                execution_time_ms=execution_time
+            )
+        
+        if ref is None:
+            return self._create_result(
+                success=False,
+                message=f"Branch '{branch_name}' does not exist",
+                error_code="GIT_BRANCH_NOT_FOUND",
+                suggestions=[
+                    "Check available branches with list_branches()",
+                    f"Create branch with create_branch('{branch_name}')"
+                ]
+            )
+        
+        branch_details = BranchInfo(
+            name=branch_name,
+            is_current=ref.is_current,
+            ahead_count=ref.ahead,
+            behind_count=ref.behind,
+            last_commit_hash=ref.commit_hash,
+            last_commit_message=ref.subject,
+            last_commit_date=ref.commit_date,
+            last_commit_author=ref.author_name,
+            tracking_branch=ref.upstream
+        )
+        
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        return self._create_result(
+            success=True,
+            message=f"Retrieved details for branch '{branch_name}'",
+            data={
+                "branch": branch_details.__dict__,
+                "commit_hash": ref.commit_hash,
+                "short_hash": ref.short_hash,
+                "author_email": ref.author_email,
+                "tracking_branch": ref.upstream,
+                "ahead_count": ref.ahead,
+                "behind_count": ref.behind
+            },
+            execution_time_ms=execution_time
+        )
+    
     def rename_branch(self, old_name: str, new_name: str) -> GitOperationResult:
         """Rename a branch"""
         start_time = time.time()
@@ -915,59 +1046,17 @@ class StandardGitProvider(GitProvider):
                 commits_ahead_result = self._run_git_command([
                     "log", "--format=%H|%s|%an|%ci", f"{branch2}..{branch1}"
                 ])
-                for line in commits_ahead_result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split('|')
-                        if len(parts) >= 4:
-                            commits_ahead.append({
-                                "hash": parts[0],
-                                "message": parts[1],
-                                "author": parts[2],
-                                "date": parts[3]
-                            })
+                commits_ahead = self._parse_comparison_log(commits_ahead_result.stdout)
             
             commits_behind = []
             if behind_count > 0:
                 commits_behind_result = self._run_git_command([
                     "log", "--format=%H|%s|%an|%ci", f"{branch1}..{branch2}"
                 ])
-                for line in commits_behind_result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split('|')
-                        if len(parts) >= 4:
-                            commits_behind.append({
-                                "hash": parts[0],
-                                "message": parts[1],
-                                "author": parts[2],
-                                "date": parts[3]
-                            })
-            
-            # Determine relationship
-            if ahead_count == 0 and behind_count == 0:
-                relationship = "identical"
-            elif ahead_count > 0 and behind_count == 0:
-                relationship = f"{branch1} is ahead"
-            elif ahead_count == 0 and behind_count > 0:
-                relationship = f"{branch1} is behind"
-            else:
-                relationship = "diverged"
+                commits_behind = self._parse_comparison_log(commits_behind_result.stdout)
             
-            execution_time = int((time.time() - start_time) * 1000)
-            
-            return self._create_result(
-                success=True,
-                message=f"Compared branches '{branch1}' and '{branch2}': {relationship}",
-                data={
-                    "branch1": branch1,
-                    "branch2": branch2,
-                    "relationship": relationship,
-                    "ahead_count": ahead_count,
-                    "behind_count": behind_count,
-                    "commits_ahead": commits_ahead,
-                    "commits_behind": commits_behind,
-                    "can_fast_forward": behind_count == 0 and ahead_count > 0
-                },
-                execution_time_ms=execution_time
+            return self._build_comparison_result(
+                branch1, branch2, ahead_count, behind_count, commits_ahead, commits_behind, start_time
             )
             
         except subprocess.CalledProcessError as e:
@@ -988,6 +1077,61 @@ class StandardGitProvider(GitProvider):
                 execution_time_ms=execution_time
             )
     
+    @staticmethod
+    def _parse_comparison_log(output: str) -> List[Dict[str, str]]:
+        """Parse `git log --format=%H|%s|%an|%ci` output for branch comparison"""
+        commits = []
+        for line in output.strip().split('\n'):
+            if line:
+                parts = line.split('|')
+                if len(parts) >= 4:
+                    commits.append({
+                        "hash": parts[0],
+                        "message": parts[1],
+                        "author": parts[2],
+                        "date": parts[3]
+                    })
+        return commits
+    
+    def _build_comparison_result(
+        self,
+        branch1: str,
+        branch2: str,
+        ahead_count: int,
+        behind_count: int,
+        commits_ahead: List[Dict[str, str]],
+        commits_behind: List[Dict[str, str]],
+        start_time: float
+    ) -> GitOperationResult:
+        """Build the compare_branches result from counts and commit lists"""
+        # Determine relationship
+        if ahead_count == 0 and behind_count == 0:
+            relationship = "identical"
+        elif ahead_count > 0 and behind_count == 0:
+            relationship = f"{branch1} is ahead"
+        elif ahead_count == 0 and behind_count > 0:
+            relationship = f"{branch1} is behind"
+        else:
+            relationship = "diverged"
+        
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        return self._create_result(
+            success=True,
+            message=f"Compared branches '{branch1}' and '{branch2}': {relationship}",
+            data={
+                "branch1": branch1,
+                "branch2": branch2,
+                "relationship": relationship,
+                "ahead_count": ahead_count,
+                "behind_count": behind_count,
+                "commits_ahead": commits_ahead,
+                "commits_behind": commits_behind,
+                "can_fast_forward": behind_count == 0 and ahead_count > 0
+            },
+            execution_time_ms=execution_time
+        )
+    
     # Placeholder methods for remaining interface (to be implemented in subsequent tasks)
     
     def stage_files(self, files: List[str] = None) -> GitOperationResult:
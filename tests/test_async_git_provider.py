@@ -0,0 +1,106 @@
+"""
+Tests for AsyncStandardGitProvider.
+
+These tests run against a temporary repository and check that the async
+provider matches the sequential provider while running git calls in parallel.
+"""
+
+import asyncio
+import subprocess
+
+import pytest
+
+from src.gitkraken_integration.providers.async_git_provider import AsyncStandardGitProvider
+from src.gitkraken_integration.providers.standard_git_provider import StandardGitProvider
+
+
+def git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = str(tmp_path)
+    git(path, "init", "-q", "-b", "main")
+    git(path, "config", "user.name", "Test Author")
+    git(path, "config", "user.email", "author@example.com")
+    git(path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+    git(path, "checkout", "-q", "-b", "feature")
+    git(path, "commit", "-q", "--allow-empty", "-m", "Feature work")
+    git(path, "commit", "-q", "--allow-empty", "-m", "More feature work")
+    git(path, "checkout", "-q", "main")
+    git(path, "commit", "-q", "--allow-empty", "-m", "Main work")
+    git(path, "branch", "--set-upstream-to=main", "feature")
+    return path
+
+
+class TestAsyncStandardGitProvider:
+    """Test AsyncStandardGitProvider"""
+    
+    def test_compare_branches_matches_sequential_provider(self, repo):
+        expected = StandardGitProvider(repo).compare_branches("feature", "main")
+        actual = AsyncStandardGitProvider(repo).compare_branches("feature", "main")
+        
+        assert actual.success
+        assert actual.data == expected.data
+        assert actual.data["relationship"] == "diverged"
+    
+    def test_compare_unknown_branch_fails(self, repo):
+        result = AsyncStandardGitProvider(repo).compare_branches("feature", "missing")
+        
+        assert result.success is False
+        assert result.error_code == "GIT_COMPARE_BRANCHES_FAILED"
+    
+    def test_list_branches_counts_every_tracked_branch(self, repo):
+        result = AsyncStandardGitProvider(repo).list_branches()
+        branches = {branch["name"]: branch for branch in result.data["branches"]}
+        
+        assert result.success
+        assert set(branches) == {"main", "feature"}
+        assert branches["feature"]["tracking_branch"] == "main"
+        assert (branches["feature"]["ahead_count"], branches["feature"]["behind_count"]) == (2, 1)
+        assert branches["main"]["is_current"] is True
+        assert branches["main"]["last_commit_author"] == "Test Author"
+    
+    def test_health_status(self, repo):
+        result = AsyncStandardGitProvider(repo).get_health_status()
+        
+        assert result.success
+        assert result.data["git_version"].startswith("git version")
+        assert result.data["remote_accessible"] is False
+    
+    def test_concurrency_is_bounded(self, repo):
+        provider = AsyncStandardGitProvider(repo, max_concurrency=2)
+        running = peak = 0
+        original = asyncio.create_subprocess_exec
+        
+        async def tracking_exec(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                process = await original(*args, **kwargs)
+                await asyncio.sleep(0.01)
+                return process
+            finally:
+                running -= 1
+        
+        async def run():
+            asyncio.create_subprocess_exec = tracking_exec
+            try:
+                return await provider.get_ahead_behind_for_branches_async({"feature": "main", "main": "feature"})
+            finally:
+                asyncio.create_subprocess_exec = original
+        
+        counts = asyncio.run(run())
+        assert counts == {"feature": {"ahead": 2, "behind": 1}, "main": {"ahead": 1, "behind": 2}}
+        assert 1 <= peak <= 2
+    
+    def test_sync_wrapper_inside_running_loop(self, repo):
+        provider = AsyncStandardGitProvider(repo)
+        
+        async def call_sync_api():
+            return provider.compare_branches("feature", "main")
+        
+        assert asyncio.run(call_sync_api()).data["ahead_count"] == 2
+        assert provider.compare_branches("feature", "main").data["behind_count"] == 1
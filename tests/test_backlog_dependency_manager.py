@@ -16,6 +16,7 @@ from src.beast_mode.backlog.dependency_manager import (
     CriticalPathAnalysis,
     CircularDependencyReport,
     DependencyResult,
+    BulkDependencyResult,
     GraphValidationResult
 )
 from src.beast_mode.backlog.models import DependencySpec
@@ -533,5 +534,79 @@ class TestErrorHandling(TestBacklogDependencyManager):
         assert not self.manager._validate_internal_consistency()
 
 
+class TestBulkDependencyImport(TestBacklogDependencyManager):
+    """Test bulk dependency import"""
+    
+    def make_spec(self, source: str, target: str) -> DependencySpec:
+        return DependencySpec(
+            dependency_id=f"{source}_depends_on_{target}",
+            dependency_type=DependencyType.BLOCKING,
+            target_item_id=target,
+            target_track=StrategicTrack.PR_GATE,
+            satisfaction_criteria=f"{target} must be completed",
+            estimated_completion=datetime.now() + timedelta(days=1),
+            risk_level=RiskLevel.LOW
+        )
+        
+    def test_bulk_import_builds_graph_once(self):
+        """Test that a clean bulk import declares everything"""
+        specs = [self.make_spec(f"item{i}", f"item{i - 1}") for i in range(1, 50)]
+        
+        result = self.manager.declare_dependencies(specs)
+        
+        assert isinstance(result, BulkDependencyResult)
+        assert result.success
+        assert result.declared_count == 49
+        assert result.circular_dependencies.cycles_found == []
+        assert self.manager._graph_cache is not None
+        assert self.manager.get_dependency_graph("").get_dependents("item0") == {"item1"}
+        assert self.manager.calculate_critical_path().critical_path[0] == "item0"
+        
+    def test_bulk_import_reports_all_cycles(self):
+        """Test that every cycle is reported in one report and its edges rejected"""
+        self.manager.declare_dependency("b", self.make_spec("b", "a"))
+        specs = [
+            self.make_spec("a", "b"),                                    # closes a cycle with the existing edge
+            self.make_spec("y", "x"), self.make_spec("z", "y"), self.make_spec("x", "z"),
+            self.make_spec("c", "b"),                                    # unaffected
+            self.make_spec("d", "d"),                                    # self dependency
+        ]
+        
+        result = self.manager.declare_dependencies(specs)
+        
+        assert not result.success
+        assert result.declared_count == 1
+        cycles = result.circular_dependencies.cycles_found
+        assert sorted(sorted(set(cycle)) for cycle in cycles) == [["a", "b"], ["x", "y", "z"]]
+        assert all(cycle[0] == cycle[-1] for cycle in cycles)
+        assert result.circular_dependencies.affected_items == {"a", "b", "x", "y", "z"}
+        assert {r.dependency_id for r in result.rejected} == {
+            "a_depends_on_b", "y_depends_on_x", "z_depends_on_y", "x_depends_on_z", "d_depends_on_d"
+        }
+        
+        # The existing edge survives and the accepted graph stays acyclic
+        assert self.manager.validate_dependency_graph().circular_dependencies.cycles_found == []
+        assert self.manager.get_dependency_graph("").get_dependents("b") == {"c"}
+        
+    def test_bulk_import_replace_existing(self):
+        """Test a full re-import replacing the current dependencies"""
+        self.manager.declare_dependency("item1", self.dep_spec_1)
+        
+        result = self.manager.declare_dependencies([self.make_spec("a", "b")], replace_existing=True)
+        
+        assert result.success
+        assert set(self.manager._dependencies) == {"a_depends_on_b"}
+        assert self.manager.declare_dependency("b", self.make_spec("b", "a")).success is False
+        
+    def test_bulk_import_performance(self):
+        """Test that importing thousands of dependencies is fast"""
+        specs = [self.make_spec(f"item{i}", f"item{j}") for i in range(1, 5000) for j in (i // 2, i - 1)]
+        
+        result = self.manager.declare_dependencies(specs)
+        
+        assert result.declared_count == len({spec.dependency_id for spec in specs})
+        assert result.import_time_ms < 5000
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -15,8 +15,10 @@ from src.beast_mode.compliance.models import (
     Phase2ValidationResult,
     ComplianceIssue,
     ComplianceIssueType,
-    IssueSeverity
+    IssueSeverity,
+    FileChangeAnalysis
 )
+from src.beast_mode.compliance.rdi.test_coverage_validator import CoverageReport, FailingTest, TestCoverageResult
 from src.beast_mode.compliance.interfaces import ComplianceValidator, ValidationContext
 
 
@@ -167,4 +169,37 @@ class TestComplianceOrchestrator:
                 description="Critical issue"
             )
         ]
-        assert not orchestrator._assess_phase3_readiness(result)
\ No newline at end of file
+        assert not orchestrator._assess_phase3_readiness(result)
+    
+    def test_validate_test_coverage_uses_file_changes(self):
+        """Test that coverage validation runs only the tests affected by the branch changes."""
+        orchestrator = ComplianceOrchestrator(".")
+        changes = FileChangeAnalysis(total_files_changed=1, files_modified=["src/module1.py"])
+        report = CoverageReport(
+            overall_coverage=97.5,
+            baseline_coverage=96.7,
+            coverage_adequate=True,
+            total_lines=40,
+            covered_lines=39,
+            test_files=[],
+            failing_tests=[FailingTest("tests/test_a.py::test_x", "tests/test_a.py", "boom", "test_failure", None, [])],
+            missing_test_files=["src/module2.py"],
+            uncovered_modules=[]
+        )
+        validator = Mock()
+        validator.get_validator_name.return_value = "TestCoverageValidator"
+        validator.analyze_changes.return_value = TestCoverageResult(report, True, 0.0, [])
+        git_analyzer = Mock()
+        git_analyzer.get_analyzer_name.return_value = "GitAnalyzer"
+        git_analyzer.analyze_file_changes.return_value = changes
+        orchestrator.register_validator(validator)
+        orchestrator.register_analyzer(git_analyzer)
+        
+        status = orchestrator._validate_test_coverage(Mock())
+        
+        validator.analyze_changes.assert_called_once_with(changes)
+        validator.analyze_coverage.assert_not_called()
+        assert status.current_coverage == 97.5
+        assert status.coverage_adequate
+        assert status.failing_tests == ["tests/test_a.py::test_x"]
+        assert status.missing_tests == ["src/module2.py"]
@@ -0,0 +1,162 @@
+"""
+Unit tests for batched failure similarity
+Tests the vectorized and pure Python similarity matrices and union-find clustering
+"""
+
+import pytest
+import random
+from datetime import datetime
+
+from src.beast_mode.testing.failure_similarity import (
+    FailureSimilarityEngine, UnionFind, NUMPY_AVAILABLE, jaccard, tokenize_words
+)
+from src.beast_mode.testing.rca_integration import TestRCAIntegrationEngine, TestFailureData
+
+
+ENGINE_MODES = [
+    pytest.param(True, marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")),
+    False
+]
+
+
+def make_failure(index: int, test_file: str, failure_type: str, error_message: str, stack_trace: str = ""):
+    """Create a minimal test failure"""
+    return TestFailureData(
+        test_name=f"{test_file}::test_{index}",
+        test_file=test_file,
+        failure_type=failure_type,
+        error_message=error_message,
+        stack_trace=stack_trace,
+        test_function=f"test_{index}",
+        test_class=None,
+        failure_timestamp=datetime.now(),
+        test_context={},
+        pytest_node_id=f"{test_file}::test_{index}"
+    )
+
+
+@pytest.fixture
+def random_failures():
+    """Randomized failures covering empty messages and traces"""
+    rng = random.Random(42)
+    words = [f"word{i}" for i in range(60)]
+    return [
+        make_failure(
+            i,
+            f"tests/test_{rng.randint(0, 5)}.py",
+            rng.choice(["import", "assertion", "error"]),
+            " ".join(rng.choices(words, k=rng.randint(0, 8))),
+            rng.choice(["", " ".join(rng.choices(words, k=6))])
+        )
+        for i in range(40)
+    ]
+
+
+@pytest.fixture
+def integrator():
+    """Integration engine used as the pairwise reference"""
+    return TestRCAIntegrationEngine()
+
+
+class TestTokenization:
+    """Test word set helpers"""
+
+    def test_tokenize_words(self):
+        assert tokenize_words("ImportError: No Module") == frozenset({"importerror:", "no", "module"})
+        assert tokenize_words("") == frozenset()
+        assert tokenize_words(None) == frozenset()
+
+    def test_jaccard(self):
+        assert jaccard(frozenset({"a", "b"}), frozenset({"b", "c"})) == pytest.approx(1 / 3)
+        assert jaccard(frozenset(), frozenset({"a"})) == 0.0
+
+
+class TestFailureSimilarityEngine:
+    """Test batched similarity matrices"""
+
+    @pytest.mark.parametrize("use_numpy", ENGINE_MODES)
+    def test_matrix_matches_pairwise_similarity(self, use_numpy, random_failures, integrator):
+        engine = FailureSimilarityEngine(use_numpy=use_numpy)
+        matrix = engine.similarity_matrix(random_failures)
+
+        for i, failure_a in enumerate(random_failures):
+            assert matrix[i][i] == 1.0
+            for j, failure_b in enumerate(random_failures):
+                if i != j:
+                    expected = integrator._calculate_failure_similarity(failure_a, failure_b)
+                    assert matrix[i][j] == pytest.approx(expected)
+
+    @pytest.mark.parametrize("use_numpy", ENGINE_MODES)
+    def test_rectangular_matrix(self, use_numpy, random_failures, integrator):
+        engine = FailureSimilarityEngine(use_numpy=use_numpy)
+        rows, cols = random_failures[:5], random_failures[5:12]
+        matrix = engine.similarity_matrix(rows, cols)
+
+        assert len(matrix) == 5 and len(matrix[0]) == 7
+        assert matrix[2][3] == pytest.approx(integrator._calculate_failure_similarity(rows[2], cols[3]))
+
+    def test_small_vocabulary_chunks(self, random_failures):
+        chunked = FailureSimilarityEngine(vocabulary_chunk_size=3).similarity_matrix(random_failures)
+        whole = FailureSimilarityEngine().similarity_matrix(random_failures)
+
+        for chunked_row, whole_row in zip(chunked, whole):
+            assert list(chunked_row) == pytest.approx(list(whole_row))
+
+    @pytest.mark.parametrize("use_numpy", ENGINE_MODES)
+    def test_mean_similarity(self, use_numpy):
+        engine = FailureSimilarityEngine(use_numpy=use_numpy)
+        group_a = [make_failure(0, "tests/test_a.py", "import", "ImportError: missing")]
+        group_b = [
+            make_failure(1, "tests/test_a.py", "import", "ImportError: missing"),
+            make_failure(2, "tests/test_b.py", "assertion", "AssertionError")
+        ]
+
+        assert engine.mean_similarity(group_a, group_b) == pytest.approx((0.8 + 0.0) / 2)
+        assert engine.mean_similarity(group_a, []) == 0.0
+
+
+class TestCorrelationClustering:
+    """Test union-find clustering over the threshold graph"""
+
+    def test_union_find_groups(self):
+        union_find = UnionFind(5)
+        union_find.union(3, 1)
+        union_find.union(4, 3)
+
+        assert union_find.groups() == [[0], [1, 3, 4], [2]]
+
+    @pytest.mark.parametrize("use_numpy", ENGINE_MODES)
+    def test_cluster_is_transitive(self, use_numpy):
+        engine = FailureSimilarityEngine(use_numpy=use_numpy)
+        matrix = [
+            [1.0, 0.9, 0.1, 0.0],
+            [0.9, 1.0, 0.8, 0.0],
+            [0.1, 0.8, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0]
+        ]
+        if use_numpy:
+            import numpy as np
+            matrix = np.array(matrix)
+
+        assert engine.cluster(matrix, 0.6) == [[0, 1, 2], [3]]
+
+    def test_split_by_correlation(self, integrator):
+        failures = [
+            make_failure(0, "tests/test_a.py", "import", "ImportError: No module named common"),
+            make_failure(1, "tests/test_a.py", "import", "ImportError: No module named common"),
+            make_failure(2, "tests/test_b.py", "assertion", "AssertionError: expected 1")
+        ]
+
+        matrix = integrator._build_correlation_matrix(failures)
+        subgroups = integrator._split_by_correlation(failures, matrix)
+
+        assert [[f.test_function for f in group] for group in subgroups] == [["test_0", "test_1"], ["test_2"]]
+
+    def test_prioritization_uses_batched_scores(self, integrator):
+        failures = [
+            make_failure(i, f"tests/test_{i}.py", "import", "ImportError: common failure", "trace")
+            for i in range(3)
+        ]
+
+        assert integrator._calculate_correlation_priority_scores(failures) == [20.0, 20.0, 20.0]
+        assert integrator._calculate_correlation_priority_score(failures[0], failures) == 20.0
@@ -7,10 +7,11 @@ file change detection, and task mapping functionality.
 
 import pytest
 import tempfile
+import io
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from src.beast_mode.compliance.git.analyzer import GitAnalyzer
 from src.beast_mode.compliance.models import (
@@ -98,43 +99,46 @@ class TestGitAnalyzer:
             assert indicators["git_repository"]["status"] == "healthy"
             assert indicators["git_executable"]["status"] == "healthy"
     
+    @patch('subprocess.Popen')
     @patch('subprocess.run')
-    def test_get_commits_ahead_of_main_success(self, mock_run, git_analyzer):
+    def test_get_commits_ahead_of_main_success(self, mock_run, mock_popen, git_analyzer):
         """Test successful retrieval of commits ahead of main."""
-        # Create a list to track call order
-        call_results = []
-        
-        # Mock git rev-list command (first call)
-        rev_list_result = Mock()
-        rev_list_result.returncode = 0
-        rev_list_result.stdout = "commit1\ncommit2\ncommit3\n"
-        call_results.append(rev_list_result)
-        
-        # Mock git show commands for each commit
-        show_result1 = Mock()
-        show_result1.returncode = 0
-        show_result1.stdout = "commit1|Author1|1640995200|First commit\nA\tsrc/file1.py\n"
-        call_results.append(show_result1)
-        
-        show_result2 = Mock()
-        show_result2.returncode = 0
-        show_result2.stdout = "commit2|Author2|1640995300|Second commit\nM\tsrc/file2.py\n"
-        call_results.append(show_result2)
-        
-        show_result3 = Mock()
-        show_result3.returncode = 0
-        show_result3.stdout = "commit3|Author3|1640995400|Third commit\nD\tsrc/file3.py\n"
-        call_results.append(show_result3)
-        
-        mock_run.side_effect = call_results
+        # Mock git rev-list command
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "commit1\ncommit2\ncommit3\n"
+        
+        # Mock the single streamed git log over all three commits
+        log_output = (
+            b"\x1ecommit1\x00base\x00Author1\x001640995200\x00First commit\x00\n"
+            b":000000 100644 0000000 1111111 A\x00src/file1.py\x002\t0\tsrc/file1.py\x00"
+            b"\x1ecommit2\x00commit1\x00Author2\x001640995300\x00Second commit\x00\n"
+            b":100644 100644 2222222 3333333 M\x00src/file2.py\x00"
+            b":100644 100644 4444444 4444444 R100\x00src/old.py\x00src/renamed.py\x00"
+            b"3\t1\tsrc/file2.py\x000\t0\t\x00src/old.py\x00src/renamed.py\x00"
+            b"\x1ecommit3\x00commit2\x00Author3\x001640995400\x00Third commit\x00\n"
+            b":100644 000000 5555555 0000000 D\x00src/file3.py\x00-\t-\tsrc/file3.py\x00"
+        )
+        process = mock_popen.return_value
+        process.stdout = io.BytesIO(log_output)
+        process.stderr = io.BytesIO(b"")
+        process.wait.return_value = 0
         
         commits = git_analyzer.get_commits_ahead_of_main()
         
+        assert mock_run.call_count == 1
+        assert mock_popen.call_count == 1
+        process.stdin.write.assert_called_once_with(b"commit1\ncommit2\ncommit3\n")
         assert len(commits) == 3
         assert commits[0].commit_hash == "commit1"
         assert commits[0].author == "Author1"
         assert commits[0].message == "First commit"
         assert "src/file1.py" in commits[0].added_files
+        assert commits[1].modified_files == ["src/file2.py", "src/renamed.py"]
+        assert commits[2].deleted_files == ["src/file3.py"]
+        # Line counts come from the same git log, without another git process
+        assert git_analyzer._get_commit_line_changes("commit2") == (3, 1)
+        assert git_analyzer._get_commit_line_changes("commit3") == (0, 0)
+        assert mock_run.call_count == 1
     
     @patch('subprocess.run')
     def test_get_commits_ahead_of_main_no_commits(self, mock_run, git_analyzer):
@@ -411,6 +415,46 @@ class TestGitAnalyzerIntegration:
         # Test task mapping
         task_mapping = analyzer.map_changes_to_tasks(file_changes)
         assert len(task_mapping) > 0
+    
+    def test_commit_metadata_from_one_git_log_and_cache(self):
+        """Test streamed commit parsing against real git, then cached reuse."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_path = Path(temp_dir)
+            
+            def git(*args):
+                subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True)
+            
+            git("init")
+            git("config", "user.name", "Test User")
+            git("config", "user.email", "test@example.com")
+            (repo_path / "old.py").write_text("a\nb\n")
+            git("add", ".")
+            git("commit", "-m", "Initial commit")
+            git("branch", "base")
+            
+            (repo_path / "old.py").write_text("a\nc\nd\n")
+            (repo_path / "new file.py").write_text("x\n")
+            git("add", ".")
+            git("commit", "-m", "Edit | with pipe")
+            git("mv", "old.py", "moved.py")
+            git("commit", "-m", "Rename")
+            
+            analyzer = GitAnalyzer(str(repo_path))
+            commits = analyzer.get_commits_ahead_of_main("HEAD", "base")
+            
+            assert [commit.message for commit in commits] == ["Edit | with pipe", "Rename"]
+            assert commits[0].added_files == ["new file.py"]
+            assert commits[0].modified_files == ["old.py"]
+            assert commits[1].modified_files == ["moved.py"]
+            assert analyzer._get_commit_line_changes(commits[0].commit_hash) == (3, 1)
+            assert analyzer.commit_cache_path.exists()
+            
+            # A new analyzer reads the commits from the on-disk cache without running git log
+            cached_analyzer = GitAnalyzer(str(repo_path))
+            with patch.object(cached_analyzer, '_stream_commit_log') as mock_stream:
+                cached_commits = cached_analyzer.get_commits_ahead_of_main("HEAD", "base")
+            mock_stream.assert_not_called()
+            assert cached_commits == commits
 
 
 if __name__ == "__main__":
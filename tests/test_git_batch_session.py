@@ -0,0 +1,111 @@
+"""
+Tests for the batched git mode of StandardGitProvider.
+
+These tests run against a temporary repository and compare the batched
+for-each-ref/cat-file path with the per-branch command path.
+"""
+
+import subprocess
+import time
+
+import pytest
+
+from src.gitkraken_integration.providers.standard_git_provider import StandardGitProvider
+
+
+def git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = str(tmp_path)
+    git(path, "init", "-q", "-b", "main")
+    git(path, "config", "user.name", "Test Author")
+    git(path, "config", "user.email", "author@example.com")
+    git(path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+    for index in range(3):
+        git(path, "branch", f"feature/{index}")
+    git(path, "commit", "-q", "--allow-empty", "-m", "Second commit\n\nWith a body")
+    return path
+
+
+class TestBatchedGitProvider:
+    """Test StandardGitProvider(batch_mode=True)"""
+    
+    def test_list_branches_matches_command_path(self, repo):
+        standard = StandardGitProvider(repo)
+        batched = StandardGitProvider(repo, batch_mode=True)
+        
+        expected = standard.list_branches().data["branches"]
+        actual = batched.list_branches().data["branches"]
+        batched.close()
+        
+        def key(branch):
+            return branch["name"]
+        
+        for want, got in zip(sorted(expected, key=key), sorted(actual, key=key)):
+            for field in ("name", "is_current", "last_commit_hash", "last_commit_message", "last_commit_author"):
+                assert got[field] == want[field]
+            assert got["last_commit_date"].timestamp() == pytest.approx(want["last_commit_date"].timestamp())
+        assert len(actual) == 4
+    
+    def test_ref_cache_invalidated_by_ref_changes(self, repo):
+        provider = StandardGitProvider(repo, batch_mode=True)
+        session = provider.batch_session
+        
+        provider.list_branches()
+        provider.list_branches()
+        assert session.get_stats()["ref_reads"] == 1
+        assert session.get_stats()["ref_cache_hits"] == 1
+        
+        git(repo, "branch", "feature/new")
+        assert "feature/new" in [b["name"] for b in provider.list_branches().data["branches"]]
+        
+        git(repo, "commit", "-q", "--allow-empty", "-m", "Third commit")
+        details = provider.get_branch_details("main")
+        assert details.data["branch"]["last_commit_message"] == "Third commit"
+        
+        git(repo, "pack-refs", "--all")
+        git(repo, "update-ref", "refs/heads/feature/0", details.data["commit_hash"])
+        assert provider.get_branch_details("feature/0").data["commit_hash"] == details.data["commit_hash"]
+        assert session.get_stats()["ref_reads"] == 4
+        provider.close()
+    
+    def test_branch_details_and_commit_lookup(self, repo):
+        provider = StandardGitProvider(repo, batch_mode=True)
+        
+        details = provider.get_branch_details("main")
+        assert details.success
+        assert details.data["author_email"] == "author@example.com"
+        assert details.data["branch"]["is_current"] is True
+        assert provider.get_branch_details("missing").error_code == "GIT_BRANCH_NOT_FOUND"
+        
+        commit = provider.batch_session.get_commit("main")
+        assert commit.hash == details.data["commit_hash"]
+        assert commit.subject == "Second commit"
+        assert commit.author_name == "Test Author"
+        assert len(commit.parent_hashes) == 1
+        assert provider.batch_session.get_commit("no-such-rev") is None
+        
+        commit_date, author = provider._get_commit_details(commit.parent_hashes[0])
+        assert author == "Test Author"
+        assert provider.batch_session.get_stats()["cat_file_running"] == 1
+        
+        provider.close()
+        assert provider.batch_session.get_stats()["cat_file_running"] == 0
+    
+    @pytest.mark.slow
+    def test_list_many_branches_is_fast(self, repo):
+        head = git(repo, "rev-parse", "HEAD").strip()
+        refs = "".join(f"create refs/heads/bulk/{index} {head}\n" for index in range(2000))
+        subprocess.run(["git", "update-ref", "--stdin"], cwd=repo, input=refs, text=True, check=True)
+        provider = StandardGitProvider(repo, batch_mode=True)
+        
+        start_time = time.time()
+        result = provider.list_branches()
+        elapsed = time.time() - start_time
+        provider.close()
+        
+        assert result.data["total_count"] == 2004
+        assert elapsed < 5.0
@@ -0,0 +1,203 @@
+"""
+Unit tests for TestImpactIndex.
+
+Tests building the source-to-test map from coverage contexts, affected test
+selection, merging partial runs into the baseline and persistence.
+"""
+
+import pytest
+import subprocess
+import tempfile
+from pathlib import Path
+
+from src.beast_mode.compliance.rdi.impact_index import TestImpactIndex, changes_since_commit
+from src.beast_mode.compliance.rdi.suite_execution import SuiteExecutionResult, SuiteOutcome
+
+
+def suite_result(files, outcomes=()):
+    """Suite result carrying a coverage JSON report with per-test contexts."""
+    return SuiteExecutionResult(
+        coverage_data=None,
+        outcomes=list(outcomes),
+        returncode=0,
+        duration_seconds=0.0,
+        coverage_json={"files": files}
+    )
+
+
+FULL_RUN = suite_result(
+    {
+        "src/a.py": {
+            "executed_lines": [1, 2, 3],
+            "missing_lines": [4],
+            "contexts": {
+                "1": [""],
+                "2": ["tests/test_a.py::test_one|run"],
+                "3": ["tests/test_a.py::TestA::test_two|run", "tests/test_shared.py::test_both|run"]
+            }
+        },
+        "src/b.py": {
+            "executed_lines": [1, 5],
+            "missing_lines": [6, 7],
+            "contexts": {"1": [""], "5": ["tests/test_shared.py::test_both|run"]}
+        },
+        "src/c.py": {"executed_lines": [1], "missing_lines": [2], "contexts": {"1": [""]}}
+    },
+    [
+        SuiteOutcome("tests/test_a.py::test_one", "tests/test_a.py", "passed"),
+        SuiteOutcome("tests/test_a.py::TestA::test_two", "tests/test_a.py", "failed", "assert 1 == 2"),
+        SuiteOutcome("tests/test_shared.py::test_both", "tests/test_shared.py", "passed"),
+        SuiteOutcome("tests/test_other.py::test_unrelated", "tests/test_other.py", "passed")
+    ]
+)
+
+
+class TestTestImpactIndex:
+    """Test cases for TestImpactIndex."""
+
+    @pytest.fixture
+    def index(self):
+        index = TestImpactIndex()
+        index.rebuild(FULL_RUN, commit="abc123")
+        return index
+
+    def test_rebuild_maps_sources_to_tests(self, index):
+        """Test that contexts map each source file to the tests that executed it."""
+        assert index.source_to_tests["src/a.py"] == {
+            "tests/test_a.py::test_one",
+            "tests/test_a.py::TestA::test_two",
+            "tests/test_shared.py::test_both"
+        }
+        assert index.source_to_tests["src/b.py"] == {"tests/test_shared.py::test_both"}
+        # Import-time lines ("" context) can't be attributed to a test
+        assert "src/c.py" not in index.source_to_tests
+        assert set(index.failing) == {"tests/test_a.py::TestA::test_two"}
+        assert index.get_stats()["tests"] == 4
+
+    def test_select_test_files(self, index):
+        """Test selection of the test files affected by changed files."""
+        assert index.select_test_files(["src/b.py"]) == {"tests/test_shared.py"}
+        assert index.select_test_files(["src/a.py"]) == {"tests/test_a.py", "tests/test_shared.py"}
+        assert index.select_test_files(["tests/test_new.py", "README.md"]) == {"tests/test_new.py"}
+        assert index.select_test_files(["src/c.py", "docs/guide.md"]) == set()
+
+    def test_select_requires_full_run(self, index):
+        """Test that shared test configuration or a missing baseline forces a full run."""
+        assert index.select_test_files(["tests/conftest.py"]) is None
+        assert index.select_test_files(["src/a.py", "requirements-dev.txt"]) is None
+        assert TestImpactIndex().select_test_files(["src/a.py"]) is None
+
+    def test_unindexed_source_file_requires_full_run(self, index):
+        """Test that a new source file the baseline never measured forces a full run."""
+        assert index.select_test_files(["src/new_module.py"]) is None
+        assert index.select_test_files(["scripts/tool.py"]) == set()
+        assert index.select_test_files([], deleted_files=["src/removed.py"]) == set()
+        assert index.select_test_files([], deleted_files=["src/b.py"]) == {"tests/test_shared.py"}
+
+    def test_merge_partial_run(self, index):
+        """Test merging a partial run into the baseline."""
+        partial = suite_result(
+            {
+                "src/a.py": {"executed_lines": [1], "missing_lines": [2, 3], "contexts": {"1": [""]}},
+                "src/b.py": {
+                    "executed_lines": [1, 6],
+                    "missing_lines": [5, 7],
+                    "contexts": {"6": ["tests/test_shared.py::test_new|run"]}
+                },
+                "src/c.py": {"executed_lines": [1], "missing_lines": [2], "contexts": {"1": [""]}}
+            },
+            [SuiteOutcome("tests/test_shared.py::test_new", "tests/test_shared.py", "passed")]
+        )
+
+        index.merge(partial, ["tests/test_shared.py"], changed_files=["src/b.py"], commit="def456")
+
+        # Changed file: replaced by the new measurement
+        assert index.files["src/b.py"] == {"executed_lines": [1, 6], "missing_lines": [5, 7]}
+        # Unchanged file: baseline lines kept, newly executed lines added
+        assert index.files["src/a.py"] == {"executed_lines": [1, 2, 3], "missing_lines": [4]}
+        # Re-run test file: old tests replaced by the new ones
+        assert "tests/test_shared.py::test_both" not in index.tests
+        assert index.source_to_tests["src/b.py"] == {"tests/test_shared.py::test_new"}
+        assert "tests/test_shared.py::test_both" not in index.source_to_tests["src/a.py"]
+        # Tests that didn't run keep their baseline outcome
+        assert set(index.failing) == {"tests/test_a.py::TestA::test_two"}
+        assert index.commit == "def456"
+
+    def test_merge_deletions_without_run(self, index):
+        """Test that deleted source and test files leave the baseline."""
+        index.merge(None, [], changed_files=[], deleted_files=["src/b.py", "tests/test_a.py"])
+
+        assert "src/b.py" not in index.files
+        assert "tests/test_a.py::test_one" not in index.tests
+        assert index.failing == {}
+        assert index.source_to_tests == {"src/a.py": {"tests/test_shared.py::test_both"}}
+        assert index.commit == "abc123"
+
+    def test_coverage_data(self, index):
+        """Test baseline coverage in the validator's format."""
+        coverage_data = index.coverage_data()
+
+        assert coverage_data["total_lines"] == 10
+        assert coverage_data["covered_lines"] == 6
+        assert coverage_data["overall_coverage"] == 60.0
+        assert coverage_data["file_coverage"]["src/a.py"]["coverage_percent"] == 75.0
+
+    def test_save_and_load(self, index):
+        """Test persistence round trip and rejection of incompatible files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "index" / "test_impact_index.json"
+            assert index.save(path)
+
+            loaded = TestImpactIndex.load(path)
+            assert loaded.commit == "abc123"
+            assert loaded.source_to_tests == index.source_to_tests
+            assert loaded.files == index.files
+            assert loaded.failing == index.failing
+            assert loaded.select_test_files(["src/b.py"]) == {"tests/test_shared.py"}
+
+            assert not TestImpactIndex.load(path, coverage_source="lib").has_baseline
+            path.write_text("not json")
+            assert not TestImpactIndex.load(path).has_baseline
+            assert not TestImpactIndex.load(Path(temp_dir) / "missing.json").has_baseline
+
+
+class TestChangesSinceCommit:
+    """Test diffing the working tree against a baseline commit."""
+
+    @staticmethod
+    def git(repo, *args):
+        return subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / "src" / name).write_text("x = 1\n")
+        self.git(tmp_path, "init", "-q", "-b", "main")
+        self.git(tmp_path, "add", ".")
+        self.git(tmp_path, "commit", "-q", "-m", "base")
+        return tmp_path
+
+    def test_committed_and_working_tree_changes(self, repo):
+        baseline = self.git(repo, "rev-parse", "HEAD")
+        (repo / "src" / "a.py").write_text("x = 2\n")
+        self.git(repo, "commit", "-q", "-am", "change a")
+        (repo / "src" / "b.py").write_text("x = 3\n")
+        (repo / "src" / "c.py").unlink()
+        (repo / "src" / "new.py").write_text("y = 1\n")
+
+        assert changes_since_commit(repo, baseline) == ({"src/a.py", "src/b.py", "src/new.py"}, {"src/c.py"})
+
+    def test_baseline_from_another_branch_is_rejected(self, repo):
+        self.git(repo, "checkout", "-q", "-b", "other")
+        (repo / "src" / "a.py").write_text("x = 2\n")
+        self.git(repo, "commit", "-q", "-am", "other work")
+        other_commit = self.git(repo, "rev-parse", "HEAD")
+        self.git(repo, "checkout", "-q", "main")
+
+        assert changes_since_commit(repo, other_commit) is None
+        assert changes_since_commit(repo, "0" * 40) is None
+        assert changes_since_commit(repo, None) is None
@@ -0,0 +1,128 @@
+"""
+Unit tests for the indexed log entry store
+Tests ring eviction, index-driven queries and queries over spilled entries
+"""
+
+import json
+from collections import namedtuple
+
+import pytest
+
+from src.beast_mode.operations.log_entry_store import LogEntryStore
+from src.beast_mode.operations.comprehensive_logging_system import (
+    ComprehensiveLoggingSystem, LogLevel, AuditEvent
+)
+
+
+Entry = namedtuple("Entry", ["n", "level", "component"])
+
+INDEX_FIELDS = {
+    "level": lambda entry: entry.level,
+    "component": lambda entry: entry.component
+}
+
+
+def parse_entry(line: str) -> Entry:
+    return Entry(*json.loads(line))
+
+
+def write_entries(store: LogEntryStore, path, entries):
+    """Append entries to a JSONL file and record their offsets, as the log writer does"""
+    with open(path, "ab") as f:
+        for entry in entries:
+            seq = store.append(entry)
+            offset = f.tell()
+            f.write((json.dumps(list(entry)) + "\n").encode("utf-8"))
+            f.flush()
+            store.record_written(seq, entry, offset)
+
+
+class TestRingBuffer:
+    """Test in-memory behaviour"""
+
+    def test_capacity_bounds_memory_and_indexes(self):
+        store = LogEntryStore(capacity=3, index_fields=INDEX_FIELDS)
+        for n in range(10):
+            store.append(Entry(n, "INFO" if n % 2 else "ERROR", "c"))
+
+        assert len(store) == 3
+        assert [entry.n for entry in store] == [7, 8, 9]
+        assert store[0].n == 7 and store[-1].n == 9
+        assert sum(len(seqs) for seqs in store._indexes["level"].values()) == 3
+        with pytest.raises(IndexError):
+            store[3]
+
+    def test_query_returns_most_recent_matches_oldest_first(self):
+        store = LogEntryStore(capacity=100, index_fields=INDEX_FIELDS)
+        for n in range(50):
+            store.append(Entry(n, "ERROR" if n % 5 == 0 else "INFO", f"c{n % 2}"))
+
+        assert [e.n for e in store.query(limit=3, level="ERROR")] == [35, 40, 45]
+        assert [e.n for e in store.query(limit=2, level="ERROR", component="c0")] == [30, 40]
+        assert [e.n for e in store.query(limit=2)] == [48, 49]
+        assert store.query(level="DEBUG") == []
+
+    def test_unknown_filter_is_rejected(self):
+        store = LogEntryStore(capacity=10, index_fields=INDEX_FIELDS)
+        with pytest.raises(ValueError):
+            store.query(message="x")
+
+
+class TestSpilledEntries:
+    """Test queries that reach entries evicted to disk"""
+
+    def test_evicted_entries_are_read_back_from_file(self, tmp_path):
+        path = tmp_path / "main.log"
+        store = LogEntryStore(capacity=5, index_fields=INDEX_FIELDS, spill_path=path, loader=parse_entry)
+        write_entries(store, path, [Entry(n, "ERROR" if n % 3 == 0 else "INFO", "c") for n in range(30)])
+
+        assert [e.n for e in store.query(limit=8)] == list(range(22, 30))
+        assert [e.n for e in store.query(limit=4, level="ERROR")] == [18, 21, 24, 27]
+        assert [e.n for e in store.query(limit=100, level="ERROR")] == list(range(0, 30, 3))
+        assert store.query(limit=8, include_spilled=False) == list(store)
+
+    def test_rotation_drops_deleted_generations(self, tmp_path):
+        path = tmp_path / "main.log"
+        store = LogEntryStore(capacity=2, index_fields=INDEX_FIELDS, spill_path=path, loader=parse_entry,
+                              backup_count=1)
+        for generation in range(3):
+            write_entries(store, path, [Entry(generation * 10 + n, "INFO", "c") for n in range(10)])
+            path.replace(tmp_path / "main.log.1")
+            store.record_rotated()
+        write_entries(store, path, [Entry(30, "INFO", "c")])
+
+        assert [e.n for e in store.query(limit=100)] == list(range(20, 31))
+        assert [e.n for e in store.query(limit=100, level="INFO")] == list(range(20, 31))
+
+    def test_replaced_file_is_not_misread(self, tmp_path):
+        path = tmp_path / "main.log"
+        store = LogEntryStore(capacity=1, index_fields=INDEX_FIELDS, spill_path=path, loader=parse_entry)
+        write_entries(store, path, [Entry(n, "INFO", "c") for n in range(3)])
+
+        # Renamed away without the rotation being recorded yet
+        path.replace(tmp_path / "main.log.1")
+        path.write_text(json.dumps([99, "INFO", "c"]) + "\n")
+
+        assert [e.n for e in store.query(limit=10)] == [2]
+
+
+class TestLoggingSystemQueries:
+    """Test get_logs and get_audit_trail beyond the in-memory window"""
+
+    def test_get_logs_reads_spilled_entries(self, tmp_path):
+        system = ComprehensiveLoggingSystem(project_root=str(tmp_path), max_in_memory_log_entries=10,
+                                            max_in_memory_audit_entries=2)
+        for n in range(40):
+            system.log(LogLevel.ERROR if n % 4 == 0 else LogLevel.INFO, f"message {n}", f"component{n % 2}")
+            if n % 10 == 0:
+                system.audit(AuditEvent.CONFIGURATION_CHANGED, "config", f"change {n}")
+        system.flush_logs()
+
+        assert len(system.log_entries) == 10
+        errors = system.get_logs(level=LogLevel.ERROR, limit=5)
+        assert [entry.message for entry in errors] == [f"message {n}" for n in (20, 24, 28, 32, 36)]
+        assert all(entry.level == LogLevel.ERROR for entry in errors)
+
+        audit = system.get_audit_trail(event_type=AuditEvent.CONFIGURATION_CHANGED)
+        assert [entry.operation for entry in audit] == [f"change {n}" for n in (0, 10, 20, 30)]
+        system.shutdown()
@@ -0,0 +1,154 @@
+"""
+Unit tests for metric series storage
+Tests ring buffers, DDSketch percentiles and indexed alert rules in the monitoring system
+"""
+
+import pytest
+import random
+import threading
+
+from src.beast_mode.observability import metric_series
+from src.beast_mode.observability.metric_series import DDSketch, MetricSeries, RingBuffer
+from src.beast_mode.observability.comprehensive_monitoring_system import (
+    ComprehensiveMonitoringSystem, AlertSeverity
+)
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy_mode(request, monkeypatch):
+    """Run a test with and without NumPy-backed buffers"""
+    if request.param and not metric_series.NUMPY_AVAILABLE:
+        pytest.skip("NumPy not installed")
+    monkeypatch.setattr(metric_series, "NUMPY_AVAILABLE", request.param)
+    return request.param
+
+
+class TestRingBuffer:
+    """Test RingBuffer functionality"""
+
+    def test_wraps_and_keeps_order(self, numpy_mode):
+        buffer = RingBuffer(3)
+        for value in range(5):
+            buffer.append(value)
+
+        assert len(buffer) == 3
+        assert list(buffer.values()) == [2.0, 3.0, 4.0]
+        assert buffer.latest() == 4.0
+
+    def test_partial_and_empty(self, numpy_mode):
+        buffer = RingBuffer(4)
+        assert buffer.latest() is None
+        buffer.append(1.5)
+
+        assert list(buffer.values()) == [1.5]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestDDSketch:
+    """Test DDSketch quantile accuracy"""
+
+    def test_relative_error_bound(self):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(3, 1.5) for _ in range(20000)]
+        sketch = DDSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.9, 0.99):
+            expected = ordered[int(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+    def test_negative_zero_and_extremes(self):
+        sketch = DDSketch()
+        for value in (-10.0, 0.0, 0.0, 5.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0) == -10.0
+        assert sketch.quantile(1) == 5.0
+        assert sketch.quantile(0.1) == pytest.approx(-10.0, rel=0.01)
+        assert sketch.quantile(0.5) == 0.0
+        assert DDSketch().quantile(0.5) is None
+
+    def test_merge(self):
+        left, right, combined = DDSketch(), DDSketch(), DDSketch()
+        for value in range(1, 1001):
+            (left if value % 2 else right).add(value)
+            combined.add(value)
+        left.merge(right)
+
+        assert left.count == 1000
+        assert left.quantile(0.99) == combined.quantile(0.99)
+
+
+class TestMetricSeries:
+    """Test MetricSeries functionality"""
+
+    def test_summary(self, numpy_mode):
+        series = MetricSeries("latency", capacity=10)
+        for value in range(1, 101):
+            series.add(value)
+
+        summary = series.summary()
+        assert summary["count"] == 10
+        assert summary["min"] == 91.0 and summary["max"] == 100.0
+        assert summary["total_count"] == 100
+        assert summary["lifetime_average"] == pytest.approx(50.5)
+        assert summary["p50"] == pytest.approx(50, rel=0.02)
+
+    def test_concurrent_adds(self):
+        series = MetricSeries("requests", capacity=100)
+
+        def emit():
+            for value in range(5000):
+                series.add(value)
+
+        threads = [threading.Thread(target=emit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert series.sketch.count == 20000
+        assert len(series) == 100
+
+
+class TestMonitoringSystemMetrics:
+    """Test ComprehensiveMonitoringSystem metric storage and alert indexing"""
+
+    @pytest.fixture
+    def monitoring(self):
+        return ComprehensiveMonitoringSystem()
+
+    def test_percentiles_in_summary(self, monitoring):
+        for value in range(1, 2001):
+            monitoring.emit_metric("queue_depth", value)
+
+        recent = monitoring.get_metrics_summary()["recent_metrics"]["queue_depth"]
+        assert recent["count"] == 1000
+        assert recent["latest_value"] == 2000
+        assert recent["p99"] == pytest.approx(1980, rel=0.02)
+        assert monitoring.get_metric_percentile("queue_depth", 50) == pytest.approx(1000, rel=0.02)
+        assert monitoring.get_metric_percentile("unknown_metric", 50) is None
+
+    def test_alert_rules_indexed_by_metric(self, monitoring):
+        monitoring.add_alert_rule("deep_queue", "queue_depth", 100, AlertSeverity.MEDIUM)
+        assert monitoring.alert_rules_by_metric["queue_depth"] == ["deep_queue"]
+
+        monitoring.emit_metric("queue_depth", 150)
+        assert "deep_queue" in monitoring.active_alerts
+        monitoring.emit_metric("queue_depth", 50)
+        assert "deep_queue" not in monitoring.active_alerts
+
+    def test_redefined_rule_moves_index(self, monitoring):
+        monitoring.add_alert_rule("deep_queue", "queue_depth", 100, AlertSeverity.MEDIUM)
+        monitoring.add_alert_rule("deep_queue", "backlog_depth", 100, AlertSeverity.MEDIUM)
+
+        assert monitoring.alert_rules_by_metric["queue_depth"] == []
+        monitoring.emit_metric("queue_depth", 500)
+        assert "deep_queue" not in monitoring.active_alerts
+        monitoring.emit_metric("backlog_depth", 500)
+        assert "deep_queue" in monitoring.active_alerts
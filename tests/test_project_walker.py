@@ -0,0 +1,120 @@
+"""
+Unit tests for ProjectWalker utility class.
+
+Tests the single-pass project walker including:
+- Extension and filename pattern filtering
+- Pruning of excluded directories
+- Depth limits
+- Parallel subtree scanning
+"""
+
+import pytest
+
+from src.beast_mode.utils.project_walker import (
+    ProjectWalker,
+    walk_project_files,
+    DEFAULT_EXCLUDED_DIRS,
+    ENVIRONMENT_EXCLUDED_DIRS
+)
+
+
+class TestProjectWalker:
+    """Test suite for ProjectWalker class."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a small project tree with excluded directories."""
+        for relative in [
+            "setup.py",
+            "README.md",
+            "Makefile",
+            "src/core/main.py",
+            "src/core/helpers.JS",
+            "src/utils/io.py",
+            "tests/test_main.py",
+            "node_modules/pkg/index.js",
+            "src/core/__pycache__/main.cpython-311.pyc",
+            ".git/config",
+            "pkg.egg-info/PKG-INFO",
+        ]:
+            path = tmp_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+        return tmp_path
+
+    def test_walk_relative_prunes_excluded_dirs(self, project):
+        """Test that excluded directories are never descended into."""
+        files = list(ProjectWalker(project).walk_relative())
+
+        assert "node_modules/pkg/index.js" not in files
+        assert ".git/config" not in files
+        assert not any("__pycache__" in path for path in files)
+        assert "src/core/main.py" in files
+
+    def test_environment_dirs_are_opt_in(self, project):
+        """Test that build and virtualenv directories are only pruned on request."""
+        for relative in ["build/lib/main.py", ".venv/lib/site.py"]:
+            (project / relative).parent.mkdir(parents=True)
+            (project / relative).write_text("x = 1\n")
+
+        default_files = list(ProjectWalker(project, extensions={".py"}).walk_relative())
+        assert "build/lib/main.py" in default_files
+        assert ".venv/lib/site.py" in default_files
+
+        walker = ProjectWalker(
+            project, extensions={".py"}, excluded_dirs=DEFAULT_EXCLUDED_DIRS | ENVIRONMENT_EXCLUDED_DIRS
+        )
+        files = list(walker.walk_relative())
+        assert "build/lib/main.py" not in files
+        assert ".venv/lib/site.py" not in files
+
+    def test_extension_filter(self, project):
+        """Test filtering by extension in a single pass."""
+        files = list(ProjectWalker(project, extensions={".py"}).walk_relative())
+
+        assert files == ["setup.py", "src/core/main.py", "src/utils/io.py", "tests/test_main.py"]
+
+    def test_extension_filter_is_case_insensitive(self, project):
+        """Test that extensions match regardless of case."""
+        files = list(ProjectWalker(project, extensions={".js"}).walk_relative())
+
+        assert files == ["src/core/helpers.JS"]
+
+    def test_pattern_filter_and_depth(self, project):
+        """Test filename patterns limited to the root directory."""
+        walker = ProjectWalker(project, patterns=["Makefile*", "*.md"], max_depth=0)
+
+        assert list(walker.walk_relative()) == ["Makefile", "README.md"]
+
+    def test_wildcard_exclusions(self, project):
+        """Test fnmatch-style excluded directory names."""
+        default_files = list(ProjectWalker(project).walk_relative())
+        assert "pkg.egg-info/PKG-INFO" in default_files
+
+        walker = ProjectWalker(project, excluded_dirs=DEFAULT_EXCLUDED_DIRS | {"*.egg-info"})
+        assert "pkg.egg-info/PKG-INFO" not in list(walker.walk_relative())
+
+    def test_walk_returns_absolute_paths(self, project):
+        """Test that walk() yields paths under the root."""
+        paths = list(ProjectWalker(project, extensions={".py"}).walk())
+
+        assert project / "src/core/main.py" in paths
+        assert all(path.is_absolute() for path in paths)
+
+    def test_parallel_walk_matches_serial(self, project):
+        """Test that threaded subtree scanning yields the same ordered results."""
+        serial = list(ProjectWalker(project).walk_relative())
+        parallel = list(ProjectWalker(project, max_workers=4).walk_relative())
+
+        assert parallel == serial
+
+    def test_files_by_extension(self, project):
+        """Test grouping files by extension."""
+        grouped = ProjectWalker(project, extensions={".py", ".md"}).files_by_extension()
+
+        assert len(grouped[".py"]) == 4
+        assert grouped[".md"] == [project / "README.md"]
+
+    def test_missing_root(self, tmp_path):
+        """Test that a missing root yields nothing instead of raising."""
+        assert walk_project_files(tmp_path / "missing") == []
@@ -25,9 +25,10 @@ class TestRCAEngineTestSpecificAnalysis:
     def teardown_method(self):
         """Cleanup test environment"""
         # Clean up test pattern file
-        test_pattern_file = Path("test_patterns.json")
-        if test_pattern_file.exists():
-            test_pattern_file.unlink()
+        for test_pattern_file in (Path("test_patterns.json"), Path("test_patterns.log.jsonl"),
+                                  Path("test_patterns.lsh.json")):
+            if test_pattern_file.exists():
+                test_pattern_file.unlink()
     
     def test_pytest_failure_categorization(self):
         """Test pytest failure categorization - Requirement 5.1"""
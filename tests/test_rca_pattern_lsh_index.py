@@ -0,0 +1,206 @@
+"""
+Unit tests for the RCA pattern LSH index
+Tests near-duplicate pattern matching, persistence and DR3 latency at scale
+"""
+
+import pytest
+import random
+import time
+from datetime import datetime
+
+from src.beast_mode.analysis import pattern_lsh_index
+from src.beast_mode.analysis.pattern_lsh_index import (
+    PatternLSHIndex, normalize_error_message, shingle, signature_error_message
+)
+from src.beast_mode.analysis.rca_engine import (
+    RCAEngine, Failure, FailureCategory, PreventionPattern
+)
+
+
+def make_failure(error_message: str, component: str = "test:tests/test_imports.py") -> Failure:
+    """Create a pytest failure with the given error message"""
+    return Failure(
+        failure_id="lsh_failure",
+        timestamp=datetime.now(),
+        component=component,
+        error_message=error_message,
+        stack_trace=None,
+        context={"test_file": "tests/test_imports.py"},
+        category=FailureCategory.PYTEST_FAILURE
+    )
+
+
+def make_pattern(engine: RCAEngine, pattern_id: str, failure: Failure) -> PreventionPattern:
+    """Create a prevention pattern for a failure"""
+    signature = engine._generate_failure_signature(failure)
+    return PreventionPattern(
+        pattern_id=pattern_id,
+        pattern_name=f"Pattern {pattern_id}",
+        failure_signature=signature,
+        root_cause_pattern="Missing dependency",
+        prevention_steps=[],
+        detection_criteria=[],
+        automated_checks=[],
+        pattern_hash=pattern_id[-8:]
+    )
+
+
+class TestNormalization:
+    """Test message normalization helpers"""
+
+    def test_normalize_error_message(self):
+        assert normalize_error_message("Timeout after 30s at 0xDEADBEEF\n  retry") == "timeout after 0s at 0x retry"
+        assert normalize_error_message(None) == ""
+
+    def test_shingle(self):
+        assert shingle("abcdef", 4) == {"abcd", "bcde", "cdef"}
+        assert shingle("ab", 4) == {"ab"}
+        assert shingle("", 4) == set()
+
+    def test_signature_error_message(self):
+        assert signature_error_message("comp|pytest_failure|ImportError: x|['a']") == "ImportError: x"
+
+
+class TestPatternLSHIndex:
+    """Test PatternLSHIndex functionality"""
+
+    def test_near_duplicate_is_ranked_first(self):
+        index = PatternLSHIndex()
+        index.add("exact", "ImportError: No module named 'requests_oauthlib'")
+        index.add("other", "AssertionError: expected status 200 but got 500")
+
+        matches = index.query("ImportError: No module named 'requests_oauthlb'")
+
+        assert matches[0][0] == "exact"
+        assert matches[0][1] > 0.5
+        assert "other" not in [pattern_id for pattern_id, _ in matches]
+
+    def test_numbers_do_not_affect_matching(self):
+        index = PatternLSHIndex()
+        index.add("timeout", "Connection timed out after 30 seconds")
+
+        assert index.query("Connection timed out after 45 seconds") == [("timeout", 1.0)]
+
+    def test_remove_and_readd(self):
+        index = PatternLSHIndex()
+        index.add("a", "KeyError: 'missing_key'")
+        assert index.remove("a")
+        assert index.query("KeyError: 'missing_key'") == []
+
+        index.add("b", "KeyError: 'missing_key'")
+        assert len(index) == 1
+        assert index.query("KeyError: 'missing_key'")[0][0] == "b"
+
+    def test_batched_signatures_match_single(self):
+        index = PatternLSHIndex(batch_size=3)
+        messages = ["ImportError: a", "", "TypeError: unsupported operand", "x", "ValueError: bad literal"]
+
+        assert index.compute_signatures(messages) == [index.compute_signature(m) for m in messages]
+
+    def test_pure_python_signatures_match_numpy(self, monkeypatch):
+        if not pattern_lsh_index.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+        message = "FileNotFoundError: [Errno 2] No such file or directory: 'config.yaml'"
+        expected = PatternLSHIndex().compute_signature(message)
+
+        monkeypatch.setattr(pattern_lsh_index, "NUMPY_AVAILABLE", False)
+        assert PatternLSHIndex().compute_signature(message) == expected
+
+    def test_save_load_and_sync(self, tmp_path):
+        path = tmp_path / "patterns.lsh.json"
+        index = PatternLSHIndex()
+        index.add("a", "ImportError: No module named 'yaml'", "hash_a")
+        index.add("b", "PermissionError: denied", "hash_b")
+        index.save(path)
+
+        restored = PatternLSHIndex()
+        assert restored.load(path)
+        computed = restored.sync([
+            ("a", "ImportError: No module named 'yaml'", "hash_a"),
+            ("c", "OSError: disk full", "hash_c")
+        ])
+
+        assert computed == 1
+        assert "b" not in restored
+        assert restored.query("ImportError: No module named 'yml'")[0][0] == "a"
+
+    def test_load_rejects_other_parameters(self, tmp_path):
+        path = tmp_path / "patterns.lsh.json"
+        PatternLSHIndex(num_perm=32, bands=8).save(path)
+
+        assert PatternLSHIndex().load(path) is False
+
+    def test_invalid_band_configuration(self):
+        with pytest.raises(ValueError):
+            PatternLSHIndex(num_perm=64, bands=10)
+
+
+class TestRCAEngineFuzzyMatching:
+    """Test fuzzy pattern matching in RCAEngine"""
+
+    def test_one_character_change_still_matches(self, tmp_path):
+        engine = RCAEngine(pattern_library_path=str(tmp_path / "rca_patterns.json"))
+        original = make_failure("ImportError: No module named 'requests_oauthlib'")
+        engine._add_pattern_to_library(make_pattern(engine, "pattern_00000001", original))
+
+        matches = engine.match_existing_patterns(make_failure("ImportError: No module named 'requests_oauthlb'"))
+
+        assert [pattern.pattern_id for pattern in matches] == ["pattern_00000001"]
+
+    def test_find_similar_patterns_is_ranked(self, tmp_path):
+        engine = RCAEngine(pattern_library_path=str(tmp_path / "rca_patterns.json"))
+        engine._add_pattern_to_library(make_pattern(
+            engine, "pattern_00000001", make_failure("ImportError: No module named 'requests_oauthlib'")))
+        engine._add_pattern_to_library(make_pattern(
+            engine, "pattern_00000002", make_failure("ImportError: No module named 'requests'")))
+
+        similar = engine.find_similar_patterns(make_failure("ImportError: No module named 'requests_oauthlb'"))
+
+        assert [pattern.pattern_id for pattern, _ in similar] == ["pattern_00000001", "pattern_00000002"]
+        assert similar[0][1] > similar[1][1]
+
+    def test_index_is_persisted_next_to_library(self, tmp_path):
+        library_path = tmp_path / "rca_patterns.json"
+        engine = RCAEngine(pattern_library_path=str(library_path))
+        engine._add_pattern_to_library(make_pattern(
+            engine, "pattern_00000001", make_failure("ValueError: invalid literal for int()")))
+
+        restarted = RCAEngine(pattern_library_path=str(library_path))
+        assert (tmp_path / "rca_patterns.lsh.json").exists()
+        assert "pattern_00000001" in restarted.pattern_lsh_index
+        assert restarted.get_module_status()["lsh_indexed_patterns"] == 1
+
+
+class TestDR3Latency:
+    """Check DR3 (<1 second matching) on a small library
+
+    The 100k pattern benchmark is scripts/benchmark_rca_pattern_matching.py.
+    """
+
+    def test_match_latency(self, tmp_path):
+        rng = random.Random(7)
+        words = ["import", "error", "module", "timeout", "connection", "refused", "assert", "expected",
+                 "file", "found", "permission", "denied", "key", "index", "attribute", "object", "type"]
+        engine = RCAEngine(pattern_library_path=str(tmp_path / "rca_patterns.json"))
+
+        patterns = []
+        for i in range(300):
+            message = " ".join(rng.choices(words, k=rng.randint(4, 10))) + f" '{rng.choice(words)}_{i:x}'"
+            pattern = make_pattern(engine, f"pattern_{i:08d}", make_failure(message))
+            engine.pattern_library[pattern.pattern_id] = pattern
+            engine.pattern_index.setdefault(pattern.pattern_hash, []).append(pattern.pattern_id)
+            patterns.append(pattern)
+        engine.pattern_lsh_index.add_many(
+            (pattern.pattern_id, signature_error_message(pattern.failure_signature), pattern.pattern_hash)
+            for pattern in patterns
+        )
+
+        worst = 0.0
+        for pattern in rng.sample(patterns, 10):
+            query = signature_error_message(pattern.failure_signature)[:-2] + "z'"
+            start_time = time.perf_counter()
+            matches = engine.match_existing_patterns(make_failure(query))
+            worst = max(worst, time.perf_counter() - start_time)
+            assert pattern in matches
+
+        assert worst < 1.0, f"Pattern matching took {worst:.3f}s"
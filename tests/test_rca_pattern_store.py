@@ -0,0 +1,115 @@
+"""
+Unit tests for the append-only RCA pattern store
+Tests log appends, streaming replay, compaction and RCAEngine persistence
+"""
+
+import json
+from dataclasses import asdict
+from unittest.mock import patch
+
+from src.beast_mode.analysis.pattern_store import PatternStore
+from src.beast_mode.analysis.rca_engine import RCAEngine, PreventionPattern
+
+
+def make_pattern(index: int, name: str = None) -> PreventionPattern:
+    """Create a minimal prevention pattern"""
+    return PreventionPattern(
+        pattern_id=f"pattern_{index}",
+        pattern_name=name or f"Pattern {index}",
+        failure_signature=f"component|pytest_failure|Error {index}|[]",
+        root_cause_pattern="Root cause",
+        prevention_steps=["step"],
+        detection_criteria=["criteria"],
+        automated_checks=["check"],
+        pattern_hash=f"{index:08x}"
+    )
+
+
+class TestPatternStore:
+    """Test PatternStore functionality"""
+
+    def test_append_and_replay(self, tmp_path):
+        store = PatternStore(tmp_path / "rca_patterns.json")
+        store.append({"pattern_id": "a"})
+        store.append({"pattern_id": "b"})
+
+        assert store.log_path == tmp_path / "rca_patterns.log.jsonl"
+        assert not store.snapshot_path.exists()
+        assert [record["pattern_id"] for record in PatternStore(store.snapshot_path).load()] == ["a", "b"]
+
+    def test_compaction_writes_snapshot_and_truncates_log(self, tmp_path):
+        store = PatternStore(tmp_path / "rca_patterns.json")
+        store.append({"pattern_id": "a"})
+        store.compact([{"pattern_id": "a"}])
+
+        data = json.loads(store.snapshot_path.read_text())
+        assert data["pattern_count"] == 1
+        assert not store.log_path.exists()
+        assert not (tmp_path / "rca_patterns.json.tmp").exists()
+
+        store.append({"pattern_id": "b"})
+        reloaded = PatternStore(store.snapshot_path)
+        assert [record["pattern_id"] for record in reloaded.load()] == ["a", "b"]
+        assert (reloaded.snapshot_records, reloaded.log_records) == (1, 1)
+
+    def test_torn_trailing_record_is_skipped(self, tmp_path):
+        store = PatternStore(tmp_path / "rca_patterns.json")
+        store.append({"pattern_id": "a"})
+        with open(store.log_path, "a") as f:
+            f.write('{"pattern_id": "b"')
+
+        assert [record["pattern_id"] for record in store.load()] == ["a"]
+        assert store.skipped_records == 1
+        assert store.needs_compaction()
+
+    def test_compaction_threshold_grows_with_snapshot(self, tmp_path):
+        store = PatternStore(tmp_path / "rca_patterns.json", min_compaction_records=2, compaction_ratio=1.0)
+        store.append({"pattern_id": "a"})
+        assert not store.needs_compaction()
+        store.append({"pattern_id": "b"})
+        assert store.needs_compaction()
+
+        store.compact([{"pattern_id": str(i)} for i in range(5)])
+        for i in range(4):
+            store.append({"pattern_id": f"new_{i}"})
+        assert not store.needs_compaction()
+
+
+class TestRCAEnginePatternStore:
+    """Test RCAEngine persistence through the pattern store"""
+
+    def test_adding_patterns_does_not_rewrite_library(self, tmp_path):
+        engine = RCAEngine(pattern_library_path=str(tmp_path / "rca_patterns.json"))
+
+        with patch.object(engine.pattern_store, 'compact', wraps=engine.pattern_store.compact) as compact:
+            for i in range(20):
+                engine._add_pattern_to_library(make_pattern(i))
+
+        compact.assert_not_called()
+        assert engine.pattern_store.log_records == 20
+
+    def test_restart_replays_log_with_latest_version(self, tmp_path):
+        library_path = str(tmp_path / "rca_patterns.json")
+        engine = RCAEngine(pattern_library_path=library_path)
+        engine._add_pattern_to_library(make_pattern(1))
+        engine._add_pattern_to_library(make_pattern(2))
+        engine._add_pattern_to_library(make_pattern(1, name="Renamed"))
+
+        restarted = RCAEngine(pattern_library_path=library_path)
+
+        assert set(restarted.pattern_library) == {"pattern_1", "pattern_2"}
+        assert restarted.pattern_library["pattern_1"].pattern_name == "Renamed"
+        assert restarted.pattern_index[make_pattern(1).pattern_hash] == ["pattern_1"]
+
+    def test_compaction_preserves_library_format(self, tmp_path):
+        library_path = tmp_path / "rca_patterns.json"
+        engine = RCAEngine(pattern_library_path=str(library_path))
+        engine.pattern_store.min_compaction_records = 5
+
+        for i in range(5):
+            engine._add_pattern_to_library(make_pattern(i))
+
+        data = json.loads(library_path.read_text())
+        assert data["pattern_count"] == 5
+        assert data["patterns"][0] == asdict(make_pattern(0))
+        assert not engine.pattern_store.log_path.exists()
@@ -5,6 +5,7 @@ Tests validation of RM interface implementation, size constraints,
 health monitoring, and registry integration.
 """
 
+import ast
 import pytest
 import tempfile
 import os
@@ -15,6 +16,7 @@ from src.beast_mode.compliance.rm.rm_validator import (
     RMValidator, RMInterfaceResult, SizeConstraintResult, 
     HealthMonitoringResult, RegistryIntegrationResult
 )
+from src.beast_mode.compliance.rm.module_analysis import ModuleAnalysisCache
 from src.beast_mode.compliance.models import (
     ComplianceIssueType, IssueSeverity, RMComplianceStatus
 )
@@ -806,5 +808,108 @@ class CompliantRM(ReflectiveModule):
         assert len(critical_issues) > 0
 
 
+class TestModuleAnalysisCache:
+    """Test the parse-once module analysis shared by all checks."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache = ModuleAnalysisCache()
+        self.validator = RMValidator(module_cache=self.cache)
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _create_temp_module(self, content: str, filename: str = "test_module.py") -> str:
+        """Create a temporary module file with given content."""
+        module_path = os.path.join(self.temp_dir, filename)
+        with open(module_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return module_path
+    
+    def test_all_checks_share_one_parse(self):
+        """Test that full validation reads and parses a module once."""
+        module_path = self._create_temp_module('''"""Module."""
+from beast_mode.core.reflective_module import ReflectiveModule
+
+class Sample(ReflectiveModule):
+    def is_healthy(self):
+        return True
+''')
+        
+        with patch('src.beast_mode.compliance.rm.module_analysis.ast.parse', wraps=ast.parse) as mock_parse:
+            self.validator.validate_rm_compliance(module_path)
+            self.validator.validate_rm_compliance(module_path)
+        
+        assert mock_parse.call_count == 1
+        assert self.cache.get_stats()["misses"] == 1
+    
+    def test_cache_invalidated_when_file_changes(self):
+        """Test that a modified module is re-read."""
+        module_path = self._create_temp_module("class A:\n    pass\n")
+        first = self.cache.get(module_path)
+        
+        with open(module_path, 'a', encoding='utf-8') as f:
+            f.write("\nclass B(ReflectiveModule):\n    def is_healthy(self):\n        return True\n")
+        second = self.cache.get(module_path)
+        
+        assert first.summary.class_count == 1
+        assert second.summary.class_count == 2
+        assert [cls.name for cls in second.summary.rm_classes] == ["B"]
+        assert second.summary.rm_classes[0].methods == {"is_healthy"}
+    
+    def test_summary_matches_module_structure(self):
+        """Test the single-pass summary: imports, counts and nesting depth."""
+        module_path = self._create_temp_module('''import os
+from . import sibling
+from typing import List
+
+# comment
+
+def outer(items):
+    for item in items:
+        if item:
+            while True:
+                break
+        try:
+            if item:
+                pass
+        except Exception:
+            pass
+''')
+        analysis = self.cache.get(module_path)
+        
+        assert analysis.summary.imports == ["os", ".", "typing"]
+        assert analysis.summary.import_count == 3
+        assert analysis.summary.function_names == {"outer"}
+        # for > if > while; the if inside try is not directly nested in the for
+        assert analysis.summary.max_nesting_depth == 3
+        assert analysis.code_lines == 13
+    
+    def test_syntax_error_keeps_line_counts(self):
+        """Test that invalid modules still get size checks but fail AST checks."""
+        module_path = self._create_temp_module("def broken(:\n    pass\n")
+        
+        size_result = self.validator.check_size_constraints(module_path)
+        interface_result = self.validator.validate_rm_interface_implementation(module_path)
+        
+        assert size_result.line_count == 2
+        assert interface_result.implements_rm_interface is False
+        assert "Failed to validate RM interface" in interface_result.issues[0].description
+    
+    def test_validate_tree(self):
+        """Test validating every module under a directory."""
+        self._create_temp_module("class A:\n    pass\n", "a.py")
+        self._create_temp_module("class B:\n    pass\n", "b.py")
+        self._create_temp_module("", "__init__.py")
+        
+        statuses = self.validator.validate_tree(self.temp_dir, max_workers=1)
+        
+        assert sorted(os.path.basename(path) for path in statuses) == ["a.py", "b.py"]
+        assert all(not status.interface_implemented for status in statuses.values())
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
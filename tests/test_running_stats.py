@@ -0,0 +1,100 @@
+"""
+Unit tests for running statistics and the systematic metrics engine accumulators
+"""
+
+import pytest
+import random
+import statistics
+
+from src.beast_mode.metrics.running_stats import RunningStats
+from src.beast_mode.metrics.systematic_metrics_engine import SystematicMetricsEngine
+
+
+class TestRunningStats:
+    """Test Welford accumulator"""
+
+    def test_matches_statistics_module(self):
+        rng = random.Random(11)
+        values = [rng.gauss(1e6, 3.0) for _ in range(5000)]
+        stats = RunningStats(values)
+
+        assert stats.count == 5000
+        assert stats.mean == pytest.approx(statistics.mean(values), rel=1e-12)
+        assert stats.stdev == pytest.approx(statistics.stdev(values), rel=1e-9)
+        assert (stats.min, stats.max) == (min(values), max(values))
+
+    def test_small_samples(self):
+        assert RunningStats().variance == 0.0
+        assert RunningStats([4.0]).stdev == 0.0
+        assert RunningStats().to_dict()["min"] is None
+
+    def test_merge(self):
+        rng = random.Random(5)
+        left_values = [rng.random() for _ in range(300)]
+        right_values = [rng.random() * 10 for _ in range(700)]
+
+        merged = RunningStats(left_values)
+        merged.merge(RunningStats(right_values))
+        merged.merge(RunningStats())
+
+        expected = RunningStats(left_values + right_values)
+        assert merged.count == expected.count
+        assert merged.mean == pytest.approx(expected.mean)
+        assert merged.variance == pytest.approx(expected.variance)
+
+
+class TestSystematicMetricsEngineAccumulators:
+    """Test SystematicMetricsEngine running statistics and columnar storage"""
+
+    @pytest.fixture
+    def engine(self):
+        return SystematicMetricsEngine()
+
+    def test_baselines_are_running_means(self, engine):
+        for value in (1.0, 2.0, 6.0):
+            engine.collect_systematic_metric("build_time", value)
+        engine.collect_adhoc_metric("build_time", 10.0)
+
+        assert engine.systematic_baselines["build_time"] == pytest.approx(3.0)
+        assert engine.adhoc_baselines["build_time"] == 10.0
+        assert list(engine.get_metric_values("build_time", "systematic")) == [1.0, 2.0, 6.0]
+
+    def test_comparative_analysis_matches_raw_statistics(self, engine):
+        systematic = [2.0, 2.5, 3.0, 2.2]
+        adhoc = [5.0, 6.0, 4.5]
+        for value in systematic:
+            engine.collect_systematic_metric("fix_time", value)
+        for value in adhoc:
+            engine.collect_adhoc_metric("fix_time", value)
+
+        result = engine.perform_comparative_analysis("fix_time")
+
+        assert result.sample_size_systematic == 4 and result.sample_size_adhoc == 3
+        assert result.systematic_average == pytest.approx(statistics.mean(systematic))
+        assert result.statistical_significance == pytest.approx(
+            engine._calculate_statistical_significance(systematic, adhoc))
+        assert result.confidence_interval == pytest.approx(engine._calculate_confidence_interval(systematic, adhoc))
+
+    def test_estimated_adhoc_baseline(self, engine):
+        engine.collect_systematic_metric("deploy_time", 10.0)
+
+        result = engine.perform_comparative_analysis("deploy_time")
+
+        assert result.adhoc_average == pytest.approx(14.0)
+        assert result.sample_size_adhoc == 1
+        with pytest.raises(ValueError):
+            engine.perform_comparative_analysis("unknown_metric")
+
+    def test_metric_data_preserves_collection_order(self, engine):
+        engine.collect_systematic_metric("a", 1.0, {"run": 1})
+        engine.collect_adhoc_metric("b", 2.0)
+        engine.collect_systematic_metric("b", 3.0)
+
+        data = engine.metric_data
+        assert [(dp.metric_name, dp.approach_type, dp.value) for dp in data] == [
+            ("a", "systematic", 1.0), ("b", "adhoc", 2.0), ("b", "systematic", 3.0)
+        ]
+        assert data[0].context == {"run": 1}
+        assert data[1].confidence_score == 0.7
+        assert engine.get_module_status()["total_metrics_collected"] == 3
+        assert engine.get_module_status()["adhoc_metrics"] == 1
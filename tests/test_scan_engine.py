@@ -0,0 +1,242 @@
+"""
+Unit tests for ComplianceScanEngine and ComplianceScanCache.
+
+Tests that the parallel scan reports the same issues as the serial
+validators, and that per-file results are reused, invalidated and pruned
+through the content-hash cache.
+"""
+
+import hashlib
+import os
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+
+from src.beast_mode.compliance.scan_engine import ComplianceScanEngine
+from src.beast_mode.compliance.scan_cache import ComplianceScanCache, FileScanResult, file_stat_key
+from src.beast_mode.compliance.models import ComplianceIssue, ComplianceIssueType, IssueSeverity
+from src.beast_mode.compliance.rm.rm_validator import RMValidator
+from src.beast_mode.compliance.rdi.requirement_tracer import RequirementTracer, RequirementReference
+from src.beast_mode.compliance.rdi.design_validator import DesignValidator, ImplementationComponent, ComponentType
+
+
+REQUIREMENTS = """# Requirements
+
+### Requirement 1
+
+**User Story:** As a user, I want widgets.
+
+### Requirement 2
+
+**User Story:** As a user, I want gadgets.
+"""
+
+DESIGN = """# Design
+
+## WidgetManager class
+
+**Purpose**: Manages widgets.
+"""
+
+WIDGETS = '''"""Widgets. Requirements: 1"""
+
+
+class WidgetManager:
+    def add(self):
+        pass
+
+
+def helper():
+    """Requirement 7"""
+    return 1
+'''
+
+
+def issue_signature(issues):
+    return sorted(
+        (issue.issue_type.value, issue.severity.value, issue.description, tuple(sorted(issue.affected_files)))
+        for issue in issues
+    )
+
+
+class TestComplianceScanEngine:
+    """Test cases for ComplianceScanEngine."""
+
+    def setup_method(self):
+        """Set up a small repository."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir).resolve()
+        self.cache_path = self.root / "cache" / "scan_cache.json"
+        self._write("docs/requirements.md", REQUIREMENTS)
+        self._write("docs/design.md", DESIGN)
+        self._write("pkg/__init__.py", "")
+        self._write("pkg/widgets.py", WIDGETS)
+        self._write("pkg/gadgets.py", "def make_gadget():\n    return None\n")
+
+    def teardown_method(self):
+        """Clean up the repository."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, relative_path: str, content: str) -> Path:
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+        return path
+
+    def _engine(self, **kwargs) -> ComplianceScanEngine:
+        kwargs.setdefault("max_workers", 1)
+        kwargs.setdefault("cache_path", str(self.cache_path))
+        return ComplianceScanEngine(str(self.root), **kwargs)
+
+    def _serial_issues(self):
+        root = str(self.root)
+        issues = []
+        rm_validator = RMValidator()
+        for module_path in sorted(self.root.rglob("*.py")):
+            if module_path.name != "__init__.py":
+                issues.extend(rm_validator.validate_rm_compliance(str(module_path)).issues)
+        issues.extend(RequirementTracer(root).validate(root))
+        issues.extend(DesignValidator(root).validate(root))
+        return issues
+
+    def test_matches_serial_validators(self):
+        """Test that a scan reports the same issues as the serial validators."""
+        engine = self._engine()
+        issues = engine.run()
+
+        assert issue_signature(issues) == issue_signature(self._serial_issues())
+        assert [ref.requirement_id for ref in engine.traceability_result.orphaned_implementations] == ["7"]
+        assert engine.alignment_result.implemented_components == 1
+        assert engine.get_stats()["files"] == 5
+
+    def test_parallel_matches_in_process(self):
+        """Test that the process pool reports the same issues as an in-process scan."""
+        parallel = self._engine(max_workers=2, use_cache=False).run()
+        in_process = self._engine(use_cache=False).run()
+
+        assert issue_signature(parallel) == issue_signature(in_process)
+
+    def test_warm_scan_uses_cache(self):
+        """Test that unchanged files are skipped on the next scan."""
+        cold = self._engine().run()
+        engine = self._engine()
+        warm = engine.run()
+
+        assert issue_signature(warm) == issue_signature(cold)
+        assert engine.get_stats()["cached"] == 5
+        assert engine.get_stats()["analyzed"] == 0
+
+    def test_changed_touched_and_deleted_files(self):
+        """Test that only changed files are analyzed again and deleted files leave the cache."""
+        self._engine().run()
+
+        self._write("pkg/gadgets.py", "def make_gadget():\n    # Requirement 9\n    return None\n")
+        widgets = self.root / "pkg" / "widgets.py"
+        stat = widgets.stat()
+        os.utime(widgets, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (self.root / "docs" / "design.md").unlink()
+
+        engine = self._engine()
+        issues = engine.run()
+        stats = engine.get_stats()
+
+        assert stats["analyzed"] == 1
+        assert stats["cached"] == 3
+        assert stats["cache"]["rehashed"] == 2  # changed gadgets.py and touched widgets.py
+        orphaned = {ref.requirement_id for ref in engine.traceability_result.orphaned_implementations}
+        assert orphaned == {"7", "9"}
+        assert issue_signature(issues) == issue_signature(self._serial_issues())
+
+        cache = ComplianceScanCache.load(self.cache_path, str(self.root), engine._fingerprint())
+        assert "docs/design.md" not in cache.entries
+        assert len(cache) == 4
+
+    def test_streams_rm_issues_before_repository_issues(self):
+        """Test that file-level issues are yielded before the scan completes."""
+        engine = self._engine()
+        scan = engine.scan()
+        first = next(scan)
+
+        assert first.issue_type == ComplianceIssueType.RM_NON_COMPLIANCE
+        assert engine.traceability_result is None
+        scan.close()
+
+        # Files analyzed before the consumer stopped are kept
+        cache = ComplianceScanCache.load(self.cache_path, str(self.root), engine._fingerprint())
+        assert len(cache) >= 1
+
+    def test_early_stop_keeps_warm_cache(self):
+        """Test that stopping early keeps entries for files the scan had not reached."""
+        self._engine().run()
+        (self.root / "docs" / "design.md").unlink()
+
+        engine = self._engine()
+        scan = engine.scan()
+        next(scan)
+        scan.close()
+
+        cache = ComplianceScanCache.load(self.cache_path, str(self.root), engine._fingerprint())
+        assert "docs/design.md" not in cache.entries
+        assert len(cache) == 4
+
+    def test_checks_subset(self):
+        """Test running only some checks."""
+        engine = self._engine(checks=["rm"])
+        issues = engine.run()
+
+        assert {issue.issue_type for issue in issues} <= {
+            ComplianceIssueType.RM_NON_COMPLIANCE, ComplianceIssueType.ARCHITECTURAL_VIOLATION
+        }
+        assert engine.traceability_result is None
+        assert engine.get_stats()["files"] == 3
+
+        with pytest.raises(ValueError):
+            self._engine(checks=["rm", "lint"])
+
+
+class TestComplianceScanCache:
+    """Test cases for ComplianceScanCache."""
+
+    def test_round_trip_and_invalidation(self):
+        """Test persisting results and rejecting caches built by other code or roots."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "module.py"
+            source.write_text("class A:\n    pass\n", encoding='utf-8')
+            result = FileScanResult(
+                path="module.py",
+                content_hash=hashlib.sha256(source.read_bytes()).hexdigest(),
+                checks=("rm", "requirements", "design"),
+                rm_issues=[ComplianceIssue(
+                    issue_type=ComplianceIssueType.RM_NON_COMPLIANCE,
+                    severity=IssueSeverity.HIGH,
+                    description="Missing RM interface",
+                    affected_files=[str(source)],
+                    metadata={"lines": 2}
+                )],
+                references=[RequirementReference("1.2", str(source), 1, "# Requirement 1.2", "comment")],
+                components=[ImplementationComponent("A", ComponentType.CLASS, [], [], str(source), 1, None, {})]
+            )
+            cache = ComplianceScanCache(temp_dir, "fp")
+            stat_key = file_stat_key(source)
+            cache.store(result, stat_key)
+            cache_path = Path(temp_dir) / "cache.json"
+            assert cache.save(cache_path)
+
+            loaded = ComplianceScanCache.load(cache_path, temp_dir, "fp")
+            hit = loaded.lookup("module.py", source, stat_key, ("rm", "design"))
+            assert hit.cached
+            assert hit.rm_issues == result.rm_issues
+            assert hit.components == result.components
+            assert hit.references == []
+            assert loaded.lookup("module.py", source, stat_key, ("rm", "coverage")) is None
+
+            assert len(ComplianceScanCache.load(cache_path, temp_dir, "other")) == 0
+            assert len(ComplianceScanCache.load(cache_path, "/elsewhere", "fp")) == 0
+
+    def test_incomplete_results_are_not_cached(self):
+        """Test that files whose checks failed are analyzed again next time."""
+        cache = ComplianceScanCache("/repo", "fp")
+        cache.store(FileScanResult(path="a.py", content_hash="abc", checks=("rm",), complete=False), [1, 2, 3])
+
+        assert len(cache) == 0
@@ -19,7 +19,41 @@ from src.beast_mode.compliance.rdi.test_coverage_validator import (
     TestType,
     TestCoverageResult
 )
-from src.beast_mode.compliance.models import ComplianceIssueType, IssueSeverity
+from src.beast_mode.compliance.rdi.suite_execution import SuiteExecutor
+from src.beast_mode.compliance.models import ComplianceIssueType, IssueSeverity, FileChangeAnalysis
+
+CHANGES_SINCE_COMMIT = 'src.beast_mode.compliance.rdi.test_coverage_validator.changes_since_commit'
+
+
+def fake_suite_run(coverage_json=None, junit_xml=None):
+    """subprocess.run stand-in that writes pytest's reports where the command asks."""
+    calls = []
+    
+    def run(cmd, **kwargs):
+        if cmd[0] == 'git':
+            raise subprocess.CalledProcessError(128, cmd)
+        calls.append(cmd)
+        for arg in cmd:
+            if coverage_json is not None and arg.startswith('--cov-report=json:'):
+                Path(arg.split(':', 1)[1]).write_text(json.dumps(coverage_json))
+            if junit_xml is not None and arg.startswith('--junitxml='):
+                Path(arg.split('=', 1)[1]).write_text(junit_xml)
+        return MagicMock(returncode=0)
+    
+    run.calls = calls
+    return run
+
+
+JUNIT_WITH_FAILURE = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="3">
+<testcase classname="tests.test_module1" name="test_function1" file="tests/test_module1.py" line="1" />
+<testcase classname="tests.test_module1" name="test_failing_test" file="tests/test_module1.py" line="15">
+<failure message="AssertionError: Intentional failure">def test_failing_test():
+&gt;       assert False, "Intentional failure"</failure>
+</testcase>
+<testcase classname="tests.test_module1.TestClass1" name="test_method1" file="tests/test_module1.py" line="5" />
+</testsuite></testsuites>
+"""
 
 
 class TestTestCoverageValidator:
@@ -180,10 +214,7 @@ def test_integration_scenario():
     @patch('subprocess.run')
     def test_run_coverage_analysis_success(self, mock_run, validator, temp_repo):
         """Test successful coverage analysis with subprocess."""
-        # Mock successful subprocess run
-        mock_run.return_value = MagicMock(returncode=0)
-        
-        # Create mock coverage.json
+        # Mock coverage.json
         coverage_data = {
             "totals": {
                 "percent_covered": 85.5,
@@ -199,12 +230,13 @@ def test_integration_scenario():
             }
         }
         
-        coverage_json_path = temp_repo / "coverage.json"
-        with open(coverage_json_path, 'w') as f:
-            json.dump(coverage_data, f)
+        mock_run.side_effect = fake_suite_run(coverage_json=coverage_data)
+        validator.suite_executor = SuiteExecutor(use_coverage=True)
         
         result = validator._run_coverage_analysis(temp_repo)
         
+        # Reports go to a private temp directory, never the repository root
+        assert not (temp_repo / "coverage.json").exists()
         assert result['overall_coverage'] == 85.5
         assert result['total_lines'] == 100
         assert result['covered_lines'] == 85
@@ -225,36 +257,195 @@ def test_integration_scenario():
     @patch('subprocess.run')
     def test_identify_failing_tests_success(self, mock_run, validator, temp_repo):
         """Test identifying failing tests with subprocess."""
-        # Mock successful test run with failures
-        mock_run.return_value = MagicMock(returncode=1)  # Tests failed
-        
-        # Create mock test report
-        test_report = {
-            "tests": [
-                {
-                    "nodeid": "tests/test_module1.py::test_failing_test",
-                    "file": "tests/test_module1.py",
-                    "outcome": "failed",
-                    "call": {
-                        "longrepr": "AssertionError: Intentional failure"
-                    }
-                },
-                {
-                    "nodeid": "tests/test_module1.py::test_function1",
-                    "file": "tests/test_module1.py",
-                    "outcome": "passed"
-                }
-            ]
-        }
-        
-        report_path = temp_repo / "test_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(test_report, f)
+        mock_run.side_effect = fake_suite_run(junit_xml=JUNIT_WITH_FAILURE)
         
         failing_tests = validator._identify_failing_tests(temp_repo)
         
         assert len(failing_tests) >= 1
-        assert any("test_failing_test" in test.test_name for test in failing_tests)
+        assert [test.test_name for test in failing_tests] == ["tests/test_module1.py::test_failing_test"]
+        assert failing_tests[0].error_message == "AssertionError: Intentional failure"
+        assert failing_tests[0].test_file == "tests/test_module1.py"
+    
+    @patch('subprocess.run')
+    def test_coverage_and_failures_share_one_suite_run(self, mock_run, temp_repo):
+        """Test that coverage and failing tests come from a single memoized pytest run."""
+        fake_run = fake_suite_run(
+            coverage_json={"totals": {"percent_covered": 70.0, "num_statements": 10, "covered_lines": 7}, "files": {}},
+            junit_xml=JUNIT_WITH_FAILURE
+        )
+        mock_run.side_effect = fake_run
+        executor = SuiteExecutor(use_coverage=True)
+        first = TestCoverageValidator(str(temp_repo), suite_executor=executor)
+        second = TestCoverageValidator(str(temp_repo), suite_executor=executor)
+        
+        with patch.object(executor, '_repository_state_key', return_value="abc123:clean"):
+            report = first._generate_coverage_report(temp_repo)
+            second_report = second._generate_coverage_report(temp_repo)
+        
+        assert len(fake_run.calls) == 1
+        assert executor.get_stats()["memo_hits"] == 3
+        assert report.overall_coverage == second_report.overall_coverage == 70.0
+        assert [test.test_name for test in report.failing_tests] == ["tests/test_module1.py::test_failing_test"]
+    
+    @patch('subprocess.run')
+    def test_suite_rerun_when_repository_state_changes(self, mock_run, temp_repo):
+        """Test that the memoized run is tied to the repository state."""
+        fake_run = fake_suite_run(junit_xml=JUNIT_WITH_FAILURE)
+        mock_run.side_effect = fake_run
+        executor = SuiteExecutor(use_coverage=False)
+        
+        with patch.object(executor, '_repository_state_key', side_effect=["abc:1", "abc:1", "def:1"]):
+            for _ in range(3):
+                executor.run(temp_repo, temp_repo / "tests")
+        
+        assert len(fake_run.calls) == 2
+    
+    def test_state_key_changes_when_modified_file_is_edited_again(self, tmp_path):
+        """Test that re-editing an already modified file yields a new repository state."""
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+        
+        git("init", "-q")
+        (tmp_path / "module.py").write_text("x = 1\n")
+        git("add", "module.py")
+        git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+        executor = SuiteExecutor(use_coverage=False)
+        
+        (tmp_path / "module.py").write_text("x = 2\n")
+        (tmp_path / "notes.py").write_text("y = 1\n")
+        first = executor._repository_state_key(tmp_path)
+        (tmp_path / "module.py").write_text("x = 22\n")
+        second = executor._repository_state_key(tmp_path)
+        (tmp_path / "notes.py").write_text("y = 12\n")
+        third = executor._repository_state_key(tmp_path)
+        
+        assert len({first, second, third}) == 3
+        assert executor._repository_state_key(tmp_path) == third
+    
+    @patch('subprocess.run')
+    def test_failed_suite_run_is_not_memoized(self, mock_run, temp_repo):
+        """Test that a timed out run is retried instead of served from the memo."""
+        fake_run = fake_suite_run(junit_xml=JUNIT_WITH_FAILURE)
+        
+        def time_out_once(cmd, **kwargs):
+            if mock_run.call_count == 1:
+                raise subprocess.TimeoutExpired(cmd, 300)
+            return fake_run(cmd, **kwargs)
+        
+        mock_run.side_effect = time_out_once
+        executor = SuiteExecutor(use_coverage=False)
+        
+        with patch.object(executor, '_repository_state_key', return_value="abc:1"):
+            assert executor.run(temp_repo, temp_repo / "tests").error is not None
+            assert executor.run(temp_repo, temp_repo / "tests").error is None
+            executor.run(temp_repo, temp_repo / "tests")
+        
+        assert mock_run.call_count == 2
+        assert executor.get_stats()["memo_hits"] == 1
+    
+    @patch('subprocess.run')
+    def test_memo_keeps_most_recent_states(self, mock_run, temp_repo):
+        """Test that only the most recent repository states stay memoized."""
+        mock_run.side_effect = fake_suite_run(junit_xml=JUNIT_WITH_FAILURE)
+        executor = SuiteExecutor(use_coverage=False, max_memoized_states=2)
+        
+        with patch.object(executor, '_repository_state_key', side_effect=["a:1", "b:1", "c:1", "b:1"]):
+            for _ in range(4):
+                executor.run(temp_repo, temp_repo / "tests")
+        
+        assert executor.get_stats()["memoized_states"] == 2
+        assert executor.get_stats()["memo_hits"] == 1
+    
+    @patch('subprocess.run')
+    def test_analyze_changes_runs_only_affected_tests(self, mock_run, temp_repo):
+        """Test that a branch check runs only affected tests and merges into the stored baseline."""
+        full_coverage = {"files": {
+            "src/module1.py": {
+                "executed_lines": [2, 3, 4],
+                "missing_lines": [5],
+                "contexts": {"4": ["tests/test_module1.py::test_function1|run"]}
+            },
+            "src/module2.py": {
+                "executed_lines": [2, 3],
+                "missing_lines": [4, 5],
+                "contexts": {"3": ["tests/integration/test_integration.py::test_integration_scenario|run"]}
+            }
+        }}
+        partial_coverage = {"files": {
+            "src/module1.py": {"executed_lines": [2, 3, 4, 5], "missing_lines": [], "contexts": {}},
+            "src/module2.py": {"executed_lines": [2], "missing_lines": [3, 4, 5], "contexts": {}}
+        }}
+        executor = SuiteExecutor(use_coverage=True)
+        index_path = temp_repo / ".git" / "beast_mode" / "test_impact_index.json"
+        validator = TestCoverageValidator(str(temp_repo), suite_executor=executor, impact_index_path=str(index_path))
+        changes = FileChangeAnalysis(total_files_changed=1, files_modified=["src/module1.py"])
+        
+        # First check: no baseline yet, so the whole suite runs with per-test contexts
+        full_run = fake_suite_run(coverage_json=full_coverage, junit_xml=JUNIT_WITH_FAILURE)
+        mock_run.side_effect = full_run
+        with patch.object(executor, '_repository_state_key', return_value="abc:1"):
+            result = validator.analyze_changes(changes)
+        
+        assert '--cov-context=test' in full_run.calls[0]
+        assert full_run.calls[0][-1] == str(temp_repo / 'tests')
+        assert result.coverage_report.overall_coverage == 62.5
+        assert index_path.exists()
+        
+        # Second check: only the test file mapped to src/module1.py runs
+        partial_run = fake_suite_run(coverage_json=partial_coverage, junit_xml=JUNIT_WITH_FAILURE.replace(
+            '<failure message="AssertionError: Intentional failure">def test_failing_test():\n'
+            '&gt;       assert False, "Intentional failure"</failure>\n', ''
+        ))
+        mock_run.side_effect = partial_run
+        with patch.object(executor, '_repository_state_key', return_value="def:1"), \
+                patch(CHANGES_SINCE_COMMIT, return_value=(set(), set())) as changes_since:
+            result = TestCoverageValidator(
+                str(temp_repo), suite_executor=executor, impact_index_path=str(index_path)
+            ).analyze_changes(changes)
+        
+        changes_since.assert_called_once_with(temp_repo, "abc")
+        assert len(partial_run.calls) == 1
+        assert partial_run.calls[0][-1] == 'tests/test_module1.py'
+        report = result.coverage_report
+        # module1 re-measured (4/4); module2 keeps its baseline (2/4) rather than the partial run's 1/4
+        assert (report.covered_lines, report.total_lines) == (6, 8)
+        assert report.failing_tests == []
+        
+        # Files changed since the baseline commit are selected even if main doesn't list them
+        mock_run.side_effect = partial_run
+        with patch.object(executor, '_repository_state_key', return_value="ghi:1"), \
+                patch(CHANGES_SINCE_COMMIT, return_value=({"src/module2.py"}, set())):
+            validator.analyze_changes(changes)
+        
+        assert partial_run.calls[1][-1] == 'tests/integration/test_integration.py'
+    
+    @pytest.mark.parametrize("since_baseline, changed", [
+        (None, "src/module1.py"),                # baseline measured on a commit HEAD doesn't contain
+        ((set(), set()), "src/new_module.py"),   # source file the baseline never measured
+    ])
+    @patch('subprocess.run')
+    def test_analyze_changes_falls_back_to_full_run(self, mock_run, temp_repo, since_baseline, changed):
+        """Test that a foreign baseline or an unindexed source file rebuilds the index from a full run."""
+        coverage = {"files": {
+            "src/module1.py": {
+                "executed_lines": [2], "missing_lines": [],
+                "contexts": {"2": ["tests/test_module1.py::test_function1|run"]}
+            }
+        }}
+        executor = SuiteExecutor(use_coverage=True)
+        index_path = temp_repo / ".git" / "beast_mode" / "test_impact_index.json"
+        validator = TestCoverageValidator(str(temp_repo), suite_executor=executor, impact_index_path=str(index_path))
+        changes = FileChangeAnalysis(total_files_changed=1, files_modified=[changed])
+        
+        runs = fake_suite_run(coverage_json=coverage, junit_xml=JUNIT_WITH_FAILURE)
+        mock_run.side_effect = runs
+        with patch.object(executor, '_repository_state_key', side_effect=["abc:1", "def:1"]), \
+                patch(CHANGES_SINCE_COMMIT, return_value=since_baseline):
+            validator.analyze_changes(changes)
+            validator.analyze_changes(changes)
+        
+        assert len(runs.calls) == 2
+        assert runs.calls[1][-1] == str(temp_repo / 'tests')
     
     @patch('subprocess.run')
     def test_identify_failing_tests_fallback(self, mock_run, validator, temp_repo):
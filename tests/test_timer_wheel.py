@@ -0,0 +1,160 @@
+"""
+Unit tests for the timer wheel scheduler
+Tests wheel cascading, O(1) cancel, the shared scheduler thread and RCATimeoutHandler integration
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+
+from src.beast_mode.testing.timer_wheel import HierarchicalTimerWheel, TimerHandle, TimerScheduler
+from src.beast_mode.testing.timeout_handler import RCATimeoutHandler, TimeoutConfiguration
+
+
+def make_handle(tick: int) -> TimerHandle:
+    return TimerHandle(lambda: None, (), 0.0, tick)
+
+
+class TestHierarchicalTimerWheel:
+    """Test HierarchicalTimerWheel functionality"""
+
+    def test_timers_fire_on_their_tick_across_levels(self):
+        wheel = HierarchicalTimerWheel(slot_bits=3, levels=3)
+        rng = random.Random(3)
+        expiries = [rng.randint(1, 2000) for _ in range(300)]  # beyond the 512-tick range too
+        handles = [make_handle(tick) for tick in expiries]
+        for handle in handles:
+            wheel.insert(handle)
+
+        fired_at = {}
+        for tick in range(1, 2001):
+            for handle in wheel.advance(tick):
+                fired_at[id(handle)] = tick
+
+        assert len(wheel) == 0
+        assert all(fired_at[id(handle)] == handle.expiry_tick for handle in handles)
+
+    def test_remove_is_constant_time_and_idempotent(self):
+        wheel = HierarchicalTimerWheel()
+        handle = make_handle(100)
+        wheel.insert(handle)
+
+        wheel.remove(handle)
+        wheel.remove(handle)
+
+        assert len(wheel) == 0
+        assert wheel.advance(200) == []
+
+    def test_past_expiry_fires_on_next_tick(self):
+        wheel = HierarchicalTimerWheel()
+        wheel.advance(10)
+        handle = make_handle(5)
+        wheel.insert(handle)
+
+        assert wheel.advance(11) == [handle]
+
+
+class TestTimerScheduler:
+    """Test TimerScheduler functionality"""
+
+    def test_callbacks_run_in_deadline_order(self):
+        scheduler = TimerScheduler(tick_seconds=0.005)
+        fired = []
+        done = threading.Event()
+        scheduler.call_later(0.06, fired.append, "late")
+        scheduler.call_later(0.02, fired.append, "early")
+        scheduler.call_later(0.08, done.set)
+
+        assert done.wait(2)
+        assert fired == ["early", "late"]
+        scheduler.close()
+
+    def test_cancelled_timer_does_not_fire(self):
+        scheduler = TimerScheduler(tick_seconds=0.005)
+        fired = []
+        handle = scheduler.call_later(0.02, fired.append, "cancelled")
+        handle.cancel()
+        time.sleep(0.06)
+
+        assert fired == []
+        assert len(scheduler) == 0
+        scheduler.close()
+
+    def test_failing_callback_does_not_stop_scheduler(self):
+        scheduler = TimerScheduler(tick_seconds=0.005)
+        done = threading.Event()
+        scheduler.call_later(0.01, lambda: 1 / 0)
+        scheduler.call_later(0.02, done.set)
+
+        assert done.wait(2)
+        assert scheduler.callback_errors == 1
+        scheduler.close()
+
+
+class TestRCATimeoutHandlerScheduling:
+    """Test RCATimeoutHandler on the timer wheel"""
+
+    def test_thousands_of_operations_share_one_thread(self):
+        handler = RCATimeoutHandler(scheduler=TimerScheduler(tick_seconds=0.01))
+        threads_before = threading.active_count()
+
+        for i in range(3000):
+            handler._setup_timeout_handlers(f"op_{i}")
+
+        assert len(handler.active_timeouts) == 3000
+        assert threading.active_count() <= threads_before + 1
+
+        for i in range(3000):
+            handler._cleanup_operation_timeouts(f"op_{i}")
+        assert len(handler.timer_scheduler) == 0
+        handler.timer_scheduler.close()
+
+    def test_warning_graceful_and_hard_callbacks_fire(self):
+        config = TimeoutConfiguration(warning_timeout_seconds=0.02, graceful_timeout_seconds=0.04,
+                                      hard_timeout_seconds=0.06)
+        handler = RCATimeoutHandler(config, scheduler=TimerScheduler(tick_seconds=0.005))
+        degradations = []
+
+        with handler.manage_operation_timeout("slow_op", degradations.append):
+            time.sleep(0.2)
+
+        assert [event.timeout_type for event in handler.timeout_events] == ["warning", "graceful", "hard"]
+        assert degradations[0]["analysis_scope"] == "reduced"
+        assert handler.hard_timeouts == 1
+        handler.timer_scheduler.close()
+
+    def test_completed_operation_cancels_timers(self):
+        config = TimeoutConfiguration(warning_timeout_seconds=0.05, graceful_timeout_seconds=0.05,
+                                      hard_timeout_seconds=0.05)
+        handler = RCATimeoutHandler(config, scheduler=TimerScheduler(tick_seconds=0.005))
+
+        with handler.manage_operation_timeout("fast_op"):
+            pass
+        time.sleep(0.1)
+
+        assert handler.timeout_events == []
+        assert handler.active_timeouts == {}
+        handler.timer_scheduler.close()
+
+    async def test_async_variant_runs_callbacks_on_event_loop(self):
+        config = TimeoutConfiguration(warning_timeout_seconds=0.01, graceful_timeout_seconds=0,
+                                      hard_timeout_seconds=0.5)
+        handler = RCATimeoutHandler(config)
+        loop_thread = threading.current_thread()
+        callback_threads = []
+        original = handler._handle_warning_timeout
+
+        def record_warning(operation_id):
+            callback_threads.append(threading.current_thread())
+            original(operation_id)
+        handler._handle_warning_timeout = record_warning
+
+        async with handler.manage_operation_timeout_async("async_op") as timeout_context:
+            assert timeout_context["operation_id"] == "async_op"
+            await asyncio.sleep(0.05)
+
+        assert callback_threads == [loop_thread]
+        assert [event.timeout_type for event in handler.timeout_events] == ["warning"]
+        assert handler.active_timeouts == {}
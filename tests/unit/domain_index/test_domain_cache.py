@@ -293,6 +293,57 @@ class TestDomainCache:
         stats = cache.get_stats()
         assert stats["cache_size"] == 50  # 5 threads * 10 keys each
 
+    def test_expired_entries_purged_before_lru_eviction(self, cache):
+        """Test that expired entries make room before live entries are evicted"""
+        cache.max_size = 2
+        cache.set("live", "value", ttl_seconds=300)
+        cache.set("stale", "value", ttl_seconds=1)
+        
+        time.sleep(1.1)
+        cache.set("new", "value")
+        
+        assert cache.get("live") == "value"
+        assert cache.get("new") == "value"
+        assert cache.evictions == 0
+    
+    def test_cleanup_skips_replaced_deadlines(self, cache):
+        """Test that cleanup ignores heap items of replaced entries"""
+        cache.set("key1", "value1", ttl_seconds=1)
+        cache.set("key1", "value1", ttl_seconds=300)
+        cache.set("key2", "value2", ttl_seconds=1)
+        
+        time.sleep(1.1)
+        cache._cleanup_expired_entries()
+        
+        assert cache.get_stats()["cache_size"] == 1
+        assert cache.get("key1") == "value1"
+    
+    def test_memory_limit_evicts_lru_entries(self):
+        """Test byte-size accounting with a memory cap"""
+        cache = DomainCache({'max_memory_bytes': 2000})
+        try:
+            cache.set("a", "x" * 800)
+            cache.set("b", "x" * 800)
+            cache.get("a")
+            cache.set("c", "x" * 800)
+
+            assert cache.get("a") is not None
+            assert cache.get("b") is None
+            assert cache.get_stats()["memory_usage_bytes"] <= 2000
+        finally:
+            cache.shutdown()
+
+    def test_memory_limit_rejects_oversized_value(self):
+        """Test that a value larger than the memory cap is not cached"""
+        cache = DomainCache({'max_memory_bytes': 1000})
+        try:
+            cache.set("big", "small")
+            assert cache.set("big", "x" * 5000) is False
+            assert cache.get("big") is None
+            assert cache.get_stats()["rejected"] == 1
+        finally:
+            cache.shutdown()
+
 
 class TestDomainSpecificCache:
     """Test DomainSpecificCache functionality"""
@@ -0,0 +1,209 @@
+"""
+Tests for Domain Pattern Matcher
+
+This module tests glob compilation, the combined trie/regex matcher and
+its integration with orphaned file detection and health monitoring.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.beast_mode.domain_index.pattern_matcher import (
+    DomainPatternMatcher, compile_glob, glob_matches
+)
+from src.beast_mode.domain_index.dependency_analyzer import OrphanedFileDetector
+from src.beast_mode.domain_index.health_monitor import DomainHealthMonitor
+from src.beast_mode.domain_index.models import (
+    Domain, DomainTools, DomainMetadata, PackagePotential
+)
+
+
+def make_domain(name, patterns):
+    """Create a minimal domain with file patterns"""
+    return Domain(
+        name=name,
+        description=f"{name} domain",
+        patterns=patterns,
+        content_indicators=[],
+        requirements=[],
+        dependencies=[],
+        tools=DomainTools(linter="", formatter="", validator=""),
+        metadata=DomainMetadata(
+            demo_role="core",
+            extraction_candidate="no",
+            package_potential=PackagePotential(0.5, [], [], "low", [])
+        )
+    )
+
+
+class TestGlobCompilation:
+    """Test glob to regex translation"""
+
+    @pytest.mark.parametrize("path,pattern,expected", [
+        ("src/core/main.py", "src/core/**/*.py", True),
+        ("src/core/sub/deep/helper.py", "src/core/**/*.py", True),
+        ("src/other/main.py", "src/core/**/*.py", False),
+        ("src/core/main.js", "src/core/**/*.py", False),
+        ("setup.py", "*.py", True),
+        ("src/setup.py", "*.py", False),
+        ("tests/unit/test_a.py", "**/test_*.py", True),
+        ("test_a.py", "**/test_*.py", True),
+        ("docs/guide/index.md", "docs/**", True),
+        ("src/a1/x.py", "src/[ab]?/*.py", True),
+        ("src/c1/x.py", "src/[!ab]?/*.py", True),
+        ("src/a1/x.py", "src/[!ab]?/*.py", False),
+        ("./src/core/main.py", "src/core/*.py", True),
+    ])
+    def test_glob_matches(self, path, pattern, expected):
+        assert glob_matches(path, pattern) is expected
+
+    def test_glob_matches_right_anchored(self):
+        assert glob_matches("pkg/sub/mod.py", "*.py", anchor_right=True)
+        assert glob_matches("pkg/sub/mod.py", "sub/*.py", anchor_right=True)
+        assert not glob_matches("pkg/sub/mod.py", "pkg/*.py", anchor_right=True)
+        assert glob_matches("tests/test_a.py", "**/test_*.py", anchor_right=True)
+
+    def test_compile_glob_is_cached(self):
+        assert compile_glob("src/**/*.py") is compile_glob("src/**/*.py")
+
+
+class TestDomainPatternMatcher:
+    """Test the combined domain pattern matcher"""
+
+    @pytest.fixture
+    def matcher(self):
+        return DomainPatternMatcher({
+            "core": ["src/core/**/*.py"],
+            "utils": ["src/utils/**/*.py", "src/**/util*.py"],
+            "build": ["setup.py", "Makefile"],
+            "tests": ["**/test_*.py"]
+        })
+
+    def test_single_domain_match(self, matcher):
+        assert matcher.covering_domains("src/core/main.py") == ["core"]
+
+    def test_multiple_domains_match(self, matcher):
+        assert matcher.covering_domains("src/core/utils.py") == ["core", "utils"]
+        assert matcher.covering_domains(Path("src/core/test_utils.py")) == ["core", "tests"]
+
+    def test_literal_patterns(self, matcher):
+        assert matcher.covering_domains("setup.py") == ["build"]
+        assert matcher.covering_domains("Makefile") == ["build"]
+        assert matcher.covering_domains("src/setup.py") == []
+
+    def test_uncovered_file(self, matcher):
+        assert not matcher.is_covered("scripts/deploy.sh")
+
+    def test_match_patterns(self, matcher):
+        assert matcher.match_patterns("src/utils/io.py") == [("utils", "src/utils/**/*.py")]
+
+    def test_classify(self, matcher):
+        groups = matcher.classify(["src/core/a.py", "src/core/b.py", "setup.py", "README.md"])
+
+        assert groups[("core", "src/core/**/*.py")] == ["src/core/a.py", "src/core/b.py"]
+        assert groups[("build", "setup.py")] == ["setup.py"]
+        assert matcher.has_pattern("build", "setup.py")
+        assert not matcher.has_pattern("build", "README.md")
+
+    def test_results_are_cached(self, matcher):
+        matcher.covering_domains("src/core/main.py")
+        matcher.covering_domains("src/core/main.py")
+
+        stats = matcher.get_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+
+    def test_cache_is_bounded(self):
+        matcher = DomainPatternMatcher({"core": ["src/**/*.py"]}, cache_size=2)
+        for i in range(5):
+            matcher.is_covered(f"src/file_{i}.py")
+        assert matcher.get_stats()["cached_paths"] <= 2
+
+    def test_right_anchored_patterns(self):
+        matcher = DomainPatternMatcher({
+            "core": ["*.py"],
+            "sub": ["sub/*.py"],
+            "deep": ["**/deep/*.py"]
+        }, anchor_right=True)
+
+        assert matcher.covering_domains("pkg/sub/mod.py") == ["core", "sub"]
+        assert matcher.covering_domains("a/deep/mod.py") == ["core", "deep"]
+        assert matcher.covering_domains("setup.py") == ["core"]
+        assert matcher.match_patterns("sub/mod.py") == [("core", "*.py"), ("sub", "sub/*.py")]
+        assert not matcher.is_covered("pkg/sub/mod.js")
+
+
+class TestMatcherIntegration:
+    """Test the shared matcher in orphaned file detection and health checks"""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        for relative in ["src/core/main.py", "src/core/sub/helper.py", "src/orphan/lonely.py"]:
+            path = tmp_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("core = True\n")
+        return tmp_path
+
+    @pytest.fixture
+    def domains(self):
+        return {
+            "core": make_domain("core", ["src/core/**/*.py"]),
+            "ghost": make_domain("ghost", ["src/ghost/**/*.py"])
+        }
+
+    def test_orphaned_file_detector(self, project, domains):
+        detector = OrphanedFileDetector(domains, project)
+        result = detector.detect_orphaned_files()
+
+        assert result["total_files_checked"] == 3
+        assert result["orphaned_files"] == [str(project / "src/orphan/lonely.py")]
+        assert result["coverage_map"][str(project / "src/core/sub/helper.py")] == ["core"]
+
+    def test_orphaned_file_detector_bare_pattern_covers_nested_files(self, project):
+        detector = OrphanedFileDetector({
+            "python": make_domain("python", ["*.py"]),
+            "sub": make_domain("sub", ["sub/*.py"])
+        }, project)
+        result = detector.detect_orphaned_files()
+
+        assert result["orphaned_files"] == []
+        assert result["coverage_map"][str(project / "src/core/sub/helper.py")] == ["python", "sub"]
+        assert detector._find_covering_domains(project / "pkg/sub/mod.py", {"core": ["*.py"], "s": ["sub/*.py"]}) == ["core", "s"]
+
+    def test_health_monitor_uses_shared_index(self, project, domains):
+        registry = type("Registry", (), {"get_all_domains": lambda self: domains})()
+        monitor = DomainHealthMonitor()
+        monitor.registry_manager = registry
+        monitor.set_project_root(str(project))
+
+        assert monitor._check_file_patterns(domains["core"]) == []
+        ghost_issues = monitor._check_file_patterns(domains["ghost"])
+        assert len(ghost_issues) == 1
+        assert "matches no files" in ghost_issues[0].description
+
+        assert monitor.detect_orphaned_files() == ["src/orphan/lonely.py"]
+
+    def test_health_monitor_unregistered_pattern(self, project, domains):
+        registry = type("Registry", (), {"get_all_domains": lambda self: domains})()
+        monitor = DomainHealthMonitor()
+        monitor.registry_manager = registry
+        monitor.set_project_root(str(project))
+
+        edited = make_domain("core", ["src/orphan/*.py"])
+        assert monitor._get_matching_files(edited, "src/orphan/*.py") == [project / "src/orphan/lonely.py"]
+
+    def test_health_monitor_reuses_matcher_until_domains_change(self, project, domains):
+        registry = type("Registry", (), {"get_all_domains": lambda self: domains})()
+        monitor = DomainHealthMonitor()
+        monitor.registry_manager = registry
+        monitor.set_project_root(str(project))
+
+        assert monitor.detect_orphaned_files() == ["src/orphan/lonely.py"]
+        matcher = monitor._pattern_matcher
+        assert monitor.detect_orphaned_files() == ["src/orphan/lonely.py"]
+        assert monitor._pattern_matcher is matcher
+
+        domains["orphan"] = make_domain("orphan", ["src/orphan/*.py"])
+        assert monitor.detect_orphaned_files() == []
+        assert monitor._pattern_matcher is not matcher
+        assert monitor._get_matching_files(domains["orphan"], "src/orphan/*.py") == [project / "src/orphan/lonely.py"]
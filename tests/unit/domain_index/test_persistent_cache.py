@@ -0,0 +1,166 @@
+"""
+Tests for Persistent Cache Tier
+
+This module tests the SQLite-backed cache tier, its integration as the
+second tier of DomainCache and warm restarts of the registry manager.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from src.beast_mode.domain_index.persistent_cache import PersistentCacheTier
+from src.beast_mode.domain_index.domain_cache import DomainCache
+from src.beast_mode.domain_index.registry_manager import DomainRegistryManager
+
+
+class TestPersistentCacheTier:
+    """Test PersistentCacheTier functionality"""
+
+    @pytest.fixture
+    def tier(self, tmp_path):
+        tier = PersistentCacheTier(tmp_path / "cache.sqlite3", namespace="v1")
+        yield tier
+        tier.close()
+
+    def test_set_and_get(self, tier):
+        assert tier.set("key", {"value": [1, 2, 3]}, ttl_seconds=60, tags={"a", "b"})
+
+        entry = tier.get("key")
+        assert entry.value == {"value": [1, 2, 3]}
+        assert entry.tags == {"a", "b"}
+        assert 0 < entry.ttl_remaining <= 60
+
+    def test_namespaces_are_isolated(self, tier):
+        tier.set("key", "v1 value")
+        tier.set_namespace("v2")
+
+        assert tier.get("key") is None
+
+        tier.set_namespace("v1")
+        assert tier.get("key").value == "v1 value"
+
+    def test_expired_entries_are_dropped(self, tier):
+        tier.set("key", "value", ttl_seconds=-1)
+        assert tier.get("key") is None
+        assert tier.keys() == []
+
+    def test_invalidation(self, tier):
+        tier.set("search:a", 1, tags={"search"})
+        tier.set("search:b", 2)
+        tier.set("domain:a", 3, tags={"search"})
+
+        assert sorted(tier.invalidate_by_tag("search")) == ["domain:a", "search:a"]
+        assert tier.invalidate_by_pattern("search:*") == ["search:b"]
+        assert tier.keys() == []
+
+    def test_prune_stale_namespaces(self, tier):
+        tier.set("key", "old")
+        tier.set_namespace("v2")
+        tier.set("key", "new")
+
+        assert tier.prune() == 1
+        tier.set_namespace("v1")
+        assert tier.get("key") is None
+
+    def test_unpicklable_value_is_rejected(self, tier):
+        assert tier.set("key", lambda: None) is False
+        assert tier.get("key") is None
+
+
+class TestDomainCachePersistentTier:
+    """Test DomainCache with a persistent second tier"""
+
+    def test_read_through_promotes_entry(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        first = DomainCache({'persistent_cache_path': str(path)})
+        first.set("domain:a", "value", tags={"domain"}, persist=True)
+        first.set("domain:b", "memory only")
+        first.shutdown()
+
+        second = DomainCache({'persistent_cache_path': str(path)})
+        try:
+            assert second.get("domain:a") == "value"
+            assert second.get("domain:b") is None
+            assert second.get_keys_by_tag("domain") == ["domain:a"]
+            assert second.get_stats()["persistent_hits"] == 1
+        finally:
+            second.shutdown()
+
+    def test_tag_invalidation_applies_to_both_tiers(self, tmp_path):
+        cache = DomainCache({'persistent_cache_path': str(tmp_path / "cache.sqlite3")})
+        try:
+            cache.set("memory", 1, tags={"collection"})
+            cache.set("both", 2, tags={"collection"}, persist=True)
+            cache.persistent_tier.set("disk", 3, tags={"collection"})
+
+            assert cache.invalidate_by_tag("collection") == 3
+            assert cache.get("both") is None
+            assert cache.get("disk") is None
+        finally:
+            cache.shutdown()
+
+
+class TestRegistryWarmRestart:
+    """Test registry loading from the persistent tier"""
+
+    @pytest.fixture
+    def registry_file(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps({
+            "domain_architecture": {
+                "core": {"description": "Core domains", "domains": ["auth", "billing"]}
+            }
+        }))
+        return path
+
+    def make_manager(self, registry_file, tmp_path):
+        return DomainRegistryManager(str(registry_file), config={
+            'cache': {'persistent_cache_path': str(tmp_path / "cache.sqlite3")}
+        })
+
+    def test_second_process_skips_parsing(self, registry_file, tmp_path):
+        first = self.make_manager(registry_file, tmp_path)
+        assert first.load_registry()
+        first._cache.shutdown()
+
+        second = self.make_manager(registry_file, tmp_path)
+        with patch.object(second, '_parse_domains') as parse_domains:
+            assert second.load_registry()
+
+        parse_domains.assert_not_called()
+        assert set(second.get_all_domains()) == {"auth", "billing"}
+        assert second.search_by_category("core")
+        second._cache.shutdown()
+
+    def test_changed_registry_is_reparsed(self, registry_file, tmp_path):
+        first = self.make_manager(registry_file, tmp_path)
+        first.load_registry()
+        first._cache.shutdown()
+
+        registry_file.write_text(json.dumps({
+            "domain_architecture": {
+                "core": {"description": "Core domains", "domains": ["auth"]}
+            }
+        }))
+
+        second = self.make_manager(registry_file, tmp_path)
+        second.load_registry()
+        assert set(second._domains) == {"auth"}
+        second._cache.shutdown()
+
+    def test_every_restart_is_warm(self, registry_file, tmp_path):
+        first = self.make_manager(registry_file, tmp_path)
+        assert first.load_registry()
+        first.get_shared_cache().set("health:statuses", {"auth": "healthy"}, 3600, persist=True)
+        first._cache.shutdown()
+
+        for _ in range(4):
+            manager = self.make_manager(registry_file, tmp_path)
+            with patch.object(manager, '_parse_domains') as parse_domains:
+                assert manager.load_registry()
+
+            parse_domains.assert_not_called()
+            assert set(manager.get_all_domains()) == {"auth", "billing"}
+            assert manager.get_shared_cache().get("health:statuses") == {"auth": "healthy"}
+            manager._cache.shutdown()
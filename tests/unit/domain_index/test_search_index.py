@@ -0,0 +1,148 @@
+"""
+Tests for Inverted Search Index
+
+This module tests the InvertedSearchIndex class including tokenization,
+BM25 ranking, incremental updates and query engine integration.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.beast_mode.domain_index.search_index import InvertedSearchIndex, tokenize
+from src.beast_mode.domain_index.query_engine import DomainQueryEngine
+from src.beast_mode.domain_index.models import (
+    Domain, DomainTools, DomainMetadata, PackagePotential
+)
+
+
+def make_domain(name, description="", patterns=None, indicators=None, requirements=None):
+    """Create a minimal domain for indexing"""
+    return Domain(
+        name=name,
+        description=description,
+        patterns=patterns or [],
+        content_indicators=indicators or [],
+        requirements=requirements or [],
+        dependencies=[],
+        tools=DomainTools(linter="", formatter="", validator=""),
+        metadata=DomainMetadata(
+            demo_role="core",
+            extraction_candidate="no",
+            package_potential=PackagePotential(0.5, [], [], "low", [])
+        )
+    )
+
+
+class TestTokenize:
+    """Test tokenization"""
+
+    def test_splits_identifiers_and_paths(self):
+        assert tokenize("test_domain") == ["test", "domain"]
+        assert tokenize("src/Test/**/*.py") == ["src", "test", "py"]
+
+    def test_empty_text(self):
+        assert tokenize("") == []
+
+
+class TestInvertedSearchIndex:
+    """Test InvertedSearchIndex functionality"""
+
+    @pytest.fixture
+    def index(self):
+        index = InvertedSearchIndex()
+        index.build([
+            make_domain("auth_domain", "Authentication and login", ["src/auth/**/*.py"], ["auth_"]),
+            make_domain("billing_domain", "Billing and invoices", ["src/billing/**/*.py"], ["invoice"]),
+            make_domain("reporting_domain", "Billing reports", ["src/reports/**/*.py"], ["report"])
+        ])
+        return index
+
+    def test_build(self, index):
+        assert len(index) == 3
+        assert "auth_domain" in index
+        assert index.vocabulary_size > 0
+
+    def test_ranking_prefers_more_relevant_domain(self, index):
+        hits = index.search(["billing"])
+        names = [name for name, _ in hits]
+
+        assert names[0] == "billing_domain"
+        assert "reporting_domain" in names
+        assert "auth_domain" not in names
+
+    def test_top_k(self, index):
+        hits = index.search(["domain"], top_k=2)
+        assert len(hits) == 2
+
+    def test_prefix_expansion(self, index):
+        names = [name for name, _ in index.search(["invo"])]
+        assert names == ["billing_domain"]
+
+    def test_field_restricted_search(self, index):
+        assert [name for name, _ in index.search(["auth"], fields=["patterns"])] == ["auth_domain"]
+        assert index.search(["authentication"], fields=["patterns"]) == []
+
+    def test_incremental_update(self, index):
+        index.add_domain(make_domain("auth_domain", "Single sign on", ["src/sso/**/*.py"]))
+
+        assert index.search(["login"]) == []
+        assert [name for name, _ in index.search(["sso"])] == ["auth_domain"]
+        assert len(index) == 3
+
+    def test_remove_domain(self, index):
+        assert index.remove_domain("billing_domain") is True
+        assert index.remove_domain("billing_domain") is False
+        assert [name for name, _ in index.search(["invoices"])] == []
+        assert [name for name, _ in index.search(["billing"])] == ["reporting_domain"]
+
+    def test_score_domains(self, index):
+        scores = index.score_domains(["billing"], ["billing_domain", "auth_domain"])
+
+        assert scores["billing_domain"] > 0.0
+        assert scores["auth_domain"] == 0.0
+        assert "reporting_domain" not in scores
+
+
+class TestQueryEngineIncrementalIndex:
+    """Test query engine index maintenance through registry notifications"""
+
+    @pytest.fixture
+    def engine(self):
+        domains = {
+            "auth_domain": make_domain("auth_domain", "Authentication", ["src/auth/**/*.py"]),
+            "billing_domain": make_domain("billing_domain", "Billing", ["src/billing/**/*.py"])
+        }
+        registry = Mock()
+        registry.get_all_domains.return_value = domains
+
+        engine = DomainQueryEngine()
+        engine.set_registry_manager(registry)
+        engine._ensure_indexes_built()
+        return engine
+
+    def test_registers_listener(self, engine):
+        engine.registry_manager.add_change_listener.assert_called_once_with(engine._on_registry_change)
+
+    def test_create_updates_index_without_rebuild(self, engine):
+        engine._on_registry_change("created", "search_domain", make_domain("search_domain", "Full text search"))
+
+        assert engine._index_built is True
+        assert engine.registry_manager.get_all_domains.call_count == 1
+        assert [d.name for d in engine._combined_search(["search"])] == ["search_domain"]
+
+    def test_update_replaces_exact_key_indexes(self, engine):
+        engine._on_registry_change("updated", "auth_domain", make_domain("auth_domain", "Identity", ["src/identity/**/*.py"]))
+
+        assert "src/auth/**/*.py" not in engine._pattern_index
+        assert engine._pattern_index["src/identity/**/*.py"] == {"auth_domain"}
+        assert [d.name for d in engine._search_by_patterns(["identity"])] == ["auth_domain"]
+
+    def test_delete_removes_domain(self, engine):
+        engine._on_registry_change("deleted", "billing_domain")
+
+        assert engine._combined_search(["billing"]) == []
+        assert "billing_domain" not in engine._indexed_domains
+
+    def test_reload_forces_rebuild(self, engine):
+        engine._on_registry_change("reloaded", "")
+        assert engine._index_built is False
@@ -18,6 +18,7 @@ import aiohttp
 from aiohttp import ClientResponseError, ClientError
 
 from src.beast_mode.integration.devpost.api.client import DevpostAPIClient
+from src.beast_mode.integration.devpost.api.rate_limiter import AsyncRateLimiter
 from src.beast_mode.integration.devpost.auth.auth_service import DevpostAuthService
 from src.beast_mode.integration.devpost.models import DevpostProject, AuthToken, AuthResult
 from src.beast_mode.core.exceptions import NetworkError, AuthenticationError, ValidationError
@@ -546,6 +547,51 @@ class TestDevpostAPIClient:
                     if temp_file.exists():
                         temp_file.unlink()
         
+        @pytest.mark.asyncio
+        async def test_batch_upload_media_bounded_concurrency(self, api_client):
+            """Test that batch uploads run concurrently up to the worker limit."""
+            temp_files = []
+            for i in range(6):
+                with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+                    f.write(b"x" * (100 * (i + 1)))
+                    temp_files.append(Path(f.name))
+            
+            in_flight = 0
+            max_in_flight = 0
+            progress_values = []
+            
+            async def fake_upload(project_id, media_path, progress_callback=None):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                progress_callback(50)
+                await asyncio.sleep(0.01)
+                progress_callback(100)
+                in_flight -= 1
+                return {"success": True, "media_id": media_path.name}
+            
+            try:
+                with patch.object(api_client, 'upload_media', side_effect=fake_upload):
+                    result = await api_client.batch_upload_media(
+                        "test-project-123",
+                        temp_files,
+                        progress_callback=progress_values.append,
+                        max_concurrent_uploads=3
+                    )
+                
+                assert max_in_flight == 3
+                assert len(result["successful_uploads"]) == 6
+                assert [upload["file"] for upload in result["successful_uploads"]] == [str(f) for f in temp_files]
+                assert result["total_size"] == sum(100 * (i + 1) for i in range(6))
+                assert progress_values == sorted(progress_values)
+                assert progress_values[-1] == 100
+            
+            finally:
+                for temp_file in temp_files:
+                    if temp_file.exists():
+                        temp_file.unlink()
+        
         @pytest.mark.asyncio
         async def test_batch_upload_media_empty_list(self, api_client):
             """Test batch upload with empty file list."""
@@ -782,13 +828,14 @@ class TestDevpostAPIClient:
                 large_file = Path(f.name)
             
             try:
-                with patch.object(api_client, '_make_request', new_callable=AsyncMock) as mock_request:
-                    # Mock init success, then chunk failure
-                    mock_request.side_effect = [
-                        {"upload_id": "upload-123"},  # Init success
-                        NetworkError("Chunk upload failed"),  # First chunk fails
-                        {"success": True}  # Abort call
-                    ]
+                with patch.object(api_client, '_make_request', new_callable=AsyncMock) as mock_request, \
+                        patch.object(api_client, '_calculate_backoff_delay', return_value=0):
+                    # Mock init success, then the first chunk failing on every attempt
+                    mock_request.side_effect = (
+                        [{"upload_id": "upload-123"}]  # Init success
+                        + [NetworkError("Chunk upload failed")] * api_client.CHUNK_RETRY_ATTEMPTS
+                        + [{"success": True}]  # Abort call
+                    )
                     
                     metadata = {
                         "size": large_file.stat().st_size,
@@ -802,14 +849,51 @@ class TestDevpostAPIClient:
                             metadata
                         )
                     
-                    # Verify abort was called
-                    assert mock_request.call_count == 3  # init, chunk, abort
-                    abort_call = mock_request.call_args_list[2]
+                    # Verify abort was called after the chunk retries
+                    assert mock_request.call_count == api_client.CHUNK_RETRY_ATTEMPTS + 2
+                    abort_call = mock_request.call_args_list[-1]
                     assert "abort" in abort_call[0][1]  # abort endpoint called
             
             finally:
                 large_file.unlink()
         
+        @pytest.mark.asyncio
+        async def test_chunked_upload_retries_only_failed_chunk(self, api_client):
+            """Test that a failed chunk is retried without re-sending earlier chunks."""
+            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+                f.write(b"x" * (12 * 1024 * 1024))  # 12MB file
+                large_file = Path(f.name)
+            
+            try:
+                with patch.object(api_client, '_make_request', new_callable=AsyncMock) as mock_request, \
+                        patch.object(api_client, '_calculate_backoff_delay', return_value=0):
+                    mock_request.side_effect = [
+                        {"upload_id": "upload-123"},
+                        {"etag": "chunk1"},
+                        NetworkError("Connection reset"),  # Chunk 2, first attempt
+                        {"etag": "chunk2"},
+                        {"etag": "chunk3"},
+                        {"media_id": "media-large"}
+                    ]
+                    
+                    result = await api_client._upload_large_media(
+                        "test-project-123",
+                        large_file,
+                        {"size": large_file.stat().st_size, "content_type": "video/mp4"}
+                    )
+                    
+                    endpoints = [call[0][1] for call in mock_request.call_args_list]
+                    assert [endpoint.rsplit("/", 1)[-1] for endpoint in endpoints[1:5]] == ["1", "2", "2", "3"]
+                    # Chunk attempts are retried here only, not again inside _make_request
+                    assert all(call[1]["max_attempts"] == 1 for call in mock_request.call_args_list[1:5])
+                    complete_payload = mock_request.call_args_list[-1][1]["json_data"]
+                    assert [chunk["etag"] for chunk in complete_payload["chunks"]] == ["chunk1", "chunk2", "chunk3"]
+                    assert sum(chunk["size"] for chunk in complete_payload["chunks"]) == 12 * 1024 * 1024
+                    assert result["chunks_uploaded"] == 3
+            
+            finally:
+                large_file.unlink()
+        
         def test_is_valid_media_file(self, api_client):
             """Test media file validation."""
             # Valid files
@@ -986,12 +1070,52 @@ class TestDevpostAPIClient:
         
         @pytest.mark.asyncio
         async def test_make_request_rate_limited(self, api_client):
-            """Test request when rate limited."""
+            """Test request when the wait for capacity exceeds the allowed maximum."""
             # Fill up rate limit
-            api_client._request_timestamps = [time.time()] * api_client.MAX_REQUESTS_PER_WINDOW
+            now = time.monotonic()
+            for _ in range(api_client.MAX_REQUESTS_PER_WINDOW):
+                api_client._rate_limiter.window.record(now)
+            api_client.max_rate_limit_wait = 1.0
             
             with pytest.raises(NetworkError, match="Rate limit exceeded"):
                 await api_client._make_request("GET", "/test")
+            
+            assert api_client.get_client_stats()["rate_limit"]["rejected"] == 1
+        
+        @pytest.mark.asyncio
+        async def test_make_request_waits_for_burst_capacity(self, api_client):
+            """Test that a request over the burst limit waits instead of failing."""
+            sleeps = []
+            
+            async def fake_sleep(delay):
+                sleeps.append(delay)
+                clock.now += delay
+            
+            clock = Mock()
+            clock.now = 1000.0
+            api_client._rate_limiter = AsyncRateLimiter(
+                max_requests=api_client.MAX_REQUESTS_PER_WINDOW,
+                window_seconds=api_client.RATE_LIMIT_WINDOW,
+                burst_limit=api_client.BURST_LIMIT,
+                burst_window_seconds=api_client.BURST_WINDOW,
+                clock=lambda: clock.now,
+                sleep=fake_sleep
+            )
+            
+            with patch.object(api_client, '_get_session') as mock_get_session, \
+                    patch.object(api_client, '_handle_response', AsyncMock(return_value={"ok": True})):
+                mock_session = Mock()
+                mock_session.request.return_value.__aenter__ = AsyncMock(return_value=Mock(status=200))
+                mock_session.request.return_value.__aexit__ = AsyncMock(return_value=None)
+                mock_get_session.return_value = mock_session
+                
+                for index in range(api_client.BURST_LIMIT + 1):
+                    await api_client._make_request("POST", f"/test/{index}")
+            
+            stats = api_client.get_client_stats()
+            assert len(sleeps) == 1
+            assert stats["rate_limit"]["delayed"] == 1
+            assert stats["rate_limit_wait_seconds"] == pytest.approx(sleeps[0])
         
         @pytest.mark.asyncio
         async def test_make_request_retry_on_500(self, api_client):
@@ -1143,8 +1267,8 @@ class TestDevpostAPIClient:
         async def test_close_cleanup(self, api_client):
             """Test client cleanup on close."""
             # Add some data to clean up
-            api_client._response_cache["test"] = {"data": "test"}
-            api_client._request_timestamps = [time.time()]
+            api_client._response_cache.put("test", "https://example.com/test", "/test", {"data": "test"})
+            api_client._rate_limiter.window.record(time.monotonic())
             
             # Mock session
             mock_session = AsyncMock()
@@ -1156,7 +1280,7 @@ class TestDevpostAPIClient:
             # Verify cleanup
             mock_session.close.assert_called_once()
             assert len(api_client._response_cache) == 0
-            assert len(api_client._request_timestamps) == 0
+            assert api_client._rate_limiter.remaining() == api_client.MAX_REQUESTS_PER_WINDOW
         
         @pytest.mark.asyncio
         async def test_context_manager(self, api_client):
@@ -0,0 +1,114 @@
+"""
+Unit tests for the Devpost API rate limiter.
+
+Covers token bucket refill, the sliding window cap, FIFO fairness across
+coroutines and wait-time statistics, using a virtual clock.
+"""
+
+import asyncio
+import pytest
+
+from src.beast_mode.integration.devpost.api.rate_limiter import (
+    AsyncRateLimiter, RateLimitExceeded, SlidingWindowLimiter, TokenBucket
+)
+
+
+class VirtualClock:
+    """Clock whose sleep advances time instantly."""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+def make_limiter(clock, max_requests=100, window=60, burst=10, burst_window=10):
+    return AsyncRateLimiter(max_requests, window, burst, burst_window, clock=clock, sleep=clock.sleep)
+
+
+class TestBuckets:
+    """Test the underlying token bucket and sliding window."""
+    
+    def test_token_bucket_refills_continuously(self):
+        clock = VirtualClock()
+        bucket = TokenBucket(2, 1.0, clock)
+        bucket.consume(clock.now)
+        bucket.consume(clock.now)
+        
+        assert bucket.delay_until_available(clock.now) == pytest.approx(1.0)
+        assert bucket.delay_until_available(clock.now + 0.5) == pytest.approx(0.5)
+        assert bucket.delay_until_available(clock.now + 5) == 0.0
+        assert bucket.tokens <= 2
+    
+    def test_sliding_window_expires_oldest(self):
+        window = SlidingWindowLimiter(2, 60)
+        window.record(0.0)
+        window.record(30.0)
+        
+        assert window.delay_until_available(45.0) == pytest.approx(15.0)
+        assert window.remaining(61.0) == 1
+
+
+class TestAsyncRateLimiter:
+    """Test AsyncRateLimiter behaviour."""
+    
+    @pytest.mark.asyncio
+    async def test_requests_wait_instead_of_failing(self):
+        clock = VirtualClock()
+        limiter = make_limiter(clock, burst=2, burst_window=2)
+        
+        waits = [await limiter.acquire() for _ in range(4)]
+        
+        assert waits == pytest.approx([0.0, 0.0, 1.0, 1.0])
+        stats = limiter.get_stats()
+        assert stats["acquired"] == 4
+        assert stats["delayed"] == 2
+        assert stats["total_wait_seconds"] == pytest.approx(2.0)
+        assert stats["max_wait_seconds"] == pytest.approx(1.0)
+    
+    @pytest.mark.asyncio
+    async def test_waiters_are_admitted_in_arrival_order(self):
+        clock = VirtualClock()
+        limiter = make_limiter(clock, burst=1, burst_window=1)
+        admitted = []
+        
+        async def worker(index):
+            await limiter.acquire()
+            admitted.append(index)
+        
+        await asyncio.gather(*(worker(index) for index in range(20)))
+        
+        assert admitted == list(range(20))
+        assert clock.now == pytest.approx(1019.0)
+    
+    @pytest.mark.asyncio
+    async def test_max_wait_rejects_without_consuming(self):
+        clock = VirtualClock()
+        limiter = make_limiter(clock, max_requests=3, burst=10)
+        for _ in range(3):
+            await limiter.acquire()
+        
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await limiter.acquire(max_wait=5)
+        
+        assert exc_info.value.required_wait == pytest.approx(60.0)
+        assert limiter.get_stats()["rejected"] == 1
+        assert limiter.remaining() == 0
+        assert await limiter.acquire() == pytest.approx(60.0)
+    
+    @pytest.mark.asyncio
+    async def test_reset_restores_capacity(self):
+        clock = VirtualClock()
+        limiter = make_limiter(clock, max_requests=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        
+        limiter.reset()
+        
+        assert limiter.remaining() == 2
+        assert await limiter.acquire() == 0.0
@@ -0,0 +1,236 @@
+"""
+Unit tests for the Devpost API response cache.
+
+Covers LRU eviction, per-endpoint TTLs, persistence, and the client's
+conditional revalidation, request coalescing and invalidation behaviour.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from src.beast_mode.integration.devpost.api.client import DevpostAPIClient
+from src.beast_mode.integration.devpost.api.response_cache import ResponseCache
+from src.beast_mode.integration.devpost.auth.auth_service import DevpostAuthService
+from src.beast_mode.integration.devpost.models import AuthToken
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in."""
+    
+    content_type = "application/json"
+    request_info = None
+    history = ()
+    
+    def __init__(self, status, data=None, headers=None):
+        self.status = status
+        self._data = data
+        self.headers = headers or {}
+    
+    async def json(self):
+        return self._data
+    
+    async def text(self):
+        return str(self._data)
+
+
+class FakeRequestContext:
+    def __init__(self, response, delay):
+        self.response = response
+        self.delay = delay
+    
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self.response
+    
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeSession:
+    """Session returning queued responses and recording request kwargs."""
+    
+    def __init__(self, responses, delay=0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.calls = []
+    
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeRequestContext(self.responses.pop(0), self.delay)
+
+
+@pytest.fixture
+def api_client():
+    auth_service = Mock(spec=DevpostAuthService)
+    auth_service.is_authenticated.return_value = True
+    auth_service.get_current_token.return_value = AuthToken(
+        access_token="test_token",
+        token_type="Bearer",
+        expires_at=datetime.now() + timedelta(hours=1)
+    )
+    return DevpostAPIClient(auth_service=auth_service, enable_logging=False)
+
+
+def use_session(api_client, session):
+    async def get_session():
+        return session
+    api_client._get_session = get_session
+
+
+class TestResponseCache:
+    """Test ResponseCache behaviour."""
+    
+    def test_lru_evicts_least_recently_used(self):
+        clock = FakeClock()
+        cache = ResponseCache(max_entries=2, clock=clock)
+        cache.put("a", "u/a", "/a", {"v": "a"})
+        cache.put("b", "u/b", "/b", {"v": "b"})
+        assert cache.get("a") == {"v": "a"}  # a becomes most recently used
+        
+        cache.put("c", "u/c", "/c", {"v": "c"})
+        
+        assert "b" not in cache
+        assert cache.get("a") == {"v": "a"}
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_per_endpoint_ttl_uses_longest_prefix(self):
+        clock = FakeClock()
+        cache = ResponseCache(default_ttl=300, ttl_overrides={"/hackathons": 900, "/hackathons/live": 10}, clock=clock)
+        cache.put("h", "u/h", "/hackathons/42", {})
+        cache.put("l", "u/l", "/hackathons/live/1", {})
+        cache.put("p", "u/p", "/projects/1", {})
+        
+        clock.now += 301
+        
+        assert cache.get("h") == {}
+        assert cache.get("l") is None
+        assert cache.get("p") is None
+        assert cache.get_entry("p") is not None  # kept for revalidation
+    
+    def test_invalidate_url_drops_all_variants(self):
+        cache = ResponseCache()
+        cache.put("u|[('page', 1)]", "u", "/u", {})
+        cache.put("u|[('page', 2)]", "u", "/u", {})
+        cache.put("v", "v", "/v", {})
+        
+        assert cache.invalidate_url("u") == 2
+        assert len(cache) == 1
+    
+    def test_save_and_load_round_trip(self, tmp_path):
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        cache.put("a", "u/a", "/a", {"v": 1}, etag='"abc"')
+        path = tmp_path / "cache" / "responses.json"
+        
+        assert cache.save(path)
+        restored = ResponseCache(clock=clock)
+        
+        assert restored.load(path) == 1
+        assert restored.get("a") == {"v": 1}
+        assert restored.get_entry("a").conditional_headers() == {"If-None-Match": '"abc"'}
+
+
+class TestClientResponseCaching:
+    """Test DevpostAPIClient use of the response cache."""
+    
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_etag(self, api_client):
+        session = FakeSession([
+            FakeResponse(200, {"items": [1, 2]}, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            FakeResponse(304)
+        ])
+        use_session(api_client, session)
+        
+        first = await api_client._make_request("GET", "/projects")
+        api_client._response_cache.get_entry(api_client._get_cache_key(
+            f"{api_client.base_url}/projects", None
+        )).expires_at = 0  # Expire the entry
+        second = await api_client._make_request("GET", "/projects")
+        
+        assert first == second == {"items": [1, 2]}
+        assert session.calls[1]["headers"]["If-None-Match"] == '"v1"'
+        assert session.calls[1]["headers"]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert api_client.get_client_stats()["cache"]["revalidations"] == 1
+        
+        # Revalidated entry is fresh again
+        assert await api_client._make_request("GET", "/projects") == {"items": [1, 2]}
+        assert len(session.calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_revalidation_restores_entry_dropped_in_flight(self, api_client):
+        session = FakeSession([
+            FakeResponse(200, {"items": [1]}, {"ETag": '"v1"'}),
+            FakeResponse(304)
+        ])
+        use_session(api_client, session)
+        cache_key = api_client._get_cache_key(f"{api_client.base_url}/projects", None)
+        
+        await api_client._make_request("GET", "/projects")
+        api_client._response_cache.get_entry(cache_key).expires_at = 0
+        
+        send_request = session.request
+        
+        def evicting_request(**kwargs):
+            api_client._response_cache.clear()  # Evicted while the conditional GET is in flight
+            return send_request(**kwargs)
+        session.request = evicting_request
+        
+        assert await api_client._make_request("GET", "/projects") == {"items": [1]}
+        assert api_client._response_cache.get(cache_key) == {"items": [1]}
+    
+    @pytest.mark.asyncio
+    async def test_identical_inflight_gets_are_coalesced(self, api_client):
+        session = FakeSession([FakeResponse(200, {"ok": True})], delay=0.01)
+        use_session(api_client, session)
+        
+        results = await asyncio.gather(*(api_client._make_request("GET", "/hackathons") for _ in range(5)))
+        
+        assert results == [{"ok": True}] * 5
+        assert len(session.calls) == 1
+        assert api_client.get_client_stats()["cache"]["coalesced"] == 4
+        assert not api_client._inflight_requests
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self, api_client):
+        session = FakeSession([FakeResponse(200, {"ok": 1}), FakeResponse(200, {"ok": 2})], delay=0.05)
+        use_session(api_client, session)
+        
+        leader = asyncio.ensure_future(api_client._make_request("GET", "/hackathons"))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.ensure_future(api_client._make_request("GET", "/hackathons")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        
+        results = await asyncio.gather(*waiters)
+        
+        assert leader.cancelled()
+        assert results == [{"ok": 2}] * 3
+        assert len(session.calls) == 2
+        assert not api_client._inflight_requests
+    
+    @pytest.mark.asyncio
+    async def test_unsafe_request_invalidates_cached_get(self, api_client):
+        session = FakeSession([
+            FakeResponse(200, {"title": "old"}),
+            FakeResponse(200, {"success": True}),
+            FakeResponse(200, {"title": "new"})
+        ])
+        use_session(api_client, session)
+        
+        assert await api_client._make_request("GET", "/projects/1") == {"title": "old"}
+        await api_client._make_request("PUT", "/projects/1", json_data={"title": "new"})
+        
+        assert await api_client._make_request("GET", "/projects/1") == {"title": "new"}
+        assert len(session.calls) == 3